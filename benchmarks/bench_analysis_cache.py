@@ -0,0 +1,43 @@
+"""Measures DAXAnalysisCache on batches where many expressions are copies of each other.
+
+Each batch repeats the resources corpus `--copies` times, like measures copy-pasted across reports, and is analyzed
+in-process with and without a cache.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_analysis_cache [--copies 1 5 20] [--lexer-backend antlr|scanner]
+"""
+import argparse
+import time
+
+from src.PyDAX import DAXAnalysisCache, DAXExpression
+
+from .bench_phases import load_corpus
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--copies", type=int, nargs="+", default=[1, 5, 20], help="Times the corpus is repeated in a batch")
+    parser.add_argument("--lexer-backend", default="scanner", choices=DAXExpression.LEXER_BACKENDS)
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    DAXExpression.analyze_many(corpus, workers=1, lexer_backend=args.lexer_backend)  # Warm up
+    for copies in args.copies:
+        batch = corpus * copies
+
+        start = time.perf_counter()
+        DAXExpression.analyze_many(batch, workers=1, lexer_backend=args.lexer_backend)
+        uncached = time.perf_counter() - start
+
+        cache = DAXAnalysisCache()
+        start = time.perf_counter()
+        DAXExpression.analyze_many(batch, workers=1, lexer_backend=args.lexer_backend, cache=cache)
+        cached = time.perf_counter() - start
+
+        info = cache.cache_info()
+        print(f"{len(batch):>6} expressions ({copies:>3} copies): uncached {uncached * 1000:8.1f} ms, cached {cached * 1000:8.1f} ms "
+              f"({uncached / cached:5.1f}x), {info.hits} hits, {info.misses} misses")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Measures DAXExpression.analyze_many on the sample expressions with an increasing number of worker processes.
+
+The size of the pickled results is what the workers send back to the parent process, which unpickles all of them.
+--keep-expressions measures results carrying the whole DAXExpression.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_analyze_many [--copies N] [--workers 1 2 4 ...] [--lexer-backend antlr|scanner] [--keep-expressions]
+"""
+import argparse
+import os
+import pickle
+import time
+from pathlib import Path
+
+from src.PyDAX import DAXExpression
+
+
+RESOURCES = Path(__file__).resolve().parent.parent / "resources"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--copies", type=int, default=10, help="Times the sample corpus is repeated in the batch")
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, 4, os.cpu_count() or 1}), help="Worker counts to measure")
+    parser.add_argument("--lexer-backend", default="antlr", choices=DAXExpression.LEXER_BACKENDS)
+    parser.add_argument("--keep-expressions", action="store_true", help="Send the analyzed expressions back with the results")
+    args = parser.parse_args()
+
+    expressions = [path.read_text(encoding="utf-8") for path in sorted(RESOURCES.rglob("*.txt"))] * args.copies
+    DAXExpression.analyze_many(expressions[:50], workers=1, lexer_backend=args.lexer_backend)  # Warm up the lexer DFA inherited by forked workers
+
+    results = DAXExpression.analyze_many(expressions, workers=1, lexer_backend=args.lexer_backend, keep_expressions=args.keep_expressions)
+    size = len(pickle.dumps(results))
+    print(f"{len(expressions)} expressions, {os.cpu_count()} CPUs, {size / len(expressions):,.0f} pickled bytes/result")
+    baseline = None
+    for workers in args.workers:
+        start = time.perf_counter()
+        results = DAXExpression.analyze_many(expressions, workers=workers, lexer_backend=args.lexer_backend, keep_expressions=args.keep_expressions)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        errors = sum(not result.ok for result in results)
+        print(f"{workers:>3} workers: {elapsed * 1000:9.1f} ms ({len(expressions) / elapsed:,.0f} expressions/s, "
+              f"speedup {baseline / elapsed:.2f}x, {errors} errors)")
+
+
+if __name__ == "__main__":
+    main()
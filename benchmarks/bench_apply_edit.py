@@ -0,0 +1,49 @@
+"""Measures the latency of DAXExpression.apply_edit against analyzing the edited text from scratch.
+
+The expressions are the generated calculated tables of bench_references, with N variables. Each edit types one
+character in the middle of the expression and deletes it again. With only lexing (--analyses none) the latency of
+apply_edit should stay flat as N grows; the analyses themselves still read the whole token buffer.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_apply_edit [--sizes 100 200 400 ...] [--edits N] [--lexer-backend antlr|scanner] [--analyses all|none]
+"""
+import argparse
+import time
+
+from benchmarks.bench_references import calculated_table
+from src.PyDAX import DAXExpression
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 200, 400, 800], help="Number of variables of each table")
+    parser.add_argument("--edits", type=int, default=20, help="Edits timed per table")
+    parser.add_argument("--lexer-backend", choices=DAXExpression.LEXER_BACKENDS, default="antlr")
+    parser.add_argument("--analyses", choices=("all", "none"), default="none", help="Analyses kept up to date after each edit")
+    args = parser.parse_args()
+    analyses = None if args.analyses == "all" else ()
+
+    for size in args.sizes:
+        dax = calculated_table(size)
+        expression = DAXExpression(dax, analyses=analyses, lexer_backend=args.lexer_backend)
+        expression.token_buffer
+        middle = dax.index("\n", len(dax) // 2)
+
+        start = time.perf_counter()
+        for _ in range(args.edits):
+            expression.apply_edit(middle, middle, " ")
+            expression.apply_edit(middle, middle + 1, "")
+        incremental = (time.perf_counter() - start) / (2 * args.edits)
+
+        start = time.perf_counter()
+        DAXExpression(dax, analyses=analyses, lexer_backend=args.lexer_backend).token_buffer
+        scratch = time.perf_counter() - start
+
+        print(
+            f"{size:>6} variables {len(expression.token_buffer):>8} tokens apply_edit {incremental * 1000:9.3f} ms"
+            f"   from scratch {scratch * 1000:9.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
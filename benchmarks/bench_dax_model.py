@@ -0,0 +1,48 @@
+"""Measures how DAXModel scales with the size of the model on synthetic models.
+
+Every measure references a calculated column and the three previous measures, so the number of references grows
+linearly with the model. Building the graph (analysis excluded) and a full unreachable() query should grow linearly too.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_dax_model [--sizes 1000 2000 4000 ...]
+"""
+import argparse
+import gc
+import time
+
+from src.PyDAX import DAXModel
+
+
+def build_model(measures: int) -> DAXModel:
+    model = DAXModel(lexer_backend="scanner")
+    for index in range(measures // 10):
+        model.add_calculated_column("Sales", f"Column {index}", f"Sales[Amount] * {index}")
+    for index in range(measures):
+        previous = " + ".join(f"[Measure {index - offset}]" for offset in (1, 2, 3) if index - offset >= 0) or "0"
+        model.add_measure("Sales", f"Measure {index}", f"SUM(Sales[Column {index // 10}]) + {previous}")
+    return model
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 2000, 4000, 8000], help="Number of measures of each model")
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        model = build_model(size)
+        model._analyze()  # Lexing is measured by the other benchmarks
+        gc.collect()
+
+        start = time.perf_counter()
+        model._graph()
+        graph = time.perf_counter() - start
+
+        start = time.perf_counter()
+        unreachable = model.unreachable([model.measure(f"Measure {size // 2}")])
+        query = time.perf_counter() - start
+        print(f"{len(model.artifacts):>6} artifacts: graph {graph * 1000:8.2f} ms, unreachable() {query * 1000:7.2f} ms "
+              f"({len(unreachable)} unreachable)")
+
+
+if __name__ == "__main__":
+    main()
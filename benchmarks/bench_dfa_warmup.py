@@ -0,0 +1,82 @@
+"""Compares the latency of lexing the first expressions of a fresh process with a cold and a pre-warmed lexer DFA.
+
+Each measurement runs in its own interpreter, so the cold run really starts from an empty DFA.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_dfa_warmup [--first N] [--runs R]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SAMPLE_EXPRESSIONS_DIR = ROOT / "resources" / "sample_dax_expressions"
+
+
+def child(first: int, cache_path: str | None) -> None:
+    """Runs inside the measured interpreter and prints its timings as JSON"""
+    from antlr4 import InputStream
+    from src.PyDAX.PyDAXLexer import PyDAXLexer
+    from src.PyDAX.DAXLexerCache import load_dfa_cache
+
+    expressions = [path.read_text(encoding="utf-8") for path in sorted(SAMPLE_EXPRESSIONS_DIR.glob("*.txt"))][:first]
+
+    start = time.perf_counter()
+    if cache_path is not None and not load_dfa_cache(cache_path):
+        raise RuntimeError(f"Could not load {cache_path}")
+    load = time.perf_counter() - start
+
+    latencies = []
+    for expression in expressions:
+        start = time.perf_counter()
+        lexer = PyDAXLexer(InputStream(expression))
+        lexer.removeErrorListeners()
+        lexer.getAllTokens()
+        latencies.append(time.perf_counter() - start)
+    print(json.dumps({"load": load, "latencies": latencies}))
+
+
+def measure(first: int, cache_path: str | None) -> dict:
+    command = [sys.executable, "-m", "benchmarks.bench_dfa_warmup", "--child", "--first", str(first)]
+    if cache_path is not None:
+        command += ["--cache", cache_path]
+    output = subprocess.run(command, cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--first", type=int, default=20, help="Number of expressions lexed by each fresh process")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh processes per configuration")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--cache", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.first, args.cache)
+        return
+
+    from src.PyDAX.DAXLexerCache import warmup
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache_path = str(Path(directory) / "PyDAXLexer.dfa")
+        states = warmup(cache_path=cache_path)
+        print(f"DFA cache: {states} states, {Path(cache_path).stat().st_size:,} bytes")
+
+        for label, path in (("cold", None), ("warm", cache_path)):
+            runs = [measure(args.first, path) for _ in range(args.runs)]
+            first_expression = statistics.median(run["latencies"][0] for run in runs)
+            total = statistics.median(sum(run["latencies"]) for run in runs)
+            load = statistics.median(run["load"] for run in runs)
+            print(f"{label}: first expression {first_expression * 1000:7.2f} ms, "
+                  f"first {args.first} expressions {total * 1000:7.2f} ms (cache load {load * 1000:.2f} ms)")
+
+
+if __name__ == "__main__":
+    main()
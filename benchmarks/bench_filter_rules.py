@@ -0,0 +1,66 @@
+"""Measures how FilterColumnValues and FilterMeasureValuesByColumns scale with the length of generated measures.
+
+Shapes, each with N filters:
+    arguments: one CALCULATE with N FILTER arguments
+    terms:     N CALCULATE terms added together, each with one FILTER argument
+    nested:    N CALCULATE calls nested in each other's first argument, each with one FILTER argument
+
+The time per token should stay flat as N grows (linear scaling).
+
+Usage (from the repository root):
+    python -m benchmarks.bench_filter_rules [--sizes 100 200 400 ...] [--repeat N]
+"""
+import argparse
+import time
+from typing import Callable
+
+from src.PyDAX import DAXExpression
+from src.PyDAX.DAXTokenBuffer import DAXTokenBuffer
+from src.PyDAX.best_practices_rules import FilterColumnValues, FilterMeasureValuesByColumns
+
+
+def arguments(size: int) -> str:
+    filters = ", ".join(f"FILTER('Sales', 'Sales'[Quantity] > {index})" if index % 2 else f"FILTER(Sales, [Total Sales] > {index})"
+                        for index in range(size))
+    return f"CALCULATE([Total Sales], {filters})"
+
+
+def terms(size: int) -> str:
+    return " + ".join(f"CALCULATE([Total Sales], FILTER('Sales', 'Sales'[Quantity] > {index}))" for index in range(size))
+
+
+def nested(size: int) -> str:
+    expression = "[Total Sales]"
+    for index in range(size):
+        expression = f"CALCULATE({expression}, FILTER(Sales, [Total Sales] > {index}))"
+    return expression
+
+
+SHAPES: dict[str, Callable[[int], str]] = {"arguments": arguments, "terms": terms, "nested": nested}
+
+
+def best_time(buffer: DAXTokenBuffer, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        FilterColumnValues().verify_violation(tokens=buffer)
+        FilterMeasureValuesByColumns().verify_violation(tokens=buffer)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 200, 400, 800], help="Number of filters of each measure")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per measure, the best is kept")
+    args = parser.parse_args()
+
+    for shape, generate in SHAPES.items():
+        for size in args.sizes:
+            buffer = DAXExpression(generate(size), analyses=(), lexer_backend="scanner").token_buffer
+            seconds = best_time(buffer, args.repeat)
+            print(f"{shape:<10} {size:>6} filters {len(buffer):>8} tokens {seconds * 1000:10.2f} ms {seconds / len(buffer) * 1e6:8.3f} us/token")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Measures the cost of importing PyDAX and of analyzing a first expression in a fresh interpreter.
+
+Each measurement runs in its own interpreter, so nothing is cached in `sys.modules`. Timing starts once the
+interpreter is up, so its start-up is not included.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_import [--runs R]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+FIRST_EXPRESSION = "VAR x = SUM(Sales[Amount]) RETURN DIVIDE(x, 2)"
+
+SCENARIOS: dict[str, str] = {
+    "import PyDAX": "import src.PyDAX",
+    "import PyDAX + first expression (scanner)": f"from src.PyDAX import DAXExpression; DAXExpression({FIRST_EXPRESSION!r}, lexer_backend='scanner')",
+    "import PyDAX + first expression (antlr)": f"from src.PyDAX import DAXExpression; DAXExpression({FIRST_EXPRESSION!r})",
+}
+
+
+def measure(code: str) -> float:
+    """Wall time in seconds of a fresh interpreter running `code`"""
+    command = [sys.executable, "-c", f"import time; _start = time.perf_counter(); {code}; print(time.perf_counter() - _start)"]
+    output = subprocess.run(command, cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    return float(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=15, help="Fresh interpreters per scenario")
+    args = parser.parse_args()
+
+    for label, code in SCENARIOS.items():
+        median = statistics.median(measure(code) for _ in range(args.runs))
+        print(f"{label:<45} {median * 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Compares the time needed to tokenize the sample expressions with each DAXExpression lexer backend.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_lexer_backends [--repeat N]
+"""
+import argparse
+import time
+from pathlib import Path
+
+from src.PyDAX import DAXExpression
+
+
+RESOURCES = Path(__file__).resolve().parent.parent / "resources"
+
+
+def tokenize_all(expressions: list[str], lexer_backend: str) -> int:
+    tokens = 0
+    for expression in expressions:
+        tokens += len(DAXExpression(expression, analyses=(), lexer_backend=lexer_backend).token_buffer)
+    return tokens
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed passes over the corpus per backend")
+    args = parser.parse_args()
+
+    expressions = [path.read_text(encoding="utf-8") for path in sorted(RESOURCES.rglob("*.txt"))]
+    timings: dict[str, float] = {}
+    for backend in DAXExpression.LEXER_BACKENDS:
+        tokens = tokenize_all(expressions, backend)  # Warm up (ANTLR builds its DFA on the first pass)
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            tokenize_all(expressions, backend)
+            best = min(best, time.perf_counter() - start)
+        timings[backend] = best
+        print(f"{backend:>8}: {best * 1000:8.1f} ms for {len(expressions)} expressions ({tokens / best:,.0f} tokens/s)")
+
+    print(f"speedup: {timings['antlr'] / timings['scanner']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Compares DAXLineage with breadth first walks over DAXModel.dependencies on synthetic models.
+
+Every measure reads a column of the data source and references one to three of the 50 previous measures, so
+measures late in the model depend on most of it. The walk answers "which physical columns does this measure depend on"
+by walking the graph once per measure. DAXLineage builds its CSR arrays and components once and answers from memoized
+bitsets. The walk is timed on a sample of measures and extrapolated to all of them.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_lineage [--sizes 5000 20000 50000 ...] [--sample N]
+"""
+import argparse
+import gc
+import random
+import time
+
+from src.PyDAX import DAXModel
+
+
+def build_model(measures: int, seed: int = 0) -> DAXModel:
+    generator = random.Random(seed)
+    model = DAXModel(lexer_backend="scanner")
+    for index in range(measures):
+        referenced = "".join(f" + [Measure {index - generator.randint(1, 50)}]" for _ in range(min(index, 50) and generator.randint(1, 3)))
+        model.add_measure("Sales", f"Measure {index}", f"SUM('Source {index % 100}'[Column {index % 1000}]){referenced}")
+    return model
+
+
+def walk_columns(model: DAXModel, artifact) -> set[tuple[str, str]]:
+    """Physical columns of `artifact` found with a walk of DAXModel.dependencies, as done before DAXLineage"""
+    columns = set()
+    for source in [artifact, *model.dependencies(artifact, transitive=True)]:
+        for reference in source.expression.table_column_references:
+            if reference.table_name and model._resolve_column(source, reference) is None:
+                columns.add((reference.table_name, reference.artifact_name))
+    return columns
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5000, 20000], help="Number of measures of each model")
+    parser.add_argument("--sample", type=int, default=100, help="Measures walked to extrapolate the walk")
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        model = build_model(size)
+        model._graph()  # Analysis and graph are shared by both
+        gc.collect()
+        sample = random.Random(1).sample(model.artifacts, min(args.sample, size))
+
+        start = time.perf_counter()
+        for artifact in sample:
+            walk_columns(model, artifact)
+        walk = (time.perf_counter() - start) / len(sample)
+
+        start = time.perf_counter()
+        lineage = model.lineage
+        built = time.perf_counter()
+        for artifact in model.artifacts:
+            lineage.physical_columns(artifact)
+        queried = time.perf_counter()
+        for artifact in sample:
+            assert set(lineage.physical_columns(artifact)) == walk_columns(model, artifact)
+
+        print(
+            f"{size:>6} measures: walk {walk * 1000:8.2f} ms/measure (~{walk * size:7.1f} s for all)"
+            f"   lineage build {(built - start) * 1000:8.1f} ms, all measures {(queried - built):6.2f} s"
+            f" ({(queried - built) / size * 1000:6.3f} ms/measure)"
+        )
+
+
+if __name__ == "__main__":
+    main()
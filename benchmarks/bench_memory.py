@@ -0,0 +1,80 @@
+"""Measures the memory kept per analyzed expression, and the size of the objects an analysis creates.
+
+The resources corpus is repeated `--copies` times and every expression is analyzed (tokens, comments, references and
+best practice rules) and kept alive. tracemalloc reports the memory held once they are all analyzed, divided by the
+number of expressions. The tokens of every reference and violation are materialized as well, as an application
+highlighting them would, which is where DAXToken instances pile up.
+
+The second table is the size of one instance of each class: the object plus its __dict__ when it has one. Run it on
+two revisions to compare them, e.g. before and after a change to the classes.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_memory [--copies N] [--lexer-backend scanner]
+"""
+import argparse
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+from src.PyDAX import DAXExpression
+
+RESOURCES = Path(__file__).resolve().parent.parent / "resources"
+
+
+def materialize_tokens(expression: DAXExpression) -> list:
+    """DAXToken objects of the references and violations of an expression"""
+    tokens = []
+    for name in DAXExpression.REFERENCE_ATTRIBUTES:
+        for reference in getattr(expression, name):
+            tokens.extend(getattr(reference, attribute) for attribute in ("artifact_token", "token") if hasattr(reference, attribute))
+    for rule in expression.best_practice_rules:
+        tokens.extend(rule.violators_tokens)
+    return tokens
+
+
+def instance_size(instance: object) -> int:
+    size = sys.getsizeof(instance)
+    if hasattr(instance, "__dict__"):
+        size += sys.getsizeof(instance.__dict__)
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--copies", type=int, default=20, help="Times the resources corpus is repeated")
+    parser.add_argument("--lexer-backend", default="scanner", choices=DAXExpression.LEXER_BACKENDS)
+    args = parser.parse_args()
+
+    corpus = [path.read_text(encoding="utf-8") for path in sorted(RESOURCES.rglob("*.txt"))] * args.copies
+    DAXExpression(corpus[0], lexer_backend=args.lexer_backend)  # Imports and lexer tables outside the measure
+
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    expressions = [DAXExpression(text, lexer_backend=args.lexer_backend) for text in corpus]
+    analyzed = tracemalloc.get_traced_memory()[0]
+    tokens = [materialize_tokens(expression) for expression in expressions]
+    materialized = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    count = len(expressions)
+    token_count = sum(map(len, tokens))
+    print(f"{count} expressions, {sum(map(len, corpus)) / count:.0f} characters on average")
+    print(f"analyzed                 {(analyzed - baseline) / count:10.0f} bytes/expression")
+    print(f"with materialized tokens {(materialized - baseline) / count:10.0f} bytes/expression ({token_count / count:.1f} tokens)")
+
+    print("\nbytes per instance")
+    sample = next(expression for expression in expressions if expression.table_column_references and expression.variables)
+    instances = {
+        "DAXToken": sample.table_column_references[0].artifact_token,
+        "DAXArtifactReference": sample.table_column_references[0],
+        "DAXVariable": sample.variables[0],
+        "BestPracticeRule": sample.best_practice_rules[0],
+    }
+    for name, instance in instances.items():
+        print(f"{name:<22} {instance_size(instance):6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Checks that DAXBimReader and DAXTmdlReader stream: the peak memory stays flat while the model grows.
+
+Generates models of N tables, each with measures, columns, annotations and a relationship, writes them as a model.bim
+file and as a TMDL folder, and reads the artifacts back. The peak traced memory should not depend on N and the time per
+megabyte should stay flat (linear scaling).
+
+Usage (from the repository root):
+    python -m benchmarks.bench_model_reader [--sizes 100 1000 ...] [--measures N]
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from src.PyDAX import DAXBimReader, DAXTmdlReader
+
+
+def table(index: int, measures: int) -> dict:
+    return {
+        "name": f"Table {index}",
+        "columns": [
+            {"name": "Amount", "dataType": "decimal", "sourceColumn": "Amount", "annotations": [{"name": "SummarizationSetBy", "value": "Automatic"}]},
+            {"name": "Double", "type": "calculated", "dataType": "decimal", "expression": f"'Table {index}'[Amount] * 2"},
+        ],
+        "partitions": [{"name": f"Table {index}", "source": {"type": "m", "expression": ["let", "    Source = #table({}, {})", "in", "    Source"]}}],
+        "measures": [
+            {
+                "name": f"Measure {index}.{measure}",
+                "expression": ["VAR total = SUM ( 'Table {index}'[Amount] )", f"RETURN DIVIDE ( total, {measure + 1} )"],
+                "formatString": "0.00",
+                "annotations": [{"name": "PBI_FormatHint", "value": "{\"isDecimal\":true}"}],
+            }
+            for measure in range(measures)
+        ],
+    }
+
+
+def write_bim(path: str, tables: int, measures: int) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        file.write('{"name": "Model", "compatibilityLevel": 1702, "model": {"tables": [')
+        for index in range(tables):
+            file.write((", " if index else "") + json.dumps(table(index, measures), indent=2))
+        file.write('], "relationships": [], "annotations": []}}')
+
+
+def write_tmdl(folder: str, tables: int, measures: int) -> None:
+    os.makedirs(os.path.join(folder, "tables"))
+    for index in range(tables):
+        with open(os.path.join(folder, "tables", f"Table {index}.tmdl"), "w", encoding="utf-8") as file:
+            file.write(f"table 'Table {index}'\n\n\tcolumn Amount\n\t\tdataType: decimal\n\n")
+            file.write(f"\tcolumn Double = 'Table {index}'[Amount] * 2\n\t\tdataType: decimal\n\n")
+            for measure in range(measures):
+                file.write(
+                    f"\tmeasure 'Measure {index}.{measure}' =\n\t\t\tVAR total = SUM ( 'Table {index}'[Amount] )\n"
+                    f"\t\t\tRETURN DIVIDE ( total, {measure + 1} )\n\t\tformatString: 0.00\n\n"
+                )
+
+
+def size(path: str) -> int:
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(directory, name)) for directory, _, names in os.walk(path) for name in names)
+
+
+def measure(reader) -> tuple[int, float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = sum(1 for _ in reader)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000], help="Number of tables of each model")
+    parser.add_argument("--measures", type=int, default=20, help="Measures per table")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for tables in args.sizes:
+            bim, tmdl = os.path.join(directory, f"model_{tables}.bim"), os.path.join(directory, f"definition_{tables}")
+            write_bim(bim, tables, args.measures)
+            write_tmdl(tmdl, tables, args.measures)
+            for name, path, reader in (("bim", bim, DAXBimReader(bim)), ("tmdl", tmdl, DAXTmdlReader(tmdl))):
+                count, elapsed, peak = measure(reader)
+                megabytes = size(path) / 1e6
+                print(
+                    f"{name:>4} {tables:>6} tables {megabytes:8.2f} MB {count:>8} artifacts {elapsed:7.2f} s"
+                    f" {elapsed / megabytes:6.2f} s/MB   peak memory {peak / 1e6:6.2f} MB"
+                )
+
+
+if __name__ == "__main__":
+    main()
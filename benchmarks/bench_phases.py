@@ -0,0 +1,157 @@
+"""Times each analysis phase over the resources corpus and compares the timings with a stored baseline.
+
+Phases: lexing, remove_comments, extract_comments, extract_references, the verify_violation of every best practice
+rule, verify_best_practices (all rules at once), generate_html and generate_html_with_violations. Every phase except
+lexing runs on expressions that are already lexed, so each timing only covers its own phase. Each phase is timed
+`--repeat` times over enough passes to last at least `--min-time` seconds, and the best time per pass is kept.
+
+Every phase is compared with the baseline relative to a fixed pure Python calibration workload timed in the same run,
+which absorbs most of the difference between machines and between quiet and busy runs. The baseline should still
+be produced on the machine that checks it:
+    python -m benchmarks.bench_phases --save-baseline               # Store the current timings as the baseline
+    python -m benchmarks.bench_phases --threshold 0.25              # Exit with status 1 if a phase is >25% slower
+
+Usage (from the repository root):
+    python -m benchmarks.bench_phases [--repeat N] [--min-time SECONDS] [--lexer-backend antlr|scanner] [--baseline PATH]
+        [--threshold FRACTION] [--save-baseline]
+"""
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+from src.PyDAX import DAXExpression
+
+
+ROOT = Path(__file__).resolve().parent.parent
+CORPUS_DIRS = (ROOT / "resources" / "sample_dax_expressions", ROOT / "resources" / "best_practices_violators")
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baselines" / "phases.json"
+
+
+def load_corpus() -> list[str]:
+    return [path.read_text(encoding="utf-8") for directory in CORPUS_DIRS for path in sorted(directory.glob("*.txt"))]
+
+
+def lexed(corpus: list[str], lexer_backend: str) -> list[DAXExpression]:
+    expressions = [DAXExpression(text, analyses=(), lexer_backend=lexer_backend) for text in corpus]
+    for expression in expressions:
+        expression.token_buffer
+    return expressions
+
+
+def phases(corpus: list[str], lexer_backend: str) -> dict[str, Callable[[], None]]:
+    """Phase name -> function running the phase once over the whole corpus"""
+    expressions = lexed(corpus, lexer_backend)
+    verified = lexed(corpus, lexer_backend)
+    for expression in verified:
+        expression.verify_best_practices()
+
+    def run_rule(name: str) -> Callable[[], None]:
+        rule_class = DAXExpression.rule_class(name)
+
+        def verify() -> None:
+            for expression in expressions:
+                rule_class().verify_violation(tokens=expression.token_buffer)
+        return verify
+
+    result: dict[str, Callable[[], None]] = {
+        "lexing": lambda: lexed(corpus, lexer_backend),
+        "remove_comments": lambda: [expression.remove_comments() for expression in expressions],
+        "extract_comments": lambda: [expression.extract_comments() for expression in expressions],
+        "extract_references": lambda: [expression.analyze_references() for expression in expressions],
+    }
+    for name in DAXExpression.BEST_PRACTICE_RULES:
+        result[f"rule:{name}"] = run_rule(name)
+    result["verify_best_practices"] = lambda: [expression.verify_best_practices() for expression in expressions]
+    result["generate_html"] = lambda: [expression.generate_html() for expression in verified]
+    result["generate_html_with_violations"] = lambda: [expression.generate_html_with_violations() for expression in verified]
+    return result
+
+
+def best_time(run: Callable[[], None], repeat: int, min_time: float) -> float:
+    """Best time in seconds of one call of `run`, timed in batches of calls lasting at least `min_time`"""
+    start = time.perf_counter()
+    run()  # Warm up (the ANTLR lexer builds its DFA on the first pass)
+    number = max(1, math.ceil(min_time / max(time.perf_counter() - start, 1e-9)))
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def measure(corpus: list[str], lexer_backend: str, repeat: int, min_time: float) -> dict[str, float]:
+    """Best time in seconds of one pass over the corpus, by phase"""
+    return {name: best_time(run, repeat, min_time) for name, run in phases(corpus, lexer_backend).items()}
+
+
+def calibration(repeat: int, min_time: float) -> float:
+    """Best time in seconds of a fixed pure Python workload, the unit phases are compared in"""
+    def workload() -> None:
+        counts: dict[str, int] = {}
+        for index in range(20_000):
+            key = str(index % 1000)
+            counts[key] = counts.get(key, 0) + len(key)
+        sorted(counts.items(), key=lambda item: item[1])
+
+    return best_time(workload, repeat, min_time)
+
+
+def slowdowns(timings: dict[str, float], unit: float, baseline: dict[str, float], baseline_unit: float) -> dict[str, float]:
+    """Slowdown of every phase against the baseline (0.25 is 25% slower), each side relative to its calibration unit"""
+    return {name: (timings[name] / unit) / (baseline[name] / baseline_unit) - 1 for name in timings if baseline.get(name)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed passes over the corpus per phase")
+    parser.add_argument("--min-time", type=float, default=0.1, help="Minimum duration in seconds of each timed batch")
+    parser.add_argument("--lexer-backend", default="antlr", choices=DAXExpression.LEXER_BACKENDS)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline file to compare with or to save")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown per phase, as a fraction of the baseline")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the timings as the new baseline instead of comparing")
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    tokens = sum(len(expression.token_buffer) for expression in lexed(corpus, args.lexer_backend))
+    unit = calibration(args.repeat, args.min_time)
+    timings = measure(corpus, args.lexer_backend, args.repeat, args.min_time)
+    unit = min(unit, calibration(args.repeat, args.min_time))  # Calibrated before and after, the quietest run is kept
+
+    stored = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline.is_file() else {}
+    baseline: dict[str, float] = stored.get("timings", {}).get(args.lexer_backend, {})
+    versus = slowdowns(timings, unit, baseline, stored["calibration"]) if baseline else {}
+
+    print(f"{len(corpus)} expressions, {tokens} tokens, lexer backend '{args.lexer_backend}', calibration {unit * 1000:.2f} ms")
+    for name, seconds in timings.items():
+        change = f"{versus[name]:+7.1%}" if name in versus else "    new"
+        print(f"{name:<70} {seconds * 1000:8.2f} ms {len(corpus) / seconds:>10,.0f} expr/s {tokens / seconds:>12,.0f} tokens/s {change}")
+
+    if args.save_baseline:
+        if "calibration" in stored:
+            # Keep every backend in the unit of the stored calibration
+            timings = {name: seconds * stored["calibration"] / unit for name, seconds in timings.items()}
+        else:
+            stored["calibration"] = unit
+        stored.setdefault("timings", {})[args.lexer_backend] = timings
+        stored["machine"] = {"python": platform.python_version(), "platform": platform.platform(), "processor": platform.processor()}
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(stored, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline saved to {args.baseline}")
+        return
+
+    regressed = {name: slowdown for name, slowdown in versus.items() if slowdown > args.threshold}
+    for name, slowdown in regressed.items():
+        print(f"REGRESSION: {name} is {slowdown:.1%} slower than the baseline (threshold {args.threshold:.0%})")
+    if regressed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Measures how extract_references scales with the number of variables and references of generated calculated tables.
+
+Each table declares N variables, each one filtering the previous and referencing a few columns, and returns the last:
+the shape of large calculated tables with hundreds of VARs. The time per token should stay flat as N grows (linear
+scaling). The lookups through DAXExpression.reference_index are timed separately.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_references [--sizes 100 200 400 ...] [--repeat N]
+"""
+import argparse
+import time
+
+from src.PyDAX import DAXExpression
+
+
+def calculated_table(size: int) -> str:
+    variables = ["VAR t0 = Sales"]
+    for index in range(1, size):
+        variables.append(
+            f"VAR t{index} = FILTER(t{index - 1}, Sales[Quantity] > {index} && 'Product'[Color] <> \"c{index}\" || [Total Sales] > 0)"
+        )
+    return "\n".join(variables) + f"\nRETURN t{size - 1}"
+
+
+def best_time(expression: DAXExpression, repeat: int) -> tuple[float, float]:
+    best_extraction = best_lookups = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        expression.analyze_references()
+        extracted = time.perf_counter()
+        index = expression.reference_index
+        for reference in expression.table_column_references:
+            index.count(reference.table_name, reference.artifact_name)
+        best_extraction = min(best_extraction, extracted - start)
+        best_lookups = min(best_lookups, time.perf_counter() - extracted)
+    return best_extraction, best_lookups
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 200, 400, 800], help="Number of variables of each table")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per table, the best is kept")
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        expression = DAXExpression(calculated_table(size), analyses=(), lexer_backend="scanner")
+        tokens = len(expression.token_buffer)
+        extraction, lookups = best_time(expression, args.repeat)
+        print(
+            f"{size:>6} variables {tokens:>8} tokens extraction {extraction * 1000:9.2f} ms {extraction / tokens * 1e6:7.3f} us/token"
+            f"   index + lookups {lookups * 1000:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
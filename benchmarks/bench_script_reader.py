@@ -0,0 +1,53 @@
+"""Checks that DAXScriptReader streams: the peak memory stays flat while the script grows.
+
+Generates DEFINE scripts of N measures (each a VAR block over a few columns) followed by an EVALUATE query, writes them
+to a temporary file and reads them back definition by definition. The peak traced memory should not depend on N, and
+the time per definition should stay flat (linear scaling).
+
+Usage (from the repository root):
+    python -m benchmarks.bench_script_reader [--sizes 1000 10000 ...] [--chunk-size N]
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from src.PyDAX import DAXScriptReader
+
+
+def script(size: int) -> str:
+    measures = [
+        f"    MEASURE Sales[m{index}] =\n        VAR amount = SUM ( Sales[Amount] ) * {index}\n"
+        f"        RETURN DIVIDE ( amount, CALCULATE ( [Total], ALL ( 'Date' ) ) ) // measure {index}"
+        for index in range(size)
+    ]
+    return "DEFINE\n" + "\n".join(measures) + "\nEVALUATE\n    SUMMARIZECOLUMNS ( 'Date'[Year], \"m0\", [m0] )\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000], help="Number of measures of each script")
+    parser.add_argument("--chunk-size", type=int, default=1 << 16, help="Characters read at once")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            path = os.path.join(directory, f"script_{size}.dax")
+            with open(path, "w", encoding="utf-8", newline="") as file:
+                file.write(script(size))
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            count = sum(1 for _ in DAXScriptReader(path, chunk_size=args.chunk_size))
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(
+                f"{size:>7} measures {os.path.getsize(path) / 1e6:8.2f} MB {count:>7} definitions {elapsed:7.2f} s"
+                f" {elapsed / count * 1e6:7.1f} us/definition   peak memory {peak / 1e6:6.2f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
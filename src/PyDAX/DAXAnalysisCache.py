@@ -0,0 +1,90 @@
+import hashlib
+from collections import OrderedDict
+from typing import Any, Iterable, NamedTuple
+
+_DISTRIBUTION: str = "PyDAXLexer"
+_version: str | None = None
+
+
+def _library_version() -> str:
+    """Installed version of the library, read once. Reading package metadata is slow, so it is not done at import."""
+    global _version
+    if _version is None:
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            _version = version(_DISTRIBUTION)
+        except PackageNotFoundError:
+            _version = "0+unknown"  # Source checkout
+    return _version
+
+
+class DAXCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class DAXAnalysisCache:
+    """Bounded LRU cache of analysis results, shared by DAXExpression objects analyzing the same text.
+
+    Entries are keyed by a digest of the expression text, the enabled rules, whether rules are verified and the library
+    version. An entry holds the token buffer, the comment and reference analyses and the rule objects of the expression
+    that computed them. Expressions served from the cache share those objects instead of lexing and analyzing again,
+    so they must be treated as read-only. References and variables are the exception: interning them for a model
+    changes them, so the entry and every expression served from it hold copies (see DAXExpression._own_references).
+    """
+
+    def __init__(self, maxsize: int = 1024, version: str | None = None) -> None:
+        """
+        Args:
+            maxsize (int): Number of distinct expressions kept, the least recently used one is dropped first
+            version (str | None): Version mixed into the keys. Defaults to the installed version of the library.
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        self.maxsize: int = maxsize
+        self.version: str = _library_version() if version is None else version
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: "OrderedDict[bytes, dict[str, Any]]" = OrderedDict()
+
+    def key(self, dax_expression: str, rule_attributes: Iterable[str], verify_rules: bool) -> bytes:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{self.version}\0{int(verify_rules)}\0{','.join(rule_attributes)}\0".encode())
+        digest.update(dax_expression.encode("utf-8", "surrogatepass"))
+        return digest.digest()
+
+    def get(self, key: bytes) -> dict[str, Any] | None:
+        """Analysis state stored under `key`, counted as a hit or a miss"""
+        state = self._entries.get(key)
+        if state is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return state
+
+    def put(self, key: bytes, state: dict[str, Any]) -> None:
+        """Stores analysis state under `key`, adding to what is already stored for it"""
+        if key in self._entries:
+            self._entries[key].update(state)
+            self._entries.move_to_end(key)
+            return
+        self._entries[key] = dict(state)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def __contains__(self, key: bytes) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def cache_info(self) -> DAXCacheInfo:
+        return DAXCacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = self.misses = 0
@@ -0,0 +1,87 @@
+from typing import Any, TYPE_CHECKING
+
+from .DAXReference import DAXArtifactReference, DAXRelationshipReference
+from .DAXToken import token_start
+
+if TYPE_CHECKING:
+    from .DAXExpression import DAXExpression
+    from .DAXTimings import DAXTimings
+
+
+def _compact_reference(reference: Any) -> tuple:
+    """Plain tuple of a reference or variable: its names, then the offset of its token in the expression"""
+    if isinstance(reference, DAXArtifactReference):
+        return reference.table_name, reference.artifact_name, token_start(reference._artifact_token, reference._tokens)
+    if isinstance(reference, DAXRelationshipReference):
+        return (reference.table1, reference.column1, reference.table2, reference.column2,
+                token_start(reference._token_userelationship, reference._tokens))
+    return reference.name, token_start(reference._token, reference._tokens)
+
+
+class DAXAnalysisResult:
+    """Outcome of analyzing one expression of a batch (see DAXExpression.analyze_many).
+
+    Results only carry plain values, so they stay small to pickle between processes:
+    - `comments`: the comments of the expression
+    - `references`: for each attribute of DAXExpression.REFERENCE_ATTRIBUTES, one tuple per reference or variable.
+      (table, column or measure, offset) for table_column_references, (table1, column1, table2, column2, offset) for
+      relationship_references and (name, offset) for the others
+    - `violations`: rule ID -> offsets of the violating tokens, for every verified rule
+
+    Offsets are positions in the expression, in characters. An analysis that did not run (see the `analyses` argument of
+    DAXExpression) is None. With keep_expressions=True, `expression` is the analyzed DAXExpression as well. When the
+    analysis raised, `error` is set and nothing else is.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        expression: "DAXExpression | None" = None,
+        error: str | None = None,
+        comments: list[str] | None = None,
+        references: dict[str, list[tuple]] | None = None,
+        violations: dict[str, list[int]] | None = None,
+        timings: "DAXTimings | None" = None,
+    ) -> None:
+        self.index: int = index
+        self.expression: "DAXExpression | None" = expression
+        self.error: str | None = error
+        self.comments: list[str] | None = comments
+        self.references: dict[str, list[tuple]] | None = references
+        self.violations: dict[str, list[int]] | None = violations
+        self.timings: "DAXTimings | None" = timings  # Phase timings, when analyzed with collect_timings=True
+
+    @classmethod
+    def from_expression(cls, index: int, expression: "DAXExpression", keep_expression: bool = False) -> "DAXAnalysisResult":
+        """Result of the analyses `expression` computed, without computing any other"""
+        computed = expression.__dict__
+        comments = computed.get("comments")
+        references = None
+        if all(name in computed for name in expression.REFERENCE_ATTRIBUTES):
+            references = {name: [_compact_reference(reference) for reference in computed[name]] for name in expression.REFERENCE_ATTRIBUTES}
+        violations = None
+        rules = [computed[name] for name in expression.rule_attributes if name in computed]
+        if rules and all(rule.verified for rule in rules):
+            violations = {rule.id: [token_start(index, rule.tokens) for index in rule.violators_indexes] for rule in rules}
+        return cls(
+            index,
+            expression=expression if keep_expression else None,
+            comments=list(comments) if comments is not None else None,
+            references=references,
+            violations=violations,
+            timings=expression.timings,
+        )
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def number_of_violations(self) -> int:
+        """Violations found by the verified rules, 0 when the rules did not run"""
+        return sum(map(len, self.violations.values())) if self.violations else 0
+
+    def __repr__(self) -> str:
+        if self.ok:
+            return f"DAXAnalysisResult(index={self.index}, ok=True)"
+        return f"DAXAnalysisResult(index={self.index}, error={self.error!r})"
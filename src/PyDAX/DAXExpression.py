@@ -1,61 +1,203 @@
-from antlr4 import *
-from typing import  Any
+from typing import  Any, Iterable, TYPE_CHECKING
+import copy
+import functools
 import html
+import math
+import os
+import time
 import warnings
 
-from .PyDAXLexer import PyDAXLexer
+from .DAXTokenTypes import DAXTokenTypes
+from .DAXTokenBuffer import DAXTokenBuffer
+from .DAXScanner import DAXScanner
 from .DAXReference import *
 from .DAXVariable import DAXVariable
-from .utils import check_contains_function
-from .best_practices_rules import *
+from .DAXReferenceIndex import DAXReferenceIndex
+from .DAXAnalysisResult import DAXAnalysisResult
+from .DAXTimings import DAXTimings
+from .DAXAnalysisCache import DAXAnalysisCache
+from .best_practices_rules import RULE_REGISTRY, _BUILT_IN_RULES
+from .best_practices_rules.best_practice_rule import BestPracticeRule
+from .best_practices_rules.rule_engine import RuleEngine
+
+if TYPE_CHECKING:
+    from antlr4 import InputStream
+    from .PyDAXLexer import PyDAXLexer
+    from .DAXSyntaxTree import DAXSyntaxTree
+    from .DAXNameTable import DAXNameTable
+
+
+def _timed(phase: str):
+    """Records the wall time of the decorated analysis method in DAXExpression.timings, when timings are collected"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self: "DAXExpression", *args, **kwargs):
+            timings = self.timings
+            if timings is None:
+                return method(self, *args, **kwargs)
+            tokens = len(self.token_buffer)  # Lexing is a phase of its own
+            start = time.perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                timings.record(phase, time.perf_counter() - start, tokens)
+        return wrapper
+    return decorator
+
 
 class DAXExpression:
     
-    def __init__(self, dax_expression: str, verify_best_practices: bool = True) -> None:
+    #* Analyses that can be requested up front; whatever is not requested is computed on first access and cached
+    ANALYSES: tuple[str, ...] = ("comments", "references", "best_practices")
+    
+    #* Attributes filled by each lazy analysis (see __getattr__)
+    COMMENT_ATTRIBUTES: tuple[str, ...] = ("dax_expression_no_comments", "comments", "clean_dax_expression")
+    REFERENCE_ATTRIBUTES: tuple[str, ...] = (
+        "variables",
+        "table_column_references",
+        "table_references",
+        "variable_references",
+        "function_references",
+        "relationship_references",
+        "unknown_references",
+    )
+    #* Built-in rule attribute -> rule class name in best_practices_rules. The rules an expression verifies come from
+    #* RULE_REGISTRY (see rule_attributes), rule modules are only imported once their rule is used
+    BEST_PRACTICE_RULES: dict[str, str] = {attribute: class_name for _, attribute, class_name in _BUILT_IN_RULES}
+    
+    #* Tokenizers that can fill the token buffer: the generated ANTLR lexer or the equivalent DAXScanner
+    LEXER_BACKENDS: tuple[str, ...] = ("antlr", "scanner")
+    
+    #* Class level defaults so unpickled expressions from previous versions behave like the default arguments
+    _verify_rules: bool = True
+    _lexer_backend: str = "antlr"
+    _rule_attributes: tuple[str, ...] | None = None  # Every registered rule, for pickles without a selection
+    _best_practice_rules: list[BestPracticeRule] | None = None
+    _reference_index: DAXReferenceIndex | None = None  # Built on first access, see reference_index
+    timings: DAXTimings | None = None  # Only collected on request, see collect_timings
+    
+    def __init__(
+        self,
+        dax_expression: str,
+        verify_best_practices: bool = True,
+        analyses: Iterable[str] | None = None,
+        lexer_backend: str = "antlr",
+        rules: Iterable[str] | None = None,
+        disabled_rules: Iterable[str] = (),
+        collect_timings: bool = False,
+        cache: DAXAnalysisCache | None = None,
+    ) -> None:
+        """
+        Args:
+            dax_expression (str): The DAX expression to analyze
+            verify_best_practices (bool): Whether best practice rules are verified (up front or on first access)
+            analyses (Iterable[str] | None): Analyses from DAXExpression.ANALYSES to run up front. Defaults to all of them.
+                Any other analysis is computed the first time one of its attributes is accessed.
+            lexer_backend (str): Tokenizer from DAXExpression.LEXER_BACKENDS. "scanner" produces the same tokens as
+                the ANTLR lexer ("antlr") several times faster.
+            rules (Iterable[str] | None): IDs or categories of the rules to verify (see RULE_REGISTRY). Defaults to every
+                registered rule. Rules left out are neither instantiated nor verified.
+            disabled_rules (Iterable[str]): IDs or categories of rules not to verify, applied after `rules`
+            collect_timings (bool): Whether the wall time and token count of each phase (lexing, comments, references,
+                each rule and HTML generation) are recorded in `timings`. Disabled, `timings` stays None.
+            cache (DAXAnalysisCache | None): Cache of analysis results. An expression already analyzed with the same
+                rules reuses its tokens and results instead of lexing again, see DAXAnalysisCache.
+        """
         
         dax_expression = "" if not isinstance(dax_expression, str) else dax_expression
         self.dax_expression: str = dax_expression
         
         #Lazy initialization of lexer and input stream
-        self._input_stream: InputStream = InputStream(dax_expression)
-        self._lexer: PyDAXLexer = PyDAXLexer(self._input_stream)
-        self._lexer.removeErrorListeners()
+        self._input_stream: "InputStream | None" = None
+        self._lexer: "PyDAXLexer | None" = None
+        self._token_buffer: DAXTokenBuffer | None = None
         
-        self.dax_expression_no_comments: str = self.remove_comments()
+        if collect_timings:
+            self.timings = DAXTimings()
         
-        #*Variables
-        self.variables: list[DAXVariable] = []
+        if lexer_backend not in self.LEXER_BACKENDS:
+            raise ValueError(f"Unknown lexer backend '{lexer_backend}', expected any of {self.LEXER_BACKENDS}")
+        self._lexer_backend = lexer_backend
         
-        #*References - Expression uses columns, measures, udfs, tables, etc
-        self.table_column_references: list[DAXArtifactReference] = []
+        self._verify_rules = verify_best_practices
+        #* Fixed here: rules registered later are not verified by this expression
+        self._rule_attributes = RULE_REGISTRY.select(rules, disabled_rules)
+        self.best_practice_attributes_initialized: bool = False
         
-        self.table_references: list[DAXTableReference] = [] #register standalone table references
-        self.variable_references: list[DAXVariableReference] = [] #register standalone variable references
-        self.function_references: list[DAXFunctionReference] = [] #register standalone function references
-        self.relationship_references: list[DAXRelationshipReference] = [] #register standalone relationship references
-        self.unknown_references: list[DAXUnknownReference] = [] #register unknown references, basically a fallback for the others
+        analyses = self.ANALYSES if analyses is None else tuple(analyses)
+        unknown_analyses = [analysis for analysis in analyses if analysis not in self.ANALYSES]
+        if unknown_analyses:
+            raise ValueError(f"Unknown analyses {unknown_analyses}, expected any of {self.ANALYSES}")
         
-        self.extract_references() #Populkate references
+        cache_key: bytes | None = None
+        if cache is not None:
+            cache_key = cache.key(dax_expression, self.rule_attributes, verify_best_practices)
+            cached_state = cache.get(cache_key)
+            if cached_state is not None:
+                self.__dict__.update(self._own_references(cached_state))
         
-        self.comments: list[str] = self.extract_comments()
-        self.clean_dax_expression: str = self.clean_expression()
+        if "comments" in analyses and not all(name in self.__dict__ for name in self.COMMENT_ATTRIBUTES):
+            self.analyze_comments()
         
-        # Initialize best practice rules
-        self.best_practice_attributes_initialized: bool = False
-        self.init_best_practices_rules()
-
-        if verify_best_practices:
-            self.verify_best_practices()
+        if "references" in analyses and not all(name in self.__dict__ for name in self.REFERENCE_ATTRIBUTES):
+            self.analyze_references()
+        
+        if "best_practices" in analyses and not self.best_practice_attributes_initialized:
+            # Initialize best practice rules
+            self.init_best_practices_rules()
+            if verify_best_practices:
+                self.verify_best_practices()
+        
+        if cache_key is not None:
+            state = self._analysis_state()
+            if state:
+                cache.put(cache_key, state)
             
+    def __getattr__(self, name: str) -> Any:
+        #* Only called for attributes that are not set yet: runs the lazy analysis that produces them
+        if name in DAXExpression.COMMENT_ATTRIBUTES:
+            self.analyze_comments()
+        elif name in DAXExpression.REFERENCE_ATTRIBUTES:
+            self.analyze_references()
+        elif name in self.rule_attributes:
+            self._init_best_practice_rule(name, verify=self._verify_rules)
+        else:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        return self.__dict__[name]
 
     def __str__(self) -> str:
         return self.dax_expression
     
+    def _analysis_state(self) -> dict[str, Any]:
+        """Computed analyses, which any expression of the same text and rules can share (see DAXAnalysisCache)"""
+        names = (*self.COMMENT_ATTRIBUTES, *self.REFERENCE_ATTRIBUTES, *self.rule_attributes)
+        state = {name: self.__dict__[name] for name in names if name in self.__dict__}
+        if self._token_buffer is not None:
+            state["_token_buffer"] = self._token_buffer
+        if self.best_practice_attributes_initialized:
+            state["best_practice_attributes_initialized"] = True
+        return self._own_references(state)
+    
+    @classmethod
+    def _own_references(cls, state: dict[str, Any]) -> dict[str, Any]:
+        """`state` with copies of its reference lists and of the references and variables in them.
+
+        intern_names and DAXModel change references in place, so neither a cache entry nor the expressions served from
+        it share them. The copies are not interned. Everything else in `state` is shared.
+        """
+        state = state.copy()
+        for name in cls.REFERENCE_ATTRIBUTES:
+            if name in state:
+                state[name] = [copy.copy(reference) for reference in state[name]]
+        return state
+    
     def __getstate__(self):
         state = self.__dict__.copy()
         # Handle attributes that can't be pickled
         state["_input_stream"] = None 
         state["_lexer"] = None
+        state.pop("_best_practice_rules", None)
+        state.pop("_reference_index", None)  # Rebuilt from the reference lists
         
         return state
 
@@ -70,23 +212,28 @@ class DAXExpression:
         if not "_lexer" in state:
             state["_lexer"] = None
         
-        if 'variables' not in state:
-            state['variables'] = []
+        #* Versions without a token buffer computed every analysis up front. Newer pickles may lack
+        #* lazy attributes on purpose, those are computed on first access instead of being defaulted here
+        if not "_token_buffer" in state:
+            state["_token_buffer"] = None
         
-        if 'table_references' not in state:
-            state['table_references'] = []
-        
-        if 'variable_references' not in state:
-            state['variable_references'] = []
-        
-        if 'function_references' not in state:
-            state['function_references'] = []
+            if 'variables' not in state:
+                state['variables'] = []
             
-        if 'relationship_references' not in state:
-            state['relationship_references'] = []
+            if 'table_references' not in state:
+                state['table_references'] = []
             
-        if 'unknown_references' not in state:
-            state['unknown_references'] = []
+            if 'variable_references' not in state:
+                state['variable_references'] = []
+            
+            if 'function_references' not in state:
+                state['function_references'] = []
+                
+            if 'relationship_references' not in state:
+                state['relationship_references'] = []
+                
+            if 'unknown_references' not in state:
+                state['unknown_references'] = []
         
         
         #Handles the change from tuples to DAXrefrence objects from past versions
@@ -105,14 +252,8 @@ class DAXExpression:
         
         if not 'best_practice_attributes_initialized' in state:
             state['best_practice_attributes_initialized'] = False
-            state['use_divide_function_for_division'] = UseDivide()
-            state['avoid_using_iferror_function'] = AvoidIfError()
-            state['use_the_treatas_function_instead_of_intersect'] = UseTreatasInsteadOfIntersect()
-            state['filter_column_values'] = FilterColumnValues()
-            state['filter_measure_values_by_columns'] = FilterMeasureValuesByColumns()
-            state['unused_variables'] = UnusedVariables()
-            state['avoid_using_1_x_y_syntax'] = AvoidOneMinusDivision()
-            state['evaluateandlog_should_not_be_used_in_production_models'] = EvaluateAndLogShouldNotBeUsedInProductionModels()
+            for name in DAXExpression.BEST_PRACTICE_RULES:
+                state[name] = DAXExpression.rule_class(name)()
             verify_rules = True
         
         
@@ -124,19 +265,19 @@ class DAXExpression:
         if extract_references:
             self.extract_references()
     
+    @property
+    def rule_attributes(self) -> tuple[str, ...]:
+        """Attributes of the rules this expression verifies"""
+        if self._rule_attributes is None:
+            return RULE_REGISTRY.select()
+        return self._rule_attributes
+    
     @property
     def best_practice_rules(self) -> list[BestPracticeRule]:
-        """Returns a list of all available best practice rules"""
-        return [
-            self.use_divide_function_for_division,
-            self.avoid_using_iferror_function,
-            self.use_the_treatas_function_instead_of_intersect,
-            self.filter_column_values,
-            self.filter_measure_values_by_columns,
-            self.unused_variables,
-            self.avoid_using_1_x_y_syntax,
-            self.evaluateandlog_should_not_be_used_in_production_models,
-        ]
+        """Returns a list of the enabled best practice rules"""
+        if self._best_practice_rules is None:
+            self._best_practice_rules = [getattr(self, name) for name in self.rule_attributes]
+        return self._best_practice_rules
     
     @property
     def contains_div(self) -> bool:
@@ -146,7 +287,7 @@ class DAXExpression:
             DeprecationWarning,
             stacklevel=2,
         )
-        return check_contains_function(lexer=self.lexer, function=PyDAXLexer.DIV)
+        return self.token_buffer.contains_type(DAXTokenTypes.DIV)
 
     @property
     def number_of_violations(self) -> int:
@@ -159,36 +300,268 @@ class DAXExpression:
         return violations
     
     @property
-    def input_stream(self) -> InputStream:
+    def input_stream(self) -> "InputStream":
+        #* The ANTLR runtime is only imported once the ANTLR backend is actually used
+        from antlr4 import InputStream
+        
         if not isinstance(self._input_stream, InputStream):
             self._input_stream = InputStream(self.dax_expression)
         return self._input_stream
 
     @property
-    def lexer(self) -> PyDAXLexer:
+    def lexer(self) -> "PyDAXLexer":
+        from .PyDAXLexer import PyDAXLexer
+        
         if not isinstance(self._lexer, PyDAXLexer):
             self._lexer = PyDAXLexer(self.input_stream)
             self._lexer.removeErrorListeners()
         return self._lexer
     
+    @property
+    def token_buffer(self) -> DAXTokenBuffer:
+        """Tokens of the expression, lexed once and shared by every analysis"""
+        if not isinstance(self._token_buffer, DAXTokenBuffer):
+            start = time.perf_counter()
+            if self._lexer_backend == "scanner":
+                self._token_buffer = DAXScanner.scan(self.dax_expression)
+            else:
+                self._token_buffer = DAXTokenBuffer.from_lexer(self.lexer)
+            if self.timings is not None:
+                self.timings.record("lexing", time.perf_counter() - start, len(self._token_buffer))
+        return self._token_buffer
+
+    @property
+    def reference_index(self) -> DAXReferenceIndex:
+        """Variables and column or measure references by name, indexed once from the extracted references"""
+        if self._reference_index is None:
+            self._reference_index = DAXReferenceIndex(self.variables, self.table_column_references, self.table_references)
+        return self._reference_index
+
+    def intern_names(self, names: "DAXNameTable") -> None:
+        """Interns the names of the variables and references in `names`, e.g. the name table of a DAXModel.
+
+        The references then share one string per spelling with the rest of the model and carry the ids of their names,
+        so comparing references interned in the same table compares integers. Extracts the references when they
+        were not yet.
+        """
+        for attribute in self.REFERENCE_ATTRIBUTES:
+            for reference in getattr(self, attribute):
+                if hasattr(reference, "intern"):
+                    reference.intern(names)
+
+    @property
+    def syntax_tree(self) -> "DAXSyntaxTree":
+        """Syntax tree of the expression, see DAXParser"""
+        return self.token_buffer.syntax_tree
+    
+    
+    # region #* Batch Analysis
+    
+    @classmethod
+    def analyze_many(
+        cls,
+        expressions: Iterable[str],
+        workers: int | None = None,
+        chunksize: int | None = None,
+        cache: DAXAnalysisCache | None = None,
+        keep_expressions: bool = False,
+        **options: Any,
+    ) -> list[DAXAnalysisResult]:
+        """Analyzes independent expressions in a process pool and returns one result per expression, in input order.
+
+        Args:
+            expressions (Iterable[str]): The DAX expressions to analyze
+            workers (int | None): Number of worker processes. Defaults to os.cpu_count(), 1 analyzes in the calling process.
+            chunksize (int | None): Expressions sent to a worker at a time. Defaults to about four chunks per worker.
+            cache (DAXAnalysisCache | None): Cache of analysis results. Each distinct expression missing from it is
+                analyzed once, every other expression is served from the cache.
+            keep_expressions (bool): Whether each result carries the analyzed DAXExpression in `expression`, with its
+                tokens and rule objects. Without it, results only hold the comments, references and violations as plain
+                values (see DAXAnalysisResult), much cheaper to send back from the workers.
+            **options: Arguments of DAXExpression (verify_best_practices, analyses, lexer_backend, rules, disabled_rules,
+                collect_timings) used for every expression
+
+        With collect_timings=True, DAXTimings.summarize(result.timings for result in results) gives the percentiles
+        of every phase over the batch.
+
+        An expression whose analysis raises does not abort the batch, its result carries the error instead.
+        """
+        expressions = list(expressions)
+        probe = cls("", **options)  # Invalid options fail here once instead of once per expression
+        if cache is not None:
+            return cls._analyze_many_cached(expressions, workers, chunksize, cache, probe, keep_expressions, options)
+        return cls._analyze_many(expressions, workers, chunksize, keep_expressions, options)
+    
+    @classmethod
+    def _analyze_many(
+        cls, expressions: list[str], workers: int | None, chunksize: int | None, keep_expressions: bool, options: dict[str, Any]
+    ) -> list[DAXAnalysisResult]:
+        workers = workers or os.cpu_count() or 1
+        analyze = functools.partial(_analyze_one, cls, options, keep_expressions)
+        if workers == 1 or len(expressions) <= 1:
+            return [analyze(item) for item in enumerate(expressions)]
+        
+        from concurrent.futures import ProcessPoolExecutor
+        
+        if chunksize is None:
+            chunksize = math.ceil(len(expressions) / (workers * 4))
+        with ProcessPoolExecutor(max_workers=min(workers, len(expressions))) as executor:
+            return list(executor.map(analyze, enumerate(expressions), chunksize=chunksize))
+    
+    @classmethod
+    def _analyze_many_cached(
+        cls,
+        expressions: list[str],
+        workers: int | None,
+        chunksize: int | None,
+        cache: DAXAnalysisCache,
+        probe: "DAXExpression",
+        keep_expressions: bool,
+        options: dict[str, Any],
+    ) -> list[DAXAnalysisResult]:
+        """analyze_many analyzing each distinct expression missing from `cache` once, the others are cache hits.
+
+        Every miss is sent to the pool at once. Copies of an expression and the expressions found in `cache` are then
+        built in this process from a cache of the batch, which keeps every distinct expression until the end of the
+        batch even when `cache` is too small to hold them all.
+        """
+        keys = [cache.key(dax_expression, probe.rule_attributes, probe._verify_rules) for dax_expression in expressions]
+        batch = DAXAnalysisCache(maxsize=max(len(set(keys)), 1), version=cache.version)
+        missing: dict[bytes, int] = {}  # Key -> position of its first expression
+        for position, key in enumerate(keys):
+            if key in batch or key in missing:
+                cache.hits += 1  # A copy of an expression of the batch
+                continue
+            state = cache.get(key)
+            if state is None:
+                missing[key] = position
+            else:
+                batch.put(key, state)
+        
+        #* Expressions analyzed in the pool come back whole, the caches keep their analysis state
+        analyzed = cls._analyze_many([expressions[position] for position in missing.values()], workers, chunksize, True, options)
+        results: dict[int, DAXAnalysisResult] = {}
+        errors: dict[bytes, str] = {}
+        for (key, position), result in zip(missing.items(), analyzed):
+            if result.ok:
+                state = result.expression._analysis_state()
+                if state:
+                    cache.put(key, state)
+                    batch.put(key, state)
+                result = DAXAnalysisResult.from_expression(position, result.expression, keep_expressions)
+            else:
+                errors[key] = result.error
+            result.index = position
+            results[position] = result
+        
+        batch_options = {**options, "cache": batch}
+        return [
+            results[position] if position in results
+            else DAXAnalysisResult(position, error=errors[key]) if key in errors
+            else _analyze_one(cls, batch_options, keep_expressions, (position, dax_expression))
+            for position, (dax_expression, key) in enumerate(zip(expressions, keys))
+        ]
+    
+    # endregion #* Batch Analysis
+    
+    # region #* Incremental Analysis
+    
+    def apply_edit(self, start: int, end: int, new_text: str) -> None:
+        """Replaces dax_expression[start:end] with `new_text`, e.g. as the expression is typed in an editor.
+
+        Only the tokens around the edit are lexed again (see DAXTokenBuffer.apply_edit), the others are copied from
+        the current token buffer. The analyses computed so far are computed again over the new tokens, the others
+        stay lazy.
+        """
+        if not 0 <= start <= end <= len(self.dax_expression):
+            raise ValueError(f"Edit [{start}, {end}) is outside of an expression of {len(self.dax_expression)} characters")
+        previous_buffer = self._token_buffer
+        self.dax_expression = self.dax_expression[:start] + new_text + self.dax_expression[end:]
+        self._input_stream = None
+        self._lexer = None
+        self._token_buffer = None
+        
+        if isinstance(previous_buffer, DAXTokenBuffer):
+            started = time.perf_counter()
+            if self._lexer_backend == "scanner":
+                lex = DAXScanner.scan
+            else:
+                lexer = self.lexer
+                lex = lambda text, *state: DAXTokenBuffer.from_lexer(lexer, *state)
+            self._token_buffer, *_ = previous_buffer.apply_edit(start, end, new_text, lex)
+            if self.timings is not None:
+                self.timings.record("lexing", time.perf_counter() - started, len(self._token_buffer))
+        
+        computed_comments = all(name in self.__dict__ for name in self.COMMENT_ATTRIBUTES)
+        computed_references = all(name in self.__dict__ for name in self.REFERENCE_ATTRIBUTES)
+        verified_rules = self.best_practice_attributes_initialized
+        for name in (*self.COMMENT_ATTRIBUTES, *self.REFERENCE_ATTRIBUTES, *self.rule_attributes):
+            self.__dict__.pop(name, None)
+        self._reference_index = None
+        self._best_practice_rules = None
+        self.best_practice_attributes_initialized = False
+        
+        if computed_comments:
+            self.analyze_comments()
+        if computed_references:
+            self.analyze_references()
+        if verified_rules:
+            self.init_best_practices_rules()
+            if self._verify_rules:
+                self.verify_best_practices()
+    
+    # endregion #* Incremental Analysis
     
     # region #? Best Practices Rules
     
     def init_best_practices_rules(self) -> None:
-        """Initializes best practice rules for the DAX expression"""
-        self.use_divide_function_for_division: UseDivide = UseDivide()
-        self.avoid_using_iferror_function: AvoidIfError = AvoidIfError()
-        self.use_the_treatas_function_instead_of_intersect: UseTreatasInsteadOfIntersect = UseTreatasInsteadOfIntersect()
-        self.filter_column_values: FilterColumnValues = FilterColumnValues()
-        self.filter_measure_values_by_columns: FilterMeasureValuesByColumns = FilterMeasureValuesByColumns()
-        self.unused_variables: UnusedVariables = UnusedVariables()
-        self.avoid_using_1_x_y_syntax: AvoidOneMinusDivision = AvoidOneMinusDivision()
-        self.evaluateandlog_should_not_be_used_in_production_models: EvaluateAndLogShouldNotBeUsedInProductionModels = EvaluateAndLogShouldNotBeUsedInProductionModels()
+        """Initializes the enabled best practice rules for the DAX expression"""
+        for name in self.rule_attributes:
+            self._init_best_practice_rule(name, verify=False)
         self.best_practice_attributes_initialized = True
+    
+    @classmethod
+    def rule_class(cls, name: str) -> type[BestPracticeRule]:
+        """Class of the rule stored under attribute `name`, importing its module on first use"""
+        registration = RULE_REGISTRY.by_attribute(name)
+        if registration is None:
+            raise KeyError(name)
+        return registration.rule_class
+    
+    def _init_best_practice_rule(self, name: str, verify: bool) -> BestPracticeRule:
+        """Instantiates the rule stored under attribute `name`, optionally verifying it right away"""
+        rule: BestPracticeRule = self.rule_class(name)()
+        if verify:
+            self._verify_rule(rule)
+        setattr(self, name, rule)
+        self._best_practice_rules = None
+        return rule
         
     def verify_best_practices(self) -> None:
-        for rule in self.best_practice_rules:
-            rule.verify_violation(lexer=self.lexer)
+        """Verifies the enabled rules, the token subscribing ones in a single walk over the token buffer (see RuleEngine)"""
+        rules: list[BestPracticeRule] = []
+        for name in self.rule_attributes:
+            rule: BestPracticeRule | None = self.__dict__.get(name)
+            if rule is None:
+                # Not accessed yet, instantiate it without the implicit verification of first access
+                rule = self._init_best_practice_rule(name, verify=False)
+            rules.append(rule)
+        if self.timings is None:
+            RuleEngine(rules).verify(self.token_buffer)
+        else:
+            # Verified one at a time so each rule gets its own timing, the violations are the same
+            for rule in rules:
+                self._verify_rule(rule)
+    
+    def _verify_rule(self, rule: BestPracticeRule) -> None:
+        """Verifies a single rule through RuleEngine, which skips it when its prerequisites are missing"""
+        buffer = self.token_buffer
+        if self.timings is None:
+            RuleEngine((rule,)).verify(buffer)
+            return
+        start = time.perf_counter()
+        RuleEngine((rule,)).verify(buffer)
+        self.timings.record(f"rule:{rule.id}", time.perf_counter() - start, len(buffer))
     
     def print_best_practices_violations(self) -> None:
         """Prints violations of best practice rules"""
@@ -203,69 +576,85 @@ class DAXExpression:
     
     # region #* DAX Expression Analysis Methods
 
-    def detect_variables(self, tokens: list[Token]) -> set[int]:
+    def detect_variables(self, tokens: list[int]) -> set[int]:
         """Detect VAR declarations and populate self.variables.
+
+        `tokens` holds indexes into the token buffer, as returned by DAXTokenBuffer.on_channels.
         """
         self.variables = []
         name_indexes: set[int] = set()
+        buffer: DAXTokenBuffer = self.token_buffer
+        types = buffer.types
 
-        i = 0
         n = len(tokens)
-        while i < n:
-            tok = tokens[i]
-            # *both VAR tokens and a fallback 'var' if not tokenized as VAR
-            #TODO: Review the fallback for lowercase 'var'
-            if tok.type == PyDAXLexer.VAR or (isinstance(tok.text, str) and tok.text.upper() == 'VAR'):
-                var_keyword_token = tok
-                # Find the variable name token: scan ahead to the first identifier-like token
-                name_token: Token | None = None
-                name_index: int | None = None
-                p = i + 1
-                while p < n and tokens[p].type not in (PyDAXLexer.ASSIGNMENT, PyDAXLexer.VAR, PyDAXLexer.RETURN):
-                    if tokens[p].type in (PyDAXLexer.TABLE_OR_VARIABLE, PyDAXLexer.TABLE):
-                        name_token = tokens[p]
-                        name_index = p
-                        break
-                    p += 1
-                # Begin scanning expression after name (if found), else after VAR
-                j = (name_index + 1) if name_index is not None else (i + 1)
-                # Skip '=' if present
-                if j < n and tokens[j].type == PyDAXLexer.ASSIGNMENT:
-                    j += 1
-                # Walk forward to next VAR, RETURN, or EOF to mark last token of expression
-                last_expr_token: Token | None = None
-                k = j
-                while k < n:
-                    tk = tokens[k]
-                    is_var_kw = (tk.type == PyDAXLexer.VAR) or (isinstance(tk.text, str) and tk.text.upper() == 'VAR')
-                    if is_var_kw or tk.type == PyDAXLexer.RETURN:
-                        break
-                    last_expr_token = tk
-                    k += 1
-                if name_token is not None:
-                    var_name = self._clean_name(name_token.text)
-                    self.variables.append(
-                        DAXVariable(
-                            name=var_name,
-                            token=name_token,
-                            var_keyword_token=var_keyword_token,
-                            last_expression_token=last_expr_token,
-                        )
-                    )
-                    name_indexes.add(name_index)
-                i = k
+        # *Keywords are case-insensitive, lowercase 'var' is tokenized as VAR too
+        boundaries: list[int] = [p for p in range(n) if types[tokens[p]] in (DAXTokenTypes.VAR, DAXTokenTypes.RETURN)]
+        for b, i in enumerate(boundaries):
+            if types[tokens[i]] != DAXTokenTypes.VAR:
                 continue
-            i += 1
+            var_keyword_token = tokens[i]
+            # The expression of the variable ends before the next VAR, RETURN, or EOF
+            k = boundaries[b + 1] if b + 1 < len(boundaries) else n
+            # Find the variable name token: scan ahead to the first identifier-like token
+            name_token: int | None = None
+            name_index: int | None = None
+            for p in range(i + 1, k):
+                if types[tokens[p]] == DAXTokenTypes.ASSIGNMENT:
+                    break
+                if types[tokens[p]] in (DAXTokenTypes.TABLE_OR_VARIABLE, DAXTokenTypes.TABLE):
+                    name_token = tokens[p]
+                    name_index = p
+                    break
+            # Begin scanning expression after name (if found), else after VAR
+            j = (name_index + 1) if name_index is not None else (i + 1)
+            # Skip '=' if present
+            if j < n and types[tokens[j]] == DAXTokenTypes.ASSIGNMENT:
+                j += 1
+            last_expr_token: int | None = tokens[k - 1] if k > j else None
+            if name_token is not None:
+                var_name = self._clean_name(buffer.token_text(name_token))
+                self.variables.append(
+                    DAXVariable(
+                        name=var_name,
+                        token=name_token,
+                        var_keyword_token=var_keyword_token,
+                        last_expression_token=last_expr_token,
+                        tokens=buffer,
+                    )
+                )
+                name_indexes.add(name_index)
 
         return name_indexes
     
     def print_tokens(self) -> None:
         """Prints all tokens in the DAX expression for debugging purposes"""
-        self.lexer.reset()  # Reset the lexer to start from the beginning
-        token: Token = self.lexer.nextToken()
-        while token.type != Token.EOF:
-            print(f"Token Type: {self.lexer.symbolicNames[token.type]}, Text: '{token.text}', Channel: {token.channel}")
-            token = self.lexer.nextToken()
+        buffer: DAXTokenBuffer = self.token_buffer
+        for index in range(len(buffer)):
+            print(f"Token Type: {DAXTokenTypes.symbolicNames[buffer.types[index]]}, Text: '{buffer.token_text(index)}', Channel: {buffer.channels[index]}")
+    
+    @_timed("comments")
+    def analyze_comments(self) -> None:
+        """Computes the comment analyses: dax_expression_no_comments, comments and clean_dax_expression"""
+        self.dax_expression_no_comments: str = self.remove_comments()
+        self.comments: list[str] = self.extract_comments()
+        self.clean_dax_expression: str = self.clean_expression()
+    
+    @_timed("references")
+    def analyze_references(self) -> None:
+        """Computes the variables and every kind of reference used by the expression"""
+        #*Variables
+        self.variables: list[DAXVariable] = []
+        
+        #*References - Expression uses columns, measures, udfs, tables, etc
+        self.table_column_references: list[DAXArtifactReference] = []
+        
+        self.table_references: list[DAXTableReference] = [] #register standalone table references
+        self.variable_references: list[DAXVariableReference] = [] #register standalone variable references
+        self.function_references: list[DAXFunctionReference] = [] #register standalone function references
+        self.relationship_references: list[DAXRelationshipReference] = [] #register standalone relationship references
+        self.unknown_references: list[DAXUnknownReference] = [] #register unknown references, basically a fallback for the others
+        
+        self.extract_references() #Populkate references
     
     def clean_expression(self) -> str:
         """Cleans the DAX expression by removing whitespaces, tabs, newlines, and carriage returns
@@ -281,16 +670,8 @@ class DAXExpression:
         Returns:
             list[str]: List of comments in the DAX expression
         """
-        self.lexer.reset()  # Reset the lexer to start from the beginning
-        comments: list[str] = []
-        token: Token = self.lexer.nextToken()
-        
-        while token.type != Token.EOF:
-            if token.channel == PyDAXLexer.COMMENTS_CHANNEL:
-                comments.append(token.text)
-            token = self.lexer.nextToken()
-        
-        return comments
+        buffer: DAXTokenBuffer = self.token_buffer
+        return [buffer.token_text(index) for index in buffer.on_channels(DAXTokenTypes.COMMENTS_CHANNEL)]
         
     def remove_comments(self) -> str:
         """Removes comments from the DAX expression
@@ -298,21 +679,19 @@ class DAXExpression:
         Returns:
             str: DAX expression without comments
         """
-        self.lexer.reset()  # Reset the lexer to start from the beginning
-        token:Token = self.lexer.nextToken()
+        buffer: DAXTokenBuffer = self.token_buffer
         result: list = []
 
-        while token.type != Token.EOF:
-            if token.channel != PyDAXLexer.COMMENTS_CHANNEL:
+        for index in range(len(buffer)):
+            if buffer.channels[index] != DAXTokenTypes.COMMENTS_CHANNEL:
                 # Preserve brackets around column/measure tokens if lexer normalizes them
-                if token.type == PyDAXLexer.COLUMN_OR_MEASURE:
-                    txt = token.text or ""
+                if buffer.types[index] == DAXTokenTypes.COLUMN_OR_MEASURE:
+                    txt = buffer.token_text(index) or ""
                     if not (txt.startswith('[') and txt.endswith(']')):
                         txt = f'[{txt}]'
                     result.append(txt)
                 else:
-                    result.append(token.text)
-            token = self.lexer.nextToken()
+                    result.append(buffer.token_text(index))
         
         return ''.join(result)
     
@@ -322,18 +701,16 @@ class DAXExpression:
         Returns:
             list[tuple[str]]: List of table and column references in the DAX expression
         """
-        self.lexer.reset()
+        buffer: DAXTokenBuffer = self.token_buffer
+        types = buffer.types
+        self._reference_index = None
         # First, collect tokens from the default and keyword channels (to include VAR/RETURN)
-        tokens: list[Token] = []
-        token: Token = self.lexer.nextToken()
-        while token.type != Token.EOF:
-            if token.channel in (Token.DEFAULT_CHANNEL, PyDAXLexer.KEYWORD_CHANNEL):
-                tokens.append(token)
-            token = self.lexer.nextToken()
+        tokens: list[int] = buffer.on_channels(DAXTokenTypes.DEFAULT_CHANNEL, DAXTokenTypes.KEYWORD_CHANNEL)
 
 
         # Detect variables: pattern VAR <name> = <expr> ... until next VAR/RETURN or EOF
         variable_name_token_indexes: set[int] = self.detect_variables(tokens)
+        variable_names: set[str] = {var.name for var in self.variables}
 
         
         used_column_indexes: set[int] = set()  # columns already paired with a table
@@ -343,135 +720,137 @@ class DAXExpression:
         i = 0
         n = len(tokens)
         while i < n:
-            token: Token = tokens[i]
+            token: int = tokens[i]
             # Detect USERELATIONSHIP references first and record them
-            if token.type == PyDAXLexer.USERELATIONSHIP:
+            if types[token] == DAXTokenTypes.USERELATIONSHIP:
                 next_i = self._extract_relationships(tokens, i)
                 # If successfully parsed, continue from the token after ')'
                 if next_i > i:
                     i = next_i
                     continue
             # The good one: TABLE or TABLE_OR_VARIABLE followed by '(' then COLUMN_OR_MEASURE
-            if token.type in (PyDAXLexer.TABLE, PyDAXLexer.TABLE_OR_VARIABLE):
-                table_name: str = token.text
+            if types[token] in (DAXTokenTypes.TABLE, DAXTokenTypes.TABLE_OR_VARIABLE):
+                table_name: str = buffer.token_text(token)
                 j = i + 1
                 # Skip a '('
-                if j < n and tokens[j].type == PyDAXLexer.OPEN_PARENS:
+                if j < n and types[tokens[j]] == DAXTokenTypes.OPEN_PARENS:
                     j += 1
                 # If next is a column/meaure, pair them
-                if j < n and tokens[j].type == PyDAXLexer.COLUMN_OR_MEASURE:
-                    artifact_name: str = tokens[j].text
+                if j < n and types[tokens[j]] == DAXTokenTypes.COLUMN_OR_MEASURE:
+                    artifact_name: str = buffer.token_text(tokens[j])
                     # Clean names
                     if artifact_name.endswith(']'):
                         artifact_name = artifact_name[:-1]
                     if artifact_name.startswith('['):
                         artifact_name = artifact_name[1:]
                     table_name = self._clean_name(table_name)
-                    self.table_column_references.append(DAXArtifactReference(table_name=table_name, artifact_name=artifact_name,table_token=token, artifact_token=tokens[j]))
+                    self.table_column_references.append(DAXArtifactReference(table_name=table_name, artifact_name=artifact_name,table_token=token, artifact_token=tokens[j], tokens=buffer))
                     used_column_indexes.add(j)
                     # mark table_or_variable as used if it was a TABLE_OR_VARIABLE token
-                    if token.type == PyDAXLexer.TABLE_OR_VARIABLE:
+                    if types[token] == DAXTokenTypes.TABLE_OR_VARIABLE:
                         used_table_or_variable_indexes.add(i)
-                    if token.type == PyDAXLexer.TABLE:
+                    if types[token] == DAXTokenTypes.TABLE:
                         used_table_indexes.add(i)
             i += 1
 
         # Add standalone columns/measures that were not paired with a table
         for idx, token in enumerate(tokens):
-            if token.type == PyDAXLexer.COLUMN_OR_MEASURE and idx not in used_column_indexes:
-                artifact_name: str = token.text
+            if types[token] == DAXTokenTypes.COLUMN_OR_MEASURE and idx not in used_column_indexes:
+                artifact_name: str = buffer.token_text(token)
                 if artifact_name.endswith(']'):
                     artifact_name = artifact_name[:-1]
                 if artifact_name.startswith('['):
                     artifact_name = artifact_name[1:]
                 #! In this case we omit the table name and token
-                self.table_column_references.append(DAXArtifactReference(table_name='', artifact_name=artifact_name, artifact_token=token))
+                self.table_column_references.append(DAXArtifactReference(table_name='', artifact_name=artifact_name, artifact_token=token, tokens=buffer))
 
         #Classify TABLE_OR_VARIABLE and TABLE tokens that are not part of table[column] pairs
         for idx, tok in enumerate(tokens):
             # Skip variable declaration name occurrences
             if idx in variable_name_token_indexes:
                 continue
-            if tok.type == PyDAXLexer.TABLE_OR_VARIABLE:
+            if types[tok] == DAXTokenTypes.TABLE_OR_VARIABLE:
                 if idx in used_table_or_variable_indexes:
                     # was used as table in a qualified column reference, not a standalone ref
                     continue
-                name = self._clean_name(tok.text)
+                name = self._clean_name(buffer.token_text(tok))
                 # Check if this token refers to a declared variable
-                is_var = any(var.name == name for var in self.variables)
-                if is_var:
-                    self.variable_references.append(DAXVariableReference(name=name,token=tok))
+                if name in variable_names:
+                    self.variable_references.append(DAXVariableReference(name=name, token=tok, tokens=buffer))
                     continue
                 # If followed by '(', consider it a (user-defined) function reference
-                if idx + 1 < n and tokens[idx + 1].type == PyDAXLexer.OPEN_PARENS:
-                    self.function_references.append(DAXFunctionReference(name=name, token=tok))
+                if idx + 1 < n and types[tokens[idx + 1]] == DAXTokenTypes.OPEN_PARENS:
+                    self.function_references.append(DAXFunctionReference(name=name, token=tok, tokens=buffer))
                     continue
                 # Otherwise, consider it a standalone table reference
-                self.table_references.append(DAXTableReference(name=name, token=tok))
-            elif tok.type == PyDAXLexer.TABLE:
+                self.table_references.append(DAXTableReference(name=name, token=tok, tokens=buffer))
+            elif types[tok] == DAXTokenTypes.TABLE:
                 if idx in used_table_indexes:
                     continue
-                name = self._clean_name(tok.text)
-                self.table_references.append(DAXTableReference(name=name, token=tok))
+                name = self._clean_name(buffer.token_text(tok))
+                self.table_references.append(DAXTableReference(name=name, token=tok, tokens=buffer))
 
         
     
     # endregion #* DAX Expression Analysis Methods
 
-    def _extract_relationships(self, tokens: list[Token], start_idx: int) -> int:
+    def _extract_relationships(self, tokens: list[int], start_idx: int) -> int:
         """Scan tokens starting at USERELATIONSHIP and capture its two fully-qualified column arguments.
 
         Returns the index of the token just after the closing ')' if successful; otherwise returns start_idx + 1.
         """
+        types = self.token_buffer.types
         i = start_idx
         n = len(tokens)
         # USERELATIONSHIP at i
-        if i >= n or tokens[i].type != PyDAXLexer.USERELATIONSHIP:
+        if i >= n or types[tokens[i]] != DAXTokenTypes.USERELATIONSHIP:
             return i + 1
 
         # Find next opening parenthesis
         j = i + 1
-        while j < n and tokens[j].type != PyDAXLexer.OPEN_PARENS:
+        while j < n and types[tokens[j]] != DAXTokenTypes.OPEN_PARENS:
             j += 1
         if j >= n:
             return i + 1
 
         # Get the first argument: table and column
         p = j + 1
-        if p >= n or tokens[p].type not in (PyDAXLexer.TABLE, PyDAXLexer.TABLE_OR_VARIABLE):
+        if p >= n or types[tokens[p]] not in (DAXTokenTypes.TABLE, DAXTokenTypes.TABLE_OR_VARIABLE):
             return i + 1
         token_table1 = tokens[p]
         p += 1
         # tolerate for an opening parens - weird Lexer thing
-        if p < n and tokens[p].type == PyDAXLexer.OPEN_PARENS:
+        if p < n and types[tokens[p]] == DAXTokenTypes.OPEN_PARENS:
             p += 1
-        if p >= n or tokens[p].type != PyDAXLexer.COLUMN_OR_MEASURE:
+        if p >= n or types[tokens[p]] != DAXTokenTypes.COLUMN_OR_MEASURE:
             return i + 1
         token_column1 = tokens[p]
         p += 1
 
         # then a comma separator
-        if p >= n or tokens[p].type != PyDAXLexer.COMMA:
+        if p >= n or types[tokens[p]] != DAXTokenTypes.COMMA:
             return i + 1
         p += 1
 
         # Parse second argument: table 2 and column 2
-        if p >= n or tokens[p].type not in (PyDAXLexer.TABLE, PyDAXLexer.TABLE_OR_VARIABLE):
+        if p >= n or types[tokens[p]] not in (DAXTokenTypes.TABLE, DAXTokenTypes.TABLE_OR_VARIABLE):
             return i + 1
         token_table2 = tokens[p]
         p += 1
-        if p < n and tokens[p].type == PyDAXLexer.OPEN_PARENS:
+        if p < n and types[tokens[p]] == DAXTokenTypes.OPEN_PARENS:
             p += 1
-        if p >= n or tokens[p].type != PyDAXLexer.COLUMN_OR_MEASURE:
+        if p >= n or types[tokens[p]] != DAXTokenTypes.COLUMN_OR_MEASURE:
             return i + 1
         token_column2 = tokens[p]
         p += 1
 
-        # Get tokens until closing parenthesis
-        while p < n and tokens[p].type != PyDAXLexer.CLOSE_PARENS:
-            p += 1
-        if p >= n:
+        # Jump to the parenthesis closing the arguments
+        navigation = self.token_buffer.navigation
+        opening = navigation.enclosing_paren[token_column2]
+        closing = navigation.matching_paren[opening] if opening >= 0 else -1
+        if closing < 0:
             return i + 1
+        p = navigation.position(closing)
 
         # Create object and register relationship reference
         try:
@@ -482,6 +861,7 @@ class DAXExpression:
                     token_column1=token_column1,
                     token_table2=token_table2,
                     token_column2=token_column2,
+                    tokens=self.token_buffer,
                 )
             )
         except Exception:
@@ -492,6 +872,7 @@ class DAXExpression:
     
     # region #! DAX Expression HTML Generation Methods
     
+    @_timed("html")
     def generate_html(self, name: str = "", light: bool = True) -> str:
         """Generates an HTML string with colorized DAX elements in light or dark mode"""
         # Define colors for both modes
@@ -526,38 +907,37 @@ class DAXExpression:
         prefix = f"{name} = " if name else ""
         html_output = [f'<pre style="font-family: Consolas, monospace; background-color: {colors["background"]}; color: {colors["text_color"]}; padding: 10px;">{prefix}']
         
-        self.lexer.reset()
-        token: Token = self.lexer.nextToken()
-        while token.type != Token.EOF:
+        buffer: DAXTokenBuffer = self.token_buffer
+        for index in range(len(buffer)):
+            token_type: int = buffer.types[index]
             # Prepare display text and escape only HTML control chars
-            display_text = self._get_original_token_text(token)
+            display_text = self._get_original_token_text(index)
             # DAX shows measures/columns in brackets
-            if token.type == PyDAXLexer.COLUMN_OR_MEASURE:
+            if token_type == DAXTokenTypes.COLUMN_OR_MEASURE:
                 if not (display_text.startswith('[') and display_text.endswith(']')):
                     display_text = f'[{display_text}]'
             # DAX uses double quotes for string literals; lexer may strip them
-            elif token.type == PyDAXLexer.STRING_LITERAL:
+            elif token_type == DAXTokenTypes.STRING_LITERAL:
                 if not (display_text.startswith('"') and display_text.endswith('"')):
                     display_text = f'"{display_text}"'
 
             safe_text = html.escape(display_text, quote=False)
-            if token.type in range(PyDAXLexer.ABS, PyDAXLexer.KEEPFILTERS) or token.type in range(PyDAXLexer.LASTDATE, PyDAXLexer.REL):
+            if token_type in range(DAXTokenTypes.ABS, DAXTokenTypes.KEEPFILTERS) or token_type in range(DAXTokenTypes.LASTDATE, DAXTokenTypes.REL):
                 html_output.append(f'<span style="color: {colors["function"]};">{safe_text}</span>')
-            elif token.type in [PyDAXLexer.PLUS, PyDAXLexer.MINUS, PyDAXLexer.STAR, PyDAXLexer.DIV, PyDAXLexer.CARET, PyDAXLexer.OP_GE, PyDAXLexer.OP_AND, PyDAXLexer.OP_LE, PyDAXLexer.OP_NE, PyDAXLexer.OP_OR, PyDAXLexer.AND, PyDAXLexer.OR, PyDAXLexer.NOT, PyDAXLexer.COMMA]:
+            elif token_type in [DAXTokenTypes.PLUS, DAXTokenTypes.MINUS, DAXTokenTypes.STAR, DAXTokenTypes.DIV, DAXTokenTypes.CARET, DAXTokenTypes.OP_GE, DAXTokenTypes.OP_AND, DAXTokenTypes.OP_LE, DAXTokenTypes.OP_NE, DAXTokenTypes.OP_OR, DAXTokenTypes.AND, DAXTokenTypes.OR, DAXTokenTypes.NOT, DAXTokenTypes.COMMA]:
                 html_output.append(f'<span style="color: {colors["operator"]};">{safe_text}</span>')
-            elif token.type in [PyDAXLexer.TABLE, PyDAXLexer.TABLE_OR_VARIABLE]:
+            elif token_type in [DAXTokenTypes.TABLE, DAXTokenTypes.TABLE_OR_VARIABLE]:
                 html_output.append(f'<span style="color: {colors["table"]};">{safe_text}</span>')
-            elif token.type == PyDAXLexer.COLUMN_OR_MEASURE:
+            elif token_type == DAXTokenTypes.COLUMN_OR_MEASURE:
                 html_output.append(f'<span style="color: {colors["column"]};">{safe_text}</span>')
-            elif token.type in [PyDAXLexer.INTEGER_LITERAL, PyDAXLexer.REAL_LITERAL]:
+            elif token_type in [DAXTokenTypes.INTEGER_LITERAL, DAXTokenTypes.REAL_LITERAL]:
                 html_output.append(f'<span style="color: {colors["number"]};">{safe_text}</span>')
-            elif token.type in [PyDAXLexer.SINGLE_LINE_COMMENT, PyDAXLexer.DELIMITED_COMMENT]:
+            elif token_type in [DAXTokenTypes.SINGLE_LINE_COMMENT, DAXTokenTypes.DELIMITED_COMMENT]:
                 html_output.append(f'<span style="color: {colors["comment"]};">{safe_text}</span>')
-            elif token.type == PyDAXLexer.STRING_LITERAL:
+            elif token_type == DAXTokenTypes.STRING_LITERAL:
                 html_output.append(f'<span style="color: {colors["string"]};">{safe_text}</span>')
             else:
                 html_output.append(f'<span style="color: {colors["text_color"]};">{safe_text}</span>')
-            token = self.lexer.nextToken()
         
         html_output.append('</pre>')
         return ''.join(html_output)
@@ -569,6 +949,7 @@ class DAXExpression:
             file.write(html_code)
         print(f"HTML saved to {file_name}")
     
+    @_timed("html_with_violations")
     def generate_html_with_violations(self, name: str = "", light: bool = True) -> str:
         """Generates HTML like generate_html, but highlights best-practice violations.
         """
@@ -636,14 +1017,14 @@ class DAXExpression:
         prefix = f"{name} = " if name else ""
         html_output = [f'<pre style="font-family: Consolas, monospace; background-color: {colors["background"]}; color: {colors["text_color"]}; padding: 10px;">{prefix}']
 
-        self.lexer.reset()
-        token: Token = self.lexer.nextToken()
-        while token.type != Token.EOF:
+        buffer: DAXTokenBuffer = self.token_buffer
+        for index in range(len(buffer)):
+            token_type: int = buffer.types[index]
             # Determine if this token overlaps any violation region
             is_violation = False
             try:
-                start = token.start
-                stop = token.stop
+                start = buffer.starts[index]
+                stop = buffer.stops[index]
                 if isinstance(start, int) and isinstance(stop, int) and 0 <= start <= stop < len(highlight_mask):
                     # if any char in region is highlighted, mark token as violation
                     is_violation = any(highlight_mask[start:stop+1])
@@ -651,30 +1032,30 @@ class DAXExpression:
                 is_violation = False
 
             # Prepare text and escape HTML control chars (<, >, &)
-            display_text = self._get_original_token_text(token)
-            if token.type == PyDAXLexer.COLUMN_OR_MEASURE:
+            display_text = self._get_original_token_text(index)
+            if token_type == DAXTokenTypes.COLUMN_OR_MEASURE:
                 if not (display_text.startswith('[') and display_text.endswith(']')):
                     display_text = f'[{display_text}]'
-            elif token.type == PyDAXLexer.STRING_LITERAL:
+            elif token_type == DAXTokenTypes.STRING_LITERAL:
                 if not (display_text.startswith('"') and display_text.endswith('"')):
                     display_text = f'"{display_text}"'
 
             safe_text = html.escape(display_text, quote=False)
 
             #! Colors:
-            if token.type in range(PyDAXLexer.ABS, PyDAXLexer.KEEPFILTERS) or token.type in range(PyDAXLexer.LASTDATE, PyDAXLexer.REL):
+            if token_type in range(DAXTokenTypes.ABS, DAXTokenTypes.KEEPFILTERS) or token_type in range(DAXTokenTypes.LASTDATE, DAXTokenTypes.REL):
                 color_style = f'color: {colors["function"]};'
-            elif token.type in [PyDAXLexer.PLUS, PyDAXLexer.MINUS, PyDAXLexer.STAR, PyDAXLexer.DIV, PyDAXLexer.CARET, PyDAXLexer.OP_GE, PyDAXLexer.OP_AND, PyDAXLexer.OP_LE, PyDAXLexer.OP_NE, PyDAXLexer.OP_OR, PyDAXLexer.AND, PyDAXLexer.OR, PyDAXLexer.NOT, PyDAXLexer.COMMA]:
+            elif token_type in [DAXTokenTypes.PLUS, DAXTokenTypes.MINUS, DAXTokenTypes.STAR, DAXTokenTypes.DIV, DAXTokenTypes.CARET, DAXTokenTypes.OP_GE, DAXTokenTypes.OP_AND, DAXTokenTypes.OP_LE, DAXTokenTypes.OP_NE, DAXTokenTypes.OP_OR, DAXTokenTypes.AND, DAXTokenTypes.OR, DAXTokenTypes.NOT, DAXTokenTypes.COMMA]:
                 color_style = f'color: {colors["operator"]};'
-            elif token.type in [PyDAXLexer.TABLE, PyDAXLexer.TABLE_OR_VARIABLE]:
+            elif token_type in [DAXTokenTypes.TABLE, DAXTokenTypes.TABLE_OR_VARIABLE]:
                 color_style = f'color: {colors["table"]};'
-            elif token.type == PyDAXLexer.COLUMN_OR_MEASURE:
+            elif token_type == DAXTokenTypes.COLUMN_OR_MEASURE:
                 color_style = f'color: {colors["column"]};'
-            elif token.type in [PyDAXLexer.INTEGER_LITERAL, PyDAXLexer.REAL_LITERAL]:
+            elif token_type in [DAXTokenTypes.INTEGER_LITERAL, DAXTokenTypes.REAL_LITERAL]:
                 color_style = f'color: {colors["number"]};'
-            elif token.type in [PyDAXLexer.SINGLE_LINE_COMMENT, PyDAXLexer.DELIMITED_COMMENT]:
+            elif token_type in [DAXTokenTypes.SINGLE_LINE_COMMENT, DAXTokenTypes.DELIMITED_COMMENT]:
                 color_style = f'color: {colors["comment"]};'
-            elif token.type == PyDAXLexer.STRING_LITERAL:
+            elif token_type == DAXTokenTypes.STRING_LITERAL:
                 color_style = f'color: {colors["string"]};'
             else:
                 color_style = f'color: {colors["text_color"]};'
@@ -710,7 +1091,6 @@ class DAXExpression:
                 html_output.append(f'<a href="#" style="{color_style} text-decoration: none;"{title_attr}>{safe_text}</a>')
             else:
                 html_output.append(f'<span style="{color_style}">{safe_text}</span>')
-            token = self.lexer.nextToken()
 
         html_output.append('</pre>')
         return ''.join(html_output)
@@ -726,29 +1106,9 @@ class DAXExpression:
 
     # region #? Helper Methods
 
-    def _get_original_token_text(self, token: Token) -> str:
-        """Return the exact lexeme slice from the original expression when possible."""
-        expr = self.dax_expression or ""
-        fallback = getattr(token, 'text', '') or ""
-        if not expr:
-            return fallback
-
-        try:
-            start = getattr(token, 'start', None)
-            stop = getattr(token, 'stop', None)
-            if isinstance(start, int) and isinstance(stop, int):
-                if stop < start:
-                    start, stop = stop, start
-                if start >= len(expr) or stop < 0:
-                    return fallback
-                start = max(0, start)
-                stop = min(len(expr) - 1, stop)
-                if start <= stop:
-                    return expr[start:stop + 1]
-        except Exception:
-            return fallback
-
-        return fallback
+    def _get_original_token_text(self, index: int) -> str:
+        """Return the exact lexeme slice from the original expression."""
+        return self.token_buffer.source_text(index)
     
     @staticmethod
     def _clean_name(text: str) -> str:
@@ -758,4 +1118,15 @@ class DAXExpression:
             text = text[1:]
         return text
 
-    # endregion #? Helper Methods
\ No newline at end of file
+    # endregion #? Helper Methods
+
+
+def _analyze_one(
+    expression_class: type[DAXExpression], options: dict[str, Any], keep_expression: bool, item: tuple[int, str]
+) -> DAXAnalysisResult:
+    """Worker of DAXExpression.analyze_many. Module level so process pools can pickle it."""
+    index, dax_expression = item
+    try:
+        return DAXAnalysisResult.from_expression(index, expression_class(dax_expression, **options), keep_expression)
+    except Exception as error:
+        return DAXAnalysisResult(index, error=f"{type(error).__name__}: {error}")
@@ -0,0 +1,69 @@
+"""Keyword table shared by PyDAXLexer and DAXScanner.
+
+DAX functions and keywords (token types ABS..NUMERIC) are lexed as identifiers and mapped to their token type
+through this table, case-insensitively. Keywords containing a dot cannot be identifiers and keep their own
+(case-insensitive) rules in PyDAXLexer.g4.
+"""
+
+#* Keywords whose spelling differs from their token name
+SPELLINGS: dict[str, str] = {
+    "SKIP_": "SKIP",
+    "ONEWAYRIGHTFILTERSLEFT": "ONEWAY_RIGHTFILTERSLEFT",
+    "ONEWAYLEFTFILTERSRIGHT": "ONEWAY_LEFTFILTERSRIGHT",
+}
+
+#* Keywords lexed by their own rule in PyDAXLexer.g4, by token name
+DOTTED_KEYWORDS: dict[str, str] = {
+    "BETADIST": "BETA.DIST",
+    "BETAINV": "BETA.INV",
+    "CHISQDIST": "CHISQ.DIST",
+    "CHISQDISTRT": "CHISQ.DIST.RT",
+    "CHISQINV": "CHISQ.INV",
+    "CHISQINVRT": "CHISQ.INV.RT",
+    "CONFIDENCENORM": "CONFIDENCE.NORM",
+    "CONFIDENCET": "CONFIDENCE.T",
+    "EXPONDIST": "EXPON.DIST",
+    "IFEAGER": "IF.EAGER",
+    "ISOCEILING": "ISO.CEILING",
+    "NORMDIST": "NORM.DIST",
+    "NORMINV": "NORM.INV",
+    "NORMSDIST": "NORM.S.DIST",
+    "NORMSINV": "NORM.S.INV",
+    "PERCENTILEEXC": "PERCENTILE.EXC",
+    "PERCENTILEINC": "PERCENTILE.INC",
+    "PERCENTILEXEXC": "PERCENTILEX.EXC",
+    "PERCENTILEXINC": "PERCENTILEX.INC",
+    "POISSONDIST": "POISSON.DIST",
+    "RANKEQ": "RANK.EQ",
+    "STDEVP": "STDEV.P",
+    "STDEVS": "STDEV.S",
+    "STDEVXP": "STDEVX.P",
+    "STDEVXS": "STDEVX.S",
+    "TDIST": "T.DIST",
+    "TDIST2T": "T.DIST.2T",
+    "TDISTRT": "T.DIST.RT",
+    "TINV": "T.INV",
+    "TINV2T": "T.INV.2T",
+    "VARP": "VAR.P",
+    "VARS": "VAR.S",
+    "VARXP": "VARX.P",
+    "VARXS": "VARX.S",
+}
+
+#* Words starting a definition in the DEFINE section of a query. They are not keywords and lex as identifiers
+DEFINITION_WORDS: frozenset[str] = frozenset({"MEASURE", "COLUMN", "TABLE", "FUNCTION"})
+
+
+def keyword_types(lexer_class: type) -> dict[str, int]:
+    """Maps the upper case spelling of every identifier-like keyword to its token type"""
+    first, last = lexer_class.ABS, lexer_class.NUMERIC
+    return {
+        SPELLINGS.get(name, name): token_type
+        for token_type, name in enumerate(lexer_class.symbolicNames[first:last + 1], first)
+        if name not in DOTTED_KEYWORDS
+    }
+
+
+def dotted_keyword_types(lexer_class: type) -> dict[str, int]:
+    """Maps the upper case spelling of every dotted keyword to its token type"""
+    return {spelling: getattr(lexer_class, name) for name, spelling in DOTTED_KEYWORDS.items()}
@@ -0,0 +1,255 @@
+"""Persistent cache of the DFA that ANTLR builds while PyDAXLexer runs.
+
+The ANTLR runtime builds the lexer DFA lazily: every new process starts with an empty DFA and lexes its first
+expressions through the (much slower) ATN simulation. The functions below save a warmed DFA to a file and load
+it back into PyDAXLexer, so short-lived processes start warm. The file is written with `marshal` and is only
+valid for the grammar (serialized ATN) and Python version that produced it; anything else is ignored.
+"""
+import hashlib
+import marshal
+import os
+import sys
+import warnings
+from importlib import resources
+from typing import Iterable
+
+from antlr4 import InputStream
+from antlr4.atn.ATNConfig import LexerATNConfig
+from antlr4.atn.ATNConfigSet import ATNConfigSet
+from antlr4.atn.LexerAction import LexerIndexedCustomAction
+from antlr4.atn.LexerActionExecutor import LexerActionExecutor
+from antlr4.atn.LexerATNSimulator import LexerATNSimulator
+from antlr4.atn.SemanticContext import SemanticContext
+from antlr4.dfa.DFAState import DFAState
+from antlr4.PredictionContext import ArrayPredictionContext, PredictionContext, SingletonPredictionContext
+
+from .PyDAXLexer import PyDAXLexer, serializedATN
+
+
+FORMAT_VERSION = 1
+
+#* Corpus used by warmup() when no expressions are given, shipped with the package: the expressions of
+#* resources/sample_dax_expressions that add states or edges to the lexer DFA, one after the other
+WARMUP_CORPUS = "warmup_corpus.dax"
+
+#* Environment variable naming a cache file to load when PyDAX is imported
+CACHE_ENVIRONMENT_VARIABLE = "PYDAX_DFA_CACHE"
+
+_ERROR_STATE = -1
+
+
+def atn_fingerprint() -> str:
+    """Identifies the grammar a cache was built for"""
+    return hashlib.sha1(repr(serializedATN()).encode()).hexdigest()
+
+
+def warmup(expressions: Iterable[str] | None = None, cache_path: str | os.PathLike | None = None) -> int:
+    """Primes the PyDAXLexer DFA and returns its number of states.
+
+    Args:
+        expressions (Iterable[str] | None): Expressions to lex. Defaults to the corpus bundled with the package (WARMUP_CORPUS).
+        cache_path (str | PathLike | None): When the file holds a valid cache it is loaded instead of lexing anything.
+            Otherwise the DFA is primed from `expressions` and saved to this file.
+    """
+    if cache_path is not None and load_dfa_cache(cache_path):
+        return dfa_size()
+
+    if expressions is None:
+        try:
+            expressions = [resources.files(__package__).joinpath(WARMUP_CORPUS).read_text(encoding="utf-8")]
+        except OSError:
+            warnings.warn(f"Warmup corpus {WARMUP_CORPUS} not found in the package, the lexer DFA was not primed", stacklevel=2)
+            expressions = []
+
+    for expression in expressions:
+        lexer = PyDAXLexer(InputStream(expression))
+        lexer.removeErrorListeners()
+        lexer.getAllTokens()
+
+    if cache_path is not None:
+        save_dfa_cache(cache_path)
+    return dfa_size()
+
+
+def dfa_size() -> int:
+    """Number of states currently in the PyDAXLexer DFA"""
+    return sum(len(dfa.states) for dfa in PyDAXLexer.decisionsToDFA)
+
+
+def save_dfa_cache(path: str | os.PathLike) -> None:
+    """Writes the current PyDAXLexer DFA to `path`"""
+    writer = _DFAWriter()
+    dfas = [writer.dfa(dfa) for dfa in PyDAXLexer.decisionsToDFA]
+    data = {
+        "version": FORMAT_VERSION,
+        "python": list(sys.version_info[:2]),
+        "atn": atn_fingerprint(),
+        "contexts": writer.contexts,
+        "executors": writer.executors,
+        "dfas": dfas,
+    }
+    with open(path, "wb") as file:
+        marshal.dump(data, file)
+
+
+def load_dfa_cache(path: str | os.PathLike) -> bool:
+    """Replaces the PyDAXLexer DFA with the one saved in `path`.
+
+    Returns False, leaving the current DFA untouched, when the file is missing, unreadable or was written for
+    another grammar or Python version.
+    """
+    try:
+        with open(path, "rb") as file:
+            data = marshal.load(file)
+    except (OSError, EOFError, ValueError, TypeError):
+        return False
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != FORMAT_VERSION
+        or data.get("python") != list(sys.version_info[:2])
+        or data.get("atn") != atn_fingerprint()
+    ):
+        return False
+
+    #* A file with a valid header can still be truncated or corrupt: nothing is replaced unless every DFA is rebuilt
+    try:
+        if len(data["dfas"]) != len(PyDAXLexer.decisionsToDFA):
+            return False
+        reader = _DFAReader(data["contexts"], data["executors"])
+        loaded = [reader.dfa(states, s0) for states, s0 in data["dfas"]]
+    except (KeyError, IndexError, TypeError, ValueError, AttributeError):
+        return False
+    for dfa, (states, s0) in zip(PyDAXLexer.decisionsToDFA, loaded):
+        dfa._states = states
+        dfa.s0 = s0
+    return True
+
+
+def load_cache_from_environment() -> bool:
+    """Loads the cache named by the PYDAX_DFA_CACHE environment variable, if any"""
+    path = os.environ.get(CACHE_ENVIRONMENT_VARIABLE)
+    return bool(path) and load_dfa_cache(path)
+
+
+class _DFAWriter:
+    """Flattens DFA states into marshal-friendly tuples. Prediction contexts and action executors are shared
+    between configurations, so they are stored once in tables and referenced by position."""
+
+    def __init__(self) -> None:
+        self.contexts: list[tuple] = []
+        self.executors: list[tuple] = []
+        self._context_ids: dict[int, int] = {}
+        self._executor_ids: dict[int, int] = {}
+        self._lexer_actions = {id(action): index for index, action in enumerate(PyDAXLexer.atn.lexerActions)}
+
+    def dfa(self, dfa) -> tuple:
+        states = sorted(dfa.states, key=lambda state: state.stateNumber)
+        s0 = -1 if dfa.s0 is None else dfa.s0.stateNumber
+        return [self.state(state) for state in states], s0
+
+    def state(self, state: DFAState) -> tuple:
+        edges = []
+        if state.edges is not None:
+            for symbol, target in enumerate(state.edges):
+                if target is not None:
+                    edges.append((symbol, _ERROR_STATE if target is LexerATNSimulator.ERROR else target.stateNumber))
+        configs = [self.config(config) for config in state.configs]
+        return (state.stateNumber, state.isAcceptState, state.prediction, self.executor(state.lexerActionExecutor), configs, edges)
+
+    def config(self, config: LexerATNConfig) -> tuple:
+        if config.semanticContext is not SemanticContext.NONE:
+            raise ValueError("Lexer DFA states with semantic predicates cannot be cached")
+        return (config.state.stateNumber, config.alt, self.context(config.context), self.executor(config.lexerActionExecutor),
+                config.passedThroughNonGreedyDecision)
+
+    def context(self, context: PredictionContext | None) -> int:
+        if context is None:
+            return -1
+        key = id(context)
+        if key not in self._context_ids:
+            if context is PredictionContext.EMPTY:
+                entry = ("E",)
+            elif isinstance(context, SingletonPredictionContext):
+                entry = ("S", self.context(context.parentCtx), context.returnState)
+            else:
+                entry = ("A", [self.context(parent) for parent in context.parents], list(context.returnStates))
+            self._context_ids[key] = len(self.contexts)
+            self.contexts.append(entry)
+        return self._context_ids[key]
+
+    def executor(self, executor: LexerActionExecutor | None) -> int:
+        if executor is None:
+            return -1
+        key = id(executor)
+        if key not in self._executor_ids:
+            actions = []
+            for action in executor.lexerActions:
+                if isinstance(action, LexerIndexedCustomAction):
+                    actions.append((self._lexer_actions[id(action.action)], action.offset))
+                else:
+                    actions.append((self._lexer_actions[id(action)], -1))
+            self._executor_ids[key] = len(self.executors)
+            self.executors.append(actions)
+        return self._executor_ids[key]
+
+
+class _DFAReader:
+    """Rebuilds DFA states written by _DFAWriter against the PyDAXLexer ATN"""
+
+    def __init__(self, contexts: list[tuple], executors: list[list]) -> None:
+        self._atn_states = PyDAXLexer.atn.states
+        self.contexts: list[PredictionContext] = []
+        for entry in contexts:
+            if entry[0] == "E":
+                context = PredictionContext.EMPTY
+            elif entry[0] == "S":
+                context = SingletonPredictionContext(self.context(entry[1]), entry[2])
+            else:
+                context = ArrayPredictionContext([self.context(parent) for parent in entry[1]], list(entry[2]))
+            self.contexts.append(context)
+
+        lexer_actions = PyDAXLexer.atn.lexerActions
+        self.executors: list[LexerActionExecutor] = [
+            LexerActionExecutor([lexer_actions[index] if offset == -1 else LexerIndexedCustomAction(offset, lexer_actions[index])
+                                 for index, offset in actions])
+            for actions in executors
+        ]
+
+    def context(self, index: int) -> PredictionContext | None:
+        return None if index == -1 else self.contexts[index]
+
+    def executor(self, index: int) -> LexerActionExecutor | None:
+        return None if index == -1 else self.executors[index]
+
+    def dfa(self, entries: list[tuple], s0: int) -> tuple[dict, DFAState | None]:
+        states: list[DFAState] = []
+        for number, is_accept, prediction, executor, configs, _ in entries:
+            config_set = ATNConfigSet()
+            for config in configs:
+                config_set.add(self.config(*config))
+            config_set.setReadonly(True)
+            state = DFAState(number, config_set)
+            state.isAcceptState = is_accept
+            state.prediction = prediction
+            state.lexerActionExecutor = self.executor(executor)
+            states.append(state)
+
+        by_number = {state.stateNumber: state for state in states}
+        for state, entry in zip(states, entries):
+            if entry[5]:
+                state.edges = [None] * (LexerATNSimulator.MAX_DFA_EDGE - LexerATNSimulator.MIN_DFA_EDGE + 1)
+                for symbol, target in entry[5]:
+                    state.edges[symbol] = LexerATNSimulator.ERROR if target == _ERROR_STATE else by_number[target]
+        return {state: state for state in states}, by_number.get(s0)
+
+    def config(self, state: int, alt: int, context: int, executor: int, non_greedy: bool) -> LexerATNConfig:
+        config = LexerATNConfig.__new__(LexerATNConfig)
+        config.state = self._atn_states[state]
+        config.alt = alt
+        config.context = self.context(context)
+        config.semanticContext = SemanticContext.NONE
+        config.reachesIntoOuterContext = 0
+        config.precedenceFilterSuppressed = False
+        config.lexerActionExecutor = self.executor(executor)
+        config.passedThroughNonGreedyDecision = non_greedy
+        return config
@@ -0,0 +1,250 @@
+from array import array
+from itertools import chain
+from typing import TYPE_CHECKING
+
+from .DAXModel import DAXModelArtifact
+from .DAXReferenceIndex import _position
+
+if TYPE_CHECKING:
+    from .DAXModel import DAXModel
+
+#* Positions of the set bits of every byte value, to list the members of a bitset one byte at a time
+_BYTE_BITS: tuple[tuple[int, ...], ...] = tuple(tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256))
+
+
+def _csr(edges: list[list[int]], count: int) -> tuple[array, array]:
+    """Compressed sparse row form of adjacency lists: the targets of node i are targets[offsets[i]:offsets[i + 1]]"""
+    offsets = array('i', [0])
+    targets = array('i')
+    for node in range(count):
+        targets.extend(edges[node])
+        offsets.append(len(targets))
+    return offsets, targets
+
+
+def _bit_positions(bits: int) -> list[int]:
+    positions: list[int] = []
+    for index, byte in enumerate(bits.to_bytes((bits.bit_length() + 7) // 8, "little")):
+        if byte:
+            positions.extend(map((index * 8).__add__, _BYTE_BITS[byte]))
+    return positions
+
+
+class DAXLineage:
+    """Transitive lineage of the artifacts of a DAXModel, down to the columns of the data source they read.
+
+    Nodes are the model artifacts (at their position in model.artifacts) followed by the physical columns: columns
+    referenced with their table that are not calculated columns of the model. The graph is stored in CSR arrays and
+    its strongly connected components are numbered so that every component only depends on lower numbered ones.
+    The transitive closure of a component is a bitset (a Python int) over those numbers, computed on first query from
+    the closures of the components it depends on and kept for later queries, in both directions. Answering a query
+    is then a lookup, and listing its result is linear in the size of the bitset. Physical columns take the lowest
+    numbers, so listing the columns an artifact reads only looks at the first bits.
+
+    Memory grows with the closures computed: up to one bit per pair of nodes once every artifact was queried.
+    """
+
+    def __init__(self, model: "DAXModel") -> None:
+        self.model: "DAXModel" = model
+        self.columns: list[tuple[str, str]] = []  # Physical columns as first written, node len(model.artifacts) + i
+        self._column_nodes: dict[tuple[int, int], int] = {}  # Ids of the table and column names -> node
+
+        artifact_count = len(model.artifacts)
+        dependencies, _ = model._graph()
+        edges = [list(referenced) for referenced in dependencies]
+        for artifact, referenced in zip(model.artifacts, edges):
+            if artifact.expression is None:
+                continue
+            for reference in sorted(artifact.expression.table_column_references, key=_position):  # Document order
+                reference.intern(model.names)  # Done by the graph, unless another model interned the expression since
+                if model._resolve_column(artifact, reference) is not None:
+                    continue
+                table_name = reference.table_name
+                if not table_name:
+                    if artifact.kind != DAXModelArtifact.CALCULATED_COLUMN:
+                        continue  # A measure, or a column of an unknown table in a row context
+                    table_name = artifact.table_name or ""
+                key = (model.names.intern(table_name), reference.artifact_id)
+                node = self._column_nodes.get(key)
+                if node is None:
+                    node = self._column_nodes[key] = artifact_count + len(self.columns)
+                    self.columns.append((table_name, reference.artifact_name))
+                    edges.append([])
+                if node not in referenced:
+                    referenced.append(node)
+
+        self.node_count: int = len(edges)
+        self.offsets, self.targets = _csr(edges, self.node_count)
+        reverse: list[list[int]] = [[] for _ in range(self.node_count)]
+        for node, referenced in enumerate(edges):
+            for target in referenced:
+                reverse[target].append(node)
+        self.reverse_offsets, self.reverse_targets = _csr(reverse, self.node_count)
+
+        self._components()
+        self._forward: list[int | None] = [None] * self.component_count
+        self._backward: list[int | None] = [None] * self.component_count
+
+    # region #? Queries
+
+    def dependencies(self, artifact: DAXModelArtifact) -> list[DAXModelArtifact]:
+        """Artifacts `artifact` depends on, directly or not, in model order"""
+        artifacts = self.model.artifacts
+        count = len(artifacts)
+        return [artifacts[node] for node in self._reached(self._node(artifact), forward=True) if node < count]
+
+    def dependents(self, artifact: DAXModelArtifact) -> list[DAXModelArtifact]:
+        """Artifacts depending on `artifact`, directly or not, in model order"""
+        artifacts = self.model.artifacts
+        return [artifacts[node] for node in self._reached(self._node(artifact), forward=False)]
+
+    def physical_columns(self, artifact: DAXModelArtifact) -> list[tuple[str, str]]:
+        """(table, column) of the data source columns `artifact` ultimately reads, through measures, calculated
+        columns and functions"""
+        bits = self._closure(self.component_of[self._node(artifact)], forward=True) & ((1 << len(self.columns)) - 1)
+        columns = self.columns
+        return [columns[rank] for rank in _bit_positions(bits)]  # The rank of a physical column is its index
+
+    def column_dependents(self, table_name: str, column_name: str) -> list[DAXModelArtifact]:
+        """Artifacts depending on the physical column table_name[column_name], directly or not, in model order"""
+        node = self._column_node(table_name, column_name)
+        if node is None:
+            return []
+        artifacts = self.model.artifacts
+        return [artifacts[node] for node in self._reached(node, forward=False)]
+
+    def depends_on(self, artifact: DAXModelArtifact, target: "DAXModelArtifact | tuple[str, str]") -> bool:
+        """Whether `artifact` depends on `target`, an artifact or a physical (table, column), directly or not"""
+        if isinstance(target, DAXModelArtifact):
+            target_node = self._node(target)
+        else:
+            target_node = self._column_node(*target)
+            if target_node is None:
+                return False
+        node = self._node(artifact)
+        if node == target_node:
+            return self._cyclic(self.component_of[node])
+        return bool(self._closure(self.component_of[node], forward=True) >> self.rank_of[target_node] & 1)
+
+    def _column_node(self, table_name: str, column_name: str) -> int | None:
+        names = self.model.names
+        table_id, column_id = names.lookup(table_name), names.lookup(column_name)
+        return None if table_id is None or column_id is None else self._column_nodes.get((table_id, column_id))
+
+    def _node(self, artifact: DAXModelArtifact) -> int:
+        return self.model._position(artifact)
+
+    def _reached(self, node: int, forward: bool) -> list[int]:
+        """Nodes reached from `node` (excluded) along dependencies, or against them, in node order"""
+        bits = self._closure(self.component_of[node], forward) & ~(1 << self.rank_of[node])
+        nodes = self.node_of_rank
+        return sorted(nodes[rank] for rank in _bit_positions(bits))
+
+    # endregion #? Queries
+
+    # region #* Closures
+
+    def _components(self) -> None:
+        """Tarjan's strongly connected components, without recursion. Components are found dependencies first, so
+        a component only depends on lower numbered ones. Nodes are ranked by component so that the members of a
+        component are the consecutive ranks [first_rank[c], first_rank[c + 1])."""
+        offsets, targets = self.offsets, self.targets
+        count = self.node_count
+        index_of = [-1] * count
+        low = [0] * count
+        on_stack = [False] * count
+        component_of = array('i', [-1]) * count
+        node_of_rank = array('i')
+        first_rank = array('i', [0])
+        stack: list[int] = []
+        next_index = 0
+        #* Physical columns have no dependencies: visited first, they take the lowest ranks [0, len(self.columns))
+        for root in chain(range(len(self.model.artifacts), count), range(len(self.model.artifacts))):
+            if index_of[root] >= 0:
+                continue
+            index_of[root] = low[root] = next_index
+            next_index += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [(root, offsets[root])]  # Node and position of the next target to visit
+            while work:
+                node, position = work[-1]
+                if position < offsets[node + 1]:
+                    work[-1] = (node, position + 1)
+                    target = targets[position]
+                    if index_of[target] < 0:
+                        index_of[target] = low[target] = next_index
+                        next_index += 1
+                        stack.append(target)
+                        on_stack[target] = True
+                        work.append((target, offsets[target]))
+                    elif on_stack[target] and index_of[target] < low[node]:
+                        low[node] = index_of[target]
+                    continue
+                work.pop()
+                if work and low[node] < low[work[-1][0]]:
+                    low[work[-1][0]] = low[node]
+                if low[node] == index_of[node]:
+                    component = len(first_rank) - 1
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component_of[member] = component
+                        node_of_rank.append(member)
+                        if member == node:
+                            break
+                    first_rank.append(len(node_of_rank))
+
+        self.component_of: array = component_of
+        self.node_of_rank: array = node_of_rank
+        self.first_rank: array = first_rank
+        self.component_count: int = len(first_rank) - 1
+        self.rank_of: array = array('i', [0]) * count
+        for rank, node in enumerate(node_of_rank):
+            self.rank_of[node] = rank
+
+    def _cyclic(self, component: int) -> bool:
+        """Whether the component depends on itself: several nodes, or one referencing itself"""
+        first = self.first_rank[component]
+        if self.first_rank[component + 1] - first > 1:
+            return True
+        node = self.node_of_rank[first]
+        return node in self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    def _members(self, component: int) -> int:
+        first, stop = self.first_rank[component], self.first_rank[component + 1]
+        return ((1 << (stop - first)) - 1) << first
+
+    def _closure(self, component: int, forward: bool) -> int:
+        """Bitset of the ranks reached from `component` (its own members only when it is cyclic), memoized"""
+        memo = self._forward if forward else self._backward
+        if memo[component] is not None:
+            return memo[component]
+        offsets, targets = (self.offsets, self.targets) if forward else (self.reverse_offsets, self.reverse_targets)
+        component_of, node_of_rank, first_rank = self.component_of, self.node_of_rank, self.first_rank
+
+        #* Post-order walk over the components, each closure is the union of the closures of its neighbours
+        work = [component]
+        while work:
+            current = work[-1]
+            if memo[current] is not None:
+                work.pop()
+                continue
+            neighbours = {
+                component_of[target]
+                for rank in range(first_rank[current], first_rank[current + 1])
+                for target in targets[offsets[node_of_rank[rank]]:offsets[node_of_rank[rank] + 1]]
+            }
+            neighbours.discard(current)
+            missing = [neighbour for neighbour in neighbours if memo[neighbour] is None]
+            if missing:
+                work.extend(missing)
+                continue
+            bits = self._members(current) if self._cyclic(current) else 0
+            for neighbour in neighbours:
+                bits |= memo[neighbour] | self._members(neighbour)
+            memo[current] = bits
+            work.pop()
+        return memo[component]
+
+    # endregion #* Closures
@@ -0,0 +1,262 @@
+from collections import deque
+from typing import Iterable, TYPE_CHECKING
+
+from .DAXExpression import DAXExpression
+from .DAXAnalysisCache import DAXAnalysisCache
+from .DAXReference import DAXArtifactReference
+from .DAXNameTable import DAXNameTable
+
+if TYPE_CHECKING:
+    from .DAXLineage import DAXLineage
+
+
+class DAXModelArtifact:
+    """A measure, calculated column, calculated table or user defined function of a DAXModel"""
+
+    MEASURE: str = "measure"
+    CALCULATED_COLUMN: str = "calculated_column"
+    CALCULATED_TABLE: str = "calculated_table"
+    FUNCTION: str = "function"
+
+    def __init__(self, kind: str, name: str, dax_expression: str, table_name: str | None = None) -> None:
+        self.kind: str = kind
+        self.name: str = name
+        self.table_name: str | None = table_name  # Home table of measures and calculated columns
+        self.dax_expression: str = dax_expression
+        self.expression: DAXExpression | None = None  # Set once the model analyzes the artifact
+        self.error: str | None = None  # Set instead of `expression` when the analysis failed
+
+    def __str__(self) -> str:
+        if self.kind == DAXModelArtifact.CALCULATED_COLUMN:
+            return f"'{self.table_name}'[{self.name}]"
+        if self.kind == DAXModelArtifact.MEASURE:
+            return f"[{self.name}]"
+        if self.kind == DAXModelArtifact.CALCULATED_TABLE:
+            return f"'{self.name}'"
+        return f"{self.name}()"
+
+    def __repr__(self) -> str:
+        return f"DAXModelArtifact({self.kind}, {self})"
+
+
+class DAXModel:
+    """Measures, calculated columns, calculated tables and user defined functions of a model and the dependencies between them.
+
+    Every artifact is analyzed once (references only) and its table_column_references, table_references and
+    function_references are resolved against the model through hash lookups, so building the dependency graph is
+    linear in the number of references. Queries walk the graph once and are linear in its size. DAX names are
+    case-insensitive, and so are the lookups: names are interned in the model's DAXNameTable and artifacts are indexed
+    by the ids of their names.
+    """
+
+    def __init__(self, lexer_backend: str = "antlr", workers: int = 1, cache: DAXAnalysisCache | None = None) -> None:
+        """
+        Args:
+            lexer_backend (str): Tokenizer from DAXExpression.LEXER_BACKENDS used to analyze the artifacts
+            workers (int): Worker processes used to analyze the artifacts (see DAXExpression.analyze_many)
+            cache (DAXAnalysisCache | None): Cache of analysis results, so identical expressions are analyzed once
+        """
+        if lexer_backend not in DAXExpression.LEXER_BACKENDS:
+            raise ValueError(f"Unknown lexer backend '{lexer_backend}', expected any of {DAXExpression.LEXER_BACKENDS}")
+        self.lexer_backend: str = lexer_backend
+        self.workers: int = workers
+        self.cache: DAXAnalysisCache | None = cache
+        self.artifacts: list[DAXModelArtifact] = []
+        self.names: DAXNameTable = DAXNameTable()  # Shared by the references of every artifact once resolved
+
+        #* Name ids -> position in self.artifacts
+        self._measures: dict[int, int] = {}
+        self._columns: dict[tuple[int, int], int] = {}
+        self._tables: dict[int, int] = {}
+        self._functions: dict[int, int] = {}
+        self._positions: dict[int, int] = {}  # id(artifact) -> position in self.artifacts
+
+        #* Adjacency lists by artifact position, built on first query and dropped whenever an artifact is added
+        self._dependencies: list[list[int]] | None = None
+        self._dependents: list[list[int]] | None = None
+        self._lineage: "DAXLineage | None" = None
+
+    # region #? Artifacts
+
+    def add_measure(self, table_name: str, name: str, dax_expression: str) -> DAXModelArtifact:
+        return self._add(DAXModelArtifact(DAXModelArtifact.MEASURE, name, dax_expression, table_name))
+
+    def add_calculated_column(self, table_name: str, name: str, dax_expression: str) -> DAXModelArtifact:
+        return self._add(DAXModelArtifact(DAXModelArtifact.CALCULATED_COLUMN, name, dax_expression, table_name))
+
+    def add_calculated_table(self, name: str, dax_expression: str) -> DAXModelArtifact:
+        return self._add(DAXModelArtifact(DAXModelArtifact.CALCULATED_TABLE, name, dax_expression))
+
+    def add_function(self, name: str, dax_expression: str) -> DAXModelArtifact:
+        return self._add(DAXModelArtifact(DAXModelArtifact.FUNCTION, name, dax_expression))
+
+    def add_artifacts(self, artifacts: Iterable[DAXModelArtifact]) -> None:
+        """Adds artifacts read from a model file (see DAXBimReader and DAXTmdlReader). Artifacts that already carry
+        an expression or an error, e.g. from DAXModelReader.analyze, are not analyzed again."""
+        for artifact in artifacts:
+            self._add(artifact)
+
+    def measure(self, name: str) -> DAXModelArtifact:
+        return self.artifacts[self._measures[self._id(name)]]
+
+    def calculated_column(self, table_name: str, name: str) -> DAXModelArtifact:
+        return self.artifacts[self._columns[(self._id(table_name), self._id(name))]]
+
+    def calculated_table(self, name: str) -> DAXModelArtifact:
+        return self.artifacts[self._tables[self._id(name)]]
+
+    def function(self, name: str) -> DAXModelArtifact:
+        return self.artifacts[self._functions[self._id(name)]]
+
+    def _id(self, name: str) -> int:
+        """Id of a name of the model, KeyError when the model never saw it"""
+        name_id = self.names.lookup(name)
+        if name_id is None:
+            raise KeyError(name)
+        return name_id
+
+    def _add(self, artifact: DAXModelArtifact) -> DAXModelArtifact:
+        name_id = self.names.intern(artifact.name)
+        if artifact.kind == DAXModelArtifact.MEASURE:
+            index, key = self._measures, name_id
+        elif artifact.kind == DAXModelArtifact.CALCULATED_COLUMN:
+            index, key = self._columns, (self.names.intern(artifact.table_name or ""), name_id)
+        elif artifact.kind == DAXModelArtifact.CALCULATED_TABLE:
+            index, key = self._tables, name_id
+        elif artifact.kind == DAXModelArtifact.FUNCTION:
+            index, key = self._functions, name_id
+        else:
+            raise ValueError(f"Unknown artifact kind '{artifact.kind}'")
+        if key in index:
+            raise ValueError(f"The model already contains {self.artifacts[index[key]]!r}")
+        index[key] = self._positions[id(artifact)] = len(self.artifacts)
+        self.artifacts.append(artifact)
+        self._dependencies = self._dependents = self._lineage = None
+        return artifact
+
+    # endregion #? Artifacts
+
+    # region #* Dependency Graph
+
+    def dependencies(self, artifact: DAXModelArtifact, transitive: bool = False) -> list[DAXModelArtifact]:
+        """Artifacts referenced by `artifact` (and, when transitive, by those in turn)"""
+        graph, _ = self._graph()
+        return [self.artifacts[position] for position in self._walk(graph, [self._position(artifact)], transitive)]
+
+    def dependents(self, artifact: DAXModelArtifact, transitive: bool = False) -> list[DAXModelArtifact]:
+        """Artifacts referencing `artifact` (and, when transitive, those referencing them in turn): what depends on it"""
+        _, graph = self._graph()
+        return [self.artifacts[position] for position in self._walk(graph, [self._position(artifact)], transitive)]
+
+    def unused(self) -> list[DAXModelArtifact]:
+        """Artifacts no other artifact of the model references"""
+        _, dependents = self._graph()
+        return [artifact for artifact, referencing in zip(self.artifacts, dependents) if not referencing]
+
+    def unreachable(self, roots: Iterable[DAXModelArtifact]) -> list[DAXModelArtifact]:
+        """Artifacts that none of `roots` (e.g. the measures used by reports) depends on, directly or not.
+
+        An artifact only used by unreachable artifacts is unreachable as well.
+        """
+        dependencies, _ = self._graph()
+        positions = [self._position(root) for root in roots]
+        reachable = set(positions)
+        reachable.update(self._walk(dependencies, positions, transitive=True))
+        return [artifact for position, artifact in enumerate(self.artifacts) if position not in reachable]
+
+    @property
+    def lineage(self) -> "DAXLineage":
+        """Memoized transitive closures of the dependency graph, down to the physical columns (see DAXLineage).
+        Built on first access and dropped whenever an artifact is added."""
+        if self._lineage is None:
+            from .DAXLineage import DAXLineage
+
+            self._lineage = DAXLineage(self)
+        return self._lineage
+
+    def _position(self, artifact: DAXModelArtifact) -> int:
+        position = self._positions.get(id(artifact))
+        if position is None or self.artifacts[position] is not artifact:
+            raise KeyError(f"{artifact!r} is not part of the model")
+        return position
+
+    @staticmethod
+    def _walk(graph: list[list[int]], starts: list[int], transitive: bool) -> list[int]:
+        """Breadth first walk from `starts`, excluded, returning the position of every artifact reached once"""
+        seen = set(starts)
+        found: list[int] = []
+        queue = deque(starts)
+        while queue:
+            for neighbour in graph[queue.popleft()]:
+                if neighbour not in seen:
+                    seen.add(neighbour)
+                    found.append(neighbour)
+                    if transitive:
+                        queue.append(neighbour)
+        return found
+
+    def _graph(self) -> tuple[list[list[int]], list[list[int]]]:
+        if self._dependencies is None:
+            self._analyze()
+            self._dependencies = [self._resolve(artifact, position) for position, artifact in enumerate(self.artifacts)]
+            self._dependents = [[] for _ in self.artifacts]
+            for position, referenced in enumerate(self._dependencies):
+                for target in referenced:
+                    self._dependents[target].append(position)
+        return self._dependencies, self._dependents
+
+    def _analyze(self) -> None:
+        pending = [artifact for artifact in self.artifacts if artifact.expression is None and artifact.error is None]
+        results = DAXExpression.analyze_many(
+            [artifact.dax_expression for artifact in pending],
+            workers=self.workers,
+            cache=self.cache,
+            keep_expressions=True,
+            analyses=("references",),
+            verify_best_practices=False,
+            lexer_backend=self.lexer_backend,
+        )
+        for artifact, result in zip(pending, results):
+            artifact.expression, artifact.error = result.expression, result.error
+
+    def _resolve(self, artifact: DAXModelArtifact, position: int) -> list[int]:
+        """Positions of the model artifacts referenced by `artifact`: columns and measures, then tables, then functions"""
+        expression = artifact.expression
+        if expression is None:
+            return []
+
+        names = self.names
+        referenced: dict[int, None] = {}
+        for reference in expression.table_column_references:
+            if reference._names is not names:
+                reference.intern(names)
+            target = self._resolve_column(artifact, reference)
+            if target is not None:
+                referenced[target] = None
+        for references, index in ((expression.table_references, self._tables), (expression.function_references, self._functions)):
+            for reference in references:
+                if reference._names is not names:
+                    reference.intern(names)
+                target = index.get(reference.name_id)
+                if target is not None:
+                    referenced[target] = None
+
+        referenced.pop(position, None)
+        return list(referenced)
+
+    def _resolve_column(self, artifact: DAXModelArtifact, reference: DAXArtifactReference) -> int | None:
+        """Position of the model artifact a column or measure reference of `artifact` points to, None when the
+        reference is to a column of the data source or to nothing the model knows. The reference must be interned in
+        the model's names."""
+        table, name = reference.table_id, reference.artifact_id
+        if not reference.table_name and artifact.kind == DAXModelArtifact.CALCULATED_COLUMN:
+            home_table = self.names.intern(artifact.table_name or "")
+            if (home_table, name) in self._columns:
+                return self._columns[(home_table, name)]  # [Column] in a calculated column is a column of its own table
+        elif reference.table_name and (table, name) in self._columns:
+            return self._columns[(table, name)]
+        if name in self._measures:
+            return self._measures[name]
+        return self._tables.get(table)  # Column of a calculated table
+
+    # endregion #* Dependency Graph
@@ -0,0 +1,391 @@
+import json
+import os
+import re
+import textwrap
+from abc import ABC, abstractmethod
+from json.decoder import scanstring
+from typing import Any, Iterator, TextIO
+
+from .DAXAnalysisCache import DAXAnalysisCache
+from .DAXExpression import DAXExpression
+from .DAXModel import DAXModelArtifact
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+#* A complete string, a bracket, or the quote of a string that continues in the next chunk
+_STRUCTURE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]]|"')
+
+#* `<object type> <name> [= <expression>]`, names with spaces or special characters are quoted with '...'
+_TMDL_DECLARATION = re.compile(r"(\w+)[ \t]+('(?:[^']|'')*'|[^\s=:]+)[ \t]*(?:=[ \t]*(.*))?$")
+_TMDL_PROPERTY = re.compile(r"(\w+)[ \t]*=[ \t]*(.*)$")
+_TMDL_FENCE = "```"
+
+
+class DAXModelReader(ABC):
+    """Reads the measures, calculated columns, calculated tables and user defined functions of a model file.
+
+    Iterating yields one DAXModelArtifact at a time, as it is read: the file is never held in memory as a whole.
+    """
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[DAXModelArtifact]:
+        """Yields the artifacts of the model in file order"""
+
+    def analyze(
+        self, batch_size: int = 1000, workers: int | None = 1, cache: DAXAnalysisCache | None = None, **options: Any
+    ) -> Iterator[DAXModelArtifact]:
+        """Analyzes the artifacts as they are read and yields each one with its `expression` (or `error`) set.
+
+        Artifacts are sent to DAXExpression.analyze_many `batch_size` at a time, so only one batch is held in memory.
+        With several workers, each batch starts its own process pool: keep batches large.
+
+        Args:
+            batch_size (int): Artifacts analyzed together
+            workers (int | None): Worker processes of analyze_many, 1 analyzes in the calling process
+            cache (DAXAnalysisCache | None): Cache of analysis results, see analyze_many
+            **options: Arguments of DAXExpression (verify_best_practices, analyses, lexer_backend, rules...)
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        batch: list[DAXModelArtifact] = []
+        for artifact in self:
+            batch.append(artifact)
+            if len(batch) == batch_size:
+                yield from self._analyze_batch(batch, workers, cache, options)
+                batch = []
+        if batch:
+            yield from self._analyze_batch(batch, workers, cache, options)
+
+    @staticmethod
+    def _analyze_batch(
+        batch: list[DAXModelArtifact], workers: int | None, cache: DAXAnalysisCache | None, options: dict[str, Any]
+    ) -> list[DAXModelArtifact]:
+        results = DAXExpression.analyze_many([artifact.dax_expression for artifact in batch], workers=workers, cache=cache, keep_expressions=True, **options)
+        for artifact, result in zip(batch, results):
+            artifact.expression, artifact.error = result.expression, result.error
+        return batch
+
+
+class DAXBimReader(DAXModelReader):
+    """Streams the artifacts of a model.bim file (a TMSL database definition).
+
+    The JSON is read in chunks and only the measures, columns, partitions and functions are decoded, one object at a
+    time. Everything else (annotations, relationships, cultures...) is skipped without being decoded.
+    """
+
+    def __init__(self, source: "str | os.PathLike | TextIO", chunk_size: int = 1 << 16, encoding: str = "utf-8-sig") -> None:
+        """
+        Args:
+            source (str | os.PathLike | TextIO): Path of the model.bim file, or a text file object to read it from
+            chunk_size (int): Characters read at once
+            encoding (str): Encoding of the file when `source` is a path. The default also accepts a byte order mark.
+        """
+        self.source = source
+        self.chunk_size: int = chunk_size
+        self.encoding: str = encoding
+
+    def __iter__(self) -> Iterator[DAXModelArtifact]:
+        if isinstance(self.source, (str, os.PathLike)):
+            with open(self.source, encoding=self.encoding) as file:
+                yield from self._read(_JSONStream(file, self.chunk_size))
+        else:
+            yield from self._read(_JSONStream(self.source, self.chunk_size))
+
+    def _read(self, stream: "_JSONStream") -> Iterator[DAXModelArtifact]:
+        for key in stream.members():
+            if key != "model":
+                stream.skip()
+                continue
+            for model_key in stream.members():
+                if model_key == "tables":
+                    for _ in stream.items():
+                        yield from self._table(stream)
+                elif model_key == "functions":
+                    for _ in stream.items():
+                        function = stream.decode()
+                        if isinstance(function, dict) and "expression" in function:
+                            yield DAXModelArtifact(DAXModelArtifact.FUNCTION, function.get("name", ""), _expression(function))
+                else:
+                    stream.skip()
+
+    @staticmethod
+    def _table(stream: "_JSONStream") -> Iterator[DAXModelArtifact]:
+        table_name: str | None = None
+        pending: list[tuple[str, dict]] = []  # Objects read before the name of the table, usually none
+        for key in stream.members():
+            if key == "name":
+                table_name = stream.decode()
+                for collection, item in pending:
+                    yield from _bim_artifacts(table_name, collection, item)
+                pending = []
+            elif key in ("measures", "columns", "partitions"):
+                for _ in stream.items():
+                    item = stream.decode()
+                    if not isinstance(item, dict):
+                        continue
+                    if table_name is None:
+                        pending.append((key, item))
+                    else:
+                        yield from _bim_artifacts(table_name, key, item)
+            else:
+                stream.skip()
+        for collection, item in pending:
+            yield from _bim_artifacts("", collection, item)
+
+
+def _expression(item: dict) -> str:
+    """TMSL stores long expressions as lists of lines"""
+    expression = item.get("expression", "")
+    return "\n".join(expression) if isinstance(expression, list) else expression
+
+
+def _bim_artifacts(table_name: str, collection: str, item: dict) -> Iterator[DAXModelArtifact]:
+    if collection == "measures":
+        yield DAXModelArtifact(DAXModelArtifact.MEASURE, item.get("name", ""), _expression(item), table_name)
+    elif collection == "columns":
+        if item.get("type") == "calculated":
+            yield DAXModelArtifact(DAXModelArtifact.CALCULATED_COLUMN, item.get("name", ""), _expression(item), table_name)
+    else:
+        source = item.get("source")
+        if isinstance(source, dict) and source.get("type") == "calculated":
+            yield DAXModelArtifact(DAXModelArtifact.CALCULATED_TABLE, table_name, _expression(source))
+
+
+class _JSONStream:
+    """JSON text read from a file a chunk at a time, walked one value at a time.
+
+    Only the text from the value being read to the last character read is kept. When a value does not fit, the next
+    read is twice as large, so long values are still read in linear time.
+    """
+
+    def __init__(self, file: TextIO, chunk_size: int) -> None:
+        self.file: TextIO = file
+        self.chunk_size: int = chunk_size
+        self.read_size: int = chunk_size
+        self.text: str = ""
+        self.position: int = 0
+        self.eof: bool = False
+
+    def _more(self) -> bool:
+        """Reads the next chunk after dropping the text already walked, False at the end of the file"""
+        if self.eof:
+            return False
+        #* Nothing was walked since the last read: the value being read is longer than the text
+        self.read_size = self.read_size * 2 if self.text and self.position == 0 else self.chunk_size
+        chunk = self.file.read(self.read_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.text = self.text[self.position:] + chunk
+        self.position = 0
+        return True
+
+    def _error(self, message: str) -> ValueError:
+        return ValueError(f"Invalid model.bim: {message}")
+
+    def peek(self) -> str:
+        """Next character after whitespace, empty at the end of the file"""
+        while True:
+            self.position = _WHITESPACE.match(self.text, self.position).end()
+            if self.position < len(self.text):
+                return self.text[self.position]
+            if not self._more():
+                return ""
+
+    def expect(self, character: str) -> None:
+        found = self.peek()
+        if found != character:
+            raise self._error(f"expected '{character}', found {found!r}" if found else f"expected '{character}' at the end of the file")
+        self.position += 1
+
+    def members(self) -> Iterator[str]:
+        """Keys of the object starting here. The value of each key must be read (or skipped) before the next one."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.position += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise self._error("expected a key")
+            key = self.decode()
+            self.expect(":")
+            yield key
+            if self.peek() == ",":
+                self.position += 1
+                continue
+            self.expect("}")
+            return
+
+    def items(self) -> Iterator[None]:
+        """Walks the array starting here. Each item must be read (or skipped) before the next one."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.position += 1
+            return
+        while True:
+            yield None
+            if self.peek() == ",":
+                self.position += 1
+                continue
+            self.expect("]")
+            return
+
+    def decode(self) -> Any:
+        """Decodes the value starting here"""
+        character = self.peek()
+        while True:
+            try:
+                if character == '"':
+                    value, end = scanstring(self.text, self.position + 1)
+                else:
+                    value, end = _DECODER.raw_decode(self.text, self.position)
+            except json.JSONDecodeError as error:
+                if self._more():
+                    continue
+                raise self._error(str(error)) from None
+            #* A number may continue in the next chunk
+            if end == len(self.text) and character not in '"{[' and self._more():
+                continue
+            self.position = end
+            return value
+
+    def skip(self) -> None:
+        """Moves past the value starting here without decoding it"""
+        if self.peek() not in "{[":
+            self.decode()
+            return
+        depth = 0
+        while True:
+            for match in _STRUCTURE.finditer(self.text, self.position):
+                token = match.group()
+                if token == '"':
+                    self.position = match.start()  # A string cut by the end of the text
+                    break
+                if token in "{[":
+                    depth += 1
+                elif token in "}]":
+                    depth -= 1
+                    if depth == 0:
+                        self.position = match.end()
+                        return
+            else:
+                self.position = len(self.text)
+            if not self._more():
+                raise self._error("unexpected end of the file")
+
+
+class DAXTmdlReader(DAXModelReader):
+    """Streams the artifacts of a TMDL folder (e.g. the definition folder of a Power BI project) or TMDL file.
+
+    Files are read line by line and only the expression being read is kept. Measures and calculated columns are the
+    `measure` and `column` objects with an expression, calculated tables the tables with a `calculated` partition and
+    user defined functions the `function` objects.
+    """
+
+    def __init__(self, source: "str | os.PathLike | TextIO", encoding: str = "utf-8-sig") -> None:
+        """
+        Args:
+            source (str | os.PathLike | TextIO): Path of a folder (read recursively) or of a .tmdl file, or a text file object
+            encoding (str): Encoding of the files. The default also accepts a byte order mark.
+        """
+        self.source = source
+        self.encoding: str = encoding
+
+    def __iter__(self) -> Iterator[DAXModelArtifact]:
+        if not isinstance(self.source, (str, os.PathLike)):
+            yield from self._read(self.source)
+            return
+        if not os.path.isdir(self.source):
+            with open(self.source, encoding=self.encoding) as file:
+                yield from self._read(file)
+            return
+        for directory, directories, files in os.walk(self.source):
+            directories.sort()
+            for name in sorted(files):
+                if name.endswith(".tmdl"):
+                    with open(os.path.join(directory, name), encoding=self.encoding) as file:
+                        yield from self._read(file)
+
+    def _read(self, file: TextIO) -> Iterator[DAXModelArtifact]:
+        table_name, table_level = "", -1
+        partition_level = -1  # Level of the calculated partition being read, -1 outside of one
+        lines = _TMDLLines(file)
+        for level, text in lines:
+            if partition_level >= 0 and level <= partition_level:
+                partition_level = -1
+            match = _TMDL_DECLARATION.match(text)
+            if match is None:
+                #* Properties with an expression are read whole, so their lines are not taken for declarations
+                match = _TMDL_PROPERTY.match(text)
+                if match is not None:
+                    expression = lines.expression(match.group(2), level)
+                    if partition_level >= 0 and level == partition_level + 1 and match.group(1) == "source":
+                        yield DAXModelArtifact(DAXModelArtifact.CALCULATED_TABLE, table_name, expression)
+                continue
+
+            object_type, name, expression = match.group(1), _tmdl_name(match.group(2)), match.group(3)
+            if expression is not None:
+                expression = lines.expression(expression, level + 1)  # Properties of the object are one level deeper
+            if object_type == "table":
+                table_name, table_level = name, level
+            elif expression is None:
+                continue
+            elif object_type == "function":
+                yield DAXModelArtifact(DAXModelArtifact.FUNCTION, name, expression)
+            elif level > table_level >= 0:
+                if object_type == "measure":
+                    yield DAXModelArtifact(DAXModelArtifact.MEASURE, name, expression, table_name)
+                elif object_type == "column":
+                    yield DAXModelArtifact(DAXModelArtifact.CALCULATED_COLUMN, name, expression, table_name)
+                elif object_type == "partition" and expression == "calculated":
+                    partition_level = level
+
+
+def _tmdl_name(name: str) -> str:
+    return name[1:-1].replace("''", "'") if name.startswith("'") else name
+
+
+def _tmdl_level(line: str) -> int:
+    """Indentation level of a line: one per tab, or per four spaces"""
+    indentation = line[:len(line) - len(line.lstrip("\t "))]
+    return indentation.count("\t") + indentation.count(" ") // 4
+
+
+class _TMDLLines:
+    """Non-blank lines of a TMDL file with their indentation level, able to read the expression of the last one"""
+
+    def __init__(self, file: TextIO) -> None:
+        self.file: TextIO = file
+        self.next_line: str | None = None  # Line read past the end of an expression, returned next
+
+    def __iter__(self) -> Iterator[tuple[int, str]]:
+        while True:
+            line, self.next_line = self.next_line, None
+            if line is None:
+                line = self.file.readline()
+                if not line:
+                    return
+            text = line.strip()
+            if text and not text.startswith("///"):
+                yield _tmdl_level(line), text
+
+    def expression(self, first_line: str, level: int) -> str:
+        """Expression starting with `first_line` (what follows the '='), continued by the next lines indented deeper
+        than `level`, or up to the closing ``` when it is fenced"""
+        if first_line.strip() == _TMDL_FENCE:
+            lines = []
+            for line in self.file:
+                if line.strip().startswith(_TMDL_FENCE):
+                    break
+                lines.append(line)
+            return textwrap.dedent("".join(lines)).strip("\n")
+
+        lines = []
+        for line in self.file:
+            if line.strip() and _tmdl_level(line) <= level:
+                self.next_line = line
+                break
+            lines.append(line)
+        body = textwrap.dedent("".join(lines)).strip("\n")
+        first_line = first_line.strip()
+        return f"{first_line}\n{body}" if first_line and body else first_line or body
@@ -0,0 +1,48 @@
+class DAXNameTable:
+    """Interns the names of tables, columns, measures, functions and variables, case-insensitively like DAX.
+
+    Every case-folded name gets a small integer id and a canonical spelling, the first one interned. Each distinct
+    spelling is stored once and shared by everything interned with it, so a model referencing a column thousands of
+    times keeps one string for it. References interned in the same table (see DAXExpression.intern_names) compare and
+    index by id.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[str, int]] = {}  # Spelling or case-folded name -> (shared spelling, id)
+        self.names: list[str] = []  # Canonical spelling of each id
+        self.keys: list[str] = []  # Case-folded name of each id
+
+    def entry(self, name: str) -> tuple[str, int]:
+        """Shared string for this spelling of `name` and the id of its case-folded form, added when missing"""
+        entry = self._entries.get(name)
+        if entry is None:
+            key = name.casefold()
+            folded = self._entries.get(key)
+            if folded is None:
+                name_id = len(self.keys)
+                self.keys.append(key)
+                self.names.append(name)
+                self._entries[key] = (key, name_id)
+            else:
+                name_id = folded[1]
+            entry = self._entries[name] = (name, name_id)
+        return entry
+
+    def intern(self, name: str) -> int:
+        """Id of `name`, added when missing"""
+        return self.entry(name)[1]
+
+    def lookup(self, name: str) -> int | None:
+        """Id of `name`, None when it was never interned"""
+        entry = self._entries.get(name) or self._entries.get(name.casefold())
+        return None if entry is None else entry[1]
+
+    def name(self, name_id: int) -> str:
+        """Canonical spelling of an id"""
+        return self.names[name_id]
+
+    def __contains__(self, name: str) -> bool:
+        return self.lookup(name) is not None
+
+    def __len__(self) -> int:
+        return len(self.keys)
@@ -0,0 +1,337 @@
+from .DAXKeywords import DEFINITION_WORDS
+from .DAXSyntaxTree import DAXNodeKinds as K, DAXSyntaxTree
+from .DAXTokenBuffer import DAXTokenBuffer
+from .DAXTokenTypes import DAXTokenTypes as T
+
+#* Binary operators: token type -> (precedence, right associative). A higher precedence binds tighter.
+_BINARY: dict[int, tuple[int, bool]] = {
+    T.LAMBDA: (5, True), T.COLON: (6, False),
+    T.OP_OR: (10, False),
+    T.OP_AND: (20, False),
+    T.ASSIGNMENT: (40, False), T.OP_NE: (40, False), T.LT: (40, False), T.GT: (40, False), T.OP_LE: (40, False),
+    T.OP_GE: (40, False), T.IN: (40, False),
+    T.AMP: (50, False),
+    T.PLUS: (60, False), T.MINUS: (60, False),
+    T.STAR: (70, False), T.DIV: (70, False),
+    T.CARET: (90, False),
+}
+#* Prefix operators: the sign binds tighter than everything but '^', NOT looser than the comparisons
+_PREFIX: dict[int, int] = {T.PLUS: 80, T.MINUS: 80, T.NOT: 30}
+_LITERALS: frozenset[int] = frozenset({T.INTEGER_LITERAL, T.REAL_LITERAL, T.STRING_LITERAL, T.DATE_LITERAL, T.TRUE, T.FALSE})
+#* Identifiers and keywords: function names, and names of variables, tables or keyword arguments
+_NAMES: frozenset[int] = frozenset({T.TABLE, T.TABLE_OR_VARIABLE, *range(T.ABS, T.NUMERIC + 1)})
+
+#* Frames closed by a parenthesis or brace
+_BRACKETS: frozenset[int] = frozenset({K.CALL, K.PARENS, K.TABLE_CONSTRUCTOR})
+#* Frames that end with the expression around them: at a ',', ')' or '}', or at the next VAR or RETURN
+_EXPRESSIONS: frozenset[int] = frozenset({K.VAR_BLOCK, K.VARIABLE, K.RETURN})
+#* Frames whose items are separated by commas
+_LISTS: frozenset[int] = frozenset({K.CALL, K.PARENS, K.TABLE_CONSTRUCTOR, K.ORDER_BY, K.START_AT})
+#* Frames that may be closed without any content
+_MAY_BE_EMPTY: frozenset[int] = frozenset({K.ROOT, K.CALL, K.TABLE_CONSTRUCTOR, K.DEFINE})
+
+
+class DAXParser:
+    """Error tolerant parser of DAX expressions and queries, producing a DAXSyntaxTree from a DAXTokenBuffer.
+
+    An operator precedence parser in a single pass over the significant tokens. Nesting (calls, parentheses, VAR
+    blocks, query sections) is kept in an explicit stack of frames rather than in recursion, so the depth of an
+    expression is not limited. A missing operand becomes an EMPTY node, an unexpected token an ERROR node and
+    unclosed frames are closed at the end, each with an entry in DAXSyntaxTree.errors.
+    """
+
+    def __init__(self, buffer: DAXTokenBuffer) -> None:
+        self.buffer: DAXTokenBuffer = buffer
+        self.tree: DAXSyntaxTree = DAXSyntaxTree(buffer)
+        self.tokens: list[int] = buffer.on_channels(T.DEFAULT_CHANNEL, T.KEYWORD_CHANNEL)
+        #* [kind, token, first token, operand base, operator base]: operands and operators of a frame are above its bases
+        self.frames: list[list[int]] = [[K.ROOT, -1, -1, 0, 0]]
+        self.operands: list[int] = []
+        #* (precedence, token, is_binary)
+        self.operators: list[tuple[int, int, bool]] = []
+        self.expect_operand: bool = True
+
+    @classmethod
+    def parse(cls, buffer: DAXTokenBuffer) -> DAXSyntaxTree:
+        return cls(buffer).run()
+
+    def run(self) -> DAXSyntaxTree:
+        tokens, types = self.tokens, self.buffer.types
+        position = 0
+        while position < len(tokens):
+            token_type = types[tokens[position]]
+            if token_type in (T.DEFINE, T.EVALUATE) or (
+                token_type in (T.ORDER, T.START) and self._next_type(position) == (T.BY if token_type == T.ORDER else T.AT)
+            ):
+                position = self._query_keyword(position)
+            elif self.expect_operand:
+                position = self._operand(position)
+            else:
+                position = self._operator(position)
+        self._close_to((K.ROOT,))
+        self._close(-1)
+        self.tree.root = self.operands.pop()
+        return self.tree
+
+    # Helpers
+
+    def _next_type(self, position: int) -> int:
+        return self.buffer.types[self.tokens[position + 1]] if position + 1 < len(self.tokens) else T.EOF
+
+    def _error(self, token: int, message: str) -> None:
+        self.tree.errors.append((token, message))
+
+    def _leaf(self, kind: int, token: int, first: int = -1) -> None:
+        self.operands.append(self.tree.add(kind, token, token if first < 0 else first, token, []))
+        self.expect_operand = False
+
+    def _empty(self, token: int, allowed: bool) -> None:
+        """Stands for a missing operand before `token`"""
+        if not allowed:
+            self._error(token, "expected an expression")
+        self.operands.append(self.tree.add(K.EMPTY, -1, -1, -1, []))
+        self.expect_operand = False
+
+    def _push_frame(self, kind: int, token: int, first: int) -> None:
+        self.frames.append([kind, token, first, len(self.operands), len(self.operators)])
+        self.expect_operand = True
+
+    def _reduce(self, precedence: int = -1, right_associative: bool = False) -> None:
+        """Builds the pending operators of the current frame that bind tighter than an operator of `precedence`"""
+        tree, operands, operators = self.tree, self.operands, self.operators
+        base = self.frames[-1][4]
+        while len(operators) > base:
+            top_precedence, token, is_binary = operators[-1]
+            if top_precedence < precedence or (top_precedence == precedence and right_associative):
+                break
+            operators.pop()
+            right = operands.pop()
+            if is_binary:
+                left = operands.pop()
+                first = tree.first_tokens[left] if tree.first_tokens[left] >= 0 else token
+                last = tree.last_tokens[right] if tree.last_tokens[right] >= 0 else token
+                operands.append(tree.add(K.BINARY, token, first, last, [left, right]))
+            else:
+                last = tree.last_tokens[right] if tree.last_tokens[right] >= 0 else token
+                operands.append(tree.add(K.UNARY, token, token, last, [right]))
+
+    def _close(self, last_token: int) -> None:
+        """Closes the current frame, `last_token` is its closing parenthesis or brace (-1 when closed implicitly)"""
+        tree = self.tree
+        kind, token, first, operand_base, operator_base = self.frames[-1]
+        if self.expect_operand:
+            pending = len(self.operators) > operator_base
+            if pending or len(self.operands) > operand_base or kind not in _MAY_BE_EMPTY:
+                self._empty(last_token, kind == K.CALL and not pending)
+            self.expect_operand = False
+        self._reduce()
+        self.frames.pop()
+        children = self.operands[operand_base:]
+        del self.operands[operand_base:]
+
+        if kind in _BRACKETS and last_token < 0:
+            self._error(token, "missing '}'" if kind == K.TABLE_CONSTRUCTOR else "missing ')'")
+        elif kind == K.VAR_BLOCK and not (children and tree.kinds[children[-1]] == K.RETURN):
+            self._error(token, "missing RETURN")
+        lasts = [tree.last_tokens[child] for child in children]
+        if last_token < 0:
+            last_token = max([first, *lasts])
+        if kind == K.ROOT:
+            firsts = [tree.first_tokens[child] for child in children if tree.first_tokens[child] >= 0]
+            first = min(firsts) if firsts else -1
+        self.operands.append(tree.add(kind, token, first, last_token, children))
+        self.expect_operand = False
+
+    def _find(self, kinds: tuple[int, ...], passable: frozenset[int]) -> int:
+        """Position in the frame stack of the innermost frame of `kinds` reachable through `passable` frames, -1 if none"""
+        for depth in range(len(self.frames) - 1, -1, -1):
+            kind = self.frames[depth][0]
+            if kind in kinds:
+                return depth
+            if kind not in passable:
+                return -1
+        return -1
+
+    @staticmethod
+    def _openers(token_type: int) -> tuple[int, ...]:
+        """Kinds of the frames closed by a ')' or '}'"""
+        return (K.TABLE_CONSTRUCTOR,) if token_type == T.CLOSE_CURLY else (K.CALL, K.PARENS)
+
+    def _close_to(self, kinds: tuple[int, ...]) -> None:
+        """Closes every frame above the innermost frame of `kinds`"""
+        while self.frames[-1][0] not in kinds:
+            self._close(-1)
+
+    # Tokens
+
+    def _query_keyword(self, position: int) -> int:
+        index = self.tokens[position]
+        token_type = self.buffer.types[index]
+        if token_type in (T.DEFINE, T.EVALUATE):
+            self._close_to((K.ROOT,))
+            self._push_frame(K.DEFINE if token_type == T.DEFINE else K.EVALUATE, index, index)
+            return position + 1
+        if self._find((K.EVALUATE,), _EXPRESSIONS | _BRACKETS | {K.ORDER_BY, K.START_AT}) < 0:
+            self._error(index, f"{'ORDER BY' if token_type == T.ORDER else 'START AT'} outside EVALUATE")
+            return position + 2
+        self._close_to((K.EVALUATE,))
+        self._push_frame(K.ORDER_BY if token_type == T.ORDER else K.START_AT, index, index)
+        return position + 2
+
+    def _operand(self, position: int) -> int:
+        tokens, types = self.tokens, self.buffer.types
+        index = tokens[position]
+        token_type = types[index]
+        next_type = self._next_type(position)
+        frame_kind = self.frames[-1][0]
+
+        if token_type in _LITERALS and not (next_type == T.OPEN_PARENS and token_type in (T.TRUE, T.FALSE)):
+            self._leaf(K.LITERAL, index)
+            return position + 1
+        if token_type == T.COLUMN_OR_MEASURE:
+            self._leaf(K.MEASURE_REFERENCE, index)
+            return position + 1
+        if token_type == T.VAR:
+            if frame_kind != K.DEFINE:
+                self._push_frame(K.VAR_BLOCK, index, index)
+            return self._variable(position)
+        if token_type in _PREFIX and not (token_type == T.NOT and next_type == T.OPEN_PARENS):
+            self.operators.append((_PREFIX[token_type], index, False))
+            return position + 1
+        if token_type == T.OPEN_PARENS:
+            self._push_frame(K.PARENS, index, index)
+            return position + 1
+        if token_type == T.OPEN_CURLY:
+            self._push_frame(K.TABLE_CONSTRUCTOR, index, index)
+            return position + 1
+        if token_type in (T.CLOSE_PARENS, T.CLOSE_CURLY) and self._find(self._openers(token_type), _EXPRESSIONS | _BRACKETS) < 0:
+            self._error(index, f"unmatched '{self.buffer.source_text(index)}'")
+            return position + 1
+        if token_type in (T.COMMA, T.CLOSE_PARENS, T.CLOSE_CURLY):
+            frame = self.frames[-1]
+            nothing_yet = len(self.operands) == frame[3] and len(self.operators) == frame[4]
+            #* '()' is the empty parameter list of a function definition: () => ...
+            parameters = frame_kind == K.PARENS and next_type == T.LAMBDA
+            if token_type == T.COMMA or not nothing_yet or not (frame_kind in _MAY_BE_EMPTY or parameters):
+                self._empty(index, frame_kind == K.CALL and len(self.operators) == frame[4])
+            self.expect_operand = False
+            return position
+        if token_type == T.ASSIGNMENT and position == 0:
+            return position + 1  # A measure definition copied with its leading '='
+        if token_type in _BINARY or token_type == T.RETURN:
+            self._empty(index, False)
+            return position
+        if token_type in _NAMES:
+            if frame_kind == K.DEFINE and token_type == T.TABLE_OR_VARIABLE and self.buffer.source_text(index).upper() in DEFINITION_WORDS:
+                return self._definition(position)
+            if next_type == T.OPEN_PARENS:
+                self._push_frame(K.CALL, index, index)
+                return position + 2
+            if next_type == T.COLUMN_OR_MEASURE:
+                self._leaf(K.COLUMN_REFERENCE, tokens[position + 1], first=index)
+                return position + 2
+            self._leaf(K.TABLE_REFERENCE if token_type == T.TABLE else K.NAME, index)
+            return position + 1
+        self._error(index, "unexpected token")
+        self._leaf(K.ERROR, index)
+        return position + 1
+
+    def _operator(self, position: int) -> int:
+        tokens, buffer = self.tokens, self.buffer
+        index = tokens[position]
+        token_type = buffer.types[index]
+
+        if token_type in _BINARY:
+            width = 1
+            if token_type == T.ASSIGNMENT and self._next_type(position) == T.ASSIGNMENT \
+                    and buffer.starts[tokens[position + 1]] == buffer.stops[index] + 1:
+                width = 2  # '==' is lexed as two '='
+            precedence, right_associative = _BINARY[token_type]
+            self._reduce(precedence, right_associative)
+            self.operators.append((precedence, index, True))
+            self.expect_operand = True
+            return position + width
+        if token_type == T.COMMA:
+            while self.frames[-1][0] in _EXPRESSIONS:
+                self._close(-1)
+            if self.frames[-1][0] not in _LISTS:
+                self._error(index, "unexpected ','")
+            self._reduce()
+            self.expect_operand = True
+            return position + 1
+        if token_type in (T.CLOSE_PARENS, T.CLOSE_CURLY):
+            depth = self._find(self._openers(token_type), _EXPRESSIONS | _BRACKETS)
+            if depth < 0:
+                self._error(index, f"unmatched '{buffer.source_text(index)}'")
+                return position + 1
+            while len(self.frames) > depth + 1:
+                self._close(-1)
+            self._close(index)
+            return position + 1
+        if token_type in (T.RETURN, T.VAR):
+            depth = self._find((K.VARIABLE,), _EXPRESSIONS | _BRACKETS)
+            if depth < 0 and token_type == T.VAR and self._find((K.DEFINITION,), _EXPRESSIONS | _BRACKETS) >= 0:
+                self._close_to((K.DEFINE,))
+                return self._variable(position)
+            if depth < 0:
+                self._error(index, "RETURN without VAR" if token_type == T.RETURN else "expected an operator")
+                if token_type == T.RETURN:
+                    return position + 1
+                self._reduce()
+                self.expect_operand = True
+                return position
+            while len(self.frames) > depth:
+                self._close(-1)
+            if token_type == T.VAR:
+                return self._variable(position)
+            self._push_frame(K.RETURN, index, index)
+            return position + 1
+        if token_type in (T.ASC, T.DESC) and self.frames[-1][0] == K.ORDER_BY:
+            self._reduce()
+            expression = self.operands.pop()
+            first = self.tree.first_tokens[expression]
+            self.operands.append(self.tree.add(K.SORT, index, first if first >= 0 else index, index, [expression]))
+            return position + 1
+        if token_type == T.TABLE_OR_VARIABLE and buffer.source_text(index).upper() in DEFINITION_WORDS \
+                and self._find((K.DEFINITION, K.VARIABLE), _EXPRESSIONS | _BRACKETS) >= 0 \
+                and self._find((K.DEFINE,), _EXPRESSIONS | _BRACKETS | {K.DEFINITION}) >= 0:
+            self._close_to((K.DEFINE,))
+            return self._definition(position)
+        # Two operands in a row: the second one starts a new item of the current frame
+        self._error(index, "expected an operator")
+        self._reduce()
+        self.expect_operand = True
+        return position
+
+    def _variable(self, position: int) -> int:
+        """VAR <name> = : opens the frame of the variable's expression"""
+        tokens, types = self.tokens, self.buffer.types
+        var_token = tokens[position]
+        position += 1
+        name = -1
+        if position < len(tokens) and types[tokens[position]] in _NAMES and types[tokens[position]] not in (T.VAR, T.RETURN):
+            name = tokens[position]
+            position += 1
+        else:
+            self._error(var_token, "expected a variable name")
+        self._push_frame(K.VARIABLE, name, var_token)
+        return self._assignment(position)
+
+    def _definition(self, position: int) -> int:
+        """MEASURE|COLUMN|TABLE|FUNCTION <name> = : opens the frame of the definition's expression"""
+        tokens, types = self.tokens, self.buffer.types
+        word = tokens[position]
+        self._push_frame(K.DEFINITION, word, word)
+        position += 1
+        if position < len(tokens) and types[tokens[position]] in _NAMES | {T.COLUMN_OR_MEASURE}:
+            position = self._operand(position)
+            self.expect_operand = True
+        else:
+            self._error(word, "expected a name")
+        return self._assignment(position)
+
+    def _assignment(self, position: int) -> int:
+        if position < len(self.tokens) and self.buffer.types[self.tokens[position]] == T.ASSIGNMENT:
+            return position + 1
+        self._error(self.tokens[position] if position < len(self.tokens) else -1, "expected '='")
+        return position
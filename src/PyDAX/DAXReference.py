@@ -1,85 +1,204 @@
-from antlr4 import Token
-from .DAXToken import DAXToken
+from typing import TYPE_CHECKING
+
+from .DAXToken import DAXToken, token_ref, resolve_token, restore_slots, restore_token_refs, slot_state
+
+if TYPE_CHECKING:
+    from .DAXNameTable import DAXNameTable
+
+
+def _interned_state(reference) -> dict:
+    """Pickled state of a reference without its name table and ids, which only mean something in this process"""
+    state = slot_state(reference)
+    for name in ("_names", "name_id", "table_id", "artifact_id"):
+        if name in state:
+            state[name] = None
+    return state
+
+
 class DAXArtifactReference:
-    def __init__(self, table_name: str, artifact_name: str, artifact_token: Token, table_token: Token = None):
+    __slots__ = ("table_name", "artifact_name", "_tokens", "_table_token", "_artifact_token", "_names", "table_id", "artifact_id")
+
+    def __init__(self, table_name: str, artifact_name: str, artifact_token: "Token | int", table_token: "Token | int" = None, tokens: "DAXTokenBuffer | None" = None):
         self.table_name = table_name
         self.artifact_name = artifact_name
-        self.table_token: DAXToken | None = DAXToken(table_token) if table_token else None #Can be empty for measures without a table reference
-        self.artifact_token: DAXToken = DAXToken(artifact_token)
+        #Tokens are kept as indexes into the expression's DAXTokenBuffer when one is given
+        self._tokens = tokens
+        self._table_token = token_ref(table_token, tokens) #Can be empty for measures without a table reference
+        self._artifact_token = token_ref(artifact_token, tokens)
+        self._names = None
+        self.table_id = None
+        self.artifact_id = None
+
+    @property
+    def table_token(self) -> DAXToken | None:
+        return resolve_token(self._table_token, self._tokens)
+
+    @property
+    def artifact_token(self) -> DAXToken:
+        return resolve_token(self._artifact_token, self._tokens)
+
+    def intern(self, names: "DAXNameTable") -> None:
+        """Shares the table and artifact names with everything interned in `names` and sets table_id and artifact_id"""
+        if self._names is not names:
+            self.table_name, self.table_id = names.entry(self.table_name)
+            self.artifact_name, self.artifact_id = names.entry(self.artifact_name)
+            self._names = names
 
     def __str__(self):
         return f"'{self.table_name}'[{self.artifact_name}]"
 
+    def __getstate__(self):
+        return _interned_state(self)
+
+    def __setstate__(self, state):
+        restore_slots(self, restore_token_refs(state, ("table_token", "artifact_token")))
+
+    def __copy__(self):
+        #* Not interned, like unpickled references
+        clone = type(self).__new__(type(self))
+        clone.table_name, clone.artifact_name = self.table_name, self.artifact_name
+        clone._tokens, clone._table_token, clone._artifact_token = self._tokens, self._table_token, self._artifact_token
+        clone._names = clone.table_id = clone.artifact_id = None
+        return clone
 
     def __eq__(self, value):
+        # DAX names are case-insensitive
         if isinstance(value, DAXArtifactReference):
-            return self.table_name == value.table_name and self.artifact_name == value.artifact_name
+            if self._names is not None and self._names is value._names:
+                return self.table_id == value.table_id and self.artifact_id == value.artifact_id
+            return self.table_name.casefold() == value.table_name.casefold() and self.artifact_name.casefold() == value.artifact_name.casefold()
         return False
-    
+
     def __hash__(self):
-        return hash((self.table_name, self.artifact_name))
-    
-    
+        return hash((self.table_name.casefold(), self.artifact_name.casefold()))
+
+
 class DAXReference:
-    def __init__(self, name: str, token: Token):
+    __slots__ = ("name", "_tokens", "_token", "_names", "name_id")
+
+    def __init__(self, name: str, token: "Token | int", tokens: "DAXTokenBuffer | None" = None):
         self.name: str = name
-        self.token: DAXToken = DAXToken(token)
+        self._tokens = tokens
+        self._token = token_ref(token, tokens)
+        self._names = None
+        self.name_id = None
+
+    @property
+    def token(self) -> DAXToken:
+        return resolve_token(self._token, self._tokens)
+
+    def intern(self, names: "DAXNameTable") -> None:
+        """Shares the name with everything interned in `names` and sets name_id"""
+        if self._names is not names:
+            self.name, self.name_id = names.entry(self.name)
+            self._names = names
 
     def __str__(self):
         return self.name
 
+    def __getstate__(self):
+        return _interned_state(self)
+
+    def __setstate__(self, state):
+        restore_slots(self, restore_token_refs(state, ("token",)))
+
+    def __copy__(self):
+        #* Not interned, like unpickled references
+        clone = type(self).__new__(type(self))
+        clone.name, clone._tokens, clone._token = self.name, self._tokens, self._token
+        clone._names = clone.name_id = None
+        return clone
 
     def __eq__(self, value):
+        # DAX names are case-insensitive
         if isinstance(value, DAXReference):
-            return self.name == value.name
+            if self._names is not None and self._names is value._names:
+                return self.name_id == value.name_id
+            return self.name.casefold() == value.name.casefold()
         return False
-    
+
     def __hash__(self):
-        return hash(self.name)
-    
+        return hash(self.name.casefold())
+
 
 class DAXTableReference(DAXReference):
-    def __init__(self, name: str, token: Token):
-        super().__init__(name, token)
+    __slots__ = ()
+
+    def __init__(self, name: str, token: "Token | int", tokens: "DAXTokenBuffer | None" = None):
+        super().__init__(name, token, tokens)
 
 class DAXVariableReference(DAXReference):
-    def __init__(self, name: str, token: Token):
-        super().__init__(name, token)
-   
-    
+    __slots__ = ()
+
+    def __init__(self, name: str, token: "Token | int", tokens: "DAXTokenBuffer | None" = None):
+        super().__init__(name, token, tokens)
+
+
 class DAXFunctionReference(DAXReference):
-    def __init__(self, name: str, token: Token):
-        super().__init__(name, token)
+    __slots__ = ()
+
+    def __init__(self, name: str, token: "Token | int", tokens: "DAXTokenBuffer | None" = None):
+        super().__init__(name, token, tokens)
 
 class DAXUnknownReference(DAXReference):
-    def __init__(self, name: str, token: Token):
-        super().__init__(name, token)
-        
+    __slots__ = ()
+
+    def __init__(self, name: str, token: "Token | int", tokens: "DAXTokenBuffer | None" = None):
+        super().__init__(name, token, tokens)
+
 
 class DAXRelationshipReference:
-    def __init__(self, token_userelationship: Token, token_table1: Token, token_column1: Token, token_table2: Token, token_column2: Token):
+    __slots__ = ("_tokens", "_token_userelationship", "_token_table1", "_token_column1", "_token_table2", "_token_column2",
+                 "table1", "column1", "table2", "column2")
+
+    def __init__(self, token_userelationship: "Token | int", token_table1: "Token | int", token_column1: "Token | int", token_table2: "Token | int", token_column2: "Token | int", tokens: "DAXTokenBuffer | None" = None):
+
+        self._tokens = tokens
+        self._token_userelationship = token_ref(token_userelationship, tokens)
+        self._token_table1 = token_ref(token_table1, tokens)
+        self._token_column1 = token_ref(token_column1, tokens)
+        self._token_table2 = token_ref(token_table2, tokens)
+        self._token_column2 = token_ref(token_column2, tokens)
+
+        self.table1: str = self.token_table1.text
+        self.column1: str = self.token_column1.text
+        self.table2: str = self.token_table2.text
+        self.column2: str = self.token_column2.text
+
+    @property
+    def token_userelationship(self) -> DAXToken:
+        return resolve_token(self._token_userelationship, self._tokens)
 
-        self.token_userelationship: DAXToken = DAXToken(token_userelationship)
-        self.token_table1: DAXToken = DAXToken(token_table1)
-        self.token_column1: DAXToken = DAXToken(token_column1)
-        self.token_table2: DAXToken = DAXToken(token_table2)
-        self.token_column2: DAXToken = DAXToken(token_column2)
+    @property
+    def token_table1(self) -> DAXToken:
+        return resolve_token(self._token_table1, self._tokens)
 
-        self.table1: str = token_table1.text
-        self.column1: str = token_column1.text
-        self.table2: str = token_table2.text
-        self.column2: str = token_column2.text
-        
+    @property
+    def token_column1(self) -> DAXToken:
+        return resolve_token(self._token_column1, self._tokens)
+
+    @property
+    def token_table2(self) -> DAXToken:
+        return resolve_token(self._token_table2, self._tokens)
+
+    @property
+    def token_column2(self) -> DAXToken:
+        return resolve_token(self._token_column2, self._tokens)
 
     def __str__(self):
         return f"{self.table1}[{self.column1}] -> {self.table2}[{self.column2}]"
 
+    def __getstate__(self):
+        return slot_state(self)
+
+    def __setstate__(self, state):
+        restore_slots(self, restore_token_refs(state, ("token_userelationship", "token_table1", "token_column1", "token_table2", "token_column2")))
 
     def __eq__(self, value):
         if isinstance(value, DAXRelationshipReference):
             return (self.token_userelationship == value.token_userelationship and self.token_table1 == value.token_table1 and
                     self.token_column1 == value.token_column1 and self.token_table2 == value.token_table2 and self.token_column2 == value.token_column2)
         return False
-    
+
     def __hash__(self):
-        return hash((self.token_userelationship, self.token_table1, self.token_column1, self.token_table2, self.token_column2))
\ No newline at end of file
+        return hash((self.token_userelationship, self.token_table1, self.token_column1, self.token_table2, self.token_column2))
@@ -0,0 +1,66 @@
+from typing import Iterable
+
+from .DAXReference import DAXArtifactReference, DAXReference
+from .DAXVariable import DAXVariable
+
+
+def _position(reference: DAXArtifactReference) -> int:
+    """Token index of the column or measure, -1 for references unpickled from versions without a token buffer"""
+    token = reference._artifact_token
+    return token if isinstance(token, int) else -1
+
+
+class DAXReferenceIndex:
+    """Hash indexes over the references of a DAXExpression, built in one pass over its reference lists.
+
+    Keys are case-folded, since DAX names are case-insensitive. Column and measure references are grouped by table
+    (the table name is '' for measures and columns written without one) and by (table, artifact), in document order,
+    so finding every use of a table or column is a dictionary lookup instead of a scan of table_column_references.
+    """
+
+    def __init__(
+        self,
+        variables: Iterable[DAXVariable],
+        table_column_references: Iterable[DAXArtifactReference],
+        table_references: Iterable[DAXReference] = (),
+    ) -> None:
+        self.variables: dict[str, list[DAXVariable]] = {}
+        self.by_table: dict[str, list[DAXArtifactReference]] = {}
+        self.by_artifact: dict[tuple[str, str], list[DAXArtifactReference]] = {}
+        self.tables: dict[str, list[DAXReference]] = {}  # Standalone table references, e.g. FILTER's first argument
+
+        for variable in variables:
+            self.variables.setdefault(variable.name.casefold(), []).append(variable)
+        #* Qualified references are extracted before the standalone ones: sorting restores document order
+        for reference in sorted(table_column_references, key=_position):
+            table = reference.table_name.casefold()
+            self.by_table.setdefault(table, []).append(reference)
+            self.by_artifact.setdefault((table, reference.artifact_name.casefold()), []).append(reference)
+        for reference in table_references:
+            self.tables.setdefault(reference.name.casefold(), []).append(reference)
+
+    def variable(self, name: str) -> DAXVariable | None:
+        """First declaration of the variable `name`, None when the expression declares no such variable"""
+        declarations = self.variables.get(name.casefold())
+        return declarations[0] if declarations else None
+
+    def references(self, table_name: str, artifact_name: str | None = None) -> list[DAXArtifactReference]:
+        """Every reference to a column or measure of `table_name` (only `artifact_name` when given), in document order"""
+        if artifact_name is None:
+            return self.by_table.get(table_name.casefold(), [])
+        return self.by_artifact.get((table_name.casefold(), artifact_name.casefold()), [])
+
+    def count(self, table_name: str, artifact_name: str | None = None) -> int:
+        return len(self.references(table_name, artifact_name))
+
+    def positions(self, table_name: str, artifact_name: str | None = None) -> list[int]:
+        """Token indexes of the referenced columns or measures, see DAXExpression.token_buffer"""
+        return [_position(reference) for reference in self.references(table_name, artifact_name)]
+
+    def unique(self) -> list[DAXArtifactReference]:
+        """First reference to each distinct (table, artifact), in document order"""
+        return [references[0] for references in self.by_artifact.values()]
+
+    def counts(self) -> dict[tuple[str, str], int]:
+        """Number of references to each distinct (table, artifact), keyed by case-folded names"""
+        return {key: len(references) for key, references in self.by_artifact.items()}
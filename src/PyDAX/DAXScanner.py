@@ -0,0 +1,207 @@
+import re
+from array import array
+
+from .DAXTokenTypes import DAXTokenTypes
+from .DAXTokenBuffer import DAXTokenBuffer
+from .DAXKeywords import keyword_types, dotted_keyword_types
+
+
+_KEYWORDS: dict[str, int] = keyword_types(DAXTokenTypes)
+_DOTTED_KEYWORDS: dict[str, int] = dotted_keyword_types(DAXTokenTypes)
+
+_OPERATORS: dict[str, int] = {
+    "{": DAXTokenTypes.OPEN_CURLY,
+    "}": DAXTokenTypes.CLOSE_CURLY,
+    "(": DAXTokenTypes.OPEN_PARENS,
+    ")": DAXTokenTypes.CLOSE_PARENS,
+    ",": DAXTokenTypes.COMMA,
+    "+": DAXTokenTypes.PLUS,
+    "-": DAXTokenTypes.MINUS,
+    "*": DAXTokenTypes.STAR,
+    "/": DAXTokenTypes.DIV,
+    "^": DAXTokenTypes.CARET,
+    "&": DAXTokenTypes.AMP,
+    "=": DAXTokenTypes.ASSIGNMENT,
+    "<": DAXTokenTypes.LT,
+    ">": DAXTokenTypes.GT,
+    "&&": DAXTokenTypes.OP_AND,
+    "||": DAXTokenTypes.OP_OR,
+    "<>": DAXTokenTypes.OP_NE,
+    "<=": DAXTokenTypes.OP_LE,
+    ">=": DAXTokenTypes.OP_GE,
+    "=>": DAXTokenTypes.LAMBDA,
+    ":": DAXTokenTypes.COLON,
+}
+
+_NEWLINES = "\r\n\u0085\u2028\u2029"
+_WHITESPACES = "\u0020\u00a0\u1680\u180e\u2000-\u2006\u2008-\u200a\u202f\u3000\u205f\t\u000b\u000c"
+
+#* Alternatives are ordered so that the first one matching is also the longest token PyDAXLexer would accept
+_TOKEN_PATTERN = re.compile(
+    rf"(?P<WHITESPACES>[{_WHITESPACES}{_NEWLINES}]+)"
+    rf"|(?P<SINGLE_LINE_COMMENT>(?://|--)[^{_NEWLINES}]*)"
+    r"|(?P<DELIMITED_COMMENT>/\*)"
+    r'|(?P<DATE_LITERAL>DT"(?:[^"]|"")*")'
+    r"|(?P<DOTTED_KEYWORD>(?ai:" + "|".join(re.escape(spelling) for spelling in sorted(_DOTTED_KEYWORDS, key=len, reverse=True)) + "))"
+    r"|(?P<IDENTIFIER>[A-Za-z_][A-Za-z0-9_]*)"
+    r"|(?P<REAL_LITERAL>[0-9]*\.[0-9]+)"
+    r"|(?P<INTEGER_LITERAL>[0-9]+)"
+    r'|(?P<STRING_LITERAL>"(?:[^"]|"")*")'
+    rf"|(?P<TABLE>'(?:[^\"'{_NEWLINES}]|'')*')"
+    rf"|(?P<COLUMN_OR_MEASURE>\[(?:[^\"\]{_NEWLINES}]|\]\])*\])"
+    r"|(?P<OPERATOR>&&|\|\||<>|<=|>=|=>|[{}(),+\-*/^&=<>:])"
+)
+_COMMENT_DELIMITERS = re.compile(r"[*/]")
+#* First character that cannot appear inside an unterminated table or column name
+_NAME_TERMINATORS = re.compile(rf"[\"{_NEWLINES}]")
+
+#* Tokens that can span several lines
+_MULTILINE_GROUPS = frozenset(("WHITESPACES", "DELIMITED_COMMENT", "DATE_LITERAL", "STRING_LITERAL"))
+
+
+class DAXScanner:
+    """Pure Python scanner producing the same token stream as PyDAXLexer, without the ANTLR runtime.
+
+    Token types, channels, offsets, lines and columns are identical to what PyDAXLexer emits, including
+    how it recovers from invalid input (the offending characters are skipped and no token is produced).
+    The scanner writes straight into a DAXTokenBuffer and is selected with DAXExpression(lexer_backend="scanner").
+    """
+
+    @classmethod
+    def scan(cls, text: str, start: int = 0, line: int = 1, column: int = 0, until: int | None = None) -> DAXTokenBuffer:
+        """Tokenizes `text` into a DAXTokenBuffer (EOF excluded).
+
+        Lexing can resume at a token `start` with that token's `line` and `column`, and stop after the first token
+        starting at or after `until` (see DAXTokenBuffer.apply_edit).
+        """
+        types: list[int] = []
+        channels: list[int] = []
+        starts: list[int] = []
+        stops: list[int] = []
+        lines: list[int] = []
+        columns: list[int] = []
+
+        match = _TOKEN_PATTERN.match
+        keywords = _KEYWORDS
+        dotted_keywords = _DOTTED_KEYWORDS
+        operators = _OPERATORS
+        keyword_channel = DAXTokenTypes.KEYWORD_CHANNEL
+
+        n = len(text)
+        pos = start
+        line_start = start - column
+        until = n if until is None else until
+        while pos < n:
+            m = match(text, pos)
+            end: int | None = None
+            if m is not None:
+                group = m.lastgroup
+                end = m.end()
+                channel = 0
+                if group == "IDENTIFIER":
+                    token_type = keywords.get(m.group().upper(), DAXTokenTypes.TABLE_OR_VARIABLE)
+                    if token_type != DAXTokenTypes.TABLE_OR_VARIABLE:
+                        channel = keyword_channel
+                elif group == "OPERATOR":
+                    token_type = operators[m.group()]
+                elif group == "WHITESPACES":
+                    token_type = DAXTokenTypes.WHITESPACES
+                    channel = DAXTokenTypes.HIDDEN
+                elif group == "DELIMITED_COMMENT":
+                    token_type, end = cls._delimited_comment(text, pos)
+                    if token_type == DAXTokenTypes.DELIMITED_COMMENT:
+                        channel = DAXTokenTypes.COMMENTS_CHANNEL
+                elif group == "SINGLE_LINE_COMMENT":
+                    token_type = DAXTokenTypes.SINGLE_LINE_COMMENT
+                    channel = DAXTokenTypes.COMMENTS_CHANNEL
+                elif group == "DOTTED_KEYWORD":
+                    token_type = dotted_keywords[m.group().upper()]
+                    channel = keyword_channel
+                else:
+                    token_type = getattr(DAXTokenTypes, group)
+
+                types.append(token_type)
+                channels.append(channel)
+                starts.append(pos)
+                stops.append(end - 1)
+                lines.append(line)
+                columns.append(pos - line_start)
+                if pos >= until:
+                    break
+                if group not in _MULTILINE_GROUPS:
+                    pos = end
+                    continue
+            else:
+                end = cls._error_end(text, pos)
+
+            newlines = text.count("\n", pos, end)
+            if newlines:
+                line += newlines
+                line_start = text.rindex("\n", pos, end) + 1
+            pos = end
+
+        buffer = DAXTokenBuffer(text=text)
+        buffer.types = array('H', types)
+        buffer.channels = array('B', channels)
+        buffer.starts = array('i', starts)
+        buffer.stops = array('i', stops)
+        buffer.lines = array('i', lines)
+        buffer.columns = array('i', columns)
+        return buffer
+
+    @staticmethod
+    def _delimited_comment(text: str, pos: int) -> tuple[int, int]:
+        """Token type and end offset of the comment opened at `pos`.
+
+        An unterminated comment whose last character is a '/' is rejected by PyDAXLexer, which falls back to DIV.
+        """
+        n = len(text)
+        i = pos + 2
+        search = _COMMENT_DELIMITERS.search
+        while True:
+            m = search(text, i)
+            if m is None:
+                return DAXTokenTypes.DELIMITED_COMMENT, n  # Comments are closed by EOF
+            i = m.start()
+            if text[i] == "*":
+                if text.startswith("/", i + 1):
+                    return DAXTokenTypes.DELIMITED_COMMENT, i + 2
+                i += 1
+            elif i + 1 >= n:
+                return DAXTokenTypes.DIV, pos + 1  # A '/' must be followed by another character inside a comment
+            elif text[i + 1] == "*":
+                return DAXScanner._nested_comment(text, pos)
+            else:
+                i += 2  # '/' consumes the next character
+
+    @staticmethod
+    def _nested_comment(text: str, pos: int) -> tuple[int, int]:
+        """Nested comments are ambiguous in the grammar ('*/' may close the inner comment or be plain text)
+        and PyDAXLexer resolves them through its ATN configuration order. They are rare enough to hand the
+        single token over to PyDAXLexer instead of reproducing that order here."""
+        from antlr4 import InputStream
+        from .PyDAXLexer import PyDAXLexer
+
+        input_stream = InputStream(text)
+        lexer = PyDAXLexer(input_stream)
+        lexer.removeErrorListeners()
+        input_stream.seek(pos)
+        token = lexer.nextToken()
+        return token.type, token.stop + 1
+
+    @staticmethod
+    def _error_end(text: str, pos: int) -> int:
+        """Offset where PyDAXLexer resumes after failing to match a token at `pos`.
+
+        The lexer consumes the longest prefix that could still become a token plus the offending character.
+        """
+        n = len(text)
+        char = text[pos]
+        if char == '"':
+            return n  # Unterminated string, DT"..." falls back to an identifier and never gets here
+        if char == "'" or char == "[":
+            m = _NAME_TERMINATORS.search(text, pos + 1)
+            return n if m is None else m.end()
+        if char == "." or char == "|":
+            return min(pos + 2, n)
+        return pos + 1
@@ -0,0 +1,241 @@
+import os
+from bisect import bisect_left
+from typing import Any, Iterator, TextIO
+
+from .DAXExpression import DAXExpression
+from .DAXKeywords import DEFINITION_WORDS
+from .DAXScanner import DAXScanner
+from .DAXTokenBuffer import DAXTokenBuffer, _LOOKAHEAD
+from .DAXTokenTypes import DAXTokenTypes as T
+
+#* Keywords after which an expression is not complete yet
+_OPEN_KEYWORDS: frozenset[int] = frozenset({T.VAR, T.RETURN, T.IN, T.NOT, T.DEFINE, T.EVALUATE, T.ORDER, T.BY, T.START, T.AT})
+#* Tokens ending an operand: a definition or a DEFINE variable can only start after one of them
+_OPERAND_ENDS: frozenset[int] = frozenset(
+    {T.DATE_LITERAL, T.INTEGER_LITERAL, T.REAL_LITERAL, T.STRING_LITERAL, T.TABLE, T.COLUMN_OR_MEASURE, T.TABLE_OR_VARIABLE,
+     T.CLOSE_PARENS, T.CLOSE_CURLY, *(token_type for token_type in range(T.ABS, T.NUMERIC + 1) if token_type not in _OPEN_KEYWORDS)}
+)
+_SKIPPED_CHANNELS: frozenset[int] = frozenset({T.HIDDEN, T.COMMENTS_CHANNEL})
+
+#* Sections of a script
+_SCRIPT, _DEFINE, _EVALUATE = 0, 1, 2
+
+
+class DAXDefinition:
+    """A definition or query read from a DAX script by DAXScriptReader.
+
+    `offset` is the position of the definition's first token in the script and `expression_offset` the position of
+    `dax_expression`, both in characters. The DAXExpression is created on first access and analyzed lazily.
+    """
+
+    MEASURE: str = "measure"
+    COLUMN: str = "column"
+    TABLE: str = "table"
+    FUNCTION: str = "function"
+    VARIABLE: str = "variable"  # VAR in DEFINE
+    EVALUATE: str = "evaluate"  # The query after EVALUATE, with its ORDER BY and START AT
+    EXPRESSION: str = "expression"  # Anything else, e.g. a script holding a single expression
+
+    def __init__(
+        self, kind: str, name: str, dax_expression: str, offset: int, line: int, expression_offset: int,
+        expression_options: dict[str, Any] | None = None,
+    ) -> None:
+        self.kind: str = kind
+        self.name: str = name  # As written, e.g. Sales[Total] for a measure, empty for queries and expressions
+        self.dax_expression: str = dax_expression
+        self.offset: int = offset
+        self.line: int = line
+        self.expression_offset: int = expression_offset
+        self._expression_options: dict[str, Any] = expression_options or {}
+        self._expression: DAXExpression | None = None
+
+    @property
+    def expression(self) -> DAXExpression:
+        if self._expression is None:
+            self._expression = DAXExpression(self.dax_expression, analyses=(), **self._expression_options)
+        return self._expression
+
+    def __repr__(self) -> str:
+        return f"DAXDefinition({self.kind}, {self.name or self.dax_expression[:30]!r}, line {self.line})"
+
+
+class DAXScriptReader:
+    """Streams the definitions of a DAX script: the MEASURE, COLUMN, TABLE, FUNCTION and VAR definitions of its
+    DEFINE sections, each EVALUATE query, or a file of definitions without DEFINE.
+
+    The script is read in chunks and tokenized with DAXScanner as it is read. Only the text of the definition being
+    read is kept, so memory is bounded by the largest definition rather than by the script.
+    """
+
+    def __init__(self, source: "str | os.PathLike | TextIO", chunk_size: int = 1 << 16, encoding: str = "utf-8", **expression_options: Any) -> None:
+        """
+        Args:
+            source (str | os.PathLike | TextIO): Path of the script, or a text file object to read it from
+            chunk_size (int): Characters read at once
+            encoding (str): Encoding of the script when `source` is a path
+            expression_options: Arguments of the DAXExpression of each definition (lexer_backend, rules, cache...)
+        """
+        self.source = source
+        self.chunk_size: int = chunk_size
+        self.encoding: str = encoding
+        self.expression_options: dict[str, Any] = expression_options
+
+    def __iter__(self) -> Iterator[DAXDefinition]:
+        if isinstance(self.source, (str, os.PathLike)):
+            #* Newlines are not translated, so offsets, lines and columns are those of the file
+            with open(self.source, encoding=self.encoding, newline="") as file:
+                yield from self._read(file)
+        else:
+            yield from self._read(self.source)
+
+    def _read(self, file: TextIO) -> Iterator[DAXDefinition]:
+        splitter = _DAXScriptSplitter(self.expression_options)
+        window = ""  # Text from the start of the current definition (or of the next token) to the last character read
+        window_offset = 0  # Offset of the window in the script
+        position, line, column = 0, 1, 0  # Where lexing resumes, in the window
+        read_size = self.chunk_size
+        while True:
+            chunk = file.read(read_size)
+            window += chunk
+            fragment = DAXScanner.scan(window, position, line, column)
+            if chunk:
+                #* Tokens the lexer may still change once more text is read stay for the next round, with the last
+                #* finished token whose end may still be followed by skipped characters
+                count = max(bisect_left(fragment.stops, len(window) - _LOOKAHEAD) - 1, 0)
+                count = _before_unterminated_comment(window, position, fragment, count)
+            else:
+                count = len(fragment)
+            yield from splitter.feed(window, window_offset, fragment, count)
+            if not chunk:
+                yield from splitter.finish(window, window_offset)
+                return
+
+            if count > 0:
+                position, line, column = fragment.starts[count], fragment.lines[count], fragment.columns[count]
+                read_size = self.chunk_size
+            else:
+                read_size *= 2  # A token longer than the window, e.g. a long comment: read more before lexing again
+            cut = min(position, splitter.start - window_offset) if splitter.start >= 0 else position
+            if cut > 0:
+                window = window[cut:]
+                window_offset += cut
+                position -= cut
+
+
+def _before_unterminated_comment(window: str, position: int, fragment: DAXTokenBuffer, count: int) -> int:
+    """Number of tokens of `fragment` that can be committed out of `count`. An unterminated '/*' is lexed as '/' '*'
+    after reading up to the end of the window, like in DAXTokenBuffer.apply_edit: the text read next may close it,
+    so tokens from its '/' on are lexed again with it."""
+    stop = fragment.starts[count] + 1 if count < len(fragment) else len(window)  # The '*' of a '/' committed last
+    starts, types = fragment.starts, fragment.types
+    comment = window.find("/*", position, stop)
+    while comment >= 0:
+        index = bisect_left(starts, comment)
+        if index < count and starts[index] == comment and types[index] == T.DIV:
+            return index
+        comment = window.find("/*", comment + 1, stop)
+    return count
+
+
+class _DAXScriptSplitter:
+    """Finds where definitions start and end in the tokens of a script, fed a few at a time"""
+
+    def __init__(self, expression_options: dict[str, Any]) -> None:
+        self.expression_options = expression_options
+        self.section: int = _SCRIPT
+        self.depth: int = 0  # Parentheses and braces
+        self.pending: int = 0  # VAR blocks waiting for their RETURN, outside parentheses
+        self.previous: int = -1  # Type of the previous significant token
+        #* Current definition: kind, offset and line of its first token, name range, expression range (script offsets)
+        self.kind: str | None = None
+        self.start: int = -1
+        self.line: int = 0
+        self.name_range: list[int] = [-1, -1]
+        self.expression_range: list[int] | None = None  # None until the '=' of a definition
+
+    def feed(self, window: str, window_offset: int, fragment: DAXTokenBuffer, count: int) -> list[DAXDefinition]:
+        definitions: list[DAXDefinition] = []
+        types, channels, starts, stops, lines = fragment.types, fragment.channels, fragment.starts, fragment.stops, fragment.lines
+        for index in range(count):
+            if channels[index] in _SKIPPED_CHANNELS:
+                continue
+            token_type = types[index]
+            start, stop = starts[index] + window_offset, stops[index] + window_offset
+
+            if token_type in (T.DEFINE, T.EVALUATE):
+                # Reserved in expressions, they end the current definition even after unbalanced parentheses
+                definitions.extend(self.finish(window, window_offset))
+                if token_type == T.DEFINE:
+                    self.section = _DEFINE
+                    self.previous = -1
+                    continue
+                self.section = _EVALUATE
+                self._begin(DAXDefinition.EVALUATE, start, lines[index])
+                self.expression_range = [-1, -1]
+                self.previous = token_type
+                continue
+
+            kind = None
+            if self.depth == 0 and self.pending == 0 and self.section != _EVALUATE and (self.kind is None or self.previous in _OPERAND_ENDS):
+                if token_type == T.TABLE_OR_VARIABLE and fragment.source_text(index).upper() in DEFINITION_WORDS:
+                    kind = fragment.source_text(index).lower()
+                elif token_type == T.VAR and self.section == _DEFINE:
+                    kind = DAXDefinition.VARIABLE
+            if kind is not None:
+                definitions.extend(self.finish(window, window_offset))
+                self._begin(kind, start, lines[index])
+                self.previous = token_type
+                continue
+            if self.kind is None:
+                self._begin(DAXDefinition.EXPRESSION, start, lines[index])
+                self.expression_range = [-1, -1]
+
+            if self.expression_range is None:
+                # Name of the definition, up to its '='
+                if token_type == T.ASSIGNMENT:
+                    self.expression_range = [-1, -1]
+                else:
+                    if self.name_range[0] < 0:
+                        self.name_range[0] = start
+                    self.name_range[1] = stop
+                self.previous = token_type
+                continue
+
+            if self.expression_range[0] < 0:
+                self.expression_range[0] = start
+            self.expression_range[1] = stop
+            if token_type in (T.OPEN_PARENS, T.OPEN_CURLY):
+                self.depth += 1
+            elif token_type in (T.CLOSE_PARENS, T.CLOSE_CURLY):
+                self.depth = max(self.depth - 1, 0)
+            elif self.depth == 0 and token_type == T.VAR:
+                if self.pending == 0 or self.previous not in _OPERAND_ENDS:
+                    self.pending += 1  # Otherwise the next variable of the same block
+            elif self.depth == 0 and token_type == T.RETURN:
+                self.pending = max(self.pending - 1, 0)
+            self.previous = token_type
+        return definitions
+
+    def finish(self, window: str, window_offset: int) -> list[DAXDefinition]:
+        """Ends the current definition, returned in a list (empty when there is none)"""
+        if self.kind is None:
+            return []
+        name_start, name_stop = self.name_range
+        expression_start, expression_stop = self.expression_range or (-1, -1)
+        name = window[name_start - window_offset:name_stop - window_offset + 1] if name_start >= 0 else ""
+        if expression_start >= 0:
+            dax_expression = window[expression_start - window_offset:expression_stop - window_offset + 1]
+        else:
+            dax_expression, expression_start = "", -1
+        definition = DAXDefinition(self.kind, name, dax_expression, self.start, self.line, expression_start, self.expression_options)
+        self.kind = None
+        self.start = -1
+        return [definition]
+
+    def _begin(self, kind: str, start: int, line: int) -> None:
+        self.kind = kind
+        self.start = start
+        self.line = line
+        self.depth = self.pending = 0
+        self.name_range = [-1, -1]
+        self.expression_range = None
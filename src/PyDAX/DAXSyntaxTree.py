@@ -0,0 +1,165 @@
+from array import array
+from typing import Iterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .DAXTokenBuffer import DAXTokenBuffer
+
+
+class DAXNodeKinds:
+    """Kinds of the nodes of a DAXSyntaxTree. The token of a node (DAXSyntaxTree.tokens) is given after each kind."""
+
+    ROOT: int = 0  # -1, children are the top level expressions or query sections
+    ERROR: int = 1  # The unexpected token
+    EMPTY: int = 2  # -1, a missing expression or a skipped argument
+    LITERAL: int = 3  # The number, string, date, TRUE or FALSE
+    NAME: int = 4  # The identifier: a variable, a table or a keyword used as an argument (ASC, SKIP...)
+    TABLE_REFERENCE: int = 5  # The quoted table name
+    COLUMN_REFERENCE: int = 6  # The column, the table is the first token of the node
+    MEASURE_REFERENCE: int = 7  # The [column or measure]
+    CALL: int = 8  # The function, children are the arguments
+    PARENS: int = 9  # '(', children are the expressions between the parentheses
+    TABLE_CONSTRUCTOR: int = 10  # '{', children are the rows
+    UNARY: int = 11  # The operator, one child
+    BINARY: int = 12  # The operator, two children
+    VAR_BLOCK: int = 13  # The first VAR, children are the VARIABLE nodes and the RETURN node
+    VARIABLE: int = 14  # The variable name, the child is its expression
+    RETURN: int = 15  # RETURN, the child is the returned expression
+    DEFINE: int = 16  # DEFINE, children are the VARIABLE and DEFINITION nodes
+    DEFINITION: int = 17  # MEASURE, COLUMN, TABLE or FUNCTION, children are the defined name and its expression
+    EVALUATE: int = 18  # EVALUATE, children are the expression and the ORDER_BY and START_AT nodes
+    ORDER_BY: int = 19  # ORDER, children are the sort expressions
+    START_AT: int = 20  # START, children are the start values
+    SORT: int = 21  # ASC or DESC after an ORDER BY expression, the child is the expression
+
+    names: list[str] = [
+        "ROOT", "ERROR", "EMPTY", "LITERAL", "NAME", "TABLE_REFERENCE", "COLUMN_REFERENCE", "MEASURE_REFERENCE", "CALL",
+        "PARENS", "TABLE_CONSTRUCTOR", "UNARY", "BINARY", "VAR_BLOCK", "VARIABLE", "RETURN", "DEFINE", "DEFINITION",
+        "EVALUATE", "ORDER_BY", "START_AT", "SORT",
+    ]
+
+
+class DAXSyntaxTree:
+    """Syntax tree of a DAX expression or query, produced by DAXParser from a DAXTokenBuffer.
+
+    Nodes are integers indexing parallel arrays: kind, main token, first and last token (buffer indexes, -1 for
+    nodes without tokens) and parent. The children of a node are stored contiguously in `child_list`, from
+    `child_starts[node]` for `child_counts[node]` entries. Children are created before their parent, so the root is
+    the last node. Syntax errors do not stop parsing: they are collected in `errors` as (token index, message), with
+    -1 for the end of the expression.
+    """
+
+    def __init__(self, buffer: "DAXTokenBuffer") -> None:
+        self.buffer: "DAXTokenBuffer" = buffer
+        self.kinds: array = array('B')
+        self.tokens: array = array('i')
+        self.first_tokens: array = array('i')
+        self.last_tokens: array = array('i')
+        self.parents: array = array('i')
+        self.child_starts: array = array('i')
+        self.child_counts: array = array('i')
+        self.child_list: array = array('i')
+        self.errors: list[tuple[int, str]] = []
+        self.root: int = -1
+        self._node_of_token: array | None = None
+
+    def add(self, kind: int, token: int, first_token: int, last_token: int, children: list[int]) -> int:
+        """Appends a node whose children are already in the tree and returns it"""
+        node = len(self.kinds)
+        self.kinds.append(kind)
+        self.tokens.append(token)
+        self.first_tokens.append(first_token)
+        self.last_tokens.append(last_token)
+        self.parents.append(-1)
+        self.child_starts.append(len(self.child_list))
+        self.child_counts.append(len(children))
+        self.child_list.extend(children)
+        parents = self.parents
+        for child in children:
+            parents[child] = node
+        return node
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def children(self, node: int) -> list[int]:
+        start = self.child_starts[node]
+        return self.child_list[start:start + self.child_counts[node]].tolist()
+
+    def walk(self, node: int | None = None) -> Iterator[int]:
+        """Nodes of the subtree of `node` (the root by default) in document order, parents before children"""
+        stack = [self.root if node is None else node]
+        child_list, child_starts, child_counts = self.child_list, self.child_starts, self.child_counts
+        while stack:
+            node = stack.pop()
+            yield node
+            start = child_starts[node]
+            stack.extend(reversed(child_list[start:start + child_counts[node]]))
+
+    def of_kind(self, *kinds: int) -> list[int]:
+        """Nodes of the given kinds, children before their parents"""
+        node_kinds = self.kinds
+        return [node for node in range(len(node_kinds)) if node_kinds[node] in kinds]
+
+    def node_of_token(self, index: int) -> int:
+        """The node whose main token is the token at buffer index `index` (or its table, for a column reference), -1
+        for tokens without one (parentheses, commas, whitespace...)"""
+        if self._node_of_token is None:
+            self._node_of_token = array('i', [-1]) * len(self.buffer)
+            for node, token in enumerate(self.tokens):
+                if token >= 0:
+                    self._node_of_token[token] = node
+            for node in self.of_kind(DAXNodeKinds.COLUMN_REFERENCE):
+                self._node_of_token[self.first_tokens[node]] = node
+        return self._node_of_token[index]
+
+    def ancestors(self, node: int) -> Iterator[int]:
+        """Parent, grand-parent... of `node` up to the root"""
+        parents = self.parents
+        node = parents[node]
+        while node >= 0:
+            yield node
+            node = parents[node]
+
+    def argument_index(self, node: int) -> int:
+        """Position of `node` among the children of its parent (the argument number in a call), -1 for the root"""
+        parent = self.parents[node]
+        if parent < 0:
+            return -1
+        start = self.child_starts[parent]
+        return self.child_list.index(node, start, start + self.child_counts[parent]) - start
+
+    def variable_scope(self, variable: int) -> tuple[int, int]:
+        """First and last token where the VARIABLE node `variable` can be used: from the end of its definition to the
+        end of its VAR block (or of the query, for a variable defined in DEFINE). (-1, -1) when nothing follows."""
+        block = self.parents[variable]
+        if block < 0:
+            return -1, -1
+        siblings = self.children(block)
+        later = siblings[siblings.index(variable) + 1:]
+        if self.kinds[block] == DAXNodeKinds.DEFINE:
+            sections = self.children(self.root)
+            later += sections[sections.index(block) + 1:]
+            block = self.root
+        firsts = [self.first_tokens[node] for node in later if self.first_tokens[node] >= 0]
+        if not firsts:
+            return -1, -1
+        return min(firsts), self.last_tokens[block]
+
+    def text(self, node: int) -> str:
+        """Source text from the first to the last token of `node`"""
+        first, last = self.first_tokens[node], self.last_tokens[node]
+        if first < 0:
+            return ""
+        return self.buffer.text[self.buffer.starts[first]:self.buffer.stops[last] + 1]
+
+    def dump(self, node: int | None = None) -> str:
+        """Indented outline of the subtree of `node`, for debugging"""
+        lines: list[str] = []
+        stack = [(self.root if node is None else node, 0)]
+        while stack:
+            node, depth = stack.pop()
+            token = self.tokens[node]
+            label = f" {self.buffer.source_text(token)}" if token >= 0 else ""
+            lines.append(f"{'  ' * depth}{DAXNodeKinds.names[self.kinds[node]]}{label}")
+            stack.extend((child, depth + 1) for child in reversed(self.children(node)))
+        return "\n".join(lines)
@@ -0,0 +1,81 @@
+import math
+from typing import Iterable, Iterator
+
+
+class DAXTimings:
+    """Wall time and token count of each analysis phase of one expression (see DAXExpression collect_timings).
+
+    Phases: "lexing", "comments", "references", "rule:<rule ID>" for each verified rule, "html" and
+    "html_with_violations". A phase that runs several times accumulates its time and counts its calls.
+    """
+
+    def __init__(self) -> None:
+        self.seconds: dict[str, float] = {}
+        self.tokens: dict[str, int] = {}
+        self.calls: dict[str, int] = {}
+
+    def record(self, phase: str, seconds: float, tokens: int) -> None:
+        self.seconds[phase] = self.seconds.get(phase, 0.0) + seconds
+        self.tokens[phase] = tokens
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+
+    def __getitem__(self, phase: str) -> float:
+        return self.seconds[phase]
+
+    def __contains__(self, phase: str) -> bool:
+        return phase in self.seconds
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.seconds)
+
+    def __len__(self) -> int:
+        return len(self.seconds)
+
+    @property
+    def total(self) -> float:
+        return sum(self.seconds.values())
+
+    def __repr__(self) -> str:
+        phases = ", ".join(f"{phase}={seconds * 1000:.3f}ms" for phase, seconds in self.seconds.items())
+        return f"DAXTimings({phases})"
+
+    @staticmethod
+    def summarize(timings: Iterable["DAXTimings | None"]) -> dict[str, "DAXTimingsSummary"]:
+        """Aggregates the timings of a batch by phase, e.g. DAXTimings.summarize(result.timings for result in results).
+
+        Expressions analyzed without timings (None) are skipped but keep their position, so `slowest` is the position
+        of the slowest expression in `timings`.
+        """
+        samples: dict[str, list[tuple[float, int, int]]] = {}
+        for position, expression_timings in enumerate(timings):
+            if expression_timings is None:
+                continue
+            for phase, seconds in expression_timings.seconds.items():
+                samples.setdefault(phase, []).append((seconds, position, expression_timings.tokens[phase]))
+        return {phase: DAXTimingsSummary(phase, phase_samples) for phase, phase_samples in samples.items()}
+
+
+class DAXTimingsSummary:
+    """Distribution of the time spent in one phase over a batch of expressions (see DAXTimings.summarize)"""
+
+    def __init__(self, phase: str, samples: list[tuple[float, int, int]]) -> None:
+        ordered = sorted(samples)
+        self.phase: str = phase
+        self.count: int = len(ordered)
+        self.total: float = sum(seconds for seconds, _, _ in ordered)
+        self.mean: float = self.total / self.count
+        self.p50: float = self.percentile(ordered, 50)
+        self.p90: float = self.percentile(ordered, 90)
+        self.p99: float = self.percentile(ordered, 99)
+        self.max, self.slowest, self.slowest_tokens = ordered[-1]
+
+    @staticmethod
+    def percentile(ordered: list[tuple[float, int, int]], percent: float) -> float:
+        """Nearest-rank percentile of samples sorted by time"""
+        return ordered[max(0, math.ceil(percent / 100 * len(ordered)) - 1)][0]
+
+    def __repr__(self) -> str:
+        return (
+            f"DAXTimingsSummary({self.phase!r}, count={self.count}, p50={self.p50 * 1000:.3f}ms, p90={self.p90 * 1000:.3f}ms, "
+            f"p99={self.p99 * 1000:.3f}ms, max={self.max * 1000:.3f}ms at {self.slowest} ({self.slowest_tokens} tokens))"
+        )
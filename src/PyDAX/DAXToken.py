@@ -1,8 +1,14 @@
-from antlr4 import Token
+from functools import cache
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from antlr4 import Token
 
 
 class DAXToken:
-    def __init__(self, token: Token) -> None:
+    __slots__ = ("start", "stop", "line", "column", "text", "type")
+
+    def __init__(self, token: "Token") -> None:
         self.start: int = token.start
         self.stop: int = token.stop
         self.line: int = token.line
@@ -10,9 +16,27 @@ class DAXToken:
         self.text: str = token.text
         self.type: int = token.type
 
+    @classmethod
+    def from_buffer(cls, tokens: "DAXTokenBuffer", index: int) -> "DAXToken":
+        """Builds the token stored at the given index of a DAXTokenBuffer"""
+        token = cls.__new__(cls)
+        token.start = tokens.starts[index]
+        token.stop = tokens.stops[index]
+        token.line = tokens.lines[index]
+        token.column = tokens.columns[index]
+        token.text = tokens.token_text(index)
+        token.type = tokens.types[index]
+        return token
+
+    def __getstate__(self) -> dict:
+        return slot_state(self)
+
+    def __setstate__(self, state: dict) -> None:
+        restore_slots(self, state)
+
     def __str__(self) -> str:
         return f"Token(Type: {self.type}, Text: '{self.text}', Line: {self.line}, Column: {self.column}, StartIndex: {self.start}, StopIndex: {self.stop})"
-    
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, DAXToken):
             return False
@@ -22,6 +46,62 @@ class DAXToken:
                 self.column == other.column and
                 self.text == other.text and
                 self.type == other.type)
-        
+
     def __hash__(self) -> int:
-        return hash((self.start, self.stop, self.line, self.column, self.text, self.type))
\ No newline at end of file
+        return hash((self.start, self.stop, self.line, self.column, self.text, self.type))
+
+
+def token_ref(token: Any, tokens: "DAXTokenBuffer | None") -> "int | DAXToken | None":
+    """Normalizes a token argument for storage: an index into `tokens` is kept as is, anything else is materialized"""
+    if token is None:
+        return None
+    if tokens is not None and isinstance(token, int):
+        return token
+    return token if isinstance(token, DAXToken) else DAXToken(token)
+
+
+def resolve_token(token: "int | DAXToken | None", tokens: "DAXTokenBuffer | None") -> DAXToken | None:
+    """Returns the DAXToken behind a stored token reference (see token_ref)"""
+    if isinstance(token, int):
+        return tokens.token(token)
+    return token
+
+
+def token_start(token: "int | DAXToken", tokens: "DAXTokenBuffer | None") -> int:
+    """Offset of the token behind a stored token reference (see token_ref), without materializing it"""
+    if isinstance(token, int):
+        return tokens.starts[token]
+    return token.start
+
+
+def restore_token_refs(state: dict, names: tuple[str, ...]) -> dict:
+    """Pickles from previous versions stored materialized DAXToken objects under the public attribute names"""
+    for name in names:
+        if name in state:
+            state[f"_{name}"] = state.pop(name)
+    if "_tokens" not in state:
+        state["_tokens"] = None
+    return state
+
+
+@cache
+def _slot_names(cls: type) -> tuple[str, ...]:
+    """Slots declared by `cls` and its bases"""
+    return tuple(name for klass in reversed(cls.__mro__) for name in klass.__dict__.get("__slots__", ()) if name != "__dict__")
+
+
+def slot_state(instance: Any) -> dict:
+    """Pickled state of an instance using __slots__, as the dict of previous versions without them"""
+    state = {name: getattr(instance, name) for name in _slot_names(type(instance)) if hasattr(instance, name)}
+    state.update(getattr(instance, "__dict__", {}))  # Subclasses without __slots__
+    return state
+
+
+def restore_slots(instance: Any, state: dict) -> None:
+    """Sets the slots of `instance` from a pickled state. Slots missing from pickles of previous versions are None and
+    keys that no longer match an attribute are dropped, unless the instance has a __dict__ to keep them"""
+    for name in _slot_names(type(instance)):
+        setattr(instance, name, state.pop(name, None))
+    instance_dict = getattr(instance, "__dict__", None)
+    if instance_dict is not None:
+        instance_dict.update(state)
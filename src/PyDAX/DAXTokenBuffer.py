@@ -0,0 +1,235 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import repeat
+from operator import add
+from typing import Callable, Iterator, TYPE_CHECKING
+
+from .DAXTokenTypes import DAXTokenTypes
+from .DAXToken import DAXToken
+from .DAXTokenNavigation import DAXTokenNavigation
+
+if TYPE_CHECKING:
+    from .PyDAXLexer import PyDAXLexer
+    from .DAXSyntaxTree import DAXSyntaxTree
+
+#* Characters the lexer may read past the end of a token before settling on it, e.g. 'NORM' or 'NORM.S.DIST'. Lexing
+#* resumes this far before an edit so that no token is kept whose lexing looked at the edited text
+_LOOKAHEAD: int = 32
+
+
+class DAXTokenBuffer:
+    """Materialized token stream of a DAX expression, stored column-wise.
+
+    The expression is lexed exactly once and every consumer (comment removal, reference extraction,
+    best practice rules and HTML generation) reads from this buffer instead of resetting the lexer.
+    Token attributes live in typed arrays indexed by token position; the token text is sliced lazily
+    from the source string, so references, variables and rule results only need to keep an integer index.
+    """
+
+    _present_types: frozenset[int] | None = None  # Computed on first access, see present_types
+    _navigation: DAXTokenNavigation | None = None  # Built on first access, see navigation
+    _syntax_tree: "DAXSyntaxTree | None" = None  # Parsed on first access, see syntax_tree
+
+    def __init__(self, text: str) -> None:
+        self.text: str = text
+        self.types: array = array('H')
+        self.channels: array = array('B')
+        self.starts: array = array('i')
+        self.stops: array = array('i')
+        self.lines: array = array('i')
+        self.columns: array = array('i')
+
+    @classmethod
+    def from_lexer(cls, lexer: "PyDAXLexer", start: int = 0, line: int = 1, column: int = 0, until: int | None = None) -> "DAXTokenBuffer":
+        """Runs the lexer from the beginning of its input and stores all tokens (EOF excluded).
+
+        Like DAXScanner.scan, lexing can resume at a token `start` with that token's `line` and `column`, and stop
+        after the first token starting at or after `until`.
+        """
+        buffer = cls(text=lexer.inputStream.strdata)
+        lexer.reset()
+        if start:
+            lexer.inputStream.seek(start)
+            lexer.line = line
+            lexer.column = column
+        until = len(buffer.text) if until is None else until
+        token = lexer.nextToken()
+        while token.type != DAXTokenTypes.EOF:
+            buffer.append(token.type, token.channel, token.start, token.stop, token.line, token.column)
+            if token.start >= until:
+                break
+            token = lexer.nextToken()
+        return buffer
+
+    def append(self, type: int, channel: int, start: int, stop: int, line: int, column: int) -> None:
+        self.types.append(type)
+        self.channels.append(channel)
+        self.starts.append(start)
+        self.stops.append(stop)
+        self.lines.append(line)
+        self.columns.append(column)
+
+    def apply_edit(
+        self, start: int, end: int, new_text: str, lex: Callable[[str, int, int, int, int], "DAXTokenBuffer"]
+    ) -> tuple["DAXTokenBuffer", int, int, int]:
+        """Tokens of the text with text[start:end] replaced by `new_text`, lexing again only around the edit.
+
+        Lexing resumes at a token starting before the edit and stops as soon as it produces a token at the start of
+        an unchanged token after the edit: from there on the lexer sees the same characters and produces the same
+        tokens, which are copied with shifted offsets and lines. `lex(text, start, line, column, until)` lexes the
+        new text like DAXScanner.scan. The buffer itself is left unchanged, it may be shared by cached expressions.
+
+        Returns:
+            tuple: The new buffer, then `first`, `old_stop` and `new_stop`: tokens [first, old_stop) of this buffer
+                were replaced by tokens [first, new_stop) of the new one
+        """
+        old_starts = self.starts
+        count = len(old_starts)
+        text = self.text[:start] + new_text + self.text[end:]
+        shift = len(new_text) - (end - start)
+
+        #* Without a token far enough before the edit, lexing resumes at the beginning of the text
+        first = bisect_right(old_starts, start - _LOOKAHEAD) - 1
+        #* An unterminated '/*' is lexed as '/' '*' after reading up to the end of the text: any later edit may close it
+        comment = self.text.find("/*", 0, start)
+        while 0 <= comment and first >= 0 and comment < old_starts[first]:
+            index = bisect_left(old_starts, comment)
+            if index < count and old_starts[index] == comment and self.types[index] == DAXTokenTypes.DIV:
+                first = index
+                break
+            comment = self.text.find("/*", comment + 1, start)
+
+        if first >= 0:
+            position, line, column = old_starts[first], self.lines[first], self.columns[first]
+        else:
+            first, position, line, column = 0, 0, 1, 0
+        until = start + len(new_text)
+        fragments: list[DAXTokenBuffer] = []
+        old_stop = count
+        while True:
+            fragment = lex(text, position, line, column, until)
+            if len(fragment) == 0 or fragment.starts[-1] < until:
+                fragments.append(fragment)  # Lexed up to the end of the text
+                break
+            resume = len(fragment) - 1  # The first token at or after `until` is lexed again or taken from this buffer
+            position, line, column = fragment.starts[resume], fragment.lines[resume], fragment.columns[resume]
+            fragments.append(fragment.slice(0, resume))
+            old_position = position - shift
+            index = bisect_left(old_starts, old_position)
+            if old_position >= end and index < count and old_starts[index] == old_position:
+                old_stop = index
+                break
+            until = position + max(position - start, 64)
+
+        buffer = self.slice(0, first)
+        buffer.text = text
+        for fragment in fragments:
+            buffer.extend(fragment)
+        new_stop = len(buffer)
+        if old_stop < count:
+            tail = self.slice(old_stop, count)
+            if shift:
+                tail.starts = array('i', map(add, tail.starts, repeat(shift)))
+                tail.stops = array('i', map(add, tail.stops, repeat(shift)))
+            line_shift = line - tail.lines[0]
+            if line_shift:
+                tail.lines = array('i', map(add, tail.lines, repeat(line_shift)))
+            #* Only the tokens on the line where lexing stopped move sideways
+            column_shift = column - tail.columns[0]
+            if column_shift:
+                for index in range(bisect_right(tail.lines, line)):
+                    tail.columns[index] += column_shift
+            buffer.extend(tail)
+        return buffer, first, old_stop, new_stop
+
+    def slice(self, start: int, stop: int) -> "DAXTokenBuffer":
+        """Buffer holding tokens [start, stop) of this one, over the same text"""
+        buffer = DAXTokenBuffer(self.text)
+        buffer.types = self.types[start:stop]
+        buffer.channels = self.channels[start:stop]
+        buffer.starts = self.starts[start:stop]
+        buffer.stops = self.stops[start:stop]
+        buffer.lines = self.lines[start:stop]
+        buffer.columns = self.columns[start:stop]
+        return buffer
+
+    def extend(self, other: "DAXTokenBuffer") -> None:
+        """Appends the tokens of `other`, whose offsets must already refer to this buffer's text"""
+        self.types.extend(other.types)
+        self.channels.extend(other.channels)
+        self.starts.extend(other.starts)
+        self.stops.extend(other.stops)
+        self.lines.extend(other.lines)
+        self.columns.extend(other.columns)
+
+    def __getstate__(self) -> dict:
+        # The navigation index and the syntax tree are several times larger than the tokens and cheap to rebuild
+        state = self.__dict__.copy()
+        state.pop("_navigation", None)
+        state.pop("_syntax_tree", None)
+        return state
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __iter__(self) -> Iterator[DAXToken]:
+        for index in range(len(self.types)):
+            yield self.token(index)
+
+    def token(self, index: int) -> DAXToken:
+        """Materializes the token at the given index"""
+        return DAXToken.from_buffer(self, index)
+
+    def source_text(self, index: int) -> str:
+        """Exact lexeme of the token as written in the expression"""
+        return self.text[self.starts[index]:self.stops[index] + 1]
+
+    def token_text(self, index: int) -> str:
+        """Token text as produced by PyDAXLexer, including the normalization done by its lexer actions"""
+        text = self.text[self.starts[index]:self.stops[index] + 1]
+        token_type = self.types[index]
+        if token_type == DAXTokenTypes.TABLE:
+            return text[1:-1].replace("''", "'")
+        if token_type == DAXTokenTypes.COLUMN_OR_MEASURE:
+            return text[1:-1].replace("]]", "]")
+        if token_type == DAXTokenTypes.STRING_LITERAL:
+            return text[1:-1]
+        if token_type == DAXTokenTypes.DATE_LITERAL:
+            return text[3:-1]
+        return text
+
+    def on_channels(self, *channels: int) -> list[int]:
+        """Returns the indexes of the tokens that belong to any of the given channels, in order"""
+        token_channels = self.channels
+        return [index for index in range(len(token_channels)) if token_channels[index] in channels]
+
+    def of_type(self, token_type: int) -> list[int]:
+        """Returns the indexes of the tokens of the given type, in order"""
+        token_types = self.types
+        return [index for index in range(len(token_types)) if token_types[index] == token_type]
+
+    def contains_type(self, token_type: int) -> bool:
+        return token_type in self.types
+
+    @property
+    def present_types(self) -> frozenset[int]:
+        """Token types found in the expression, collected once from the finished buffer"""
+        if self._present_types is None:
+            self._present_types = frozenset(self.types)
+        return self._present_types
+
+    @property
+    def navigation(self) -> DAXTokenNavigation:
+        """Matching parentheses, significant neighbours and argument boundaries, indexed once from the finished buffer"""
+        if self._navigation is None:
+            self._navigation = DAXTokenNavigation(self)
+        return self._navigation
+
+    @property
+    def syntax_tree(self) -> "DAXSyntaxTree":
+        """Syntax tree of the expression, parsed once from the finished buffer"""
+        if self._syntax_tree is None:
+            from .DAXParser import DAXParser
+
+            self._syntax_tree = DAXParser.parse(self)
+        return self._syntax_tree
@@ -0,0 +1,89 @@
+from array import array
+from bisect import bisect_left
+from itertools import accumulate, compress
+from operator import sub
+from typing import TYPE_CHECKING
+
+from .DAXTokenTypes import DAXTokenTypes
+
+if TYPE_CHECKING:
+    from .DAXTokenBuffer import DAXTokenBuffer
+
+
+class DAXTokenNavigation:
+    """Navigation index of a DAXTokenBuffer, built in one linear pass the first time it is needed
+    (see DAXTokenBuffer.navigation) so scans for a parenthesis, a neighbour or an argument become lookups.
+
+    Significant tokens are the tokens of the default and keyword channels, whitespace and comments are skipped.
+    Arrays are indexed by buffer index and hold buffer indexes, -1 when there is none.
+    """
+
+    def __init__(self, buffer: "DAXTokenBuffer") -> None:
+        count = len(buffer)
+        types, channels = buffer.types, buffer.channels
+        skipped = (DAXTokenTypes.HIDDEN, DAXTokenTypes.COMMENTS_CHANNEL)
+        open_parens, close_parens, comma = DAXTokenTypes.OPEN_PARENS, DAXTokenTypes.CLOSE_PARENS, DAXTokenTypes.COMMA
+
+        #* The neighbours are read from the running count of significant tokens, without a Python loop
+        is_significant: list[bool] = [channel not in skipped for channel in channels]
+        self.significant: list[int] = list(compress(range(count), is_significant))
+        counts = list(accumulate(is_significant))
+        self.previous_significant: array = array('i', [-1])[:count]  # The first token has none
+        self.previous_significant.extend(map([-1, *self.significant].__getitem__, counts[:-1]))
+        self.next_significant: array = array('i', map([*self.significant, -1].__getitem__, counts))
+        #* '(' <-> ')' of the same pair, -1 for unbalanced parentheses and any other token
+        self.matching_paren: array = array('i', [-1]) * count
+
+        #* Only parentheses and commas change the enclosing pair and argument. The state after each of them is recorded
+        #* once and every token takes the state after the last one up to it, '(' and ',' the state before themselves.
+        is_structural = list(map(frozenset({open_parens, close_parens, comma}).__contains__, types))
+        parens: list[int] = []  # Open parentheses around the current token
+        arguments: list[int] = []  # Current argument of each of them
+        paren_states, argument_states = [-1], [-1]
+        for index in compress(range(count), is_structural):
+            token_type = types[index]
+            if token_type == open_parens:
+                parens.append(index)
+                arguments.append(0)
+            elif not parens:
+                pass  # Unbalanced ')' or a comma outside any call
+            elif token_type == close_parens:
+                opening = parens.pop()
+                arguments.pop()
+                self.matching_paren[opening] = index
+                self.matching_paren[index] = opening
+            else:
+                arguments[-1] += 1
+            paren_states.append(parens[-1] if parens else -1)
+            argument_states.append(arguments[-1] if arguments else -1)
+
+        events = list(map(sub, accumulate(is_structural), map(frozenset({open_parens, comma}).__contains__, types)))
+        #* '(' of the innermost pair around the token, and the argument (0 based) of that pair the token belongs to.
+        #* The parentheses of a pair belong to the enclosing pair, a comma to the argument it ends.
+        self.enclosing_paren: array = array('i', map(paren_states.__getitem__, events))
+        self.argument_positions: array = array('i', map(argument_states.__getitem__, events))
+        self._types: array = types
+        self._separators: dict[int, list[int]] | None = None
+
+    def position(self, index: int) -> int:
+        """Position of the token at buffer index `index` in `significant`, -1 for whitespace and comments"""
+        position = bisect_left(self.significant, index)
+        return position if position < len(self.significant) and self.significant[position] == index else -1
+
+    def function_of(self, open_paren: int) -> int:
+        """The token called by the '(' at `open_paren` (the significant token before it), -1 at the start"""
+        return self.previous_significant[open_paren]
+
+    def arguments(self, open_paren: int) -> list[tuple[int, int]]:
+        """(separator before, separator after) of each argument of the '(' at `open_paren`. The first significant
+        token of an argument is next_significant[before], the argument is empty when that is `after`. The last
+        argument of an unclosed '(' ends after the last token."""
+        if self._separators is None:
+            #* The commas of every pair, grouped the first time arguments are asked for
+            self._separators = {}
+            for index in compress(range(len(self._types)), map(DAXTokenTypes.COMMA.__eq__, self._types)):
+                if self.enclosing_paren[index] >= 0:
+                    self._separators.setdefault(self.enclosing_paren[index], []).append(index)
+        closing = self.matching_paren[open_paren]
+        separators = [open_paren, *self._separators.get(open_paren, ()), closing if closing >= 0 else len(self._types)]
+        return list(zip(separators, separators[1:]))
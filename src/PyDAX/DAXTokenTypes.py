@@ -0,0 +1,34 @@
+from pathlib import Path
+
+
+class DAXTokenTypes:
+    """Token types and channels of PyDAXLexer, available without loading the ANTLR runtime.
+
+    The token types are read from PyDAXLexer.tokens, which ANTLR generates next to the lexer, so they always
+    match `PyDAXLexer.<NAME>`. Only tokenizing with the ANTLR backend needs to import PyDAXLexer itself.
+    """
+
+    EOF: int = -1
+
+    DEFAULT_CHANNEL: int = 0
+    HIDDEN: int = 1
+    COMMENTS_CHANNEL: int = 2
+    KEYWORD_CHANNEL: int = 3
+
+    #* Same layout as PyDAXLexer.symbolicNames: the token name at each token type
+    symbolicNames: list[str] = ["<INVALID>"]
+
+
+def _load_token_types(path: Path) -> None:
+    for line in path.read_text(encoding="utf-8").splitlines():
+        name, _, token_type = line.rpartition("=")
+        if name.startswith("'"):
+            continue  # Literal aliases ('{'=403) repeat token types already declared by name
+        token_type = int(token_type)
+        setattr(DAXTokenTypes, name, token_type)
+        names = DAXTokenTypes.symbolicNames
+        names.extend(["<INVALID>"] * (token_type + 1 - len(names)))
+        names[token_type] = name
+
+
+_load_token_types(Path(__file__).with_name("PyDAXLexer.tokens"))
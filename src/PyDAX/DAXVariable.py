@@ -1,16 +1,66 @@
-from .DAXToken import DAXToken
-from antlr4 import Token
+from typing import TYPE_CHECKING
+
+from .DAXToken import DAXToken, token_ref, resolve_token, restore_slots, restore_token_refs, slot_state
+
+if TYPE_CHECKING:
+    from .DAXNameTable import DAXNameTable
+
+
 class DAXVariable:
-    def __init__(self, name: str, token: Token, var_keyword_token: Token, last_expression_token: Token | None) -> None:
+    __slots__ = ("name", "_tokens", "_token", "_var_keyword_token", "_last_expression_token", "_names", "name_id")
+
+    def __init__(self, name: str, token: "Token | int", var_keyword_token: "Token | int", last_expression_token: "Token | int | None", tokens: "DAXTokenBuffer | None" = None) -> None:
         self.name: str = name
-        self.token: DAXToken = DAXToken(token)
-        self.var_keyword_token: DAXToken = DAXToken(var_keyword_token)
-        self.last_expression_token: DAXToken | None = DAXToken(last_expression_token) if last_expression_token else None
+        #Tokens are kept as indexes into the expression's DAXTokenBuffer when one is given
+        self._tokens = tokens
+        self._token = token_ref(token, tokens)
+        self._var_keyword_token = token_ref(var_keyword_token, tokens)
+        self._last_expression_token = token_ref(last_expression_token, tokens)
+        self._names = None
+        self.name_id = None
+
+    @property
+    def token(self) -> DAXToken:
+        return resolve_token(self._token, self._tokens)
+
+    @property
+    def var_keyword_token(self) -> DAXToken:
+        return resolve_token(self._var_keyword_token, self._tokens)
+
+    @property
+    def last_expression_token(self) -> DAXToken | None:
+        return resolve_token(self._last_expression_token, self._tokens)
+
+    def intern(self, names: "DAXNameTable") -> None:
+        """Shares the name with everything interned in `names` and sets name_id"""
+        if self._names is not names:
+            self.name, self.name_id = names.entry(self.name)
+            self._names = names
+
+    def __getstate__(self):
+        return {**slot_state(self), "_names": None, "name_id": None}
+
+    def __setstate__(self, state):
+        restore_slots(self, restore_token_refs(state, ("token", "var_keyword_token", "last_expression_token")))
+
+    def __copy__(self):
+        #* Not interned, like unpickled variables
+        clone = type(self).__new__(type(self))
+        clone.name, clone._tokens, clone._token = self.name, self._tokens, self._token
+        clone._var_keyword_token, clone._last_expression_token = self._var_keyword_token, self._last_expression_token
+        clone._names = clone.name_id = None
+        return clone
+
+    def _same_name(self, other: "DAXVariable") -> bool:
+        # DAX names are case-insensitive
+        if self._names is not None and self._names is other._names:
+            return self.name_id == other.name_id
+        return self.name.casefold() == other.name.casefold()
 
     def __eq__(self, value):
         if isinstance(value, DAXVariable):
-            return self.name == value.name and self.token == value.token and self.var_keyword_token == value.var_keyword_token and self.last_expression_token == value.last_expression_token
+            return self._same_name(value) and self.token == value.token and self.var_keyword_token == value.var_keyword_token and self.last_expression_token == value.last_expression_token
         return False
-    
+
     def __hash__(self):
-        return hash((self.name, self.token, self.var_keyword_token, self.last_expression_token))
\ No newline at end of file
+        return hash((self.name.casefold(), self.token, self.var_keyword_token, self.last_expression_token))
@@ -2,420 +2,120 @@ lexer grammar PyDAXLexer;
 
 channels { COMMENTS_CHANNEL, KEYWORD_CHANNEL }
 
+@header {
+from .DAXKeywords import keyword_types
+}
+
+@members {
+# Upper case keyword spelling -> token type, built on first use (see DAXKeywords)
+KEYWORD_TYPES = None
+
+def keyword_or_identifier(self):
+    keyword_types_by_spelling = PyDAXLexer.KEYWORD_TYPES
+    if keyword_types_by_spelling is None:
+        keyword_types_by_spelling = PyDAXLexer.KEYWORD_TYPES = keyword_types(PyDAXLexer)
+    token_type = keyword_types_by_spelling.get(self.text.upper())
+    if token_type is not None:
+        self._type = token_type
+        self._channel = self.KEYWORD_CHANNEL
+}
+
+// Keywords are lexed as TABLE_OR_VARIABLE and mapped to their token type through DAXKeywords (case-insensitive).
+// They are declared here, in their original order, so that every token type keeps its number.
+tokens {
+    SINGLE_LINE_COMMENT, DELIMITED_COMMENT, WHITESPACES, ABS, ACOS, ACOSH, ACOT, ACOTH,
+    ADDCOLUMNS, ADDMISSINGITEMS, ALL, ALLCROSSFILTERED, ALLEXCEPT, ALLNOBLANKROW, ALLSELECTED, AND,
+    APPROXIMATEDISTINCTCOUNT, ASIN, ASINH, ATAN, ATANH, AVERAGE, AVERAGEA, AVERAGEX,
+    BETADIST, BETAINV, BLANK, CALCULATE, CALCULATETABLE, CALENDAR, CALENDARAUTO, CEILING,
+    CHISQDIST, CHISQDISTRT, CHISQINV, CHISQINVRT, CLOSINGBALANCEMONTH, CLOSINGBALANCEQUARTER, CLOSINGBALANCEYEAR, COALESCE,
+    COMBIN, COMBINA, COMBINEVALUES, CONCATENATE, CONCATENATEX, CONFIDENCENORM, CONFIDENCET, CONTAINS,
+    CONTAINSROW, CONTAINSSTRING, CONTAINSSTRINGEXACT, CONVERT, COS, COSH, COT, COTH,
+    COUNT, COUNTA, COUNTAX, COUNTBLANK, COUNTROWS, COUNTX, CROSSFILTER, CROSSJOIN,
+    CURRENCY, CURRENTGROUP, CUSTOMDATA, DATATABLE, DATE, DATEADD, DATEDIFF, DATESBETWEEN,
+    DATESINPERIOD, DATESMTD, DATESQTD, DATESYTD, DATEVALUE, DAY, DEGREES, DETAILROWS,
+    DISTINCT, DISTINCTCOUNT, DISTINCTCOUNTNOBLANK, DIVIDE, EARLIER, EARLIEST, EDATE, ENDOFMONTH,
+    ENDOFQUARTER, ENDOFYEAR, EOMONTH, ERROR, EVEN, EXACT, EXCEPT, EXP,
+    EXPONDIST, FACT, FALSE, FILTER, FILTERS, FIND, FIRSTDATE, FIRSTNONBLANK,
+    FIRSTNONBLANKVALUE, FIXED, FLOOR, FORMAT, GCD, GENERATE, GENERATEALL, GENERATESERIES,
+    GEOMEAN, GEOMEANX, GROUPBY, HASONEFILTER, HASONEVALUE, HOUR, IF, IFEAGER,
+    IFERROR, IGNORE, INT, INTERSECT, ISBLANK, ISCROSSFILTERED, ISEMPTY, ISERROR,
+    ISEVEN, ISFILTERED, ISINSCOPE, ISLOGICAL, ISNONTEXT, ISNUMBER, ISOCEILING, ISODD,
+    ISONORAFTER, ISSELECTEDMEASURE, ISSUBTOTAL, ISTEXT, KEEPFILTERS, KEYWORDMATCH, LASTDATE, LASTNONBLANK,
+    LASTNONBLANKVALUE, LCM, LEFT, LEN, LN, LOG, LOG10, LOOKUPVALUE,
+    LOWER, MAX, MAXA, MAXX, MEDIAN, MEDIANX, MID, MIN,
+    MINA, MINUTE, MINX, MOD, MONTH, MROUND, NATURALINNERJOIN, NATURALLEFTOUTERJOIN,
+    NEXTDAY, NEXTMONTH, NEXTQUARTER, NEXTYEAR, NONVISUAL, NORMDIST, NORMINV, NORMSDIST,
+    NORMSINV, NOT, NOW, ODD, OPENINGBALANCEMONTH, OPENINGBALANCEQUARTER, OPENINGBALANCEYEAR, OR,
+    PARALLELPERIOD, PATH, PATHCONTAINS, PATHITEM, PATHITEMREVERSE, PATHLENGTH, PERCENTILEEXC, PERCENTILEINC,
+    PERCENTILEXEXC, PERCENTILEXINC, PERMUT, PI, POISSONDIST, POWER, PREVIOUSDAY, PREVIOUSMONTH,
+    PREVIOUSQUARTER, PREVIOUSYEAR, PRODUCT, PRODUCTX, QUARTER, QUOTIENT, RADIANS, RAND,
+    RANDBETWEEN, RANKEQ, RANKX, RELATED, RELATEDTABLE, REMOVEFILTERS, REPLACE, REPT,
+    RIGHT, ROLLUP, ROLLUPADDISSUBTOTAL, ROLLUPGROUP, ROLLUPISSUBTOTAL, ROUND, ROUNDDOWN, ROUNDUP,
+    ROW, SAMEPERIODLASTYEAR, SAMPLE, SEARCH, SECOND, SELECTCOLUMNS, SELECTEDMEASURE, SELECTEDMEASUREFORMATSTRING,
+    SELECTEDMEASURENAME, SELECTEDVALUE, SIGN, SIN, SINH, SQRT, SQRTPI, STARTOFMONTH,
+    STARTOFQUARTER, STARTOFYEAR, STDEVP, STDEVS, STDEVXP, STDEVXS, SUBSTITUTE, SUBSTITUTEWITHINDEX,
+    SUM, SUMMARIZE, SUMMARIZECOLUMNS, SUMX, SWITCH, TDIST, TDIST2T, TDISTRT,
+    TINV, TINV2T, TAN, TANH, TIME, TIMEVALUE, TODAY, TOPN,
+    TOPNPERLEVEL, TOPNSKIP, TOTALMTD, TOTALQTD, TOTALYTD, TREATAS, TRIM, TRUE,
+    TRUNC, UNICHAR, UNICODE, UNION, UPPER, USERELATIONSHIP, USERNAME, USEROBJECTID,
+    USERPRINCIPALNAME, UTCNOW, UTCTODAY, VALUE, VALUES, VARP, VARS, VARXP,
+    VARXS, WEEKDAY, YEARFRAC, WEEKNUM, XIRR, XNPV, YEAR, ACCRINT,
+    ACCRINTM, AMORDEGRC, AMORLINC, COUPDAYBS, COUPDAYS, COUPDAYSNC, COUPNCD, COUPNUM,
+    COUPPCD, CUMIPMT, CUMPRINC, DB, DDB, DISC, DOLLARDE, DOLLARFR,
+    DURATION, EFFECT, FV, INTRATE, IPMT, ISPMT, MDURATION, NOMINAL,
+    NPER, ODDFPRICE, ODDFYIELD, ODDLPRICE, ODDLYIELD, PDURATION, PMT, PPMT,
+    PRICE, PRICEDISC, PRICEMAT, PV, RATE, RECEIVED, RRI, SLN,
+    SYD, TBILLEQ, TBILLPRICE, TBILLYIELD, VDB, YIELD, YIELDDISC, YIELDMAT,
+    SAMPLEAXISWITHLOCALMINMAX, EVALUATEANDLOG, OFFSET, INDEX, WINDOW, ORDERBY, RANK, ROWNUMBER,
+    PARTITIONBY, EXTERNALMEASURE, KMEANSCLUSTERING, DEFINE, EVALUATE, ORDER, BY, START,
+    AT, RETURN, VAR, IN, ASC, DESC, SKIP_, DENSE,
+    BLANKS, LAST, FIRST, WEEK, BOTH, NONE, ONEWAY, ONEWAYRIGHTFILTERSLEFT,
+    ONEWAYLEFTFILTERSRIGHT, INTEGER, DOUBLE, STRING, BOOLEAN, DATETIME, VARIANT, TEXT,
+    ALPHABETICAL, KEEP, REL, EXPR, VAL, ANYVAL, ANYREF, SCALAR,
+    INT64, DECIMAL, NUMERIC
+}
+
 SINGLE_LINE_COMMENT:     ( '//' | '--' )  InputCharacter*    -> channel(COMMENTS_CHANNEL);
 DELIMITED_COMMENT:       '/*' ( DELIMITED_COMMENT | '/' ~'*' | ~'/' )*? ( '*/' | EOF )  -> channel(COMMENTS_CHANNEL);
 
 WHITESPACES:   (Whitespace | NewLine)+            -> channel(HIDDEN);
 
-// Note: Must use DAXCharStream as input, to make the lexer case-insensitive. More information here:
-// https://github.com/antlr/antlr4/blob/master/doc/case-insensitive-lexing.md
-ABS:                                     'ABS'                                     -> channel(KEYWORD_CHANNEL);
-ACOS:                                    'ACOS'                                    -> channel(KEYWORD_CHANNEL);
-ACOSH:                                   'ACOSH'                                   -> channel(KEYWORD_CHANNEL);
-ACOT:                                    'ACOT'                                    -> channel(KEYWORD_CHANNEL);
-ACOTH:                                   'ACOTH'                                   -> channel(KEYWORD_CHANNEL);
-ADDCOLUMNS:                              'ADDCOLUMNS'                              -> channel(KEYWORD_CHANNEL);
-ADDMISSINGITEMS:                         'ADDMISSINGITEMS'                         -> channel(KEYWORD_CHANNEL);
-ALL:                                     'ALL'                                     -> channel(KEYWORD_CHANNEL);
-ALLCROSSFILTERED:						 'ALLCROSSFILTERED'						   -> channel(KEYWORD_CHANNEL);
-ALLEXCEPT:                               'ALLEXCEPT'                               -> channel(KEYWORD_CHANNEL);
-ALLNOBLANKROW:                           'ALLNOBLANKROW'                           -> channel(KEYWORD_CHANNEL);
-ALLSELECTED:                             'ALLSELECTED'                             -> channel(KEYWORD_CHANNEL);
-AND:                                     'AND'                                     -> channel(KEYWORD_CHANNEL);
-APPROXIMATEDISTINCTCOUNT:                'APPROXIMATEDISTINCTCOUNT'                -> channel(KEYWORD_CHANNEL);
-ASIN:                                    'ASIN'                                    -> channel(KEYWORD_CHANNEL);
-ASINH:                                   'ASINH'                                   -> channel(KEYWORD_CHANNEL);
-ATAN:                                    'ATAN'                                    -> channel(KEYWORD_CHANNEL);
-ATANH:                                   'ATANH'                                   -> channel(KEYWORD_CHANNEL);
-AVERAGE:                                 'AVERAGE'                                 -> channel(KEYWORD_CHANNEL);
-AVERAGEA:                                'AVERAGEA'                                -> channel(KEYWORD_CHANNEL);
-AVERAGEX:                                'AVERAGEX'                                -> channel(KEYWORD_CHANNEL);
-BETADIST:                                'BETA.DIST'                               -> channel(KEYWORD_CHANNEL);
-BETAINV:                                 'BETA.INV'                                -> channel(KEYWORD_CHANNEL);
-BLANK:                                   'BLANK'                                   -> channel(KEYWORD_CHANNEL);
-CALCULATE:                               'CALCULATE'                               -> channel(KEYWORD_CHANNEL);
-CALCULATETABLE:                          'CALCULATETABLE'                          -> channel(KEYWORD_CHANNEL);
-CALENDAR:                                'CALENDAR'                                -> channel(KEYWORD_CHANNEL);
-CALENDARAUTO:                            'CALENDARAUTO'                            -> channel(KEYWORD_CHANNEL);
-CEILING:                                 'CEILING'                                 -> channel(KEYWORD_CHANNEL);
-CHISQDIST:                               'CHISQ.DIST'                              -> channel(KEYWORD_CHANNEL);
-CHISQDISTRT:                             'CHISQ.DIST.RT'                           -> channel(KEYWORD_CHANNEL);
-CHISQINV:                                'CHISQ.INV'                               -> channel(KEYWORD_CHANNEL);
-CHISQINVRT:                              'CHISQ.INV.RT'                            -> channel(KEYWORD_CHANNEL);
-CLOSINGBALANCEMONTH:                     'CLOSINGBALANCEMONTH'                     -> channel(KEYWORD_CHANNEL);
-CLOSINGBALANCEQUARTER:                   'CLOSINGBALANCEQUARTER'                   -> channel(KEYWORD_CHANNEL);
-CLOSINGBALANCEYEAR:                      'CLOSINGBALANCEYEAR'                      -> channel(KEYWORD_CHANNEL);
-COALESCE:								 'COALESCE'								   -> channel(KEYWORD_CHANNEL);
-COMBIN:                                  'COMBIN'                                  -> channel(KEYWORD_CHANNEL);
-COMBINA:                                 'COMBINA'                                 -> channel(KEYWORD_CHANNEL);
-COMBINEVALUES:                           'COMBINEVALUES'                           -> channel(KEYWORD_CHANNEL);
-CONCATENATE:                             'CONCATENATE'                             -> channel(KEYWORD_CHANNEL);
-CONCATENATEX:                            'CONCATENATEX'                            -> channel(KEYWORD_CHANNEL);
-CONFIDENCENORM:                          'CONFIDENCE.NORM'                         -> channel(KEYWORD_CHANNEL);
-CONFIDENCET:                             'CONFIDENCE.T'                            -> channel(KEYWORD_CHANNEL);
-CONTAINS:                                'CONTAINS'                                -> channel(KEYWORD_CHANNEL);
-CONTAINSROW:                             'CONTAINSROW'                             -> channel(KEYWORD_CHANNEL);
-CONTAINSSTRING:							 'CONTAINSSTRING'						   -> channel(KEYWORD_CHANNEL);
-CONTAINSSTRINGEXACT:					 'CONTAINSSTRINGEXACT'					   -> channel(KEYWORD_CHANNEL);
-CONVERT:								 'CONVERT'								   -> channel(KEYWORD_CHANNEL);
-COS:                                     'COS'                                     -> channel(KEYWORD_CHANNEL);
-COSH:                                    'COSH'                                    -> channel(KEYWORD_CHANNEL);
-COT:                                     'COT'                                     -> channel(KEYWORD_CHANNEL);
-COTH:                                    'COTH'                                    -> channel(KEYWORD_CHANNEL);
-COUNT:                                   'COUNT'                                   -> channel(KEYWORD_CHANNEL);
-COUNTA:                                  'COUNTA'                                  -> channel(KEYWORD_CHANNEL);
-COUNTAX:                                 'COUNTAX'                                 -> channel(KEYWORD_CHANNEL);
-COUNTBLANK:                              'COUNTBLANK'                              -> channel(KEYWORD_CHANNEL);
-COUNTROWS:                               'COUNTROWS'                               -> channel(KEYWORD_CHANNEL);
-COUNTX:                                  'COUNTX'                                  -> channel(KEYWORD_CHANNEL);
-CROSSFILTER:                             'CROSSFILTER'                             -> channel(KEYWORD_CHANNEL);
-CROSSJOIN:                               'CROSSJOIN'                               -> channel(KEYWORD_CHANNEL);
-CURRENCY:                                'CURRENCY'                                -> channel(KEYWORD_CHANNEL);
-CURRENTGROUP:                            'CURRENTGROUP'                            -> channel(KEYWORD_CHANNEL);
-CUSTOMDATA:                              'CUSTOMDATA'                              -> channel(KEYWORD_CHANNEL);
-DATATABLE:                               'DATATABLE'                               -> channel(KEYWORD_CHANNEL);
-DATE:                                    'DATE'                                    -> channel(KEYWORD_CHANNEL);
-DATEADD:                                 'DATEADD'                                 -> channel(KEYWORD_CHANNEL);
-DATEDIFF:                                'DATEDIFF'                                -> channel(KEYWORD_CHANNEL);
-DATESBETWEEN:                            'DATESBETWEEN'                            -> channel(KEYWORD_CHANNEL);
-DATESINPERIOD:                           'DATESINPERIOD'                           -> channel(KEYWORD_CHANNEL);
-DATESMTD:                                'DATESMTD'                                -> channel(KEYWORD_CHANNEL);
-DATESQTD:                                'DATESQTD'                                -> channel(KEYWORD_CHANNEL);
-DATESYTD:                                'DATESYTD'                                -> channel(KEYWORD_CHANNEL);
-DATEVALUE:                               'DATEVALUE'                               -> channel(KEYWORD_CHANNEL);
-DAY:                                     'DAY'                                     -> channel(KEYWORD_CHANNEL);
-DEGREES:                                 'DEGREES'                                 -> channel(KEYWORD_CHANNEL);
-DETAILROWS:                              'DETAILROWS'                              -> channel(KEYWORD_CHANNEL);
-DISTINCT:                                'DISTINCT'                                -> channel(KEYWORD_CHANNEL);
-DISTINCTCOUNT:                           'DISTINCTCOUNT'                           -> channel(KEYWORD_CHANNEL);
-DISTINCTCOUNTNOBLANK:                    'DISTINCTCOUNTNOBLANK'                    -> channel(KEYWORD_CHANNEL);
-DIVIDE:                                  'DIVIDE'                                  -> channel(KEYWORD_CHANNEL);
-EARLIER:                                 'EARLIER'                                 -> channel(KEYWORD_CHANNEL);
-EARLIEST:                                'EARLIEST'                                -> channel(KEYWORD_CHANNEL);
-EDATE:                                   'EDATE'                                   -> channel(KEYWORD_CHANNEL);
-ENDOFMONTH:                              'ENDOFMONTH'                              -> channel(KEYWORD_CHANNEL);
-ENDOFQUARTER:                            'ENDOFQUARTER'                            -> channel(KEYWORD_CHANNEL);
-ENDOFYEAR:                               'ENDOFYEAR'                               -> channel(KEYWORD_CHANNEL);
-EOMONTH:                                 'EOMONTH'                                 -> channel(KEYWORD_CHANNEL);
-ERROR:                                   'ERROR'                                   -> channel(KEYWORD_CHANNEL);
-EVEN:                                    'EVEN'                                    -> channel(KEYWORD_CHANNEL);
-EXACT:                                   'EXACT'                                   -> channel(KEYWORD_CHANNEL);
-EXCEPT:                                  'EXCEPT'                                  -> channel(KEYWORD_CHANNEL);
-EXP:                                     'EXP'                                     -> channel(KEYWORD_CHANNEL);
-EXPONDIST:                               'EXPON.DIST'                              -> channel(KEYWORD_CHANNEL);
-FACT:                                    'FACT'                                    -> channel(KEYWORD_CHANNEL);
-FALSE:                                   'FALSE'                                   -> channel(KEYWORD_CHANNEL);
-FILTER:                                  'FILTER'                                  -> channel(KEYWORD_CHANNEL);
-FILTERS:                                 'FILTERS'                                 -> channel(KEYWORD_CHANNEL);
-FIND:                                    'FIND'                                    -> channel(KEYWORD_CHANNEL);
-FIRSTDATE:                               'FIRSTDATE'                               -> channel(KEYWORD_CHANNEL);
-FIRSTNONBLANK:                           'FIRSTNONBLANK'                           -> channel(KEYWORD_CHANNEL);
-FIRSTNONBLANKVALUE:						 'FIRSTNONBLANKVALUE'					   -> channel(KEYWORD_CHANNEL);
-FIXED:                                   'FIXED'                                   -> channel(KEYWORD_CHANNEL);
-FLOOR:                                   'FLOOR'                                   -> channel(KEYWORD_CHANNEL);
-FORMAT:                                  'FORMAT'                                  -> channel(KEYWORD_CHANNEL);
-GCD:                                     'GCD'                                     -> channel(KEYWORD_CHANNEL);
-GENERATE:                                'GENERATE'                                -> channel(KEYWORD_CHANNEL);
-GENERATEALL:                             'GENERATEALL'                             -> channel(KEYWORD_CHANNEL);
-GENERATESERIES:                          'GENERATESERIES'                          -> channel(KEYWORD_CHANNEL);
-GEOMEAN:                                 'GEOMEAN'                                 -> channel(KEYWORD_CHANNEL);
-GEOMEANX:                                'GEOMEANX'                                -> channel(KEYWORD_CHANNEL);
-GROUPBY:                                 'GROUPBY'                                 -> channel(KEYWORD_CHANNEL);
-HASONEFILTER:                            'HASONEFILTER'                            -> channel(KEYWORD_CHANNEL);
-HASONEVALUE:                             'HASONEVALUE'                             -> channel(KEYWORD_CHANNEL);
-HOUR:                                    'HOUR'                                    -> channel(KEYWORD_CHANNEL);
-IF:                                      'IF'                                      -> channel(KEYWORD_CHANNEL);
-IFEAGER:                                 'IF.EAGER'                                -> channel(KEYWORD_CHANNEL);
-IFERROR:                                 'IFERROR'                                 -> channel(KEYWORD_CHANNEL);
-IGNORE:                                  'IGNORE'                                  -> channel(KEYWORD_CHANNEL);
-INT:                                     'INT'                                     -> channel(KEYWORD_CHANNEL);
-INTERSECT:                               'INTERSECT'                               -> channel(KEYWORD_CHANNEL);
-ISBLANK:                                 'ISBLANK'                                 -> channel(KEYWORD_CHANNEL);
-ISCROSSFILTERED:                         'ISCROSSFILTERED'                         -> channel(KEYWORD_CHANNEL);
-ISEMPTY:                                 'ISEMPTY'                                 -> channel(KEYWORD_CHANNEL);
-ISERROR:                                 'ISERROR'                                 -> channel(KEYWORD_CHANNEL);
-ISEVEN:                                  'ISEVEN'                                  -> channel(KEYWORD_CHANNEL);
-ISFILTERED:                              'ISFILTERED'                              -> channel(KEYWORD_CHANNEL);
-ISINSCOPE:                               'ISINSCOPE'                               -> channel(KEYWORD_CHANNEL);
-ISLOGICAL:                               'ISLOGICAL'                               -> channel(KEYWORD_CHANNEL);
-ISNONTEXT:                               'ISNONTEXT'                               -> channel(KEYWORD_CHANNEL);
-ISNUMBER:                                'ISNUMBER'                                -> channel(KEYWORD_CHANNEL);
-ISOCEILING:                              'ISO.CEILING'                             -> channel(KEYWORD_CHANNEL);
-ISODD:                                   'ISODD'                                   -> channel(KEYWORD_CHANNEL);
-ISONORAFTER:                             'ISONORAFTER'                             -> channel(KEYWORD_CHANNEL);
-ISSELECTEDMEASURE:                       'ISSELECTEDMEASURE'                       -> channel(KEYWORD_CHANNEL);
-ISSUBTOTAL:                              'ISSUBTOTAL'                              -> channel(KEYWORD_CHANNEL);
-ISTEXT:                                  'ISTEXT'                                  -> channel(KEYWORD_CHANNEL);
-KEEPFILTERS:                             'KEEPFILTERS'                             -> channel(KEYWORD_CHANNEL);
-KEYWORDMATCH:                            'KEYWORDMATCH'                            -> channel(KEYWORD_CHANNEL);
-LASTDATE:                                'LASTDATE'                                -> channel(KEYWORD_CHANNEL);
-LASTNONBLANK:                            'LASTNONBLANK'                            -> channel(KEYWORD_CHANNEL);
-LASTNONBLANKVALUE:                       'LASTNONBLANKVALUE'                       -> channel(KEYWORD_CHANNEL);
-LCM:                                     'LCM'                                     -> channel(KEYWORD_CHANNEL);
-LEFT:                                    'LEFT'                                    -> channel(KEYWORD_CHANNEL);
-LEN:                                     'LEN'                                     -> channel(KEYWORD_CHANNEL);
-LN:                                      'LN'                                      -> channel(KEYWORD_CHANNEL);
-LOG:                                     'LOG'                                     -> channel(KEYWORD_CHANNEL);
-LOG10:                                   'LOG10'                                   -> channel(KEYWORD_CHANNEL);
-LOOKUPVALUE:                             'LOOKUPVALUE'                             -> channel(KEYWORD_CHANNEL);
-LOWER:                                   'LOWER'                                   -> channel(KEYWORD_CHANNEL);
-MAX:                                     'MAX'                                     -> channel(KEYWORD_CHANNEL);
-MAXA:                                    'MAXA'                                    -> channel(KEYWORD_CHANNEL);
-MAXX:                                    'MAXX'                                    -> channel(KEYWORD_CHANNEL);
-MEDIAN:                                  'MEDIAN'                                  -> channel(KEYWORD_CHANNEL);
-MEDIANX:                                 'MEDIANX'                                 -> channel(KEYWORD_CHANNEL);
-MID:                                     'MID'                                     -> channel(KEYWORD_CHANNEL);
-MIN:                                     'MIN'                                     -> channel(KEYWORD_CHANNEL);
-MINA:                                    'MINA'                                    -> channel(KEYWORD_CHANNEL);
-MINUTE:                                  'MINUTE'                                  -> channel(KEYWORD_CHANNEL);
-MINX:                                    'MINX'                                    -> channel(KEYWORD_CHANNEL);
-MOD:                                     'MOD'                                     -> channel(KEYWORD_CHANNEL);
-MONTH:                                   'MONTH'                                   -> channel(KEYWORD_CHANNEL);
-MROUND:                                  'MROUND'                                  -> channel(KEYWORD_CHANNEL);
-NATURALINNERJOIN:                        'NATURALINNERJOIN'                        -> channel(KEYWORD_CHANNEL);
-NATURALLEFTOUTERJOIN:                    'NATURALLEFTOUTERJOIN'                    -> channel(KEYWORD_CHANNEL);
-NEXTDAY:                                 'NEXTDAY'                                 -> channel(KEYWORD_CHANNEL);
-NEXTMONTH:                               'NEXTMONTH'                               -> channel(KEYWORD_CHANNEL);
-NEXTQUARTER:                             'NEXTQUARTER'                             -> channel(KEYWORD_CHANNEL);
-NEXTYEAR:                                'NEXTYEAR'                                -> channel(KEYWORD_CHANNEL);
-NONVISUAL:                               'NONVISUAL'                               -> channel(KEYWORD_CHANNEL);
-NORMDIST:                                'NORM.DIST'                               -> channel(KEYWORD_CHANNEL);
-NORMINV:                                 'NORM.INV'                                -> channel(KEYWORD_CHANNEL);
-NORMSDIST:                               'NORM.S.DIST'                             -> channel(KEYWORD_CHANNEL);
-NORMSINV:                                'NORM.S.INV'                              -> channel(KEYWORD_CHANNEL);
-NOT:                                     'NOT'                                     -> channel(KEYWORD_CHANNEL);
-NOW:                                     'NOW'                                     -> channel(KEYWORD_CHANNEL);
-ODD:                                     'ODD'                                     -> channel(KEYWORD_CHANNEL);
-OPENINGBALANCEMONTH:                     'OPENINGBALANCEMONTH'                     -> channel(KEYWORD_CHANNEL);
-OPENINGBALANCEQUARTER:                   'OPENINGBALANCEQUARTER'                   -> channel(KEYWORD_CHANNEL);
-OPENINGBALANCEYEAR:                      'OPENINGBALANCEYEAR'                      -> channel(KEYWORD_CHANNEL);
-OR:                                      'OR'                                      -> channel(KEYWORD_CHANNEL);
-PARALLELPERIOD:                          'PARALLELPERIOD'                          -> channel(KEYWORD_CHANNEL);
-PATH:                                    'PATH'                                    -> channel(KEYWORD_CHANNEL);
-PATHCONTAINS:                            'PATHCONTAINS'                            -> channel(KEYWORD_CHANNEL);
-PATHITEM:                                'PATHITEM'                                -> channel(KEYWORD_CHANNEL);
-PATHITEMREVERSE:                         'PATHITEMREVERSE'                         -> channel(KEYWORD_CHANNEL);
-PATHLENGTH:                              'PATHLENGTH'                              -> channel(KEYWORD_CHANNEL);
-PERCENTILEEXC:                           'PERCENTILE.EXC'                          -> channel(KEYWORD_CHANNEL);
-PERCENTILEINC:                           'PERCENTILE.INC'                          -> channel(KEYWORD_CHANNEL);
-PERCENTILEXEXC:                          'PERCENTILEX.EXC'                         -> channel(KEYWORD_CHANNEL);
-PERCENTILEXINC:                          'PERCENTILEX.INC'                         -> channel(KEYWORD_CHANNEL);
-PERMUT:                                  'PERMUT'                                  -> channel(KEYWORD_CHANNEL);
-PI:                                      'PI'                                      -> channel(KEYWORD_CHANNEL);
-POISSONDIST:                             'POISSON.DIST'                            -> channel(KEYWORD_CHANNEL);
-POWER:                                   'POWER'                                   -> channel(KEYWORD_CHANNEL);
-PREVIOUSDAY:                             'PREVIOUSDAY'                             -> channel(KEYWORD_CHANNEL);
-PREVIOUSMONTH:                           'PREVIOUSMONTH'                           -> channel(KEYWORD_CHANNEL);
-PREVIOUSQUARTER:                         'PREVIOUSQUARTER'                         -> channel(KEYWORD_CHANNEL);
-PREVIOUSYEAR:                            'PREVIOUSYEAR'                            -> channel(KEYWORD_CHANNEL);
-PRODUCT:                                 'PRODUCT'                                 -> channel(KEYWORD_CHANNEL);
-PRODUCTX:                                'PRODUCTX'                                -> channel(KEYWORD_CHANNEL);
-QUARTER:								 'QUARTER'								   -> channel(KEYWORD_CHANNEL);
-QUOTIENT:                                'QUOTIENT'                                -> channel(KEYWORD_CHANNEL);
-RADIANS:                                 'RADIANS'                                 -> channel(KEYWORD_CHANNEL);
-RAND:                                    'RAND'                                    -> channel(KEYWORD_CHANNEL);
-RANDBETWEEN:                             'RANDBETWEEN'                             -> channel(KEYWORD_CHANNEL);
-RANKEQ:                                  'RANK.EQ'                                 -> channel(KEYWORD_CHANNEL);
-RANKX:                                   'RANKX'                                   -> channel(KEYWORD_CHANNEL);
-RELATED:                                 'RELATED'                                 -> channel(KEYWORD_CHANNEL);
-RELATEDTABLE:                            'RELATEDTABLE'                            -> channel(KEYWORD_CHANNEL);
-REMOVEFILTERS:							 'REMOVEFILTERS'						   -> channel(KEYWORD_CHANNEL);
-REPLACE:                                 'REPLACE'                                 -> channel(KEYWORD_CHANNEL);
-REPT:                                    'REPT'                                    -> channel(KEYWORD_CHANNEL);
-RIGHT:                                   'RIGHT'                                   -> channel(KEYWORD_CHANNEL);
-ROLLUP:                                  'ROLLUP'                                  -> channel(KEYWORD_CHANNEL);
-ROLLUPADDISSUBTOTAL:                     'ROLLUPADDISSUBTOTAL'                     -> channel(KEYWORD_CHANNEL);
-ROLLUPGROUP:                             'ROLLUPGROUP'                             -> channel(KEYWORD_CHANNEL);
-ROLLUPISSUBTOTAL:                        'ROLLUPISSUBTOTAL'                        -> channel(KEYWORD_CHANNEL);
-ROUND:                                   'ROUND'                                   -> channel(KEYWORD_CHANNEL);
-ROUNDDOWN:                               'ROUNDDOWN'                               -> channel(KEYWORD_CHANNEL);
-ROUNDUP:                                 'ROUNDUP'                                 -> channel(KEYWORD_CHANNEL);
-ROW:                                     'ROW'                                     -> channel(KEYWORD_CHANNEL);
-SAMEPERIODLASTYEAR:                      'SAMEPERIODLASTYEAR'                      -> channel(KEYWORD_CHANNEL);
-SAMPLE:                                  'SAMPLE'                                  -> channel(KEYWORD_CHANNEL);
-SEARCH:                                  'SEARCH'                                  -> channel(KEYWORD_CHANNEL);
-SECOND:                                  'SECOND'                                  -> channel(KEYWORD_CHANNEL);
-SELECTCOLUMNS:                           'SELECTCOLUMNS'                           -> channel(KEYWORD_CHANNEL);
-SELECTEDMEASURE:                         'SELECTEDMEASURE'                         -> channel(KEYWORD_CHANNEL);
-SELECTEDMEASUREFORMATSTRING:             'SELECTEDMEASUREFORMATSTRING'             -> channel(KEYWORD_CHANNEL);
-SELECTEDMEASURENAME:                     'SELECTEDMEASURENAME'                     -> channel(KEYWORD_CHANNEL);
-SELECTEDVALUE:                           'SELECTEDVALUE'                           -> channel(KEYWORD_CHANNEL);
-SIGN:                                    'SIGN'                                    -> channel(KEYWORD_CHANNEL);
-SIN:                                     'SIN'                                     -> channel(KEYWORD_CHANNEL);
-SINH:                                    'SINH'                                    -> channel(KEYWORD_CHANNEL);
-SQRT:                                    'SQRT'                                    -> channel(KEYWORD_CHANNEL);
-SQRTPI:                                  'SQRTPI'                                  -> channel(KEYWORD_CHANNEL);
-STARTOFMONTH:                            'STARTOFMONTH'                            -> channel(KEYWORD_CHANNEL);
-STARTOFQUARTER:                          'STARTOFQUARTER'                          -> channel(KEYWORD_CHANNEL);
-STARTOFYEAR:                             'STARTOFYEAR'                             -> channel(KEYWORD_CHANNEL);
-STDEVP:                                  'STDEV.P'                                 -> channel(KEYWORD_CHANNEL);
-STDEVS:                                  'STDEV.S'                                 -> channel(KEYWORD_CHANNEL);
-STDEVXP:                                 'STDEVX.P'                                -> channel(KEYWORD_CHANNEL);
-STDEVXS:                                 'STDEVX.S'                                -> channel(KEYWORD_CHANNEL);
-SUBSTITUTE:                              'SUBSTITUTE'                              -> channel(KEYWORD_CHANNEL);
-SUBSTITUTEWITHINDEX:                     'SUBSTITUTEWITHINDEX'                     -> channel(KEYWORD_CHANNEL);
-SUM:                                     'SUM'                                     -> channel(KEYWORD_CHANNEL);
-SUMMARIZE:                               'SUMMARIZE'                               -> channel(KEYWORD_CHANNEL);
-SUMMARIZECOLUMNS:                        'SUMMARIZECOLUMNS'                        -> channel(KEYWORD_CHANNEL);
-SUMX:                                    'SUMX'                                    -> channel(KEYWORD_CHANNEL);
-SWITCH:                                  'SWITCH'                                  -> channel(KEYWORD_CHANNEL);
-TDIST:                                   'T.DIST'                                  -> channel(KEYWORD_CHANNEL);
-TDIST2T:                                 'T.DIST.2T'                               -> channel(KEYWORD_CHANNEL);
-TDISTRT:                                 'T.DIST.RT'                               -> channel(KEYWORD_CHANNEL);
-TINV:                                    'T.INV'                                   -> channel(KEYWORD_CHANNEL);
-TINV2T:                                  'T.INV.2T'                                -> channel(KEYWORD_CHANNEL);
-TAN:                                     'TAN'                                     -> channel(KEYWORD_CHANNEL);
-TANH:                                    'TANH'                                    -> channel(KEYWORD_CHANNEL);
-TIME:                                    'TIME'                                    -> channel(KEYWORD_CHANNEL);
-TIMEVALUE:                               'TIMEVALUE'                               -> channel(KEYWORD_CHANNEL);
-TODAY:                                   'TODAY'                                   -> channel(KEYWORD_CHANNEL);
-TOPN:                                    'TOPN'                                    -> channel(KEYWORD_CHANNEL);
-TOPNPERLEVEL:                            'TOPNPERLEVEL'                            -> channel(KEYWORD_CHANNEL);
-TOPNSKIP:                                'TOPNSKIP'                                -> channel(KEYWORD_CHANNEL);
-TOTALMTD:                                'TOTALMTD'                                -> channel(KEYWORD_CHANNEL);
-TOTALQTD:                                'TOTALQTD'                                -> channel(KEYWORD_CHANNEL);
-TOTALYTD:                                'TOTALYTD'                                -> channel(KEYWORD_CHANNEL);
-TREATAS:                                 'TREATAS'                                 -> channel(KEYWORD_CHANNEL);
-TRIM:                                    'TRIM'                                    -> channel(KEYWORD_CHANNEL);
-TRUE:                                    'TRUE'                                    -> channel(KEYWORD_CHANNEL);
-TRUNC:                                   'TRUNC'                                   -> channel(KEYWORD_CHANNEL);
-UNICHAR:                                 'UNICHAR'                                 -> channel(KEYWORD_CHANNEL);
-UNICODE:                                 'UNICODE'                                 -> channel(KEYWORD_CHANNEL);
-UNION:                                   'UNION'                                   -> channel(KEYWORD_CHANNEL);
-UPPER:                                   'UPPER'                                   -> channel(KEYWORD_CHANNEL);
-USERELATIONSHIP:                         'USERELATIONSHIP'                         -> channel(KEYWORD_CHANNEL);
-USERNAME:                                'USERNAME'                                -> channel(KEYWORD_CHANNEL);
-USEROBJECTID:                            'USEROBJECTID'                            -> channel(KEYWORD_CHANNEL);
-USERPRINCIPALNAME:                       'USERPRINCIPALNAME'                       -> channel(KEYWORD_CHANNEL);
-UTCNOW:                                  'UTCNOW'                                  -> channel(KEYWORD_CHANNEL);
-UTCTODAY:                                'UTCTODAY'                                -> channel(KEYWORD_CHANNEL);
-VALUE:                                   'VALUE'                                   -> channel(KEYWORD_CHANNEL);
-VALUES:                                  'VALUES'                                  -> channel(KEYWORD_CHANNEL);
-VARP:                                    'VAR.P'                                   -> channel(KEYWORD_CHANNEL);
-VARS:                                    'VAR.S'                                   -> channel(KEYWORD_CHANNEL);
-VARXP:                                   'VARX.P'                                  -> channel(KEYWORD_CHANNEL);
-VARXS:                                   'VARX.S'                                  -> channel(KEYWORD_CHANNEL);
-WEEKDAY:                                 'WEEKDAY'                                 -> channel(KEYWORD_CHANNEL);
-YEARFRAC:                                'YEARFRAC'                                -> channel(KEYWORD_CHANNEL);
-WEEKNUM:                                 'WEEKNUM'                                 -> channel(KEYWORD_CHANNEL);
-XIRR:                                    'XIRR'                                    -> channel(KEYWORD_CHANNEL);
-XNPV:                                    'XNPV'                                    -> channel(KEYWORD_CHANNEL);
-YEAR:                                    'YEAR'                                    -> channel(KEYWORD_CHANNEL);
-
-// New financial DAX functions added June 2020:
-ACCRINT:                                  'ACCRINT'                                -> channel(KEYWORD_CHANNEL);
-ACCRINTM:                                 'ACCRINTM'                               -> channel(KEYWORD_CHANNEL);
-AMORDEGRC:                                'AMORDEGRC'                              -> channel(KEYWORD_CHANNEL);
-AMORLINC:                                 'AMORLINC'                               -> channel(KEYWORD_CHANNEL);
-COUPDAYBS:                                'COUPDAYBS'                              -> channel(KEYWORD_CHANNEL);
-COUPDAYS:                                 'COUPDAYS'                               -> channel(KEYWORD_CHANNEL);
-COUPDAYSNC:                               'COUPDAYSNC'                             -> channel(KEYWORD_CHANNEL);
-COUPNCD:                                  'COUPNCD'                                -> channel(KEYWORD_CHANNEL);
-COUPNUM:                                  'COUPNUM'                                -> channel(KEYWORD_CHANNEL);
-COUPPCD:                                  'COUPPCD'                                -> channel(KEYWORD_CHANNEL);
-CUMIPMT:                                  'CUMIPMT'                                -> channel(KEYWORD_CHANNEL);
-CUMPRINC:                                 'CUMPRINC'                               -> channel(KEYWORD_CHANNEL);
-DB:                                       'DB'                                     -> channel(KEYWORD_CHANNEL);
-DDB:                                      'DDB'                                    -> channel(KEYWORD_CHANNEL);
-DISC:                                     'DISC'                                   -> channel(KEYWORD_CHANNEL);
-DOLLARDE:                                 'DOLLARDE'                               -> channel(KEYWORD_CHANNEL);
-DOLLARFR:                                 'DOLLARFR'                               -> channel(KEYWORD_CHANNEL);
-DURATION:                                 'DURATION'                               -> channel(KEYWORD_CHANNEL);
-EFFECT:                                   'EFFECT'                                 -> channel(KEYWORD_CHANNEL);
-FV:                                       'FV'                                     -> channel(KEYWORD_CHANNEL);
-INTRATE:                                  'INTRATE'                                -> channel(KEYWORD_CHANNEL);
-IPMT:                                     'IPMT'                                   -> channel(KEYWORD_CHANNEL);
-ISPMT:                                    'ISPMT'                                  -> channel(KEYWORD_CHANNEL);
-MDURATION:                                'MDURATION'                              -> channel(KEYWORD_CHANNEL);
-NOMINAL:                                  'NOMINAL'                                -> channel(KEYWORD_CHANNEL);
-NPER:                                     'NPER'                                   -> channel(KEYWORD_CHANNEL);
-ODDFPRICE:                                'ODDFPRICE'                              -> channel(KEYWORD_CHANNEL);
-ODDFYIELD:                                'ODDFYIELD'                              -> channel(KEYWORD_CHANNEL);
-ODDLPRICE:                                'ODDLPRICE'                              -> channel(KEYWORD_CHANNEL);
-ODDLYIELD:                                'ODDLYIELD'                              -> channel(KEYWORD_CHANNEL);
-PDURATION:                                'PDURATION'                              -> channel(KEYWORD_CHANNEL);
-PMT:                                      'PMT'                                    -> channel(KEYWORD_CHANNEL);
-PPMT:                                     'PPMT'                                   -> channel(KEYWORD_CHANNEL);
-PRICE:                                    'PRICE'                                  -> channel(KEYWORD_CHANNEL);
-PRICEDISC:                                'PRICEDISC'                              -> channel(KEYWORD_CHANNEL);
-PRICEMAT:                                 'PRICEMAT'                               -> channel(KEYWORD_CHANNEL);
-PV:                                       'PV'                                     -> channel(KEYWORD_CHANNEL);
-RATE:                                     'RATE'                                   -> channel(KEYWORD_CHANNEL);
-RECEIVED:                                 'RECEIVED'                               -> channel(KEYWORD_CHANNEL);
-RRI:                                      'RRI'                                    -> channel(KEYWORD_CHANNEL);
-SLN:                                      'SLN'                                    -> channel(KEYWORD_CHANNEL);
-SYD:                                      'SYD'                                    -> channel(KEYWORD_CHANNEL);
-TBILLEQ:                                  'TBILLEQ'                                -> channel(KEYWORD_CHANNEL);
-TBILLPRICE:                               'TBILLPRICE'                             -> channel(KEYWORD_CHANNEL);
-TBILLYIELD:                               'TBILLYIELD'                             -> channel(KEYWORD_CHANNEL);
-VDB:                                      'VDB'                                    -> channel(KEYWORD_CHANNEL);
-YIELD:                                    'YIELD'                                  -> channel(KEYWORD_CHANNEL);
-YIELDDISC:                                'YIELDDISC'                              -> channel(KEYWORD_CHANNEL);
-YIELDMAT:                                 'YIELDMAT'                               -> channel(KEYWORD_CHANNEL);
-
-SAMPLEAXISWITHLOCALMINMAX:				  'SAMPLEAXISWITHLOCALMINMAX'			   -> channel(KEYWORD_CHANNEL);
-EVALUATEANDLOG:							  'EVALUATEANDLOG'						   -> channel(KEYWORD_CHANNEL);
-OFFSET:									  'OFFSET'								   -> channel(KEYWORD_CHANNEL);
-INDEX:									  'INDEX'								   -> channel(KEYWORD_CHANNEL);
-WINDOW:									  'WINDOW'								   -> channel(KEYWORD_CHANNEL);
-ORDERBY:								  'ORDERBY'								   -> channel(KEYWORD_CHANNEL);
-RANK:								      'RANK'								   -> channel(KEYWORD_CHANNEL);
-ROWNUMBER:								  'ROWNUMBER'							   -> channel(KEYWORD_CHANNEL);
-PARTITIONBY:							  'PARTITIONBY'							   -> channel(KEYWORD_CHANNEL);
-EXTERNALMEASURE:                          'EXTERNALMEASURE'                        -> channel(KEYWORD_CHANNEL);
-KMEANSCLUSTERING:                         'KMEANSCLUSTERING'                       -> channel(KEYWORD_CHANNEL);
-
-// Statements:
-DEFINE:                                  'DEFINE'                                  -> channel(KEYWORD_CHANNEL);
-EVALUATE:                                'EVALUATE'                                -> channel(KEYWORD_CHANNEL);
-ORDER:                                   'ORDER'                                   -> channel(KEYWORD_CHANNEL);
-BY:                                      'BY'                                      -> channel(KEYWORD_CHANNEL);
-START:                                   'START'                                   -> channel(KEYWORD_CHANNEL);
-AT:                                      'AT'                                      -> channel(KEYWORD_CHANNEL);
-RETURN:                                  'RETURN'                                  -> channel(KEYWORD_CHANNEL);
-VAR:                                     'VAR'                                     -> channel(KEYWORD_CHANNEL);
-IN:                                      'IN'                                      -> channel(KEYWORD_CHANNEL);
-ASC:                                     'ASC'                                     -> channel(KEYWORD_CHANNEL);
-DESC:                                    'DESC'                                    -> channel(KEYWORD_CHANNEL);
-SKIP_:                                   'SKIP'                                    -> channel(KEYWORD_CHANNEL);
-DENSE:                                   'DENSE'                                   -> channel(KEYWORD_CHANNEL);
-BLANKS:                                  'BLANKS'                                  -> channel(KEYWORD_CHANNEL);
-LAST:                                    'LAST'                                    -> channel(KEYWORD_CHANNEL);
-FIRST:                                   'FIRST'                                   -> channel(KEYWORD_CHANNEL);
-
-// DATEADD / DATEDIFF interval arguments (in addition to Day, Month, Quarter, Year, which are also functions):
-WEEK:                                    'WEEK'                                    -> channel(KEYWORD_CHANNEL);
-
-// CROSSFILTER direction arguments:
-BOTH:                                    'BOTH'                                    -> channel(KEYWORD_CHANNEL);
-NONE:                                    'NONE'                                    -> channel(KEYWORD_CHANNEL);
-ONEWAY:                                  'ONEWAY'                                  -> channel(KEYWORD_CHANNEL);
-ONEWAYRIGHTFILTERSLEFT:                  'ONEWAY_RIGHTFILTERSLEFT'                 -> channel(KEYWORD_CHANNEL);
-ONEWAYLEFTFILTERSRIGHT:                  'ONEWAY_LEFTFILTERSRIGHT'                 -> channel(KEYWORD_CHANNEL);
-
-// DATATABLE type arguments (in addition to Currency, which is also a function):
-INTEGER:                                 'INTEGER'                                 -> channel(KEYWORD_CHANNEL);
-DOUBLE:                                  'DOUBLE'                                  -> channel(KEYWORD_CHANNEL);
-STRING:                                  'STRING'                                  -> channel(KEYWORD_CHANNEL);
-BOOLEAN:                                 'BOOLEAN'                                 -> channel(KEYWORD_CHANNEL);
-DATETIME:                                'DATETIME'                                -> channel(KEYWORD_CHANNEL);
-VARIANT:                                 'VARIANT'                                 -> channel(KEYWORD_CHANNEL);
-
-TEXT:                                    'TEXT'                                    -> channel(KEYWORD_CHANNEL);
-ALPHABETICAL:                            'ALPHABETICAL'                            -> channel(KEYWORD_CHANNEL);
-KEEP:									 'KEEP'									   -> channel(KEYWORD_CHANNEL);
-REL:									 'REL'									   -> channel(KEYWORD_CHANNEL);
-
-EXPR:									 'EXPR'									   -> channel(KEYWORD_CHANNEL);
-VAL:									 'VAL'									   -> channel(KEYWORD_CHANNEL);
-
-ANYVAL:									 'ANYVAL'								   -> channel(KEYWORD_CHANNEL);
-ANYREF:									 'ANYREF'								   -> channel(KEYWORD_CHANNEL);
-SCALAR:									 'SCALAR'								   -> channel(KEYWORD_CHANNEL);
+// Keywords containing a dot cannot be lexed as identifiers, they keep their own case-insensitive rules
+BETADIST options { caseInsensitive = true; }:             'BETA.DIST'         -> channel(KEYWORD_CHANNEL);
+BETAINV options { caseInsensitive = true; }:              'BETA.INV'          -> channel(KEYWORD_CHANNEL);
+CHISQDIST options { caseInsensitive = true; }:            'CHISQ.DIST'        -> channel(KEYWORD_CHANNEL);
+CHISQDISTRT options { caseInsensitive = true; }:          'CHISQ.DIST.RT'     -> channel(KEYWORD_CHANNEL);
+CHISQINV options { caseInsensitive = true; }:             'CHISQ.INV'         -> channel(KEYWORD_CHANNEL);
+CHISQINVRT options { caseInsensitive = true; }:           'CHISQ.INV.RT'      -> channel(KEYWORD_CHANNEL);
+CONFIDENCENORM options { caseInsensitive = true; }:       'CONFIDENCE.NORM'   -> channel(KEYWORD_CHANNEL);
+CONFIDENCET options { caseInsensitive = true; }:          'CONFIDENCE.T'      -> channel(KEYWORD_CHANNEL);
+EXPONDIST options { caseInsensitive = true; }:            'EXPON.DIST'        -> channel(KEYWORD_CHANNEL);
+IFEAGER options { caseInsensitive = true; }:              'IF.EAGER'          -> channel(KEYWORD_CHANNEL);
+ISOCEILING options { caseInsensitive = true; }:           'ISO.CEILING'       -> channel(KEYWORD_CHANNEL);
+NORMDIST options { caseInsensitive = true; }:             'NORM.DIST'         -> channel(KEYWORD_CHANNEL);
+NORMINV options { caseInsensitive = true; }:              'NORM.INV'          -> channel(KEYWORD_CHANNEL);
+NORMSDIST options { caseInsensitive = true; }:            'NORM.S.DIST'       -> channel(KEYWORD_CHANNEL);
+NORMSINV options { caseInsensitive = true; }:             'NORM.S.INV'        -> channel(KEYWORD_CHANNEL);
+PERCENTILEEXC options { caseInsensitive = true; }:        'PERCENTILE.EXC'    -> channel(KEYWORD_CHANNEL);
+PERCENTILEINC options { caseInsensitive = true; }:        'PERCENTILE.INC'    -> channel(KEYWORD_CHANNEL);
+PERCENTILEXEXC options { caseInsensitive = true; }:       'PERCENTILEX.EXC'   -> channel(KEYWORD_CHANNEL);
+PERCENTILEXINC options { caseInsensitive = true; }:       'PERCENTILEX.INC'   -> channel(KEYWORD_CHANNEL);
+POISSONDIST options { caseInsensitive = true; }:          'POISSON.DIST'      -> channel(KEYWORD_CHANNEL);
+RANKEQ options { caseInsensitive = true; }:               'RANK.EQ'           -> channel(KEYWORD_CHANNEL);
+STDEVP options { caseInsensitive = true; }:               'STDEV.P'           -> channel(KEYWORD_CHANNEL);
+STDEVS options { caseInsensitive = true; }:               'STDEV.S'           -> channel(KEYWORD_CHANNEL);
+STDEVXP options { caseInsensitive = true; }:              'STDEVX.P'          -> channel(KEYWORD_CHANNEL);
+STDEVXS options { caseInsensitive = true; }:              'STDEVX.S'          -> channel(KEYWORD_CHANNEL);
+TDIST options { caseInsensitive = true; }:                'T.DIST'            -> channel(KEYWORD_CHANNEL);
+TDIST2T options { caseInsensitive = true; }:              'T.DIST.2T'         -> channel(KEYWORD_CHANNEL);
+TDISTRT options { caseInsensitive = true; }:              'T.DIST.RT'         -> channel(KEYWORD_CHANNEL);
+TINV options { caseInsensitive = true; }:                 'T.INV'             -> channel(KEYWORD_CHANNEL);
+TINV2T options { caseInsensitive = true; }:               'T.INV.2T'          -> channel(KEYWORD_CHANNEL);
+VARP options { caseInsensitive = true; }:                 'VAR.P'             -> channel(KEYWORD_CHANNEL);
+VARS options { caseInsensitive = true; }:                 'VAR.S'             -> channel(KEYWORD_CHANNEL);
+VARXP options { caseInsensitive = true; }:                'VARX.P'            -> channel(KEYWORD_CHANNEL);
+VARXS options { caseInsensitive = true; }:                'VARX.S'            -> channel(KEYWORD_CHANNEL);
 
-INT64:									 'INT64'								   -> channel(KEYWORD_CHANNEL);
-DECIMAL:							     'DECIMAL'								   -> channel(KEYWORD_CHANNEL);
-NUMERIC:							     'NUMERIC'								   -> channel(KEYWORD_CHANNEL);
 
 DATE_LITERAL:          'DT"' (~'"' | '""')* '"' {self.text = self.text[3:-1];};
 INTEGER_LITERAL:       [0-9]+;
@@ -423,7 +123,7 @@ REAL_LITERAL:          [0-9]* '.' [0-9]+;
 STRING_LITERAL:        '"' (~'"' | '""')* '"' {self.text = self.text[1:-1];};
 TABLE:                 '\'' (~["'\r\n\u0085\u2028\u2029] | '\'\'')* '\'' {self.text = self.text[1:-1].replace("''","'");};
 COLUMN_OR_MEASURE:     '[' (~["\]\r\n\u0085\u2028\u2029] | ']]')* ']'   {self.text = self.text[1:-1].replace("]]","]");};
-TABLE_OR_VARIABLE:     IdentifierOrKeyword;
+TABLE_OR_VARIABLE:     IdentifierOrKeyword {self.keyword_or_identifier()};
 
 OPEN_CURLY:			   '{';
 CLOSE_CURLY:		   '}';
@@ -8,535 +8,88 @@ else:
     from typing.io import TextIO
 
 
+from .DAXKeywords import keyword_types
+
+
 def serializedATN():
     return [
-        4,0,423,5392,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,
-        5,2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,
-        2,13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,
-        7,19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,
-        2,26,7,26,2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,
-        7,32,2,33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,
-        2,39,7,39,2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,
-        7,45,2,46,7,46,2,47,7,47,2,48,7,48,2,49,7,49,2,50,7,50,2,51,7,51,
-        2,52,7,52,2,53,7,53,2,54,7,54,2,55,7,55,2,56,7,56,2,57,7,57,2,58,
-        7,58,2,59,7,59,2,60,7,60,2,61,7,61,2,62,7,62,2,63,7,63,2,64,7,64,
-        2,65,7,65,2,66,7,66,2,67,7,67,2,68,7,68,2,69,7,69,2,70,7,70,2,71,
-        7,71,2,72,7,72,2,73,7,73,2,74,7,74,2,75,7,75,2,76,7,76,2,77,7,77,
-        2,78,7,78,2,79,7,79,2,80,7,80,2,81,7,81,2,82,7,82,2,83,7,83,2,84,
-        7,84,2,85,7,85,2,86,7,86,2,87,7,87,2,88,7,88,2,89,7,89,2,90,7,90,
-        2,91,7,91,2,92,7,92,2,93,7,93,2,94,7,94,2,95,7,95,2,96,7,96,2,97,
-        7,97,2,98,7,98,2,99,7,99,2,100,7,100,2,101,7,101,2,102,7,102,2,103,
-        7,103,2,104,7,104,2,105,7,105,2,106,7,106,2,107,7,107,2,108,7,108,
-        2,109,7,109,2,110,7,110,2,111,7,111,2,112,7,112,2,113,7,113,2,114,
-        7,114,2,115,7,115,2,116,7,116,2,117,7,117,2,118,7,118,2,119,7,119,
-        2,120,7,120,2,121,7,121,2,122,7,122,2,123,7,123,2,124,7,124,2,125,
-        7,125,2,126,7,126,2,127,7,127,2,128,7,128,2,129,7,129,2,130,7,130,
-        2,131,7,131,2,132,7,132,2,133,7,133,2,134,7,134,2,135,7,135,2,136,
-        7,136,2,137,7,137,2,138,7,138,2,139,7,139,2,140,7,140,2,141,7,141,
-        2,142,7,142,2,143,7,143,2,144,7,144,2,145,7,145,2,146,7,146,2,147,
-        7,147,2,148,7,148,2,149,7,149,2,150,7,150,2,151,7,151,2,152,7,152,
-        2,153,7,153,2,154,7,154,2,155,7,155,2,156,7,156,2,157,7,157,2,158,
-        7,158,2,159,7,159,2,160,7,160,2,161,7,161,2,162,7,162,2,163,7,163,
-        2,164,7,164,2,165,7,165,2,166,7,166,2,167,7,167,2,168,7,168,2,169,
-        7,169,2,170,7,170,2,171,7,171,2,172,7,172,2,173,7,173,2,174,7,174,
-        2,175,7,175,2,176,7,176,2,177,7,177,2,178,7,178,2,179,7,179,2,180,
-        7,180,2,181,7,181,2,182,7,182,2,183,7,183,2,184,7,184,2,185,7,185,
-        2,186,7,186,2,187,7,187,2,188,7,188,2,189,7,189,2,190,7,190,2,191,
-        7,191,2,192,7,192,2,193,7,193,2,194,7,194,2,195,7,195,2,196,7,196,
-        2,197,7,197,2,198,7,198,2,199,7,199,2,200,7,200,2,201,7,201,2,202,
-        7,202,2,203,7,203,2,204,7,204,2,205,7,205,2,206,7,206,2,207,7,207,
-        2,208,7,208,2,209,7,209,2,210,7,210,2,211,7,211,2,212,7,212,2,213,
-        7,213,2,214,7,214,2,215,7,215,2,216,7,216,2,217,7,217,2,218,7,218,
-        2,219,7,219,2,220,7,220,2,221,7,221,2,222,7,222,2,223,7,223,2,224,
-        7,224,2,225,7,225,2,226,7,226,2,227,7,227,2,228,7,228,2,229,7,229,
-        2,230,7,230,2,231,7,231,2,232,7,232,2,233,7,233,2,234,7,234,2,235,
-        7,235,2,236,7,236,2,237,7,237,2,238,7,238,2,239,7,239,2,240,7,240,
-        2,241,7,241,2,242,7,242,2,243,7,243,2,244,7,244,2,245,7,245,2,246,
-        7,246,2,247,7,247,2,248,7,248,2,249,7,249,2,250,7,250,2,251,7,251,
-        2,252,7,252,2,253,7,253,2,254,7,254,2,255,7,255,2,256,7,256,2,257,
-        7,257,2,258,7,258,2,259,7,259,2,260,7,260,2,261,7,261,2,262,7,262,
-        2,263,7,263,2,264,7,264,2,265,7,265,2,266,7,266,2,267,7,267,2,268,
-        7,268,2,269,7,269,2,270,7,270,2,271,7,271,2,272,7,272,2,273,7,273,
-        2,274,7,274,2,275,7,275,2,276,7,276,2,277,7,277,2,278,7,278,2,279,
-        7,279,2,280,7,280,2,281,7,281,2,282,7,282,2,283,7,283,2,284,7,284,
-        2,285,7,285,2,286,7,286,2,287,7,287,2,288,7,288,2,289,7,289,2,290,
-        7,290,2,291,7,291,2,292,7,292,2,293,7,293,2,294,7,294,2,295,7,295,
-        2,296,7,296,2,297,7,297,2,298,7,298,2,299,7,299,2,300,7,300,2,301,
-        7,301,2,302,7,302,2,303,7,303,2,304,7,304,2,305,7,305,2,306,7,306,
-        2,307,7,307,2,308,7,308,2,309,7,309,2,310,7,310,2,311,7,311,2,312,
-        7,312,2,313,7,313,2,314,7,314,2,315,7,315,2,316,7,316,2,317,7,317,
-        2,318,7,318,2,319,7,319,2,320,7,320,2,321,7,321,2,322,7,322,2,323,
-        7,323,2,324,7,324,2,325,7,325,2,326,7,326,2,327,7,327,2,328,7,328,
-        2,329,7,329,2,330,7,330,2,331,7,331,2,332,7,332,2,333,7,333,2,334,
-        7,334,2,335,7,335,2,336,7,336,2,337,7,337,2,338,7,338,2,339,7,339,
-        2,340,7,340,2,341,7,341,2,342,7,342,2,343,7,343,2,344,7,344,2,345,
-        7,345,2,346,7,346,2,347,7,347,2,348,7,348,2,349,7,349,2,350,7,350,
-        2,351,7,351,2,352,7,352,2,353,7,353,2,354,7,354,2,355,7,355,2,356,
-        7,356,2,357,7,357,2,358,7,358,2,359,7,359,2,360,7,360,2,361,7,361,
-        2,362,7,362,2,363,7,363,2,364,7,364,2,365,7,365,2,366,7,366,2,367,
-        7,367,2,368,7,368,2,369,7,369,2,370,7,370,2,371,7,371,2,372,7,372,
-        2,373,7,373,2,374,7,374,2,375,7,375,2,376,7,376,2,377,7,377,2,378,
-        7,378,2,379,7,379,2,380,7,380,2,381,7,381,2,382,7,382,2,383,7,383,
-        2,384,7,384,2,385,7,385,2,386,7,386,2,387,7,387,2,388,7,388,2,389,
-        7,389,2,390,7,390,2,391,7,391,2,392,7,392,2,393,7,393,2,394,7,394,
-        2,395,7,395,2,396,7,396,2,397,7,397,2,398,7,398,2,399,7,399,2,400,
-        7,400,2,401,7,401,2,402,7,402,2,403,7,403,2,404,7,404,2,405,7,405,
-        2,406,7,406,2,407,7,407,2,408,7,408,2,409,7,409,2,410,7,410,2,411,
-        7,411,2,412,7,412,2,413,7,413,2,414,7,414,2,415,7,415,2,416,7,416,
-        2,417,7,417,2,418,7,418,2,419,7,419,2,420,7,420,2,421,7,421,2,422,
-        7,422,2,423,7,423,2,424,7,424,2,425,7,425,2,426,7,426,2,427,7,427,
-        2,428,7,428,2,429,7,429,2,430,7,430,2,431,7,431,2,432,7,432,1,0,
-        1,0,1,0,1,0,3,0,872,8,0,1,0,5,0,875,8,0,10,0,12,0,878,9,0,1,0,1,
-        0,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,1,889,8,1,10,1,12,1,892,9,1,1,1,
-        1,1,1,1,3,1,897,8,1,1,1,1,1,1,2,1,2,4,2,903,8,2,11,2,12,2,904,1,
-        2,1,2,1,3,1,3,1,3,1,3,1,3,1,3,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,5,1,
-        5,1,5,1,5,1,5,1,5,1,5,1,5,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,7,1,7,1,
-        7,1,7,1,7,1,7,1,7,1,7,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,
-        8,1,8,1,8,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,
-        9,1,9,1,9,1,9,1,9,1,10,1,10,1,10,1,10,1,10,1,10,1,11,1,11,1,11,1,
-        11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,
-        11,1,11,1,11,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,
-        12,1,12,1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,
-        13,1,13,1,13,1,13,1,13,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,
-        14,1,14,1,14,1,14,1,14,1,14,1,15,1,15,1,15,1,15,1,15,1,15,1,16,1,
-        16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,
-        16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,
-        17,1,17,1,17,1,17,1,17,1,17,1,17,1,18,1,18,1,18,1,18,1,18,1,18,1,
-        18,1,18,1,19,1,19,1,19,1,19,1,19,1,19,1,19,1,20,1,20,1,20,1,20,1,
-        20,1,20,1,20,1,20,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,
-        21,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,23,1,
-        23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,24,1,24,1,24,1,
-        24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,25,1,25,1,25,1,25,1,
-        25,1,25,1,25,1,25,1,25,1,25,1,25,1,26,1,26,1,26,1,26,1,26,1,26,1,
-        26,1,26,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,
-        27,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,
-        28,1,28,1,28,1,28,1,28,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,
-        29,1,29,1,29,1,30,1,30,1,30,1,30,1,30,1,30,1,30,1,30,1,30,1,30,1,
-        30,1,30,1,30,1,30,1,30,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,
-        31,1,31,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,
-        32,1,32,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,
-        33,1,33,1,33,1,33,1,33,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,
-        34,1,34,1,34,1,34,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,
-        35,1,35,1,35,1,35,1,35,1,35,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,
-        36,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,
-        36,1,36,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,
-        37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,37,1,
-        38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,
-        38,1,38,1,38,1,38,1,38,1,38,1,38,1,38,1,39,1,39,1,39,1,39,1,39,1,
-        39,1,39,1,39,1,39,1,39,1,39,1,40,1,40,1,40,1,40,1,40,1,40,1,40,1,
-        40,1,40,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,42,1,
-        42,1,42,1,42,1,42,1,42,1,42,1,42,1,42,1,42,1,42,1,42,1,42,1,42,1,
-        42,1,42,1,43,1,43,1,43,1,43,1,43,1,43,1,43,1,43,1,43,1,43,1,43,1,
-        43,1,43,1,43,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,
-        44,1,44,1,44,1,44,1,44,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,
-        45,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,46,1,46,1,46,1,
-        46,1,46,1,46,1,46,1,46,1,46,1,46,1,46,1,46,1,46,1,46,1,46,1,47,1,
-        47,1,47,1,47,1,47,1,47,1,47,1,47,1,47,1,47,1,47,1,48,1,48,1,48,1,
-        48,1,48,1,48,1,48,1,48,1,48,1,48,1,48,1,48,1,48,1,48,1,49,1,49,1,
-        49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,
-        49,1,49,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,
-        50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,51,1,51,1,
-        51,1,51,1,51,1,51,1,51,1,51,1,51,1,51,1,52,1,52,1,52,1,52,1,52,1,
-        52,1,53,1,53,1,53,1,53,1,53,1,53,1,53,1,54,1,54,1,54,1,54,1,54,1,
-        54,1,55,1,55,1,55,1,55,1,55,1,55,1,55,1,56,1,56,1,56,1,56,1,56,1,
-        56,1,56,1,56,1,57,1,57,1,57,1,57,1,57,1,57,1,57,1,57,1,57,1,58,1,
-        58,1,58,1,58,1,58,1,58,1,58,1,58,1,58,1,58,1,59,1,59,1,59,1,59,1,
-        59,1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,59,1,60,1,60,1,60,1,60,1,
-        60,1,60,1,60,1,60,1,60,1,60,1,60,1,60,1,61,1,61,1,61,1,61,1,61,1,
-        61,1,61,1,61,1,61,1,62,1,62,1,62,1,62,1,62,1,62,1,62,1,62,1,62,1,
-        62,1,62,1,62,1,62,1,62,1,63,1,63,1,63,1,63,1,63,1,63,1,63,1,63,1,
-        63,1,63,1,63,1,63,1,64,1,64,1,64,1,64,1,64,1,64,1,64,1,64,1,64,1,
-        64,1,64,1,65,1,65,1,65,1,65,1,65,1,65,1,65,1,65,1,65,1,65,1,65,1,
-        65,1,65,1,65,1,65,1,66,1,66,1,66,1,66,1,66,1,66,1,66,1,66,1,66,1,
-        66,1,66,1,66,1,66,1,67,1,67,1,67,1,67,1,67,1,67,1,67,1,67,1,67,1,
-        67,1,67,1,67,1,68,1,68,1,68,1,68,1,68,1,68,1,68,1,69,1,69,1,69,1,
-        69,1,69,1,69,1,69,1,69,1,69,1,69,1,70,1,70,1,70,1,70,1,70,1,70,1,
-        70,1,70,1,70,1,70,1,70,1,71,1,71,1,71,1,71,1,71,1,71,1,71,1,71,1,
-        71,1,71,1,71,1,71,1,71,1,71,1,71,1,72,1,72,1,72,1,72,1,72,1,72,1,
-        72,1,72,1,72,1,72,1,72,1,72,1,72,1,72,1,72,1,72,1,73,1,73,1,73,1,
-        73,1,73,1,73,1,73,1,73,1,73,1,73,1,73,1,74,1,74,1,74,1,74,1,74,1,
-        74,1,74,1,74,1,74,1,74,1,74,1,75,1,75,1,75,1,75,1,75,1,75,1,75,1,
-        75,1,75,1,75,1,75,1,76,1,76,1,76,1,76,1,76,1,76,1,76,1,76,1,76,1,
-        76,1,76,1,76,1,77,1,77,1,77,1,77,1,77,1,77,1,78,1,78,1,78,1,78,1,
-        78,1,78,1,78,1,78,1,78,1,78,1,79,1,79,1,79,1,79,1,79,1,79,1,79,1,
-        79,1,79,1,79,1,79,1,79,1,79,1,80,1,80,1,80,1,80,1,80,1,80,1,80,1,
-        80,1,80,1,80,1,80,1,81,1,81,1,81,1,81,1,81,1,81,1,81,1,81,1,81,1,
-        81,1,81,1,81,1,81,1,81,1,81,1,81,1,82,1,82,1,82,1,82,1,82,1,82,1,
-        82,1,82,1,82,1,82,1,82,1,82,1,82,1,82,1,82,1,82,1,82,1,82,1,82,1,
-        82,1,82,1,82,1,82,1,83,1,83,1,83,1,83,1,83,1,83,1,83,1,83,1,83,1,
-        84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,84,1,85,1,85,1,85,1,
-        85,1,85,1,85,1,85,1,85,1,85,1,85,1,85,1,86,1,86,1,86,1,86,1,86,1,
-        86,1,86,1,86,1,87,1,87,1,87,1,87,1,87,1,87,1,87,1,87,1,87,1,87,1,
-        87,1,87,1,87,1,88,1,88,1,88,1,88,1,88,1,88,1,88,1,88,1,88,1,88,1,
-        88,1,88,1,88,1,88,1,88,1,89,1,89,1,89,1,89,1,89,1,89,1,89,1,89,1,
-        89,1,89,1,89,1,89,1,90,1,90,1,90,1,90,1,90,1,90,1,90,1,90,1,90,1,
-        90,1,91,1,91,1,91,1,91,1,91,1,91,1,91,1,91,1,92,1,92,1,92,1,92,1,
-        92,1,92,1,92,1,93,1,93,1,93,1,93,1,93,1,93,1,93,1,93,1,94,1,94,1,
-        94,1,94,1,94,1,94,1,94,1,94,1,94,1,95,1,95,1,95,1,95,1,95,1,95,1,
-        96,1,96,1,96,1,96,1,96,1,96,1,96,1,96,1,96,1,96,1,96,1,96,1,96,1,
-        97,1,97,1,97,1,97,1,97,1,97,1,97,1,98,1,98,1,98,1,98,1,98,1,98,1,
-        98,1,98,1,99,1,99,1,99,1,99,1,99,1,99,1,99,1,99,1,99,1,100,1,100,
-        1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,100,1,101,1,101,1,101,
-        1,101,1,101,1,101,1,101,1,102,1,102,1,102,1,102,1,102,1,102,1,102,
-        1,102,1,102,1,102,1,102,1,102,1,103,1,103,1,103,1,103,1,103,1,103,
-        1,103,1,103,1,103,1,103,1,103,1,103,1,103,1,103,1,103,1,103,1,104,
-        1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,
-        1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,104,1,105,1,105,
-        1,105,1,105,1,105,1,105,1,105,1,105,1,106,1,106,1,106,1,106,1,106,
-        1,106,1,106,1,106,1,107,1,107,1,107,1,107,1,107,1,107,1,107,1,107,
-        1,107,1,108,1,108,1,108,1,108,1,108,1,108,1,109,1,109,1,109,1,109,
-        1,109,1,109,1,109,1,109,1,109,1,109,1,109,1,110,1,110,1,110,1,110,
-        1,110,1,110,1,110,1,110,1,110,1,110,1,110,1,110,1,110,1,110,1,111,
-        1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,1,111,
-        1,111,1,111,1,111,1,111,1,111,1,112,1,112,1,112,1,112,1,112,1,112,
-        1,112,1,112,1,112,1,112,1,113,1,113,1,113,1,113,1,113,1,113,1,113,
-        1,113,1,113,1,113,1,113,1,114,1,114,1,114,1,114,1,114,1,114,1,114,
-        1,114,1,114,1,114,1,115,1,115,1,115,1,115,1,115,1,115,1,115,1,115,
-        1,115,1,115,1,115,1,115,1,115,1,115,1,115,1,116,1,116,1,116,1,116,
-        1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,116,1,117,
-        1,117,1,117,1,117,1,117,1,117,1,117,1,118,1,118,1,118,1,118,1,118,
-        1,119,1,119,1,119,1,119,1,119,1,119,1,119,1,119,1,119,1,119,1,119,
-        1,120,1,120,1,120,1,120,1,120,1,120,1,120,1,120,1,120,1,120,1,121,
-        1,121,1,121,1,121,1,121,1,121,1,121,1,121,1,121,1,122,1,122,1,122,
-        1,122,1,122,1,122,1,123,1,123,1,123,1,123,1,123,1,123,1,123,1,123,
-        1,123,1,123,1,123,1,123,1,124,1,124,1,124,1,124,1,124,1,124,1,124,
-        1,124,1,124,1,124,1,125,1,125,1,125,1,125,1,125,1,125,1,125,1,125,
-        1,125,1,125,1,125,1,125,1,125,1,125,1,125,1,125,1,125,1,125,1,126,
-        1,126,1,126,1,126,1,126,1,126,1,126,1,126,1,126,1,126,1,127,1,127,
-        1,127,1,127,1,127,1,127,1,127,1,127,1,127,1,127,1,128,1,128,1,128,
-        1,128,1,128,1,128,1,128,1,128,1,128,1,129,1,129,1,129,1,129,1,129,
-        1,129,1,129,1,129,1,129,1,129,1,129,1,129,1,129,1,130,1,130,1,130,
-        1,130,1,130,1,130,1,130,1,130,1,130,1,130,1,130,1,130,1,131,1,131,
-        1,131,1,131,1,131,1,131,1,131,1,131,1,131,1,131,1,131,1,131,1,132,
-        1,132,1,132,1,132,1,132,1,132,1,132,1,132,1,132,1,132,1,132,1,132,
-        1,133,1,133,1,133,1,133,1,133,1,133,1,133,1,133,1,133,1,133,1,133,
-        1,134,1,134,1,134,1,134,1,134,1,134,1,134,1,134,1,134,1,134,1,134,
-        1,134,1,134,1,134,1,135,1,135,1,135,1,135,1,135,1,135,1,135,1,135,
-        1,136,1,136,1,136,1,136,1,136,1,136,1,136,1,136,1,136,1,136,1,136,
-        1,136,1,136,1,136,1,137,1,137,1,137,1,137,1,137,1,137,1,137,1,137,
-        1,137,1,137,1,137,1,137,1,137,1,137,1,137,1,137,1,137,1,137,1,137,
-        1,137,1,138,1,138,1,138,1,138,1,138,1,138,1,138,1,138,1,138,1,138,
-        1,138,1,138,1,138,1,139,1,139,1,139,1,139,1,139,1,139,1,139,1,139,
-        1,139,1,140,1,140,1,140,1,140,1,140,1,140,1,140,1,140,1,140,1,140,
-        1,140,1,140,1,140,1,140,1,141,1,141,1,141,1,141,1,141,1,141,1,141,
-        1,141,1,141,1,141,1,141,1,141,1,141,1,141,1,141,1,142,1,142,1,142,
-        1,142,1,142,1,142,1,142,1,142,1,142,1,142,1,142,1,143,1,143,1,143,
-        1,143,1,143,1,143,1,143,1,143,1,143,1,143,1,143,1,143,1,143,1,143,
-        1,143,1,144,1,144,1,144,1,144,1,144,1,144,1,144,1,144,1,144,1,144,
-        1,144,1,144,1,144,1,144,1,144,1,144,1,144,1,144,1,144,1,144,1,145,
-        1,145,1,145,1,145,1,145,1,145,1,146,1,146,1,146,1,146,1,146,1,146,
-        1,146,1,147,1,147,1,147,1,147,1,147,1,147,1,148,1,148,1,148,1,148,
-        1,148,1,149,1,149,1,149,1,149,1,149,1,149,1,150,1,150,1,150,1,150,
-        1,150,1,150,1,150,1,150,1,151,1,151,1,151,1,151,1,151,1,151,1,151,
-        1,151,1,151,1,151,1,151,1,151,1,151,1,151,1,152,1,152,1,152,1,152,
-        1,152,1,152,1,152,1,152,1,153,1,153,1,153,1,153,1,153,1,153,1,154,
-        1,154,1,154,1,154,1,154,1,154,1,154,1,155,1,155,1,155,1,155,1,155,
-        1,155,1,155,1,156,1,156,1,156,1,156,1,156,1,156,1,156,1,156,1,156,
-        1,157,1,157,1,157,1,157,1,157,1,157,1,157,1,157,1,157,1,157,1,158,
-        1,158,1,158,1,158,1,158,1,158,1,159,1,159,1,159,1,159,1,159,1,159,
-        1,160,1,160,1,160,1,160,1,160,1,160,1,160,1,161,1,161,1,161,1,161,
-        1,161,1,161,1,161,1,161,1,161,1,162,1,162,1,162,1,162,1,162,1,162,
-        1,162,1,163,1,163,1,163,1,163,1,163,1,163,1,164,1,164,1,164,1,164,
-        1,164,1,164,1,164,1,164,1,165,1,165,1,165,1,165,1,165,1,165,1,165,
-        1,165,1,165,1,166,1,166,1,166,1,166,1,166,1,166,1,166,1,166,1,166,
-        1,166,1,166,1,166,1,166,1,166,1,166,1,166,1,166,1,166,1,166,1,167,
-        1,167,1,167,1,167,1,167,1,167,1,167,1,167,1,167,1,167,1,167,1,167,
-        1,167,1,167,1,167,1,167,1,167,1,167,1,167,1,167,1,167,1,167,1,167,
-        1,168,1,168,1,168,1,168,1,168,1,168,1,168,1,168,1,168,1,168,1,169,
-        1,169,1,169,1,169,1,169,1,169,1,169,1,169,1,169,1,169,1,169,1,169,
-        1,170,1,170,1,170,1,170,1,170,1,170,1,170,1,170,1,170,1,170,1,170,
-        1,170,1,170,1,170,1,171,1,171,1,171,1,171,1,171,1,171,1,171,1,171,
-        1,171,1,171,1,171,1,172,1,172,1,172,1,172,1,172,1,172,1,172,1,172,
-        1,172,1,172,1,172,1,172,1,173,1,173,1,173,1,173,1,173,1,173,1,173,
-        1,173,1,173,1,173,1,173,1,173,1,174,1,174,1,174,1,174,1,174,1,174,
-        1,174,1,174,1,174,1,174,1,174,1,175,1,175,1,175,1,175,1,175,1,175,
-        1,175,1,175,1,175,1,175,1,175,1,175,1,175,1,175,1,176,1,176,1,176,
-        1,176,1,176,1,176,1,176,1,176,1,176,1,176,1,176,1,176,1,176,1,177,
-        1,177,1,177,1,177,1,177,1,177,1,178,1,178,1,178,1,178,1,178,1,178,
-        1,179,1,179,1,179,1,179,1,179,1,179,1,180,1,180,1,180,1,180,1,180,
-        1,180,1,180,1,180,1,180,1,180,1,180,1,180,1,180,1,180,1,180,1,180,
-        1,180,1,180,1,180,1,180,1,180,1,180,1,181,1,181,1,181,1,181,1,181,
-        1,181,1,181,1,181,1,181,1,181,1,181,1,181,1,181,1,181,1,181,1,181,
-        1,181,1,181,1,181,1,181,1,181,1,181,1,181,1,181,1,182,1,182,1,182,
-        1,182,1,182,1,182,1,182,1,182,1,182,1,182,1,182,1,182,1,182,1,182,
-        1,182,1,182,1,182,1,182,1,182,1,182,1,182,1,183,1,183,1,183,1,183,
-        1,183,1,184,1,184,1,184,1,184,1,184,1,184,1,184,1,184,1,184,1,184,
-        1,184,1,184,1,184,1,184,1,184,1,184,1,184,1,185,1,185,1,185,1,185,
-        1,185,1,185,1,185,1,186,1,186,1,186,1,186,1,186,1,186,1,186,1,186,
-        1,186,1,186,1,186,1,186,1,186,1,186,1,186,1,187,1,187,1,187,1,187,
-        1,187,1,187,1,187,1,187,1,187,1,187,1,187,1,188,1,188,1,188,1,188,
-        1,188,1,188,1,188,1,188,1,188,1,188,1,188,1,188,1,188,1,188,1,188,
-        1,188,1,188,1,188,1,189,1,189,1,189,1,189,1,189,1,189,1,189,1,189,
-        1,189,1,189,1,189,1,189,1,189,1,190,1,190,1,190,1,190,1,190,1,190,
-        1,190,1,190,1,190,1,190,1,190,1,190,1,190,1,190,1,190,1,190,1,190,
-        1,191,1,191,1,191,1,191,1,191,1,191,1,191,1,191,1,191,1,191,1,191,
-        1,191,1,191,1,191,1,191,1,191,1,191,1,192,1,192,1,192,1,192,1,192,
-        1,192,1,192,1,192,1,192,1,192,1,192,1,192,1,192,1,192,1,192,1,192,
-        1,192,1,192,1,193,1,193,1,193,1,193,1,193,1,193,1,193,1,193,1,193,
-        1,193,1,193,1,193,1,193,1,193,1,193,1,193,1,193,1,193,1,194,1,194,
-        1,194,1,194,1,194,1,194,1,194,1,194,1,194,1,195,1,195,1,195,1,195,
-        1,195,1,196,1,196,1,196,1,196,1,196,1,196,1,196,1,196,1,196,1,196,
-        1,196,1,196,1,196,1,196,1,196,1,197,1,197,1,197,1,197,1,197,1,197,
-        1,197,1,197,1,198,1,198,1,198,1,198,1,198,1,198,1,198,1,198,1,198,
-        1,198,1,198,1,198,1,198,1,198,1,199,1,199,1,199,1,199,1,199,1,199,
-        1,199,1,199,1,199,1,199,1,199,1,199,1,199,1,199,1,199,1,199,1,200,
-        1,200,1,200,1,200,1,200,1,200,1,200,1,200,1,200,1,200,1,200,1,200,
-        1,200,1,200,1,200,1,200,1,200,1,200,1,201,1,201,1,201,1,201,1,201,
-        1,201,1,201,1,201,1,201,1,201,1,201,1,201,1,201,1,201,1,201,1,202,
-        1,202,1,202,1,202,1,202,1,202,1,202,1,202,1,202,1,202,1,203,1,203,
-        1,203,1,203,1,203,1,203,1,203,1,203,1,203,1,203,1,203,1,204,1,204,
-        1,204,1,204,1,204,1,204,1,204,1,204,1,204,1,204,1,205,1,205,1,205,
-        1,205,1,205,1,205,1,205,1,205,1,205,1,205,1,205,1,206,1,206,1,206,
-        1,206,1,206,1,206,1,206,1,206,1,206,1,206,1,207,1,207,1,207,1,207,
-        1,207,1,207,1,207,1,208,1,208,1,208,1,208,1,208,1,208,1,208,1,208,
-        1,208,1,208,1,208,1,208,1,208,1,208,1,209,1,209,1,209,1,209,1,209,
-        1,209,1,209,1,209,1,209,1,209,1,210,1,210,1,210,1,210,1,210,1,210,
-        1,210,1,210,1,211,1,211,1,211,1,211,1,211,1,211,1,211,1,211,1,211,
-        1,211,1,212,1,212,1,212,1,212,1,212,1,212,1,212,1,212,1,212,1,212,
-        1,212,1,212,1,212,1,212,1,212,1,213,1,213,1,213,1,213,1,213,1,213,
-        1,213,1,213,1,213,1,213,1,213,1,213,1,213,1,213,1,213,1,213,1,214,
-        1,214,1,214,1,214,1,214,1,214,1,214,1,214,1,214,1,214,1,215,1,215,
-        1,215,1,215,1,215,1,215,1,215,1,216,1,216,1,216,1,216,1,216,1,216,
-        1,216,1,216,1,217,1,217,1,217,1,217,1,217,1,217,1,217,1,217,1,217,
-        1,218,1,218,1,218,1,218,1,218,1,218,1,218,1,218,1,218,1,218,1,218,
-        1,218,1,218,1,218,1,218,1,218,1,218,1,218,1,218,1,218,1,218,1,218,
-        1,219,1,219,1,219,1,219,1,219,1,219,1,219,1,219,1,219,1,219,1,219,
-        1,219,1,219,1,219,1,220,1,220,1,220,1,220,1,220,1,220,1,220,1,220,
-        1,220,1,220,1,220,1,220,1,220,1,220,1,220,1,220,1,220,1,220,1,220,
-        1,221,1,221,1,221,1,221,1,221,1,221,1,221,1,221,1,222,1,222,1,222,
-        1,222,1,222,1,222,1,222,1,222,1,222,1,222,1,222,1,222,1,223,1,223,
-        1,223,1,223,1,223,1,223,1,223,1,223,1,223,1,223,1,224,1,224,1,224,
-        1,224,1,224,1,224,1,225,1,225,1,225,1,225,1,225,1,225,1,225,1,225,
-        1,225,1,225,1,225,1,225,1,225,1,225,1,225,1,225,1,225,1,225,1,225,
-        1,225,1,225,1,226,1,226,1,226,1,226,1,226,1,226,1,226,1,226,1,226,
-        1,227,1,227,1,227,1,227,1,227,1,227,1,227,1,227,1,227,1,228,1,228,
-        1,228,1,228,1,228,1,228,1,228,1,228,1,228,1,229,1,229,1,229,1,229,
-        1,229,1,229,1,229,1,229,1,229,1,229,1,229,1,229,1,229,1,229,1,229,
-        1,229,1,230,1,230,1,230,1,230,1,230,1,230,1,230,1,230,1,230,1,230,
-        1,230,1,230,1,230,1,230,1,230,1,230,1,230,1,230,1,231,1,231,1,231,
-        1,231,1,231,1,231,1,231,1,231,1,231,1,231,1,231,1,231,1,231,1,231,
-        1,231,1,231,1,231,1,231,1,231,1,231,1,231,1,231,1,231,1,231,1,231,
-        1,231,1,231,1,231,1,231,1,231,1,232,1,232,1,232,1,232,1,232,1,232,
-        1,232,1,232,1,232,1,232,1,232,1,232,1,232,1,232,1,232,1,232,1,232,
-        1,232,1,232,1,232,1,232,1,232,1,233,1,233,1,233,1,233,1,233,1,233,
-        1,233,1,233,1,233,1,233,1,233,1,233,1,233,1,233,1,233,1,233,1,234,
-        1,234,1,234,1,234,1,234,1,234,1,234,1,235,1,235,1,235,1,235,1,235,
-        1,235,1,236,1,236,1,236,1,236,1,236,1,236,1,236,1,237,1,237,1,237,
-        1,237,1,237,1,237,1,237,1,238,1,238,1,238,1,238,1,238,1,238,1,238,
-        1,238,1,238,1,239,1,239,1,239,1,239,1,239,1,239,1,239,1,239,1,239,
-        1,239,1,239,1,239,1,239,1,239,1,239,1,240,1,240,1,240,1,240,1,240,
-        1,240,1,240,1,240,1,240,1,240,1,240,1,240,1,240,1,240,1,240,1,240,
-        1,240,1,241,1,241,1,241,1,241,1,241,1,241,1,241,1,241,1,241,1,241,
-        1,241,1,241,1,241,1,241,1,242,1,242,1,242,1,242,1,242,1,242,1,242,
-        1,242,1,242,1,242,1,243,1,243,1,243,1,243,1,243,1,243,1,243,1,243,
-        1,243,1,243,1,244,1,244,1,244,1,244,1,244,1,244,1,244,1,244,1,244,
-        1,244,1,244,1,245,1,245,1,245,1,245,1,245,1,245,1,245,1,245,1,245,
-        1,245,1,245,1,246,1,246,1,246,1,246,1,246,1,246,1,246,1,246,1,246,
-        1,246,1,246,1,246,1,246,1,247,1,247,1,247,1,247,1,247,1,247,1,247,
-        1,247,1,247,1,247,1,247,1,247,1,247,1,247,1,247,1,247,1,247,1,247,
-        1,247,1,247,1,247,1,247,1,248,1,248,1,248,1,248,1,248,1,248,1,249,
-        1,249,1,249,1,249,1,249,1,249,1,249,1,249,1,249,1,249,1,249,1,249,
-        1,250,1,250,1,250,1,250,1,250,1,250,1,250,1,250,1,250,1,250,1,250,
-        1,250,1,250,1,250,1,250,1,250,1,250,1,250,1,250,1,251,1,251,1,251,
-        1,251,1,251,1,251,1,251,1,252,1,252,1,252,1,252,1,252,1,252,1,252,
-        1,252,1,252,1,253,1,253,1,253,1,253,1,253,1,253,1,253,1,253,1,253,
-        1,254,1,254,1,254,1,254,1,254,1,254,1,254,1,254,1,254,1,254,1,254,
-        1,254,1,255,1,255,1,255,1,255,1,255,1,255,1,255,1,255,1,255,1,255,
-        1,255,1,255,1,256,1,256,1,256,1,256,1,256,1,256,1,256,1,256,1,257,
-        1,257,1,257,1,257,1,257,1,257,1,257,1,257,1,257,1,257,1,257,1,258,
-        1,258,1,258,1,258,1,258,1,258,1,259,1,259,1,259,1,259,1,259,1,259,
-        1,259,1,260,1,260,1,260,1,260,1,260,1,260,1,260,1,261,1,261,1,261,
-        1,261,1,261,1,261,1,261,1,261,1,261,1,261,1,261,1,261,1,262,1,262,
-        1,262,1,262,1,262,1,262,1,262,1,262,1,263,1,263,1,263,1,263,1,263,
-        1,263,1,263,1,264,1,264,1,264,1,264,1,264,1,264,1,264,1,264,1,264,
-        1,264,1,264,1,264,1,264,1,264,1,264,1,265,1,265,1,265,1,265,1,265,
-        1,265,1,265,1,265,1,265,1,265,1,265,1,266,1,266,1,266,1,266,1,266,
-        1,266,1,266,1,266,1,266,1,266,1,266,1,267,1,267,1,267,1,267,1,267,
-        1,267,1,267,1,267,1,267,1,267,1,267,1,268,1,268,1,268,1,268,1,268,
-        1,268,1,268,1,268,1,268,1,268,1,268,1,269,1,269,1,269,1,269,1,269,
-        1,269,1,269,1,269,1,269,1,269,1,270,1,270,1,270,1,270,1,270,1,270,
-        1,270,1,271,1,271,1,271,1,271,1,271,1,271,1,271,1,272,1,272,1,272,
-        1,272,1,272,1,272,1,272,1,272,1,273,1,273,1,273,1,273,1,273,1,273,
-        1,273,1,273,1,273,1,273,1,274,1,274,1,274,1,274,1,274,1,274,1,274,
-        1,274,1,274,1,274,1,275,1,275,1,275,1,275,1,275,1,275,1,275,1,275,
-        1,276,1,276,1,276,1,276,1,276,1,276,1,276,1,276,1,277,1,277,1,277,
-        1,277,1,277,1,277,1,277,1,277,1,277,1,277,1,277,1,277,1,277,1,277,
-        1,277,1,277,1,277,1,277,1,278,1,278,1,278,1,278,1,278,1,278,1,278,
-        1,278,1,278,1,278,1,278,1,279,1,279,1,279,1,279,1,279,1,279,1,279,
-        1,279,1,279,1,279,1,279,1,279,1,279,1,279,1,279,1,280,1,280,1,280,
-        1,280,1,280,1,280,1,280,1,280,1,280,1,280,1,280,1,280,1,280,1,280,
-        1,280,1,280,1,280,1,280,1,280,1,280,1,281,1,281,1,281,1,281,1,281,
-        1,281,1,281,1,281,1,281,1,282,1,282,1,282,1,282,1,282,1,282,1,282,
-        1,282,1,282,1,282,1,282,1,283,1,283,1,283,1,283,1,283,1,283,1,283,
-        1,283,1,284,1,284,1,284,1,284,1,284,1,284,1,284,1,284,1,284,1,285,
-        1,285,1,285,1,285,1,285,1,285,1,285,1,285,1,286,1,286,1,286,1,286,
-        1,286,1,286,1,286,1,286,1,287,1,287,1,287,1,287,1,287,1,287,1,287,
-        1,287,1,287,1,288,1,288,1,288,1,288,1,288,1,288,1,288,1,288,1,288,
-        1,289,1,289,1,289,1,289,1,289,1,289,1,289,1,289,1,289,1,289,1,290,
-        1,290,1,290,1,290,1,290,1,290,1,290,1,290,1,290,1,290,1,290,1,291,
-        1,291,1,291,1,291,1,291,1,291,1,291,1,291,1,291,1,291,1,292,1,292,
-        1,292,1,292,1,292,1,292,1,292,1,293,1,293,1,293,1,293,1,293,1,293,
-        1,293,1,294,1,294,1,294,1,294,1,294,1,294,1,294,1,295,1,295,1,295,
-        1,295,1,295,1,295,1,295,1,295,1,295,1,295,1,296,1,296,1,296,1,296,
-        1,296,1,296,1,296,1,296,1,296,1,296,1,296,1,297,1,297,1,297,1,297,
-        1,297,1,297,1,297,1,297,1,297,1,297,1,297,1,297,1,298,1,298,1,298,
-        1,298,1,298,1,298,1,298,1,298,1,298,1,298,1,298,1,299,1,299,1,299,
-        1,299,1,299,1,299,1,299,1,299,1,299,1,299,1,299,1,299,1,300,1,300,
-        1,300,1,300,1,300,1,300,1,300,1,300,1,300,1,300,1,300,1,301,1,301,
-        1,301,1,301,1,301,1,301,1,301,1,301,1,301,1,301,1,301,1,301,1,301,
-        1,302,1,302,1,302,1,302,1,302,1,302,1,302,1,302,1,302,1,302,1,303,
-        1,303,1,303,1,303,1,303,1,303,1,303,1,303,1,303,1,303,1,304,1,304,
-        1,304,1,304,1,304,1,304,1,304,1,304,1,304,1,304,1,305,1,305,1,305,
-        1,305,1,305,1,305,1,305,1,305,1,305,1,305,1,306,1,306,1,306,1,306,
-        1,306,1,306,1,306,1,306,1,306,1,306,1,306,1,307,1,307,1,307,1,307,
-        1,307,1,308,1,308,1,308,1,308,1,308,1,308,1,309,1,309,1,309,1,309,
-        1,309,1,309,1,309,1,310,1,310,1,310,1,310,1,310,1,310,1,310,1,310,
-        1,310,1,310,1,310,1,311,1,311,1,311,1,311,1,311,1,311,1,311,1,311,
-        1,311,1,311,1,311,1,312,1,312,1,312,1,312,1,312,1,312,1,312,1,312,
-        1,312,1,312,1,312,1,313,1,313,1,313,1,313,1,313,1,313,1,313,1,313,
-        1,313,1,314,1,314,1,314,1,314,1,314,1,315,1,315,1,315,1,315,1,315,
-        1,315,1,315,1,315,1,315,1,315,1,316,1,316,1,316,1,316,1,316,1,316,
-        1,316,1,317,1,317,1,317,1,317,1,317,1,317,1,317,1,317,1,318,1,318,
-        1,318,1,318,1,318,1,318,1,318,1,318,1,318,1,318,1,318,1,318,1,319,
-        1,319,1,319,1,319,1,319,1,319,1,319,1,319,1,319,1,319,1,320,1,320,
-        1,320,1,320,1,320,1,320,1,320,1,321,1,321,1,321,1,321,1,321,1,321,
-        1,321,1,321,1,321,1,321,1,321,1,321,1,322,1,322,1,322,1,322,1,322,
-        1,322,1,322,1,322,1,322,1,322,1,322,1,322,1,323,1,323,1,323,1,323,
-        1,323,1,323,1,323,1,323,1,323,1,323,1,323,1,323,1,324,1,324,1,324,
-        1,324,1,324,1,324,1,324,1,324,1,324,1,324,1,324,1,324,1,325,1,325,
-        1,325,1,325,1,325,1,325,1,325,1,325,1,325,1,325,1,325,1,325,1,326,
-        1,326,1,326,1,326,1,326,1,326,1,327,1,327,1,327,1,327,1,327,1,327,
-        1,327,1,328,1,328,1,328,1,328,1,328,1,328,1,328,1,328,1,329,1,329,
-        1,329,1,329,1,329,1,329,1,329,1,329,1,329,1,329,1,329,1,329,1,330,
-        1,330,1,330,1,330,1,330,1,330,1,330,1,330,1,330,1,330,1,330,1,331,
-        1,331,1,331,1,331,1,331,1,332,1,332,1,332,1,332,1,332,1,332,1,332,
-        1,333,1,333,1,333,1,333,1,333,1,333,1,333,1,333,1,333,1,333,1,333,
-        1,334,1,334,1,334,1,334,1,334,1,334,1,335,1,335,1,335,1,335,1,335,
-        1,335,1,336,1,336,1,336,1,336,1,336,1,336,1,337,1,337,1,337,1,337,
-        1,337,1,337,1,337,1,337,1,337,1,337,1,338,1,338,1,338,1,338,1,338,
-        1,338,1,338,1,338,1,338,1,338,1,338,1,338,1,338,1,339,1,339,1,339,
-        1,339,1,339,1,339,1,339,1,339,1,339,1,339,1,339,1,339,1,339,1,340,
-        1,340,1,340,1,340,1,340,1,340,1,341,1,341,1,341,1,341,1,341,1,341,
-        1,341,1,341,1,342,1,342,1,342,1,342,1,342,1,342,1,342,1,342,1,342,
-        1,342,1,342,1,342,1,343,1,343,1,343,1,343,1,343,1,343,1,343,1,343,
-        1,343,1,343,1,343,1,344,1,344,1,344,1,344,1,344,1,344,1,344,1,344,
-        1,344,1,344,1,344,1,344,1,344,1,344,1,344,1,344,1,344,1,344,1,344,
-        1,344,1,344,1,344,1,344,1,344,1,344,1,344,1,344,1,344,1,345,1,345,
-        1,345,1,345,1,345,1,345,1,345,1,345,1,345,1,345,1,345,1,345,1,345,
-        1,345,1,345,1,345,1,345,1,346,1,346,1,346,1,346,1,346,1,346,1,346,
-        1,346,1,346,1,347,1,347,1,347,1,347,1,347,1,347,1,347,1,347,1,348,
-        1,348,1,348,1,348,1,348,1,348,1,348,1,348,1,348,1,349,1,349,1,349,
-        1,349,1,349,1,349,1,349,1,349,1,349,1,349,1,350,1,350,1,350,1,350,
-        1,350,1,350,1,350,1,351,1,351,1,351,1,351,1,351,1,351,1,351,1,351,
-        1,351,1,351,1,351,1,351,1,352,1,352,1,352,1,352,1,352,1,352,1,352,
-        1,352,1,352,1,352,1,352,1,352,1,352,1,352,1,353,1,353,1,353,1,353,
-        1,353,1,353,1,353,1,353,1,353,1,353,1,353,1,353,1,353,1,353,1,353,
-        1,353,1,353,1,353,1,354,1,354,1,354,1,354,1,354,1,354,1,354,1,354,
-        1,354,1,354,1,354,1,354,1,354,1,354,1,354,1,354,1,354,1,354,1,354,
-        1,355,1,355,1,355,1,355,1,355,1,355,1,355,1,355,1,355,1,356,1,356,
-        1,356,1,356,1,356,1,356,1,356,1,356,1,356,1,356,1,356,1,357,1,357,
-        1,357,1,357,1,357,1,357,1,357,1,357,1,358,1,358,1,358,1,358,1,358,
-        1,359,1,359,1,359,1,359,1,359,1,359,1,359,1,359,1,360,1,360,1,360,
-        1,360,1,360,1,361,1,361,1,361,1,361,1,361,1,361,1,361,1,361,1,361,
-        1,362,1,362,1,362,1,362,1,362,1,362,1,363,1,363,1,363,1,363,1,363,
-        1,364,1,364,1,364,1,364,1,364,1,364,1,365,1,365,1,365,1,365,1,365,
-        1,365,1,365,1,366,1,366,1,366,1,366,1,366,1,366,1,366,1,367,1,367,
-        1,367,1,367,1,367,1,367,1,367,1,367,1,368,1,368,1,368,1,368,1,368,
-        1,368,1,368,1,368,1,368,1,369,1,369,1,369,1,369,1,369,1,369,1,369,
-        1,370,1,370,1,370,1,370,1,370,1,370,1,370,1,370,1,371,1,371,1,371,
-        1,371,1,371,1,371,1,371,1,372,1,372,1,372,1,372,1,372,1,372,1,372,
-        1,373,1,373,1,373,1,373,1,373,1,373,1,373,1,374,1,374,1,374,1,374,
-        1,374,1,374,1,374,1,374,1,374,1,375,1,375,1,375,1,375,1,375,1,375,
-        1,375,1,375,1,375,1,375,1,375,1,375,1,375,1,375,1,375,1,375,1,375,
-        1,375,1,375,1,375,1,375,1,375,1,375,1,375,1,375,1,375,1,376,1,376,
-        1,376,1,376,1,376,1,376,1,376,1,376,1,376,1,376,1,376,1,376,1,376,
-        1,376,1,376,1,376,1,376,1,376,1,376,1,376,1,376,1,376,1,376,1,376,
-        1,376,1,376,1,377,1,377,1,377,1,377,1,377,1,377,1,377,1,377,1,377,
-        1,377,1,378,1,378,1,378,1,378,1,378,1,378,1,378,1,378,1,378,1,379,
-        1,379,1,379,1,379,1,379,1,379,1,379,1,379,1,379,1,380,1,380,1,380,
-        1,380,1,380,1,380,1,380,1,380,1,380,1,380,1,381,1,381,1,381,1,381,
-        1,381,1,381,1,381,1,381,1,381,1,381,1,381,1,382,1,382,1,382,1,382,
-        1,382,1,382,1,382,1,382,1,382,1,382,1,383,1,383,1,383,1,383,1,383,
-        1,383,1,383,1,384,1,384,1,384,1,384,1,384,1,384,1,384,1,384,1,384,
-        1,384,1,384,1,384,1,384,1,384,1,384,1,385,1,385,1,385,1,385,1,385,
-        1,385,1,385,1,386,1,386,1,386,1,386,1,386,1,386,1,387,1,387,1,387,
-        1,387,1,387,1,387,1,387,1,388,1,388,1,388,1,388,1,388,1,388,1,389,
-        1,389,1,389,1,389,1,389,1,389,1,389,1,389,1,389,1,390,1,390,1,390,
-        1,390,1,390,1,390,1,390,1,390,1,390,1,391,1,391,1,391,1,391,1,391,
-        1,391,1,391,1,391,1,391,1,392,1,392,1,392,1,392,1,392,1,392,1,392,
-        1,392,1,393,1,393,1,393,1,393,1,393,1,393,1,393,1,393,1,393,1,393,
-        1,394,1,394,1,394,1,394,1,394,1,394,1,394,1,394,1,394,1,394,1,395,
-        1,395,1,395,1,395,1,395,1,395,1,395,5,395,5247,8,395,10,395,12,395,
-        5250,9,395,1,395,1,395,1,395,1,396,4,396,5256,8,396,11,396,12,396,
-        5257,1,397,5,397,5261,8,397,10,397,12,397,5264,9,397,1,397,1,397,
-        4,397,5268,8,397,11,397,12,397,5269,1,398,1,398,1,398,1,398,5,398,
-        5276,8,398,10,398,12,398,5279,9,398,1,398,1,398,1,398,1,399,1,399,
-        1,399,1,399,5,399,5288,8,399,10,399,12,399,5291,9,399,1,399,1,399,
-        1,399,1,400,1,400,1,400,1,400,5,400,5300,8,400,10,400,12,400,5303,
-        9,400,1,400,1,400,1,400,1,401,1,401,1,402,1,402,1,403,1,403,1,404,
-        1,404,1,405,1,405,1,406,1,406,1,407,1,407,1,408,1,408,1,409,1,409,
-        1,410,1,410,1,411,1,411,1,412,1,412,1,413,1,413,1,414,1,414,1,415,
-        1,415,1,416,1,416,1,416,1,417,1,417,1,417,1,418,1,418,1,418,1,419,
-        1,419,1,419,1,420,1,420,1,420,1,421,1,421,1,421,1,422,1,422,1,423,
-        1,423,1,424,1,424,1,424,3,424,5363,8,424,1,425,1,425,3,425,5367,
-        8,425,1,426,1,426,1,427,1,427,5,427,5373,8,427,10,427,12,427,5376,
-        9,427,1,428,1,428,1,428,3,428,5381,8,428,1,429,1,429,3,429,5385,
-        8,429,1,430,1,430,1,431,1,431,1,432,1,432,1,890,0,433,1,1,3,2,5,
-        3,7,4,9,5,11,6,13,7,15,8,17,9,19,10,21,11,23,12,25,13,27,14,29,15,
-        31,16,33,17,35,18,37,19,39,20,41,21,43,22,45,23,47,24,49,25,51,26,
-        53,27,55,28,57,29,59,30,61,31,63,32,65,33,67,34,69,35,71,36,73,37,
-        75,38,77,39,79,40,81,41,83,42,85,43,87,44,89,45,91,46,93,47,95,48,
-        97,49,99,50,101,51,103,52,105,53,107,54,109,55,111,56,113,57,115,
-        58,117,59,119,60,121,61,123,62,125,63,127,64,129,65,131,66,133,67,
-        135,68,137,69,139,70,141,71,143,72,145,73,147,74,149,75,151,76,153,
-        77,155,78,157,79,159,80,161,81,163,82,165,83,167,84,169,85,171,86,
-        173,87,175,88,177,89,179,90,181,91,183,92,185,93,187,94,189,95,191,
-        96,193,97,195,98,197,99,199,100,201,101,203,102,205,103,207,104,
-        209,105,211,106,213,107,215,108,217,109,219,110,221,111,223,112,
-        225,113,227,114,229,115,231,116,233,117,235,118,237,119,239,120,
-        241,121,243,122,245,123,247,124,249,125,251,126,253,127,255,128,
-        257,129,259,130,261,131,263,132,265,133,267,134,269,135,271,136,
-        273,137,275,138,277,139,279,140,281,141,283,142,285,143,287,144,
-        289,145,291,146,293,147,295,148,297,149,299,150,301,151,303,152,
-        305,153,307,154,309,155,311,156,313,157,315,158,317,159,319,160,
-        321,161,323,162,325,163,327,164,329,165,331,166,333,167,335,168,
-        337,169,339,170,341,171,343,172,345,173,347,174,349,175,351,176,
-        353,177,355,178,357,179,359,180,361,181,363,182,365,183,367,184,
-        369,185,371,186,373,187,375,188,377,189,379,190,381,191,383,192,
-        385,193,387,194,389,195,391,196,393,197,395,198,397,199,399,200,
-        401,201,403,202,405,203,407,204,409,205,411,206,413,207,415,208,
-        417,209,419,210,421,211,423,212,425,213,427,214,429,215,431,216,
-        433,217,435,218,437,219,439,220,441,221,443,222,445,223,447,224,
-        449,225,451,226,453,227,455,228,457,229,459,230,461,231,463,232,
-        465,233,467,234,469,235,471,236,473,237,475,238,477,239,479,240,
-        481,241,483,242,485,243,487,244,489,245,491,246,493,247,495,248,
-        497,249,499,250,501,251,503,252,505,253,507,254,509,255,511,256,
-        513,257,515,258,517,259,519,260,521,261,523,262,525,263,527,264,
-        529,265,531,266,533,267,535,268,537,269,539,270,541,271,543,272,
-        545,273,547,274,549,275,551,276,553,277,555,278,557,279,559,280,
-        561,281,563,282,565,283,567,284,569,285,571,286,573,287,575,288,
-        577,289,579,290,581,291,583,292,585,293,587,294,589,295,591,296,
-        593,297,595,298,597,299,599,300,601,301,603,302,605,303,607,304,
-        609,305,611,306,613,307,615,308,617,309,619,310,621,311,623,312,
-        625,313,627,314,629,315,631,316,633,317,635,318,637,319,639,320,
-        641,321,643,322,645,323,647,324,649,325,651,326,653,327,655,328,
-        657,329,659,330,661,331,663,332,665,333,667,334,669,335,671,336,
-        673,337,675,338,677,339,679,340,681,341,683,342,685,343,687,344,
-        689,345,691,346,693,347,695,348,697,349,699,350,701,351,703,352,
-        705,353,707,354,709,355,711,356,713,357,715,358,717,359,719,360,
-        721,361,723,362,725,363,727,364,729,365,731,366,733,367,735,368,
-        737,369,739,370,741,371,743,372,745,373,747,374,749,375,751,376,
-        753,377,755,378,757,379,759,380,761,381,763,382,765,383,767,384,
-        769,385,771,386,773,387,775,388,777,389,779,390,781,391,783,392,
-        785,393,787,394,789,395,791,396,793,397,795,398,797,399,799,400,
-        801,401,803,402,805,403,807,404,809,405,811,406,813,407,815,408,
-        817,409,819,410,821,411,823,412,825,413,827,414,829,415,831,416,
-        833,417,835,418,837,419,839,420,841,421,843,422,845,423,847,0,849,
-        0,851,0,853,0,855,0,857,0,859,0,861,0,863,0,865,0,1,0,9,1,0,42,42,
-        1,0,47,47,1,0,34,34,1,0,48,57,6,0,10,10,13,13,34,34,39,39,133,133,
+        4,0,423,769,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
+        2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,
+        13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,
+        19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,
+        26,7,26,2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,
+        32,2,33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,
+        39,7,39,2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,
+        45,2,46,7,46,2,47,7,47,2,48,7,48,2,49,7,49,2,50,7,50,2,51,7,51,2,
+        52,7,52,2,53,7,53,2,54,7,54,2,55,7,55,2,56,7,56,2,57,7,57,2,58,7,
+        58,2,59,7,59,2,60,7,60,2,61,7,61,2,62,7,62,2,63,7,63,2,64,7,64,2,
+        65,7,65,2,66,7,66,2,67,7,67,2,68,7,68,2,69,7,69,2,70,7,70,2,71,7,
+        71,2,72,7,72,2,73,7,73,2,74,7,74,1,0,1,0,1,0,1,0,3,0,156,8,0,1,0,
+        5,0,159,8,0,10,0,12,0,162,9,0,1,0,1,0,1,1,1,1,1,1,1,1,1,1,1,1,1,
+        1,5,1,173,8,1,10,1,12,1,176,9,1,1,1,1,1,1,1,3,1,181,8,1,1,1,1,1,
+        1,2,1,2,4,2,187,8,2,11,2,12,2,188,1,2,1,2,1,3,1,3,1,3,1,3,1,3,1,
+        3,1,3,1,3,1,3,1,3,1,3,1,3,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,
+        4,1,4,1,5,1,5,1,5,1,5,1,5,1,5,1,5,1,5,1,5,1,5,1,5,1,5,1,5,1,6,1,
+        6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,7,1,
+        7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,8,1,8,1,8,1,8,1,8,1,
+        8,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,9,1,9,1,9,1,9,1,9,1,9,1,
+        9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,10,1,10,1,10,1,10,
+        1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,11,1,11,
+        1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,12,1,12,
+        1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,13,1,13,1,13,1,13,
+        1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,14,1,14,1,14,
+        1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,15,1,15,1,15,1,15,
+        1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,16,1,16,1,16,1,16,1,16,1,16,
+        1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,17,1,17,1,17,1,17,1,17,
+        1,17,1,17,1,17,1,17,1,17,1,17,1,17,1,17,1,18,1,18,1,18,1,18,1,18,
+        1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,18,1,19,
+        1,19,1,19,1,19,1,19,1,19,1,19,1,19,1,19,1,19,1,19,1,19,1,19,1,19,
+        1,19,1,19,1,19,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,
+        1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,20,1,21,1,21,1,21,1,21,1,21,
+        1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,1,21,
+        1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,1,22,
+        1,22,1,22,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,23,1,24,
+        1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,25,1,25,1,25,1,25,
+        1,25,1,25,1,25,1,25,1,25,1,25,1,26,1,26,1,26,1,26,1,26,1,26,1,26,
+        1,26,1,26,1,26,1,26,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,
+        1,27,1,27,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,28,1,29,1,29,
+        1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,30,1,30,1,30,
+        1,30,1,30,1,30,1,30,1,30,1,30,1,30,1,30,1,30,1,31,1,31,1,31,1,31,
+        1,31,1,31,1,31,1,31,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,
+        1,32,1,32,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,34,1,34,1,34,
+        1,34,1,34,1,34,1,34,1,34,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,
+        1,35,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,37,1,37,1,37,
+        1,37,1,37,1,37,1,37,5,37,623,8,37,10,37,12,37,626,9,37,1,37,1,37,
+        1,37,1,38,4,38,632,8,38,11,38,12,38,633,1,39,5,39,637,8,39,10,39,
+        12,39,640,9,39,1,39,1,39,4,39,644,8,39,11,39,12,39,645,1,40,1,40,
+        1,40,1,40,5,40,652,8,40,10,40,12,40,655,9,40,1,40,1,40,1,40,1,41,
+        1,41,1,41,1,41,5,41,664,8,41,10,41,12,41,667,9,41,1,41,1,41,1,41,
+        1,42,1,42,1,42,1,42,5,42,676,8,42,10,42,12,42,679,9,42,1,42,1,42,
+        1,42,1,43,1,43,1,43,1,44,1,44,1,45,1,45,1,46,1,46,1,47,1,47,1,48,
+        1,48,1,49,1,49,1,50,1,50,1,51,1,51,1,52,1,52,1,53,1,53,1,54,1,54,
+        1,55,1,55,1,56,1,56,1,57,1,57,1,58,1,58,1,58,1,59,1,59,1,59,1,60,
+        1,60,1,60,1,61,1,61,1,61,1,62,1,62,1,62,1,63,1,63,1,63,1,64,1,64,
+        1,65,1,65,1,66,1,66,1,66,3,66,740,8,66,1,67,1,67,3,67,744,8,67,1,
+        68,1,68,1,69,1,69,5,69,750,8,69,10,69,12,69,753,9,69,1,70,1,70,1,
+        70,3,70,758,8,70,1,71,1,71,3,71,762,8,71,1,72,1,72,1,73,1,73,1,74,
+        1,74,1,174,0,75,1,1,3,2,5,3,7,25,9,26,11,33,13,34,15,35,17,36,19,
+        46,21,47,23,97,25,120,27,135,29,174,31,175,33,176,35,177,37,191,
+        39,192,41,193,43,194,45,197,47,210,49,243,51,244,53,245,55,246,57,
+        254,59,255,61,256,63,257,65,258,67,286,69,287,71,288,73,289,75,396,
+        77,397,79,398,81,399,83,400,85,401,87,402,89,403,91,404,93,405,95,
+        406,97,407,99,408,101,409,103,410,105,411,107,412,109,413,111,414,
+        113,415,115,416,117,417,119,418,121,419,123,420,125,421,127,422,
+        129,423,131,0,133,0,135,0,137,0,139,0,141,0,143,0,145,0,147,0,149,
+        0,1,0,30,1,0,42,42,1,0,47,47,2,0,66,66,98,98,2,0,69,69,101,101,2,
+        0,84,84,116,116,2,0,65,65,97,97,2,0,68,68,100,100,2,0,73,73,105,
+        105,2,0,83,83,115,115,2,0,78,78,110,110,2,0,86,86,118,118,2,0,67,
+        67,99,99,2,0,72,72,104,104,2,0,81,81,113,113,2,0,82,82,114,114,2,
+        0,79,79,111,111,2,0,70,70,102,102,2,0,77,77,109,109,2,0,88,88,120,
+        120,2,0,80,80,112,112,2,0,71,71,103,103,2,0,76,76,108,108,2,0,75,
+        75,107,107,1,0,34,34,1,0,48,57,6,0,10,10,13,13,34,34,39,39,133,133,
         8232,8233,6,0,10,10,13,13,34,34,93,93,133,133,8232,8233,4,0,10,10,
         13,13,133,133,8232,8233,2,0,9,9,11,12,9,0,32,32,160,160,5760,5760,
-        6158,6158,8192,8198,8200,8202,8239,8239,8287,8287,12288,12288,5406,
+        6158,6158,8192,8198,8200,8202,8239,8239,8287,8287,12288,12288,783,
         0,1,1,0,0,0,0,3,1,0,0,0,0,5,1,0,0,0,0,7,1,0,0,0,0,9,1,0,0,0,0,11,
         1,0,0,0,0,13,1,0,0,0,0,15,1,0,0,0,0,17,1,0,0,0,0,19,1,0,0,0,0,21,
         1,0,0,0,0,23,1,0,0,0,0,25,1,0,0,0,0,27,1,0,0,0,0,29,1,0,0,0,0,31,
@@ -550,1501 +103,188 @@ def serializedATN():
         1,0,0,0,0,103,1,0,0,0,0,105,1,0,0,0,0,107,1,0,0,0,0,109,1,0,0,0,
         0,111,1,0,0,0,0,113,1,0,0,0,0,115,1,0,0,0,0,117,1,0,0,0,0,119,1,
         0,0,0,0,121,1,0,0,0,0,123,1,0,0,0,0,125,1,0,0,0,0,127,1,0,0,0,0,
-        129,1,0,0,0,0,131,1,0,0,0,0,133,1,0,0,0,0,135,1,0,0,0,0,137,1,0,
-        0,0,0,139,1,0,0,0,0,141,1,0,0,0,0,143,1,0,0,0,0,145,1,0,0,0,0,147,
-        1,0,0,0,0,149,1,0,0,0,0,151,1,0,0,0,0,153,1,0,0,0,0,155,1,0,0,0,
-        0,157,1,0,0,0,0,159,1,0,0,0,0,161,1,0,0,0,0,163,1,0,0,0,0,165,1,
-        0,0,0,0,167,1,0,0,0,0,169,1,0,0,0,0,171,1,0,0,0,0,173,1,0,0,0,0,
-        175,1,0,0,0,0,177,1,0,0,0,0,179,1,0,0,0,0,181,1,0,0,0,0,183,1,0,
-        0,0,0,185,1,0,0,0,0,187,1,0,0,0,0,189,1,0,0,0,0,191,1,0,0,0,0,193,
-        1,0,0,0,0,195,1,0,0,0,0,197,1,0,0,0,0,199,1,0,0,0,0,201,1,0,0,0,
-        0,203,1,0,0,0,0,205,1,0,0,0,0,207,1,0,0,0,0,209,1,0,0,0,0,211,1,
-        0,0,0,0,213,1,0,0,0,0,215,1,0,0,0,0,217,1,0,0,0,0,219,1,0,0,0,0,
-        221,1,0,0,0,0,223,1,0,0,0,0,225,1,0,0,0,0,227,1,0,0,0,0,229,1,0,
-        0,0,0,231,1,0,0,0,0,233,1,0,0,0,0,235,1,0,0,0,0,237,1,0,0,0,0,239,
-        1,0,0,0,0,241,1,0,0,0,0,243,1,0,0,0,0,245,1,0,0,0,0,247,1,0,0,0,
-        0,249,1,0,0,0,0,251,1,0,0,0,0,253,1,0,0,0,0,255,1,0,0,0,0,257,1,
-        0,0,0,0,259,1,0,0,0,0,261,1,0,0,0,0,263,1,0,0,0,0,265,1,0,0,0,0,
-        267,1,0,0,0,0,269,1,0,0,0,0,271,1,0,0,0,0,273,1,0,0,0,0,275,1,0,
-        0,0,0,277,1,0,0,0,0,279,1,0,0,0,0,281,1,0,0,0,0,283,1,0,0,0,0,285,
-        1,0,0,0,0,287,1,0,0,0,0,289,1,0,0,0,0,291,1,0,0,0,0,293,1,0,0,0,
-        0,295,1,0,0,0,0,297,1,0,0,0,0,299,1,0,0,0,0,301,1,0,0,0,0,303,1,
-        0,0,0,0,305,1,0,0,0,0,307,1,0,0,0,0,309,1,0,0,0,0,311,1,0,0,0,0,
-        313,1,0,0,0,0,315,1,0,0,0,0,317,1,0,0,0,0,319,1,0,0,0,0,321,1,0,
-        0,0,0,323,1,0,0,0,0,325,1,0,0,0,0,327,1,0,0,0,0,329,1,0,0,0,0,331,
-        1,0,0,0,0,333,1,0,0,0,0,335,1,0,0,0,0,337,1,0,0,0,0,339,1,0,0,0,
-        0,341,1,0,0,0,0,343,1,0,0,0,0,345,1,0,0,0,0,347,1,0,0,0,0,349,1,
-        0,0,0,0,351,1,0,0,0,0,353,1,0,0,0,0,355,1,0,0,0,0,357,1,0,0,0,0,
-        359,1,0,0,0,0,361,1,0,0,0,0,363,1,0,0,0,0,365,1,0,0,0,0,367,1,0,
-        0,0,0,369,1,0,0,0,0,371,1,0,0,0,0,373,1,0,0,0,0,375,1,0,0,0,0,377,
-        1,0,0,0,0,379,1,0,0,0,0,381,1,0,0,0,0,383,1,0,0,0,0,385,1,0,0,0,
-        0,387,1,0,0,0,0,389,1,0,0,0,0,391,1,0,0,0,0,393,1,0,0,0,0,395,1,
-        0,0,0,0,397,1,0,0,0,0,399,1,0,0,0,0,401,1,0,0,0,0,403,1,0,0,0,0,
-        405,1,0,0,0,0,407,1,0,0,0,0,409,1,0,0,0,0,411,1,0,0,0,0,413,1,0,
-        0,0,0,415,1,0,0,0,0,417,1,0,0,0,0,419,1,0,0,0,0,421,1,0,0,0,0,423,
-        1,0,0,0,0,425,1,0,0,0,0,427,1,0,0,0,0,429,1,0,0,0,0,431,1,0,0,0,
-        0,433,1,0,0,0,0,435,1,0,0,0,0,437,1,0,0,0,0,439,1,0,0,0,0,441,1,
-        0,0,0,0,443,1,0,0,0,0,445,1,0,0,0,0,447,1,0,0,0,0,449,1,0,0,0,0,
-        451,1,0,0,0,0,453,1,0,0,0,0,455,1,0,0,0,0,457,1,0,0,0,0,459,1,0,
-        0,0,0,461,1,0,0,0,0,463,1,0,0,0,0,465,1,0,0,0,0,467,1,0,0,0,0,469,
-        1,0,0,0,0,471,1,0,0,0,0,473,1,0,0,0,0,475,1,0,0,0,0,477,1,0,0,0,
-        0,479,1,0,0,0,0,481,1,0,0,0,0,483,1,0,0,0,0,485,1,0,0,0,0,487,1,
-        0,0,0,0,489,1,0,0,0,0,491,1,0,0,0,0,493,1,0,0,0,0,495,1,0,0,0,0,
-        497,1,0,0,0,0,499,1,0,0,0,0,501,1,0,0,0,0,503,1,0,0,0,0,505,1,0,
-        0,0,0,507,1,0,0,0,0,509,1,0,0,0,0,511,1,0,0,0,0,513,1,0,0,0,0,515,
-        1,0,0,0,0,517,1,0,0,0,0,519,1,0,0,0,0,521,1,0,0,0,0,523,1,0,0,0,
-        0,525,1,0,0,0,0,527,1,0,0,0,0,529,1,0,0,0,0,531,1,0,0,0,0,533,1,
-        0,0,0,0,535,1,0,0,0,0,537,1,0,0,0,0,539,1,0,0,0,0,541,1,0,0,0,0,
-        543,1,0,0,0,0,545,1,0,0,0,0,547,1,0,0,0,0,549,1,0,0,0,0,551,1,0,
-        0,0,0,553,1,0,0,0,0,555,1,0,0,0,0,557,1,0,0,0,0,559,1,0,0,0,0,561,
-        1,0,0,0,0,563,1,0,0,0,0,565,1,0,0,0,0,567,1,0,0,0,0,569,1,0,0,0,
-        0,571,1,0,0,0,0,573,1,0,0,0,0,575,1,0,0,0,0,577,1,0,0,0,0,579,1,
-        0,0,0,0,581,1,0,0,0,0,583,1,0,0,0,0,585,1,0,0,0,0,587,1,0,0,0,0,
-        589,1,0,0,0,0,591,1,0,0,0,0,593,1,0,0,0,0,595,1,0,0,0,0,597,1,0,
-        0,0,0,599,1,0,0,0,0,601,1,0,0,0,0,603,1,0,0,0,0,605,1,0,0,0,0,607,
-        1,0,0,0,0,609,1,0,0,0,0,611,1,0,0,0,0,613,1,0,0,0,0,615,1,0,0,0,
-        0,617,1,0,0,0,0,619,1,0,0,0,0,621,1,0,0,0,0,623,1,0,0,0,0,625,1,
-        0,0,0,0,627,1,0,0,0,0,629,1,0,0,0,0,631,1,0,0,0,0,633,1,0,0,0,0,
-        635,1,0,0,0,0,637,1,0,0,0,0,639,1,0,0,0,0,641,1,0,0,0,0,643,1,0,
-        0,0,0,645,1,0,0,0,0,647,1,0,0,0,0,649,1,0,0,0,0,651,1,0,0,0,0,653,
-        1,0,0,0,0,655,1,0,0,0,0,657,1,0,0,0,0,659,1,0,0,0,0,661,1,0,0,0,
-        0,663,1,0,0,0,0,665,1,0,0,0,0,667,1,0,0,0,0,669,1,0,0,0,0,671,1,
-        0,0,0,0,673,1,0,0,0,0,675,1,0,0,0,0,677,1,0,0,0,0,679,1,0,0,0,0,
-        681,1,0,0,0,0,683,1,0,0,0,0,685,1,0,0,0,0,687,1,0,0,0,0,689,1,0,
-        0,0,0,691,1,0,0,0,0,693,1,0,0,0,0,695,1,0,0,0,0,697,1,0,0,0,0,699,
-        1,0,0,0,0,701,1,0,0,0,0,703,1,0,0,0,0,705,1,0,0,0,0,707,1,0,0,0,
-        0,709,1,0,0,0,0,711,1,0,0,0,0,713,1,0,0,0,0,715,1,0,0,0,0,717,1,
-        0,0,0,0,719,1,0,0,0,0,721,1,0,0,0,0,723,1,0,0,0,0,725,1,0,0,0,0,
-        727,1,0,0,0,0,729,1,0,0,0,0,731,1,0,0,0,0,733,1,0,0,0,0,735,1,0,
-        0,0,0,737,1,0,0,0,0,739,1,0,0,0,0,741,1,0,0,0,0,743,1,0,0,0,0,745,
-        1,0,0,0,0,747,1,0,0,0,0,749,1,0,0,0,0,751,1,0,0,0,0,753,1,0,0,0,
-        0,755,1,0,0,0,0,757,1,0,0,0,0,759,1,0,0,0,0,761,1,0,0,0,0,763,1,
-        0,0,0,0,765,1,0,0,0,0,767,1,0,0,0,0,769,1,0,0,0,0,771,1,0,0,0,0,
-        773,1,0,0,0,0,775,1,0,0,0,0,777,1,0,0,0,0,779,1,0,0,0,0,781,1,0,
-        0,0,0,783,1,0,0,0,0,785,1,0,0,0,0,787,1,0,0,0,0,789,1,0,0,0,0,791,
-        1,0,0,0,0,793,1,0,0,0,0,795,1,0,0,0,0,797,1,0,0,0,0,799,1,0,0,0,
-        0,801,1,0,0,0,0,803,1,0,0,0,0,805,1,0,0,0,0,807,1,0,0,0,0,809,1,
-        0,0,0,0,811,1,0,0,0,0,813,1,0,0,0,0,815,1,0,0,0,0,817,1,0,0,0,0,
-        819,1,0,0,0,0,821,1,0,0,0,0,823,1,0,0,0,0,825,1,0,0,0,0,827,1,0,
-        0,0,0,829,1,0,0,0,0,831,1,0,0,0,0,833,1,0,0,0,0,835,1,0,0,0,0,837,
-        1,0,0,0,0,839,1,0,0,0,0,841,1,0,0,0,0,843,1,0,0,0,0,845,1,0,0,0,
-        1,871,1,0,0,0,3,881,1,0,0,0,5,902,1,0,0,0,7,908,1,0,0,0,9,914,1,
-        0,0,0,11,921,1,0,0,0,13,929,1,0,0,0,15,936,1,0,0,0,17,944,1,0,0,
-        0,19,957,1,0,0,0,21,975,1,0,0,0,23,981,1,0,0,0,25,1000,1,0,0,0,27,
-        1012,1,0,0,0,29,1028,1,0,0,0,31,1042,1,0,0,0,33,1048,1,0,0,0,35,
-        1075,1,0,0,0,37,1082,1,0,0,0,39,1090,1,0,0,0,41,1097,1,0,0,0,43,
-        1105,1,0,0,0,45,1115,1,0,0,0,47,1126,1,0,0,0,49,1137,1,0,0,0,51,
-        1149,1,0,0,0,53,1160,1,0,0,0,55,1168,1,0,0,0,57,1180,1,0,0,0,59,
-        1197,1,0,0,0,61,1208,1,0,0,0,63,1223,1,0,0,0,65,1233,1,0,0,0,67,
-        1246,1,0,0,0,69,1262,1,0,0,0,71,1274,1,0,0,0,73,1289,1,0,0,0,75,
-        1311,1,0,0,0,77,1335,1,0,0,0,79,1356,1,0,0,0,81,1367,1,0,0,0,83,
-        1376,1,0,0,0,85,1386,1,0,0,0,87,1402,1,0,0,0,89,1416,1,0,0,0,91,
-        1431,1,0,0,0,93,1449,1,0,0,0,95,1464,1,0,0,0,97,1475,1,0,0,0,99,
-        1489,1,0,0,0,101,1506,1,0,0,0,103,1528,1,0,0,0,105,1538,1,0,0,0,
-        107,1544,1,0,0,0,109,1551,1,0,0,0,111,1557,1,0,0,0,113,1564,1,0,
-        0,0,115,1572,1,0,0,0,117,1581,1,0,0,0,119,1591,1,0,0,0,121,1604,
-        1,0,0,0,123,1616,1,0,0,0,125,1625,1,0,0,0,127,1639,1,0,0,0,129,1651,
-        1,0,0,0,131,1662,1,0,0,0,133,1677,1,0,0,0,135,1690,1,0,0,0,137,1702,
-        1,0,0,0,139,1709,1,0,0,0,141,1719,1,0,0,0,143,1730,1,0,0,0,145,1745,
-        1,0,0,0,147,1761,1,0,0,0,149,1772,1,0,0,0,151,1783,1,0,0,0,153,1794,
-        1,0,0,0,155,1806,1,0,0,0,157,1812,1,0,0,0,159,1822,1,0,0,0,161,1835,
-        1,0,0,0,163,1846,1,0,0,0,165,1862,1,0,0,0,167,1885,1,0,0,0,169,1894,
-        1,0,0,0,171,1904,1,0,0,0,173,1915,1,0,0,0,175,1923,1,0,0,0,177,1936,
-        1,0,0,0,179,1951,1,0,0,0,181,1963,1,0,0,0,183,1973,1,0,0,0,185,1981,
-        1,0,0,0,187,1988,1,0,0,0,189,1996,1,0,0,0,191,2005,1,0,0,0,193,2011,
-        1,0,0,0,195,2024,1,0,0,0,197,2031,1,0,0,0,199,2039,1,0,0,0,201,2048,
-        1,0,0,0,203,2058,1,0,0,0,205,2065,1,0,0,0,207,2077,1,0,0,0,209,2093,
-        1,0,0,0,211,2114,1,0,0,0,213,2122,1,0,0,0,215,2130,1,0,0,0,217,2139,
-        1,0,0,0,219,2145,1,0,0,0,221,2156,1,0,0,0,223,2170,1,0,0,0,225,2187,
-        1,0,0,0,227,2197,1,0,0,0,229,2208,1,0,0,0,231,2218,1,0,0,0,233,2233,
-        1,0,0,0,235,2247,1,0,0,0,237,2254,1,0,0,0,239,2259,1,0,0,0,241,2270,
-        1,0,0,0,243,2280,1,0,0,0,245,2289,1,0,0,0,247,2295,1,0,0,0,249,2307,
-        1,0,0,0,251,2317,1,0,0,0,253,2335,1,0,0,0,255,2345,1,0,0,0,257,2355,
-        1,0,0,0,259,2364,1,0,0,0,261,2377,1,0,0,0,263,2389,1,0,0,0,265,2401,
-        1,0,0,0,267,2413,1,0,0,0,269,2424,1,0,0,0,271,2438,1,0,0,0,273,2446,
-        1,0,0,0,275,2460,1,0,0,0,277,2480,1,0,0,0,279,2493,1,0,0,0,281,2502,
-        1,0,0,0,283,2516,1,0,0,0,285,2531,1,0,0,0,287,2542,1,0,0,0,289,2557,
-        1,0,0,0,291,2577,1,0,0,0,293,2583,1,0,0,0,295,2590,1,0,0,0,297,2596,
-        1,0,0,0,299,2601,1,0,0,0,301,2607,1,0,0,0,303,2615,1,0,0,0,305,2629,
-        1,0,0,0,307,2637,1,0,0,0,309,2643,1,0,0,0,311,2650,1,0,0,0,313,2657,
-        1,0,0,0,315,2666,1,0,0,0,317,2676,1,0,0,0,319,2682,1,0,0,0,321,2688,
-        1,0,0,0,323,2695,1,0,0,0,325,2704,1,0,0,0,327,2711,1,0,0,0,329,2717,
-        1,0,0,0,331,2725,1,0,0,0,333,2734,1,0,0,0,335,2753,1,0,0,0,337,2776,
-        1,0,0,0,339,2786,1,0,0,0,341,2798,1,0,0,0,343,2812,1,0,0,0,345,2823,
-        1,0,0,0,347,2835,1,0,0,0,349,2847,1,0,0,0,351,2858,1,0,0,0,353,2872,
-        1,0,0,0,355,2885,1,0,0,0,357,2891,1,0,0,0,359,2897,1,0,0,0,361,2903,
-        1,0,0,0,363,2925,1,0,0,0,365,2949,1,0,0,0,367,2970,1,0,0,0,369,2975,
-        1,0,0,0,371,2992,1,0,0,0,373,2999,1,0,0,0,375,3014,1,0,0,0,377,3025,
-        1,0,0,0,379,3043,1,0,0,0,381,3056,1,0,0,0,383,3073,1,0,0,0,385,3090,
-        1,0,0,0,387,3108,1,0,0,0,389,3126,1,0,0,0,391,3135,1,0,0,0,393,3140,
-        1,0,0,0,395,3155,1,0,0,0,397,3163,1,0,0,0,399,3177,1,0,0,0,401,3193,
-        1,0,0,0,403,3211,1,0,0,0,405,3226,1,0,0,0,407,3236,1,0,0,0,409,3247,
-        1,0,0,0,411,3257,1,0,0,0,413,3268,1,0,0,0,415,3278,1,0,0,0,417,3285,
-        1,0,0,0,419,3299,1,0,0,0,421,3309,1,0,0,0,423,3317,1,0,0,0,425,3327,
-        1,0,0,0,427,3342,1,0,0,0,429,3358,1,0,0,0,431,3368,1,0,0,0,433,3375,
-        1,0,0,0,435,3383,1,0,0,0,437,3392,1,0,0,0,439,3414,1,0,0,0,441,3428,
-        1,0,0,0,443,3447,1,0,0,0,445,3455,1,0,0,0,447,3467,1,0,0,0,449,3477,
-        1,0,0,0,451,3483,1,0,0,0,453,3504,1,0,0,0,455,3513,1,0,0,0,457,3522,
-        1,0,0,0,459,3531,1,0,0,0,461,3547,1,0,0,0,463,3565,1,0,0,0,465,3595,
-        1,0,0,0,467,3617,1,0,0,0,469,3633,1,0,0,0,471,3640,1,0,0,0,473,3646,
-        1,0,0,0,475,3653,1,0,0,0,477,3660,1,0,0,0,479,3669,1,0,0,0,481,3684,
-        1,0,0,0,483,3701,1,0,0,0,485,3715,1,0,0,0,487,3725,1,0,0,0,489,3735,
-        1,0,0,0,491,3746,1,0,0,0,493,3757,1,0,0,0,495,3770,1,0,0,0,497,3792,
-        1,0,0,0,499,3798,1,0,0,0,501,3810,1,0,0,0,503,3829,1,0,0,0,505,3836,
-        1,0,0,0,507,3845,1,0,0,0,509,3854,1,0,0,0,511,3866,1,0,0,0,513,3878,
-        1,0,0,0,515,3886,1,0,0,0,517,3897,1,0,0,0,519,3903,1,0,0,0,521,3910,
-        1,0,0,0,523,3917,1,0,0,0,525,3929,1,0,0,0,527,3937,1,0,0,0,529,3944,
-        1,0,0,0,531,3959,1,0,0,0,533,3970,1,0,0,0,535,3981,1,0,0,0,537,3992,
-        1,0,0,0,539,4003,1,0,0,0,541,4013,1,0,0,0,543,4020,1,0,0,0,545,4027,
-        1,0,0,0,547,4035,1,0,0,0,549,4045,1,0,0,0,551,4055,1,0,0,0,553,4063,
-        1,0,0,0,555,4071,1,0,0,0,557,4089,1,0,0,0,559,4100,1,0,0,0,561,4115,
-        1,0,0,0,563,4135,1,0,0,0,565,4144,1,0,0,0,567,4155,1,0,0,0,569,4163,
-        1,0,0,0,571,4172,1,0,0,0,573,4180,1,0,0,0,575,4188,1,0,0,0,577,4197,
-        1,0,0,0,579,4206,1,0,0,0,581,4216,1,0,0,0,583,4227,1,0,0,0,585,4237,
-        1,0,0,0,587,4244,1,0,0,0,589,4251,1,0,0,0,591,4258,1,0,0,0,593,4268,
-        1,0,0,0,595,4279,1,0,0,0,597,4291,1,0,0,0,599,4302,1,0,0,0,601,4314,
-        1,0,0,0,603,4325,1,0,0,0,605,4338,1,0,0,0,607,4348,1,0,0,0,609,4358,
-        1,0,0,0,611,4368,1,0,0,0,613,4378,1,0,0,0,615,4389,1,0,0,0,617,4394,
-        1,0,0,0,619,4400,1,0,0,0,621,4407,1,0,0,0,623,4418,1,0,0,0,625,4429,
-        1,0,0,0,627,4440,1,0,0,0,629,4449,1,0,0,0,631,4454,1,0,0,0,633,4464,
-        1,0,0,0,635,4471,1,0,0,0,637,4479,1,0,0,0,639,4491,1,0,0,0,641,4501,
-        1,0,0,0,643,4508,1,0,0,0,645,4520,1,0,0,0,647,4532,1,0,0,0,649,4544,
-        1,0,0,0,651,4556,1,0,0,0,653,4568,1,0,0,0,655,4574,1,0,0,0,657,4581,
-        1,0,0,0,659,4589,1,0,0,0,661,4601,1,0,0,0,663,4612,1,0,0,0,665,4617,
-        1,0,0,0,667,4624,1,0,0,0,669,4635,1,0,0,0,671,4641,1,0,0,0,673,4647,
-        1,0,0,0,675,4653,1,0,0,0,677,4663,1,0,0,0,679,4676,1,0,0,0,681,4689,
-        1,0,0,0,683,4695,1,0,0,0,685,4703,1,0,0,0,687,4715,1,0,0,0,689,4726,
-        1,0,0,0,691,4754,1,0,0,0,693,4771,1,0,0,0,695,4780,1,0,0,0,697,4788,
-        1,0,0,0,699,4797,1,0,0,0,701,4807,1,0,0,0,703,4814,1,0,0,0,705,4826,
-        1,0,0,0,707,4840,1,0,0,0,709,4858,1,0,0,0,711,4877,1,0,0,0,713,4886,
-        1,0,0,0,715,4897,1,0,0,0,717,4905,1,0,0,0,719,4910,1,0,0,0,721,4918,
-        1,0,0,0,723,4923,1,0,0,0,725,4932,1,0,0,0,727,4938,1,0,0,0,729,4943,
-        1,0,0,0,731,4949,1,0,0,0,733,4956,1,0,0,0,735,4963,1,0,0,0,737,4971,
-        1,0,0,0,739,4980,1,0,0,0,741,4987,1,0,0,0,743,4995,1,0,0,0,745,5002,
-        1,0,0,0,747,5009,1,0,0,0,749,5016,1,0,0,0,751,5025,1,0,0,0,753,5051,
-        1,0,0,0,755,5077,1,0,0,0,757,5087,1,0,0,0,759,5096,1,0,0,0,761,5105,
-        1,0,0,0,763,5115,1,0,0,0,765,5126,1,0,0,0,767,5136,1,0,0,0,769,5143,
-        1,0,0,0,771,5158,1,0,0,0,773,5165,1,0,0,0,775,5171,1,0,0,0,777,5178,
-        1,0,0,0,779,5184,1,0,0,0,781,5193,1,0,0,0,783,5202,1,0,0,0,785,5211,
-        1,0,0,0,787,5219,1,0,0,0,789,5229,1,0,0,0,791,5239,1,0,0,0,793,5255,
-        1,0,0,0,795,5262,1,0,0,0,797,5271,1,0,0,0,799,5283,1,0,0,0,801,5295,
-        1,0,0,0,803,5307,1,0,0,0,805,5309,1,0,0,0,807,5311,1,0,0,0,809,5313,
-        1,0,0,0,811,5315,1,0,0,0,813,5317,1,0,0,0,815,5319,1,0,0,0,817,5321,
-        1,0,0,0,819,5323,1,0,0,0,821,5325,1,0,0,0,823,5327,1,0,0,0,825,5329,
-        1,0,0,0,827,5331,1,0,0,0,829,5333,1,0,0,0,831,5335,1,0,0,0,833,5337,
-        1,0,0,0,835,5340,1,0,0,0,837,5343,1,0,0,0,839,5346,1,0,0,0,841,5349,
-        1,0,0,0,843,5352,1,0,0,0,845,5355,1,0,0,0,847,5357,1,0,0,0,849,5362,
-        1,0,0,0,851,5366,1,0,0,0,853,5368,1,0,0,0,855,5370,1,0,0,0,857,5380,
-        1,0,0,0,859,5384,1,0,0,0,861,5386,1,0,0,0,863,5388,1,0,0,0,865,5390,
-        1,0,0,0,867,868,5,47,0,0,868,872,5,47,0,0,869,870,5,45,0,0,870,872,
-        5,45,0,0,871,867,1,0,0,0,871,869,1,0,0,0,872,876,1,0,0,0,873,875,
-        3,847,423,0,874,873,1,0,0,0,875,878,1,0,0,0,876,874,1,0,0,0,876,
-        877,1,0,0,0,877,879,1,0,0,0,878,876,1,0,0,0,879,880,6,0,0,0,880,
-        2,1,0,0,0,881,882,5,47,0,0,882,883,5,42,0,0,883,890,1,0,0,0,884,
-        889,3,3,1,0,885,886,5,47,0,0,886,889,8,0,0,0,887,889,8,1,0,0,888,
-        884,1,0,0,0,888,885,1,0,0,0,888,887,1,0,0,0,889,892,1,0,0,0,890,
-        891,1,0,0,0,890,888,1,0,0,0,891,896,1,0,0,0,892,890,1,0,0,0,893,
-        894,5,42,0,0,894,897,5,47,0,0,895,897,5,0,0,1,896,893,1,0,0,0,896,
-        895,1,0,0,0,897,898,1,0,0,0,898,899,6,1,0,0,899,4,1,0,0,0,900,903,
-        3,851,425,0,901,903,3,849,424,0,902,900,1,0,0,0,902,901,1,0,0,0,
-        903,904,1,0,0,0,904,902,1,0,0,0,904,905,1,0,0,0,905,906,1,0,0,0,
-        906,907,6,2,1,0,907,6,1,0,0,0,908,909,5,65,0,0,909,910,5,66,0,0,
-        910,911,5,83,0,0,911,912,1,0,0,0,912,913,6,3,2,0,913,8,1,0,0,0,914,
-        915,5,65,0,0,915,916,5,67,0,0,916,917,5,79,0,0,917,918,5,83,0,0,
-        918,919,1,0,0,0,919,920,6,4,2,0,920,10,1,0,0,0,921,922,5,65,0,0,
-        922,923,5,67,0,0,923,924,5,79,0,0,924,925,5,83,0,0,925,926,5,72,
-        0,0,926,927,1,0,0,0,927,928,6,5,2,0,928,12,1,0,0,0,929,930,5,65,
-        0,0,930,931,5,67,0,0,931,932,5,79,0,0,932,933,5,84,0,0,933,934,1,
-        0,0,0,934,935,6,6,2,0,935,14,1,0,0,0,936,937,5,65,0,0,937,938,5,
-        67,0,0,938,939,5,79,0,0,939,940,5,84,0,0,940,941,5,72,0,0,941,942,
-        1,0,0,0,942,943,6,7,2,0,943,16,1,0,0,0,944,945,5,65,0,0,945,946,
-        5,68,0,0,946,947,5,68,0,0,947,948,5,67,0,0,948,949,5,79,0,0,949,
-        950,5,76,0,0,950,951,5,85,0,0,951,952,5,77,0,0,952,953,5,78,0,0,
-        953,954,5,83,0,0,954,955,1,0,0,0,955,956,6,8,2,0,956,18,1,0,0,0,
-        957,958,5,65,0,0,958,959,5,68,0,0,959,960,5,68,0,0,960,961,5,77,
-        0,0,961,962,5,73,0,0,962,963,5,83,0,0,963,964,5,83,0,0,964,965,5,
-        73,0,0,965,966,5,78,0,0,966,967,5,71,0,0,967,968,5,73,0,0,968,969,
-        5,84,0,0,969,970,5,69,0,0,970,971,5,77,0,0,971,972,5,83,0,0,972,
-        973,1,0,0,0,973,974,6,9,2,0,974,20,1,0,0,0,975,976,5,65,0,0,976,
-        977,5,76,0,0,977,978,5,76,0,0,978,979,1,0,0,0,979,980,6,10,2,0,980,
-        22,1,0,0,0,981,982,5,65,0,0,982,983,5,76,0,0,983,984,5,76,0,0,984,
-        985,5,67,0,0,985,986,5,82,0,0,986,987,5,79,0,0,987,988,5,83,0,0,
-        988,989,5,83,0,0,989,990,5,70,0,0,990,991,5,73,0,0,991,992,5,76,
-        0,0,992,993,5,84,0,0,993,994,5,69,0,0,994,995,5,82,0,0,995,996,5,
-        69,0,0,996,997,5,68,0,0,997,998,1,0,0,0,998,999,6,11,2,0,999,24,
-        1,0,0,0,1000,1001,5,65,0,0,1001,1002,5,76,0,0,1002,1003,5,76,0,0,
-        1003,1004,5,69,0,0,1004,1005,5,88,0,0,1005,1006,5,67,0,0,1006,1007,
-        5,69,0,0,1007,1008,5,80,0,0,1008,1009,5,84,0,0,1009,1010,1,0,0,0,
-        1010,1011,6,12,2,0,1011,26,1,0,0,0,1012,1013,5,65,0,0,1013,1014,
-        5,76,0,0,1014,1015,5,76,0,0,1015,1016,5,78,0,0,1016,1017,5,79,0,
-        0,1017,1018,5,66,0,0,1018,1019,5,76,0,0,1019,1020,5,65,0,0,1020,
-        1021,5,78,0,0,1021,1022,5,75,0,0,1022,1023,5,82,0,0,1023,1024,5,
-        79,0,0,1024,1025,5,87,0,0,1025,1026,1,0,0,0,1026,1027,6,13,2,0,1027,
-        28,1,0,0,0,1028,1029,5,65,0,0,1029,1030,5,76,0,0,1030,1031,5,76,
-        0,0,1031,1032,5,83,0,0,1032,1033,5,69,0,0,1033,1034,5,76,0,0,1034,
-        1035,5,69,0,0,1035,1036,5,67,0,0,1036,1037,5,84,0,0,1037,1038,5,
-        69,0,0,1038,1039,5,68,0,0,1039,1040,1,0,0,0,1040,1041,6,14,2,0,1041,
-        30,1,0,0,0,1042,1043,5,65,0,0,1043,1044,5,78,0,0,1044,1045,5,68,
-        0,0,1045,1046,1,0,0,0,1046,1047,6,15,2,0,1047,32,1,0,0,0,1048,1049,
-        5,65,0,0,1049,1050,5,80,0,0,1050,1051,5,80,0,0,1051,1052,5,82,0,
-        0,1052,1053,5,79,0,0,1053,1054,5,88,0,0,1054,1055,5,73,0,0,1055,
-        1056,5,77,0,0,1056,1057,5,65,0,0,1057,1058,5,84,0,0,1058,1059,5,
-        69,0,0,1059,1060,5,68,0,0,1060,1061,5,73,0,0,1061,1062,5,83,0,0,
-        1062,1063,5,84,0,0,1063,1064,5,73,0,0,1064,1065,5,78,0,0,1065,1066,
-        5,67,0,0,1066,1067,5,84,0,0,1067,1068,5,67,0,0,1068,1069,5,79,0,
-        0,1069,1070,5,85,0,0,1070,1071,5,78,0,0,1071,1072,5,84,0,0,1072,
-        1073,1,0,0,0,1073,1074,6,16,2,0,1074,34,1,0,0,0,1075,1076,5,65,0,
-        0,1076,1077,5,83,0,0,1077,1078,5,73,0,0,1078,1079,5,78,0,0,1079,
-        1080,1,0,0,0,1080,1081,6,17,2,0,1081,36,1,0,0,0,1082,1083,5,65,0,
-        0,1083,1084,5,83,0,0,1084,1085,5,73,0,0,1085,1086,5,78,0,0,1086,
-        1087,5,72,0,0,1087,1088,1,0,0,0,1088,1089,6,18,2,0,1089,38,1,0,0,
-        0,1090,1091,5,65,0,0,1091,1092,5,84,0,0,1092,1093,5,65,0,0,1093,
-        1094,5,78,0,0,1094,1095,1,0,0,0,1095,1096,6,19,2,0,1096,40,1,0,0,
-        0,1097,1098,5,65,0,0,1098,1099,5,84,0,0,1099,1100,5,65,0,0,1100,
-        1101,5,78,0,0,1101,1102,5,72,0,0,1102,1103,1,0,0,0,1103,1104,6,20,
-        2,0,1104,42,1,0,0,0,1105,1106,5,65,0,0,1106,1107,5,86,0,0,1107,1108,
-        5,69,0,0,1108,1109,5,82,0,0,1109,1110,5,65,0,0,1110,1111,5,71,0,
-        0,1111,1112,5,69,0,0,1112,1113,1,0,0,0,1113,1114,6,21,2,0,1114,44,
-        1,0,0,0,1115,1116,5,65,0,0,1116,1117,5,86,0,0,1117,1118,5,69,0,0,
-        1118,1119,5,82,0,0,1119,1120,5,65,0,0,1120,1121,5,71,0,0,1121,1122,
-        5,69,0,0,1122,1123,5,65,0,0,1123,1124,1,0,0,0,1124,1125,6,22,2,0,
-        1125,46,1,0,0,0,1126,1127,5,65,0,0,1127,1128,5,86,0,0,1128,1129,
-        5,69,0,0,1129,1130,5,82,0,0,1130,1131,5,65,0,0,1131,1132,5,71,0,
-        0,1132,1133,5,69,0,0,1133,1134,5,88,0,0,1134,1135,1,0,0,0,1135,1136,
-        6,23,2,0,1136,48,1,0,0,0,1137,1138,5,66,0,0,1138,1139,5,69,0,0,1139,
-        1140,5,84,0,0,1140,1141,5,65,0,0,1141,1142,5,46,0,0,1142,1143,5,
-        68,0,0,1143,1144,5,73,0,0,1144,1145,5,83,0,0,1145,1146,5,84,0,0,
-        1146,1147,1,0,0,0,1147,1148,6,24,2,0,1148,50,1,0,0,0,1149,1150,5,
-        66,0,0,1150,1151,5,69,0,0,1151,1152,5,84,0,0,1152,1153,5,65,0,0,
-        1153,1154,5,46,0,0,1154,1155,5,73,0,0,1155,1156,5,78,0,0,1156,1157,
-        5,86,0,0,1157,1158,1,0,0,0,1158,1159,6,25,2,0,1159,52,1,0,0,0,1160,
-        1161,5,66,0,0,1161,1162,5,76,0,0,1162,1163,5,65,0,0,1163,1164,5,
-        78,0,0,1164,1165,5,75,0,0,1165,1166,1,0,0,0,1166,1167,6,26,2,0,1167,
-        54,1,0,0,0,1168,1169,5,67,0,0,1169,1170,5,65,0,0,1170,1171,5,76,
-        0,0,1171,1172,5,67,0,0,1172,1173,5,85,0,0,1173,1174,5,76,0,0,1174,
-        1175,5,65,0,0,1175,1176,5,84,0,0,1176,1177,5,69,0,0,1177,1178,1,
-        0,0,0,1178,1179,6,27,2,0,1179,56,1,0,0,0,1180,1181,5,67,0,0,1181,
-        1182,5,65,0,0,1182,1183,5,76,0,0,1183,1184,5,67,0,0,1184,1185,5,
-        85,0,0,1185,1186,5,76,0,0,1186,1187,5,65,0,0,1187,1188,5,84,0,0,
-        1188,1189,5,69,0,0,1189,1190,5,84,0,0,1190,1191,5,65,0,0,1191,1192,
-        5,66,0,0,1192,1193,5,76,0,0,1193,1194,5,69,0,0,1194,1195,1,0,0,0,
-        1195,1196,6,28,2,0,1196,58,1,0,0,0,1197,1198,5,67,0,0,1198,1199,
-        5,65,0,0,1199,1200,5,76,0,0,1200,1201,5,69,0,0,1201,1202,5,78,0,
-        0,1202,1203,5,68,0,0,1203,1204,5,65,0,0,1204,1205,5,82,0,0,1205,
-        1206,1,0,0,0,1206,1207,6,29,2,0,1207,60,1,0,0,0,1208,1209,5,67,0,
-        0,1209,1210,5,65,0,0,1210,1211,5,76,0,0,1211,1212,5,69,0,0,1212,
-        1213,5,78,0,0,1213,1214,5,68,0,0,1214,1215,5,65,0,0,1215,1216,5,
-        82,0,0,1216,1217,5,65,0,0,1217,1218,5,85,0,0,1218,1219,5,84,0,0,
-        1219,1220,5,79,0,0,1220,1221,1,0,0,0,1221,1222,6,30,2,0,1222,62,
-        1,0,0,0,1223,1224,5,67,0,0,1224,1225,5,69,0,0,1225,1226,5,73,0,0,
-        1226,1227,5,76,0,0,1227,1228,5,73,0,0,1228,1229,5,78,0,0,1229,1230,
-        5,71,0,0,1230,1231,1,0,0,0,1231,1232,6,31,2,0,1232,64,1,0,0,0,1233,
-        1234,5,67,0,0,1234,1235,5,72,0,0,1235,1236,5,73,0,0,1236,1237,5,
-        83,0,0,1237,1238,5,81,0,0,1238,1239,5,46,0,0,1239,1240,5,68,0,0,
-        1240,1241,5,73,0,0,1241,1242,5,83,0,0,1242,1243,5,84,0,0,1243,1244,
-        1,0,0,0,1244,1245,6,32,2,0,1245,66,1,0,0,0,1246,1247,5,67,0,0,1247,
-        1248,5,72,0,0,1248,1249,5,73,0,0,1249,1250,5,83,0,0,1250,1251,5,
-        81,0,0,1251,1252,5,46,0,0,1252,1253,5,68,0,0,1253,1254,5,73,0,0,
-        1254,1255,5,83,0,0,1255,1256,5,84,0,0,1256,1257,5,46,0,0,1257,1258,
-        5,82,0,0,1258,1259,5,84,0,0,1259,1260,1,0,0,0,1260,1261,6,33,2,0,
-        1261,68,1,0,0,0,1262,1263,5,67,0,0,1263,1264,5,72,0,0,1264,1265,
-        5,73,0,0,1265,1266,5,83,0,0,1266,1267,5,81,0,0,1267,1268,5,46,0,
-        0,1268,1269,5,73,0,0,1269,1270,5,78,0,0,1270,1271,5,86,0,0,1271,
-        1272,1,0,0,0,1272,1273,6,34,2,0,1273,70,1,0,0,0,1274,1275,5,67,0,
-        0,1275,1276,5,72,0,0,1276,1277,5,73,0,0,1277,1278,5,83,0,0,1278,
-        1279,5,81,0,0,1279,1280,5,46,0,0,1280,1281,5,73,0,0,1281,1282,5,
-        78,0,0,1282,1283,5,86,0,0,1283,1284,5,46,0,0,1284,1285,5,82,0,0,
-        1285,1286,5,84,0,0,1286,1287,1,0,0,0,1287,1288,6,35,2,0,1288,72,
-        1,0,0,0,1289,1290,5,67,0,0,1290,1291,5,76,0,0,1291,1292,5,79,0,0,
-        1292,1293,5,83,0,0,1293,1294,5,73,0,0,1294,1295,5,78,0,0,1295,1296,
-        5,71,0,0,1296,1297,5,66,0,0,1297,1298,5,65,0,0,1298,1299,5,76,0,
-        0,1299,1300,5,65,0,0,1300,1301,5,78,0,0,1301,1302,5,67,0,0,1302,
-        1303,5,69,0,0,1303,1304,5,77,0,0,1304,1305,5,79,0,0,1305,1306,5,
-        78,0,0,1306,1307,5,84,0,0,1307,1308,5,72,0,0,1308,1309,1,0,0,0,1309,
-        1310,6,36,2,0,1310,74,1,0,0,0,1311,1312,5,67,0,0,1312,1313,5,76,
-        0,0,1313,1314,5,79,0,0,1314,1315,5,83,0,0,1315,1316,5,73,0,0,1316,
-        1317,5,78,0,0,1317,1318,5,71,0,0,1318,1319,5,66,0,0,1319,1320,5,
-        65,0,0,1320,1321,5,76,0,0,1321,1322,5,65,0,0,1322,1323,5,78,0,0,
-        1323,1324,5,67,0,0,1324,1325,5,69,0,0,1325,1326,5,81,0,0,1326,1327,
-        5,85,0,0,1327,1328,5,65,0,0,1328,1329,5,82,0,0,1329,1330,5,84,0,
-        0,1330,1331,5,69,0,0,1331,1332,5,82,0,0,1332,1333,1,0,0,0,1333,1334,
-        6,37,2,0,1334,76,1,0,0,0,1335,1336,5,67,0,0,1336,1337,5,76,0,0,1337,
-        1338,5,79,0,0,1338,1339,5,83,0,0,1339,1340,5,73,0,0,1340,1341,5,
-        78,0,0,1341,1342,5,71,0,0,1342,1343,5,66,0,0,1343,1344,5,65,0,0,
-        1344,1345,5,76,0,0,1345,1346,5,65,0,0,1346,1347,5,78,0,0,1347,1348,
-        5,67,0,0,1348,1349,5,69,0,0,1349,1350,5,89,0,0,1350,1351,5,69,0,
-        0,1351,1352,5,65,0,0,1352,1353,5,82,0,0,1353,1354,1,0,0,0,1354,1355,
-        6,38,2,0,1355,78,1,0,0,0,1356,1357,5,67,0,0,1357,1358,5,79,0,0,1358,
-        1359,5,65,0,0,1359,1360,5,76,0,0,1360,1361,5,69,0,0,1361,1362,5,
-        83,0,0,1362,1363,5,67,0,0,1363,1364,5,69,0,0,1364,1365,1,0,0,0,1365,
-        1366,6,39,2,0,1366,80,1,0,0,0,1367,1368,5,67,0,0,1368,1369,5,79,
-        0,0,1369,1370,5,77,0,0,1370,1371,5,66,0,0,1371,1372,5,73,0,0,1372,
-        1373,5,78,0,0,1373,1374,1,0,0,0,1374,1375,6,40,2,0,1375,82,1,0,0,
-        0,1376,1377,5,67,0,0,1377,1378,5,79,0,0,1378,1379,5,77,0,0,1379,
-        1380,5,66,0,0,1380,1381,5,73,0,0,1381,1382,5,78,0,0,1382,1383,5,
-        65,0,0,1383,1384,1,0,0,0,1384,1385,6,41,2,0,1385,84,1,0,0,0,1386,
-        1387,5,67,0,0,1387,1388,5,79,0,0,1388,1389,5,77,0,0,1389,1390,5,
-        66,0,0,1390,1391,5,73,0,0,1391,1392,5,78,0,0,1392,1393,5,69,0,0,
-        1393,1394,5,86,0,0,1394,1395,5,65,0,0,1395,1396,5,76,0,0,1396,1397,
-        5,85,0,0,1397,1398,5,69,0,0,1398,1399,5,83,0,0,1399,1400,1,0,0,0,
-        1400,1401,6,42,2,0,1401,86,1,0,0,0,1402,1403,5,67,0,0,1403,1404,
-        5,79,0,0,1404,1405,5,78,0,0,1405,1406,5,67,0,0,1406,1407,5,65,0,
-        0,1407,1408,5,84,0,0,1408,1409,5,69,0,0,1409,1410,5,78,0,0,1410,
-        1411,5,65,0,0,1411,1412,5,84,0,0,1412,1413,5,69,0,0,1413,1414,1,
-        0,0,0,1414,1415,6,43,2,0,1415,88,1,0,0,0,1416,1417,5,67,0,0,1417,
-        1418,5,79,0,0,1418,1419,5,78,0,0,1419,1420,5,67,0,0,1420,1421,5,
-        65,0,0,1421,1422,5,84,0,0,1422,1423,5,69,0,0,1423,1424,5,78,0,0,
-        1424,1425,5,65,0,0,1425,1426,5,84,0,0,1426,1427,5,69,0,0,1427,1428,
-        5,88,0,0,1428,1429,1,0,0,0,1429,1430,6,44,2,0,1430,90,1,0,0,0,1431,
-        1432,5,67,0,0,1432,1433,5,79,0,0,1433,1434,5,78,0,0,1434,1435,5,
-        70,0,0,1435,1436,5,73,0,0,1436,1437,5,68,0,0,1437,1438,5,69,0,0,
-        1438,1439,5,78,0,0,1439,1440,5,67,0,0,1440,1441,5,69,0,0,1441,1442,
-        5,46,0,0,1442,1443,5,78,0,0,1443,1444,5,79,0,0,1444,1445,5,82,0,
-        0,1445,1446,5,77,0,0,1446,1447,1,0,0,0,1447,1448,6,45,2,0,1448,92,
-        1,0,0,0,1449,1450,5,67,0,0,1450,1451,5,79,0,0,1451,1452,5,78,0,0,
-        1452,1453,5,70,0,0,1453,1454,5,73,0,0,1454,1455,5,68,0,0,1455,1456,
-        5,69,0,0,1456,1457,5,78,0,0,1457,1458,5,67,0,0,1458,1459,5,69,0,
-        0,1459,1460,5,46,0,0,1460,1461,5,84,0,0,1461,1462,1,0,0,0,1462,1463,
-        6,46,2,0,1463,94,1,0,0,0,1464,1465,5,67,0,0,1465,1466,5,79,0,0,1466,
-        1467,5,78,0,0,1467,1468,5,84,0,0,1468,1469,5,65,0,0,1469,1470,5,
-        73,0,0,1470,1471,5,78,0,0,1471,1472,5,83,0,0,1472,1473,1,0,0,0,1473,
-        1474,6,47,2,0,1474,96,1,0,0,0,1475,1476,5,67,0,0,1476,1477,5,79,
-        0,0,1477,1478,5,78,0,0,1478,1479,5,84,0,0,1479,1480,5,65,0,0,1480,
-        1481,5,73,0,0,1481,1482,5,78,0,0,1482,1483,5,83,0,0,1483,1484,5,
-        82,0,0,1484,1485,5,79,0,0,1485,1486,5,87,0,0,1486,1487,1,0,0,0,1487,
-        1488,6,48,2,0,1488,98,1,0,0,0,1489,1490,5,67,0,0,1490,1491,5,79,
-        0,0,1491,1492,5,78,0,0,1492,1493,5,84,0,0,1493,1494,5,65,0,0,1494,
-        1495,5,73,0,0,1495,1496,5,78,0,0,1496,1497,5,83,0,0,1497,1498,5,
-        83,0,0,1498,1499,5,84,0,0,1499,1500,5,82,0,0,1500,1501,5,73,0,0,
-        1501,1502,5,78,0,0,1502,1503,5,71,0,0,1503,1504,1,0,0,0,1504,1505,
-        6,49,2,0,1505,100,1,0,0,0,1506,1507,5,67,0,0,1507,1508,5,79,0,0,
-        1508,1509,5,78,0,0,1509,1510,5,84,0,0,1510,1511,5,65,0,0,1511,1512,
-        5,73,0,0,1512,1513,5,78,0,0,1513,1514,5,83,0,0,1514,1515,5,83,0,
-        0,1515,1516,5,84,0,0,1516,1517,5,82,0,0,1517,1518,5,73,0,0,1518,
-        1519,5,78,0,0,1519,1520,5,71,0,0,1520,1521,5,69,0,0,1521,1522,5,
-        88,0,0,1522,1523,5,65,0,0,1523,1524,5,67,0,0,1524,1525,5,84,0,0,
-        1525,1526,1,0,0,0,1526,1527,6,50,2,0,1527,102,1,0,0,0,1528,1529,
-        5,67,0,0,1529,1530,5,79,0,0,1530,1531,5,78,0,0,1531,1532,5,86,0,
-        0,1532,1533,5,69,0,0,1533,1534,5,82,0,0,1534,1535,5,84,0,0,1535,
-        1536,1,0,0,0,1536,1537,6,51,2,0,1537,104,1,0,0,0,1538,1539,5,67,
-        0,0,1539,1540,5,79,0,0,1540,1541,5,83,0,0,1541,1542,1,0,0,0,1542,
-        1543,6,52,2,0,1543,106,1,0,0,0,1544,1545,5,67,0,0,1545,1546,5,79,
-        0,0,1546,1547,5,83,0,0,1547,1548,5,72,0,0,1548,1549,1,0,0,0,1549,
-        1550,6,53,2,0,1550,108,1,0,0,0,1551,1552,5,67,0,0,1552,1553,5,79,
-        0,0,1553,1554,5,84,0,0,1554,1555,1,0,0,0,1555,1556,6,54,2,0,1556,
-        110,1,0,0,0,1557,1558,5,67,0,0,1558,1559,5,79,0,0,1559,1560,5,84,
-        0,0,1560,1561,5,72,0,0,1561,1562,1,0,0,0,1562,1563,6,55,2,0,1563,
-        112,1,0,0,0,1564,1565,5,67,0,0,1565,1566,5,79,0,0,1566,1567,5,85,
-        0,0,1567,1568,5,78,0,0,1568,1569,5,84,0,0,1569,1570,1,0,0,0,1570,
-        1571,6,56,2,0,1571,114,1,0,0,0,1572,1573,5,67,0,0,1573,1574,5,79,
-        0,0,1574,1575,5,85,0,0,1575,1576,5,78,0,0,1576,1577,5,84,0,0,1577,
-        1578,5,65,0,0,1578,1579,1,0,0,0,1579,1580,6,57,2,0,1580,116,1,0,
-        0,0,1581,1582,5,67,0,0,1582,1583,5,79,0,0,1583,1584,5,85,0,0,1584,
-        1585,5,78,0,0,1585,1586,5,84,0,0,1586,1587,5,65,0,0,1587,1588,5,
-        88,0,0,1588,1589,1,0,0,0,1589,1590,6,58,2,0,1590,118,1,0,0,0,1591,
-        1592,5,67,0,0,1592,1593,5,79,0,0,1593,1594,5,85,0,0,1594,1595,5,
-        78,0,0,1595,1596,5,84,0,0,1596,1597,5,66,0,0,1597,1598,5,76,0,0,
-        1598,1599,5,65,0,0,1599,1600,5,78,0,0,1600,1601,5,75,0,0,1601,1602,
-        1,0,0,0,1602,1603,6,59,2,0,1603,120,1,0,0,0,1604,1605,5,67,0,0,1605,
-        1606,5,79,0,0,1606,1607,5,85,0,0,1607,1608,5,78,0,0,1608,1609,5,
-        84,0,0,1609,1610,5,82,0,0,1610,1611,5,79,0,0,1611,1612,5,87,0,0,
-        1612,1613,5,83,0,0,1613,1614,1,0,0,0,1614,1615,6,60,2,0,1615,122,
-        1,0,0,0,1616,1617,5,67,0,0,1617,1618,5,79,0,0,1618,1619,5,85,0,0,
-        1619,1620,5,78,0,0,1620,1621,5,84,0,0,1621,1622,5,88,0,0,1622,1623,
-        1,0,0,0,1623,1624,6,61,2,0,1624,124,1,0,0,0,1625,1626,5,67,0,0,1626,
-        1627,5,82,0,0,1627,1628,5,79,0,0,1628,1629,5,83,0,0,1629,1630,5,
-        83,0,0,1630,1631,5,70,0,0,1631,1632,5,73,0,0,1632,1633,5,76,0,0,
-        1633,1634,5,84,0,0,1634,1635,5,69,0,0,1635,1636,5,82,0,0,1636,1637,
-        1,0,0,0,1637,1638,6,62,2,0,1638,126,1,0,0,0,1639,1640,5,67,0,0,1640,
-        1641,5,82,0,0,1641,1642,5,79,0,0,1642,1643,5,83,0,0,1643,1644,5,
-        83,0,0,1644,1645,5,74,0,0,1645,1646,5,79,0,0,1646,1647,5,73,0,0,
-        1647,1648,5,78,0,0,1648,1649,1,0,0,0,1649,1650,6,63,2,0,1650,128,
-        1,0,0,0,1651,1652,5,67,0,0,1652,1653,5,85,0,0,1653,1654,5,82,0,0,
-        1654,1655,5,82,0,0,1655,1656,5,69,0,0,1656,1657,5,78,0,0,1657,1658,
-        5,67,0,0,1658,1659,5,89,0,0,1659,1660,1,0,0,0,1660,1661,6,64,2,0,
-        1661,130,1,0,0,0,1662,1663,5,67,0,0,1663,1664,5,85,0,0,1664,1665,
-        5,82,0,0,1665,1666,5,82,0,0,1666,1667,5,69,0,0,1667,1668,5,78,0,
-        0,1668,1669,5,84,0,0,1669,1670,5,71,0,0,1670,1671,5,82,0,0,1671,
-        1672,5,79,0,0,1672,1673,5,85,0,0,1673,1674,5,80,0,0,1674,1675,1,
-        0,0,0,1675,1676,6,65,2,0,1676,132,1,0,0,0,1677,1678,5,67,0,0,1678,
-        1679,5,85,0,0,1679,1680,5,83,0,0,1680,1681,5,84,0,0,1681,1682,5,
-        79,0,0,1682,1683,5,77,0,0,1683,1684,5,68,0,0,1684,1685,5,65,0,0,
-        1685,1686,5,84,0,0,1686,1687,5,65,0,0,1687,1688,1,0,0,0,1688,1689,
-        6,66,2,0,1689,134,1,0,0,0,1690,1691,5,68,0,0,1691,1692,5,65,0,0,
-        1692,1693,5,84,0,0,1693,1694,5,65,0,0,1694,1695,5,84,0,0,1695,1696,
-        5,65,0,0,1696,1697,5,66,0,0,1697,1698,5,76,0,0,1698,1699,5,69,0,
-        0,1699,1700,1,0,0,0,1700,1701,6,67,2,0,1701,136,1,0,0,0,1702,1703,
-        5,68,0,0,1703,1704,5,65,0,0,1704,1705,5,84,0,0,1705,1706,5,69,0,
-        0,1706,1707,1,0,0,0,1707,1708,6,68,2,0,1708,138,1,0,0,0,1709,1710,
-        5,68,0,0,1710,1711,5,65,0,0,1711,1712,5,84,0,0,1712,1713,5,69,0,
-        0,1713,1714,5,65,0,0,1714,1715,5,68,0,0,1715,1716,5,68,0,0,1716,
-        1717,1,0,0,0,1717,1718,6,69,2,0,1718,140,1,0,0,0,1719,1720,5,68,
-        0,0,1720,1721,5,65,0,0,1721,1722,5,84,0,0,1722,1723,5,69,0,0,1723,
-        1724,5,68,0,0,1724,1725,5,73,0,0,1725,1726,5,70,0,0,1726,1727,5,
-        70,0,0,1727,1728,1,0,0,0,1728,1729,6,70,2,0,1729,142,1,0,0,0,1730,
-        1731,5,68,0,0,1731,1732,5,65,0,0,1732,1733,5,84,0,0,1733,1734,5,
-        69,0,0,1734,1735,5,83,0,0,1735,1736,5,66,0,0,1736,1737,5,69,0,0,
-        1737,1738,5,84,0,0,1738,1739,5,87,0,0,1739,1740,5,69,0,0,1740,1741,
-        5,69,0,0,1741,1742,5,78,0,0,1742,1743,1,0,0,0,1743,1744,6,71,2,0,
-        1744,144,1,0,0,0,1745,1746,5,68,0,0,1746,1747,5,65,0,0,1747,1748,
-        5,84,0,0,1748,1749,5,69,0,0,1749,1750,5,83,0,0,1750,1751,5,73,0,
-        0,1751,1752,5,78,0,0,1752,1753,5,80,0,0,1753,1754,5,69,0,0,1754,
-        1755,5,82,0,0,1755,1756,5,73,0,0,1756,1757,5,79,0,0,1757,1758,5,
-        68,0,0,1758,1759,1,0,0,0,1759,1760,6,72,2,0,1760,146,1,0,0,0,1761,
-        1762,5,68,0,0,1762,1763,5,65,0,0,1763,1764,5,84,0,0,1764,1765,5,
-        69,0,0,1765,1766,5,83,0,0,1766,1767,5,77,0,0,1767,1768,5,84,0,0,
-        1768,1769,5,68,0,0,1769,1770,1,0,0,0,1770,1771,6,73,2,0,1771,148,
-        1,0,0,0,1772,1773,5,68,0,0,1773,1774,5,65,0,0,1774,1775,5,84,0,0,
-        1775,1776,5,69,0,0,1776,1777,5,83,0,0,1777,1778,5,81,0,0,1778,1779,
-        5,84,0,0,1779,1780,5,68,0,0,1780,1781,1,0,0,0,1781,1782,6,74,2,0,
-        1782,150,1,0,0,0,1783,1784,5,68,0,0,1784,1785,5,65,0,0,1785,1786,
-        5,84,0,0,1786,1787,5,69,0,0,1787,1788,5,83,0,0,1788,1789,5,89,0,
-        0,1789,1790,5,84,0,0,1790,1791,5,68,0,0,1791,1792,1,0,0,0,1792,1793,
-        6,75,2,0,1793,152,1,0,0,0,1794,1795,5,68,0,0,1795,1796,5,65,0,0,
-        1796,1797,5,84,0,0,1797,1798,5,69,0,0,1798,1799,5,86,0,0,1799,1800,
-        5,65,0,0,1800,1801,5,76,0,0,1801,1802,5,85,0,0,1802,1803,5,69,0,
-        0,1803,1804,1,0,0,0,1804,1805,6,76,2,0,1805,154,1,0,0,0,1806,1807,
-        5,68,0,0,1807,1808,5,65,0,0,1808,1809,5,89,0,0,1809,1810,1,0,0,0,
-        1810,1811,6,77,2,0,1811,156,1,0,0,0,1812,1813,5,68,0,0,1813,1814,
-        5,69,0,0,1814,1815,5,71,0,0,1815,1816,5,82,0,0,1816,1817,5,69,0,
-        0,1817,1818,5,69,0,0,1818,1819,5,83,0,0,1819,1820,1,0,0,0,1820,1821,
-        6,78,2,0,1821,158,1,0,0,0,1822,1823,5,68,0,0,1823,1824,5,69,0,0,
-        1824,1825,5,84,0,0,1825,1826,5,65,0,0,1826,1827,5,73,0,0,1827,1828,
-        5,76,0,0,1828,1829,5,82,0,0,1829,1830,5,79,0,0,1830,1831,5,87,0,
-        0,1831,1832,5,83,0,0,1832,1833,1,0,0,0,1833,1834,6,79,2,0,1834,160,
-        1,0,0,0,1835,1836,5,68,0,0,1836,1837,5,73,0,0,1837,1838,5,83,0,0,
-        1838,1839,5,84,0,0,1839,1840,5,73,0,0,1840,1841,5,78,0,0,1841,1842,
-        5,67,0,0,1842,1843,5,84,0,0,1843,1844,1,0,0,0,1844,1845,6,80,2,0,
-        1845,162,1,0,0,0,1846,1847,5,68,0,0,1847,1848,5,73,0,0,1848,1849,
-        5,83,0,0,1849,1850,5,84,0,0,1850,1851,5,73,0,0,1851,1852,5,78,0,
-        0,1852,1853,5,67,0,0,1853,1854,5,84,0,0,1854,1855,5,67,0,0,1855,
-        1856,5,79,0,0,1856,1857,5,85,0,0,1857,1858,5,78,0,0,1858,1859,5,
-        84,0,0,1859,1860,1,0,0,0,1860,1861,6,81,2,0,1861,164,1,0,0,0,1862,
-        1863,5,68,0,0,1863,1864,5,73,0,0,1864,1865,5,83,0,0,1865,1866,5,
-        84,0,0,1866,1867,5,73,0,0,1867,1868,5,78,0,0,1868,1869,5,67,0,0,
-        1869,1870,5,84,0,0,1870,1871,5,67,0,0,1871,1872,5,79,0,0,1872,1873,
-        5,85,0,0,1873,1874,5,78,0,0,1874,1875,5,84,0,0,1875,1876,5,78,0,
-        0,1876,1877,5,79,0,0,1877,1878,5,66,0,0,1878,1879,5,76,0,0,1879,
-        1880,5,65,0,0,1880,1881,5,78,0,0,1881,1882,5,75,0,0,1882,1883,1,
-        0,0,0,1883,1884,6,82,2,0,1884,166,1,0,0,0,1885,1886,5,68,0,0,1886,
-        1887,5,73,0,0,1887,1888,5,86,0,0,1888,1889,5,73,0,0,1889,1890,5,
-        68,0,0,1890,1891,5,69,0,0,1891,1892,1,0,0,0,1892,1893,6,83,2,0,1893,
-        168,1,0,0,0,1894,1895,5,69,0,0,1895,1896,5,65,0,0,1896,1897,5,82,
-        0,0,1897,1898,5,76,0,0,1898,1899,5,73,0,0,1899,1900,5,69,0,0,1900,
-        1901,5,82,0,0,1901,1902,1,0,0,0,1902,1903,6,84,2,0,1903,170,1,0,
-        0,0,1904,1905,5,69,0,0,1905,1906,5,65,0,0,1906,1907,5,82,0,0,1907,
-        1908,5,76,0,0,1908,1909,5,73,0,0,1909,1910,5,69,0,0,1910,1911,5,
-        83,0,0,1911,1912,5,84,0,0,1912,1913,1,0,0,0,1913,1914,6,85,2,0,1914,
-        172,1,0,0,0,1915,1916,5,69,0,0,1916,1917,5,68,0,0,1917,1918,5,65,
-        0,0,1918,1919,5,84,0,0,1919,1920,5,69,0,0,1920,1921,1,0,0,0,1921,
-        1922,6,86,2,0,1922,174,1,0,0,0,1923,1924,5,69,0,0,1924,1925,5,78,
-        0,0,1925,1926,5,68,0,0,1926,1927,5,79,0,0,1927,1928,5,70,0,0,1928,
-        1929,5,77,0,0,1929,1930,5,79,0,0,1930,1931,5,78,0,0,1931,1932,5,
-        84,0,0,1932,1933,5,72,0,0,1933,1934,1,0,0,0,1934,1935,6,87,2,0,1935,
-        176,1,0,0,0,1936,1937,5,69,0,0,1937,1938,5,78,0,0,1938,1939,5,68,
-        0,0,1939,1940,5,79,0,0,1940,1941,5,70,0,0,1941,1942,5,81,0,0,1942,
-        1943,5,85,0,0,1943,1944,5,65,0,0,1944,1945,5,82,0,0,1945,1946,5,
-        84,0,0,1946,1947,5,69,0,0,1947,1948,5,82,0,0,1948,1949,1,0,0,0,1949,
-        1950,6,88,2,0,1950,178,1,0,0,0,1951,1952,5,69,0,0,1952,1953,5,78,
-        0,0,1953,1954,5,68,0,0,1954,1955,5,79,0,0,1955,1956,5,70,0,0,1956,
-        1957,5,89,0,0,1957,1958,5,69,0,0,1958,1959,5,65,0,0,1959,1960,5,
-        82,0,0,1960,1961,1,0,0,0,1961,1962,6,89,2,0,1962,180,1,0,0,0,1963,
-        1964,5,69,0,0,1964,1965,5,79,0,0,1965,1966,5,77,0,0,1966,1967,5,
-        79,0,0,1967,1968,5,78,0,0,1968,1969,5,84,0,0,1969,1970,5,72,0,0,
-        1970,1971,1,0,0,0,1971,1972,6,90,2,0,1972,182,1,0,0,0,1973,1974,
-        5,69,0,0,1974,1975,5,82,0,0,1975,1976,5,82,0,0,1976,1977,5,79,0,
-        0,1977,1978,5,82,0,0,1978,1979,1,0,0,0,1979,1980,6,91,2,0,1980,184,
-        1,0,0,0,1981,1982,5,69,0,0,1982,1983,5,86,0,0,1983,1984,5,69,0,0,
-        1984,1985,5,78,0,0,1985,1986,1,0,0,0,1986,1987,6,92,2,0,1987,186,
-        1,0,0,0,1988,1989,5,69,0,0,1989,1990,5,88,0,0,1990,1991,5,65,0,0,
-        1991,1992,5,67,0,0,1992,1993,5,84,0,0,1993,1994,1,0,0,0,1994,1995,
-        6,93,2,0,1995,188,1,0,0,0,1996,1997,5,69,0,0,1997,1998,5,88,0,0,
-        1998,1999,5,67,0,0,1999,2000,5,69,0,0,2000,2001,5,80,0,0,2001,2002,
-        5,84,0,0,2002,2003,1,0,0,0,2003,2004,6,94,2,0,2004,190,1,0,0,0,2005,
-        2006,5,69,0,0,2006,2007,5,88,0,0,2007,2008,5,80,0,0,2008,2009,1,
-        0,0,0,2009,2010,6,95,2,0,2010,192,1,0,0,0,2011,2012,5,69,0,0,2012,
-        2013,5,88,0,0,2013,2014,5,80,0,0,2014,2015,5,79,0,0,2015,2016,5,
-        78,0,0,2016,2017,5,46,0,0,2017,2018,5,68,0,0,2018,2019,5,73,0,0,
-        2019,2020,5,83,0,0,2020,2021,5,84,0,0,2021,2022,1,0,0,0,2022,2023,
-        6,96,2,0,2023,194,1,0,0,0,2024,2025,5,70,0,0,2025,2026,5,65,0,0,
-        2026,2027,5,67,0,0,2027,2028,5,84,0,0,2028,2029,1,0,0,0,2029,2030,
-        6,97,2,0,2030,196,1,0,0,0,2031,2032,5,70,0,0,2032,2033,5,65,0,0,
-        2033,2034,5,76,0,0,2034,2035,5,83,0,0,2035,2036,5,69,0,0,2036,2037,
-        1,0,0,0,2037,2038,6,98,2,0,2038,198,1,0,0,0,2039,2040,5,70,0,0,2040,
-        2041,5,73,0,0,2041,2042,5,76,0,0,2042,2043,5,84,0,0,2043,2044,5,
-        69,0,0,2044,2045,5,82,0,0,2045,2046,1,0,0,0,2046,2047,6,99,2,0,2047,
-        200,1,0,0,0,2048,2049,5,70,0,0,2049,2050,5,73,0,0,2050,2051,5,76,
-        0,0,2051,2052,5,84,0,0,2052,2053,5,69,0,0,2053,2054,5,82,0,0,2054,
-        2055,5,83,0,0,2055,2056,1,0,0,0,2056,2057,6,100,2,0,2057,202,1,0,
-        0,0,2058,2059,5,70,0,0,2059,2060,5,73,0,0,2060,2061,5,78,0,0,2061,
-        2062,5,68,0,0,2062,2063,1,0,0,0,2063,2064,6,101,2,0,2064,204,1,0,
-        0,0,2065,2066,5,70,0,0,2066,2067,5,73,0,0,2067,2068,5,82,0,0,2068,
-        2069,5,83,0,0,2069,2070,5,84,0,0,2070,2071,5,68,0,0,2071,2072,5,
-        65,0,0,2072,2073,5,84,0,0,2073,2074,5,69,0,0,2074,2075,1,0,0,0,2075,
-        2076,6,102,2,0,2076,206,1,0,0,0,2077,2078,5,70,0,0,2078,2079,5,73,
-        0,0,2079,2080,5,82,0,0,2080,2081,5,83,0,0,2081,2082,5,84,0,0,2082,
-        2083,5,78,0,0,2083,2084,5,79,0,0,2084,2085,5,78,0,0,2085,2086,5,
-        66,0,0,2086,2087,5,76,0,0,2087,2088,5,65,0,0,2088,2089,5,78,0,0,
-        2089,2090,5,75,0,0,2090,2091,1,0,0,0,2091,2092,6,103,2,0,2092,208,
-        1,0,0,0,2093,2094,5,70,0,0,2094,2095,5,73,0,0,2095,2096,5,82,0,0,
-        2096,2097,5,83,0,0,2097,2098,5,84,0,0,2098,2099,5,78,0,0,2099,2100,
-        5,79,0,0,2100,2101,5,78,0,0,2101,2102,5,66,0,0,2102,2103,5,76,0,
-        0,2103,2104,5,65,0,0,2104,2105,5,78,0,0,2105,2106,5,75,0,0,2106,
-        2107,5,86,0,0,2107,2108,5,65,0,0,2108,2109,5,76,0,0,2109,2110,5,
-        85,0,0,2110,2111,5,69,0,0,2111,2112,1,0,0,0,2112,2113,6,104,2,0,
-        2113,210,1,0,0,0,2114,2115,5,70,0,0,2115,2116,5,73,0,0,2116,2117,
-        5,88,0,0,2117,2118,5,69,0,0,2118,2119,5,68,0,0,2119,2120,1,0,0,0,
-        2120,2121,6,105,2,0,2121,212,1,0,0,0,2122,2123,5,70,0,0,2123,2124,
-        5,76,0,0,2124,2125,5,79,0,0,2125,2126,5,79,0,0,2126,2127,5,82,0,
-        0,2127,2128,1,0,0,0,2128,2129,6,106,2,0,2129,214,1,0,0,0,2130,2131,
-        5,70,0,0,2131,2132,5,79,0,0,2132,2133,5,82,0,0,2133,2134,5,77,0,
-        0,2134,2135,5,65,0,0,2135,2136,5,84,0,0,2136,2137,1,0,0,0,2137,2138,
-        6,107,2,0,2138,216,1,0,0,0,2139,2140,5,71,0,0,2140,2141,5,67,0,0,
-        2141,2142,5,68,0,0,2142,2143,1,0,0,0,2143,2144,6,108,2,0,2144,218,
-        1,0,0,0,2145,2146,5,71,0,0,2146,2147,5,69,0,0,2147,2148,5,78,0,0,
-        2148,2149,5,69,0,0,2149,2150,5,82,0,0,2150,2151,5,65,0,0,2151,2152,
-        5,84,0,0,2152,2153,5,69,0,0,2153,2154,1,0,0,0,2154,2155,6,109,2,
-        0,2155,220,1,0,0,0,2156,2157,5,71,0,0,2157,2158,5,69,0,0,2158,2159,
-        5,78,0,0,2159,2160,5,69,0,0,2160,2161,5,82,0,0,2161,2162,5,65,0,
-        0,2162,2163,5,84,0,0,2163,2164,5,69,0,0,2164,2165,5,65,0,0,2165,
-        2166,5,76,0,0,2166,2167,5,76,0,0,2167,2168,1,0,0,0,2168,2169,6,110,
-        2,0,2169,222,1,0,0,0,2170,2171,5,71,0,0,2171,2172,5,69,0,0,2172,
-        2173,5,78,0,0,2173,2174,5,69,0,0,2174,2175,5,82,0,0,2175,2176,5,
-        65,0,0,2176,2177,5,84,0,0,2177,2178,5,69,0,0,2178,2179,5,83,0,0,
-        2179,2180,5,69,0,0,2180,2181,5,82,0,0,2181,2182,5,73,0,0,2182,2183,
-        5,69,0,0,2183,2184,5,83,0,0,2184,2185,1,0,0,0,2185,2186,6,111,2,
-        0,2186,224,1,0,0,0,2187,2188,5,71,0,0,2188,2189,5,69,0,0,2189,2190,
-        5,79,0,0,2190,2191,5,77,0,0,2191,2192,5,69,0,0,2192,2193,5,65,0,
-        0,2193,2194,5,78,0,0,2194,2195,1,0,0,0,2195,2196,6,112,2,0,2196,
-        226,1,0,0,0,2197,2198,5,71,0,0,2198,2199,5,69,0,0,2199,2200,5,79,
-        0,0,2200,2201,5,77,0,0,2201,2202,5,69,0,0,2202,2203,5,65,0,0,2203,
-        2204,5,78,0,0,2204,2205,5,88,0,0,2205,2206,1,0,0,0,2206,2207,6,113,
-        2,0,2207,228,1,0,0,0,2208,2209,5,71,0,0,2209,2210,5,82,0,0,2210,
-        2211,5,79,0,0,2211,2212,5,85,0,0,2212,2213,5,80,0,0,2213,2214,5,
-        66,0,0,2214,2215,5,89,0,0,2215,2216,1,0,0,0,2216,2217,6,114,2,0,
-        2217,230,1,0,0,0,2218,2219,5,72,0,0,2219,2220,5,65,0,0,2220,2221,
-        5,83,0,0,2221,2222,5,79,0,0,2222,2223,5,78,0,0,2223,2224,5,69,0,
-        0,2224,2225,5,70,0,0,2225,2226,5,73,0,0,2226,2227,5,76,0,0,2227,
-        2228,5,84,0,0,2228,2229,5,69,0,0,2229,2230,5,82,0,0,2230,2231,1,
-        0,0,0,2231,2232,6,115,2,0,2232,232,1,0,0,0,2233,2234,5,72,0,0,2234,
-        2235,5,65,0,0,2235,2236,5,83,0,0,2236,2237,5,79,0,0,2237,2238,5,
-        78,0,0,2238,2239,5,69,0,0,2239,2240,5,86,0,0,2240,2241,5,65,0,0,
-        2241,2242,5,76,0,0,2242,2243,5,85,0,0,2243,2244,5,69,0,0,2244,2245,
-        1,0,0,0,2245,2246,6,116,2,0,2246,234,1,0,0,0,2247,2248,5,72,0,0,
-        2248,2249,5,79,0,0,2249,2250,5,85,0,0,2250,2251,5,82,0,0,2251,2252,
-        1,0,0,0,2252,2253,6,117,2,0,2253,236,1,0,0,0,2254,2255,5,73,0,0,
-        2255,2256,5,70,0,0,2256,2257,1,0,0,0,2257,2258,6,118,2,0,2258,238,
-        1,0,0,0,2259,2260,5,73,0,0,2260,2261,5,70,0,0,2261,2262,5,46,0,0,
-        2262,2263,5,69,0,0,2263,2264,5,65,0,0,2264,2265,5,71,0,0,2265,2266,
-        5,69,0,0,2266,2267,5,82,0,0,2267,2268,1,0,0,0,2268,2269,6,119,2,
-        0,2269,240,1,0,0,0,2270,2271,5,73,0,0,2271,2272,5,70,0,0,2272,2273,
-        5,69,0,0,2273,2274,5,82,0,0,2274,2275,5,82,0,0,2275,2276,5,79,0,
-        0,2276,2277,5,82,0,0,2277,2278,1,0,0,0,2278,2279,6,120,2,0,2279,
-        242,1,0,0,0,2280,2281,5,73,0,0,2281,2282,5,71,0,0,2282,2283,5,78,
-        0,0,2283,2284,5,79,0,0,2284,2285,5,82,0,0,2285,2286,5,69,0,0,2286,
-        2287,1,0,0,0,2287,2288,6,121,2,0,2288,244,1,0,0,0,2289,2290,5,73,
-        0,0,2290,2291,5,78,0,0,2291,2292,5,84,0,0,2292,2293,1,0,0,0,2293,
-        2294,6,122,2,0,2294,246,1,0,0,0,2295,2296,5,73,0,0,2296,2297,5,78,
-        0,0,2297,2298,5,84,0,0,2298,2299,5,69,0,0,2299,2300,5,82,0,0,2300,
-        2301,5,83,0,0,2301,2302,5,69,0,0,2302,2303,5,67,0,0,2303,2304,5,
-        84,0,0,2304,2305,1,0,0,0,2305,2306,6,123,2,0,2306,248,1,0,0,0,2307,
-        2308,5,73,0,0,2308,2309,5,83,0,0,2309,2310,5,66,0,0,2310,2311,5,
-        76,0,0,2311,2312,5,65,0,0,2312,2313,5,78,0,0,2313,2314,5,75,0,0,
-        2314,2315,1,0,0,0,2315,2316,6,124,2,0,2316,250,1,0,0,0,2317,2318,
-        5,73,0,0,2318,2319,5,83,0,0,2319,2320,5,67,0,0,2320,2321,5,82,0,
-        0,2321,2322,5,79,0,0,2322,2323,5,83,0,0,2323,2324,5,83,0,0,2324,
-        2325,5,70,0,0,2325,2326,5,73,0,0,2326,2327,5,76,0,0,2327,2328,5,
-        84,0,0,2328,2329,5,69,0,0,2329,2330,5,82,0,0,2330,2331,5,69,0,0,
-        2331,2332,5,68,0,0,2332,2333,1,0,0,0,2333,2334,6,125,2,0,2334,252,
-        1,0,0,0,2335,2336,5,73,0,0,2336,2337,5,83,0,0,2337,2338,5,69,0,0,
-        2338,2339,5,77,0,0,2339,2340,5,80,0,0,2340,2341,5,84,0,0,2341,2342,
-        5,89,0,0,2342,2343,1,0,0,0,2343,2344,6,126,2,0,2344,254,1,0,0,0,
-        2345,2346,5,73,0,0,2346,2347,5,83,0,0,2347,2348,5,69,0,0,2348,2349,
-        5,82,0,0,2349,2350,5,82,0,0,2350,2351,5,79,0,0,2351,2352,5,82,0,
-        0,2352,2353,1,0,0,0,2353,2354,6,127,2,0,2354,256,1,0,0,0,2355,2356,
-        5,73,0,0,2356,2357,5,83,0,0,2357,2358,5,69,0,0,2358,2359,5,86,0,
-        0,2359,2360,5,69,0,0,2360,2361,5,78,0,0,2361,2362,1,0,0,0,2362,2363,
-        6,128,2,0,2363,258,1,0,0,0,2364,2365,5,73,0,0,2365,2366,5,83,0,0,
-        2366,2367,5,70,0,0,2367,2368,5,73,0,0,2368,2369,5,76,0,0,2369,2370,
-        5,84,0,0,2370,2371,5,69,0,0,2371,2372,5,82,0,0,2372,2373,5,69,0,
-        0,2373,2374,5,68,0,0,2374,2375,1,0,0,0,2375,2376,6,129,2,0,2376,
-        260,1,0,0,0,2377,2378,5,73,0,0,2378,2379,5,83,0,0,2379,2380,5,73,
-        0,0,2380,2381,5,78,0,0,2381,2382,5,83,0,0,2382,2383,5,67,0,0,2383,
-        2384,5,79,0,0,2384,2385,5,80,0,0,2385,2386,5,69,0,0,2386,2387,1,
-        0,0,0,2387,2388,6,130,2,0,2388,262,1,0,0,0,2389,2390,5,73,0,0,2390,
-        2391,5,83,0,0,2391,2392,5,76,0,0,2392,2393,5,79,0,0,2393,2394,5,
-        71,0,0,2394,2395,5,73,0,0,2395,2396,5,67,0,0,2396,2397,5,65,0,0,
-        2397,2398,5,76,0,0,2398,2399,1,0,0,0,2399,2400,6,131,2,0,2400,264,
-        1,0,0,0,2401,2402,5,73,0,0,2402,2403,5,83,0,0,2403,2404,5,78,0,0,
-        2404,2405,5,79,0,0,2405,2406,5,78,0,0,2406,2407,5,84,0,0,2407,2408,
-        5,69,0,0,2408,2409,5,88,0,0,2409,2410,5,84,0,0,2410,2411,1,0,0,0,
-        2411,2412,6,132,2,0,2412,266,1,0,0,0,2413,2414,5,73,0,0,2414,2415,
-        5,83,0,0,2415,2416,5,78,0,0,2416,2417,5,85,0,0,2417,2418,5,77,0,
-        0,2418,2419,5,66,0,0,2419,2420,5,69,0,0,2420,2421,5,82,0,0,2421,
-        2422,1,0,0,0,2422,2423,6,133,2,0,2423,268,1,0,0,0,2424,2425,5,73,
-        0,0,2425,2426,5,83,0,0,2426,2427,5,79,0,0,2427,2428,5,46,0,0,2428,
-        2429,5,67,0,0,2429,2430,5,69,0,0,2430,2431,5,73,0,0,2431,2432,5,
-        76,0,0,2432,2433,5,73,0,0,2433,2434,5,78,0,0,2434,2435,5,71,0,0,
-        2435,2436,1,0,0,0,2436,2437,6,134,2,0,2437,270,1,0,0,0,2438,2439,
-        5,73,0,0,2439,2440,5,83,0,0,2440,2441,5,79,0,0,2441,2442,5,68,0,
-        0,2442,2443,5,68,0,0,2443,2444,1,0,0,0,2444,2445,6,135,2,0,2445,
-        272,1,0,0,0,2446,2447,5,73,0,0,2447,2448,5,83,0,0,2448,2449,5,79,
-        0,0,2449,2450,5,78,0,0,2450,2451,5,79,0,0,2451,2452,5,82,0,0,2452,
-        2453,5,65,0,0,2453,2454,5,70,0,0,2454,2455,5,84,0,0,2455,2456,5,
-        69,0,0,2456,2457,5,82,0,0,2457,2458,1,0,0,0,2458,2459,6,136,2,0,
-        2459,274,1,0,0,0,2460,2461,5,73,0,0,2461,2462,5,83,0,0,2462,2463,
-        5,83,0,0,2463,2464,5,69,0,0,2464,2465,5,76,0,0,2465,2466,5,69,0,
-        0,2466,2467,5,67,0,0,2467,2468,5,84,0,0,2468,2469,5,69,0,0,2469,
-        2470,5,68,0,0,2470,2471,5,77,0,0,2471,2472,5,69,0,0,2472,2473,5,
-        65,0,0,2473,2474,5,83,0,0,2474,2475,5,85,0,0,2475,2476,5,82,0,0,
-        2476,2477,5,69,0,0,2477,2478,1,0,0,0,2478,2479,6,137,2,0,2479,276,
-        1,0,0,0,2480,2481,5,73,0,0,2481,2482,5,83,0,0,2482,2483,5,83,0,0,
-        2483,2484,5,85,0,0,2484,2485,5,66,0,0,2485,2486,5,84,0,0,2486,2487,
-        5,79,0,0,2487,2488,5,84,0,0,2488,2489,5,65,0,0,2489,2490,5,76,0,
-        0,2490,2491,1,0,0,0,2491,2492,6,138,2,0,2492,278,1,0,0,0,2493,2494,
-        5,73,0,0,2494,2495,5,83,0,0,2495,2496,5,84,0,0,2496,2497,5,69,0,
-        0,2497,2498,5,88,0,0,2498,2499,5,84,0,0,2499,2500,1,0,0,0,2500,2501,
-        6,139,2,0,2501,280,1,0,0,0,2502,2503,5,75,0,0,2503,2504,5,69,0,0,
-        2504,2505,5,69,0,0,2505,2506,5,80,0,0,2506,2507,5,70,0,0,2507,2508,
-        5,73,0,0,2508,2509,5,76,0,0,2509,2510,5,84,0,0,2510,2511,5,69,0,
-        0,2511,2512,5,82,0,0,2512,2513,5,83,0,0,2513,2514,1,0,0,0,2514,2515,
-        6,140,2,0,2515,282,1,0,0,0,2516,2517,5,75,0,0,2517,2518,5,69,0,0,
-        2518,2519,5,89,0,0,2519,2520,5,87,0,0,2520,2521,5,79,0,0,2521,2522,
-        5,82,0,0,2522,2523,5,68,0,0,2523,2524,5,77,0,0,2524,2525,5,65,0,
-        0,2525,2526,5,84,0,0,2526,2527,5,67,0,0,2527,2528,5,72,0,0,2528,
-        2529,1,0,0,0,2529,2530,6,141,2,0,2530,284,1,0,0,0,2531,2532,5,76,
-        0,0,2532,2533,5,65,0,0,2533,2534,5,83,0,0,2534,2535,5,84,0,0,2535,
-        2536,5,68,0,0,2536,2537,5,65,0,0,2537,2538,5,84,0,0,2538,2539,5,
-        69,0,0,2539,2540,1,0,0,0,2540,2541,6,142,2,0,2541,286,1,0,0,0,2542,
-        2543,5,76,0,0,2543,2544,5,65,0,0,2544,2545,5,83,0,0,2545,2546,5,
-        84,0,0,2546,2547,5,78,0,0,2547,2548,5,79,0,0,2548,2549,5,78,0,0,
-        2549,2550,5,66,0,0,2550,2551,5,76,0,0,2551,2552,5,65,0,0,2552,2553,
-        5,78,0,0,2553,2554,5,75,0,0,2554,2555,1,0,0,0,2555,2556,6,143,2,
-        0,2556,288,1,0,0,0,2557,2558,5,76,0,0,2558,2559,5,65,0,0,2559,2560,
-        5,83,0,0,2560,2561,5,84,0,0,2561,2562,5,78,0,0,2562,2563,5,79,0,
-        0,2563,2564,5,78,0,0,2564,2565,5,66,0,0,2565,2566,5,76,0,0,2566,
-        2567,5,65,0,0,2567,2568,5,78,0,0,2568,2569,5,75,0,0,2569,2570,5,
-        86,0,0,2570,2571,5,65,0,0,2571,2572,5,76,0,0,2572,2573,5,85,0,0,
-        2573,2574,5,69,0,0,2574,2575,1,0,0,0,2575,2576,6,144,2,0,2576,290,
-        1,0,0,0,2577,2578,5,76,0,0,2578,2579,5,67,0,0,2579,2580,5,77,0,0,
-        2580,2581,1,0,0,0,2581,2582,6,145,2,0,2582,292,1,0,0,0,2583,2584,
-        5,76,0,0,2584,2585,5,69,0,0,2585,2586,5,70,0,0,2586,2587,5,84,0,
-        0,2587,2588,1,0,0,0,2588,2589,6,146,2,0,2589,294,1,0,0,0,2590,2591,
-        5,76,0,0,2591,2592,5,69,0,0,2592,2593,5,78,0,0,2593,2594,1,0,0,0,
-        2594,2595,6,147,2,0,2595,296,1,0,0,0,2596,2597,5,76,0,0,2597,2598,
-        5,78,0,0,2598,2599,1,0,0,0,2599,2600,6,148,2,0,2600,298,1,0,0,0,
-        2601,2602,5,76,0,0,2602,2603,5,79,0,0,2603,2604,5,71,0,0,2604,2605,
-        1,0,0,0,2605,2606,6,149,2,0,2606,300,1,0,0,0,2607,2608,5,76,0,0,
-        2608,2609,5,79,0,0,2609,2610,5,71,0,0,2610,2611,5,49,0,0,2611,2612,
-        5,48,0,0,2612,2613,1,0,0,0,2613,2614,6,150,2,0,2614,302,1,0,0,0,
-        2615,2616,5,76,0,0,2616,2617,5,79,0,0,2617,2618,5,79,0,0,2618,2619,
-        5,75,0,0,2619,2620,5,85,0,0,2620,2621,5,80,0,0,2621,2622,5,86,0,
-        0,2622,2623,5,65,0,0,2623,2624,5,76,0,0,2624,2625,5,85,0,0,2625,
-        2626,5,69,0,0,2626,2627,1,0,0,0,2627,2628,6,151,2,0,2628,304,1,0,
-        0,0,2629,2630,5,76,0,0,2630,2631,5,79,0,0,2631,2632,5,87,0,0,2632,
-        2633,5,69,0,0,2633,2634,5,82,0,0,2634,2635,1,0,0,0,2635,2636,6,152,
-        2,0,2636,306,1,0,0,0,2637,2638,5,77,0,0,2638,2639,5,65,0,0,2639,
-        2640,5,88,0,0,2640,2641,1,0,0,0,2641,2642,6,153,2,0,2642,308,1,0,
-        0,0,2643,2644,5,77,0,0,2644,2645,5,65,0,0,2645,2646,5,88,0,0,2646,
-        2647,5,65,0,0,2647,2648,1,0,0,0,2648,2649,6,154,2,0,2649,310,1,0,
-        0,0,2650,2651,5,77,0,0,2651,2652,5,65,0,0,2652,2653,5,88,0,0,2653,
-        2654,5,88,0,0,2654,2655,1,0,0,0,2655,2656,6,155,2,0,2656,312,1,0,
-        0,0,2657,2658,5,77,0,0,2658,2659,5,69,0,0,2659,2660,5,68,0,0,2660,
-        2661,5,73,0,0,2661,2662,5,65,0,0,2662,2663,5,78,0,0,2663,2664,1,
-        0,0,0,2664,2665,6,156,2,0,2665,314,1,0,0,0,2666,2667,5,77,0,0,2667,
-        2668,5,69,0,0,2668,2669,5,68,0,0,2669,2670,5,73,0,0,2670,2671,5,
-        65,0,0,2671,2672,5,78,0,0,2672,2673,5,88,0,0,2673,2674,1,0,0,0,2674,
-        2675,6,157,2,0,2675,316,1,0,0,0,2676,2677,5,77,0,0,2677,2678,5,73,
-        0,0,2678,2679,5,68,0,0,2679,2680,1,0,0,0,2680,2681,6,158,2,0,2681,
-        318,1,0,0,0,2682,2683,5,77,0,0,2683,2684,5,73,0,0,2684,2685,5,78,
-        0,0,2685,2686,1,0,0,0,2686,2687,6,159,2,0,2687,320,1,0,0,0,2688,
-        2689,5,77,0,0,2689,2690,5,73,0,0,2690,2691,5,78,0,0,2691,2692,5,
-        65,0,0,2692,2693,1,0,0,0,2693,2694,6,160,2,0,2694,322,1,0,0,0,2695,
-        2696,5,77,0,0,2696,2697,5,73,0,0,2697,2698,5,78,0,0,2698,2699,5,
-        85,0,0,2699,2700,5,84,0,0,2700,2701,5,69,0,0,2701,2702,1,0,0,0,2702,
-        2703,6,161,2,0,2703,324,1,0,0,0,2704,2705,5,77,0,0,2705,2706,5,73,
-        0,0,2706,2707,5,78,0,0,2707,2708,5,88,0,0,2708,2709,1,0,0,0,2709,
-        2710,6,162,2,0,2710,326,1,0,0,0,2711,2712,5,77,0,0,2712,2713,5,79,
-        0,0,2713,2714,5,68,0,0,2714,2715,1,0,0,0,2715,2716,6,163,2,0,2716,
-        328,1,0,0,0,2717,2718,5,77,0,0,2718,2719,5,79,0,0,2719,2720,5,78,
-        0,0,2720,2721,5,84,0,0,2721,2722,5,72,0,0,2722,2723,1,0,0,0,2723,
-        2724,6,164,2,0,2724,330,1,0,0,0,2725,2726,5,77,0,0,2726,2727,5,82,
-        0,0,2727,2728,5,79,0,0,2728,2729,5,85,0,0,2729,2730,5,78,0,0,2730,
-        2731,5,68,0,0,2731,2732,1,0,0,0,2732,2733,6,165,2,0,2733,332,1,0,
-        0,0,2734,2735,5,78,0,0,2735,2736,5,65,0,0,2736,2737,5,84,0,0,2737,
-        2738,5,85,0,0,2738,2739,5,82,0,0,2739,2740,5,65,0,0,2740,2741,5,
-        76,0,0,2741,2742,5,73,0,0,2742,2743,5,78,0,0,2743,2744,5,78,0,0,
-        2744,2745,5,69,0,0,2745,2746,5,82,0,0,2746,2747,5,74,0,0,2747,2748,
-        5,79,0,0,2748,2749,5,73,0,0,2749,2750,5,78,0,0,2750,2751,1,0,0,0,
-        2751,2752,6,166,2,0,2752,334,1,0,0,0,2753,2754,5,78,0,0,2754,2755,
-        5,65,0,0,2755,2756,5,84,0,0,2756,2757,5,85,0,0,2757,2758,5,82,0,
-        0,2758,2759,5,65,0,0,2759,2760,5,76,0,0,2760,2761,5,76,0,0,2761,
-        2762,5,69,0,0,2762,2763,5,70,0,0,2763,2764,5,84,0,0,2764,2765,5,
-        79,0,0,2765,2766,5,85,0,0,2766,2767,5,84,0,0,2767,2768,5,69,0,0,
-        2768,2769,5,82,0,0,2769,2770,5,74,0,0,2770,2771,5,79,0,0,2771,2772,
-        5,73,0,0,2772,2773,5,78,0,0,2773,2774,1,0,0,0,2774,2775,6,167,2,
-        0,2775,336,1,0,0,0,2776,2777,5,78,0,0,2777,2778,5,69,0,0,2778,2779,
-        5,88,0,0,2779,2780,5,84,0,0,2780,2781,5,68,0,0,2781,2782,5,65,0,
-        0,2782,2783,5,89,0,0,2783,2784,1,0,0,0,2784,2785,6,168,2,0,2785,
-        338,1,0,0,0,2786,2787,5,78,0,0,2787,2788,5,69,0,0,2788,2789,5,88,
-        0,0,2789,2790,5,84,0,0,2790,2791,5,77,0,0,2791,2792,5,79,0,0,2792,
-        2793,5,78,0,0,2793,2794,5,84,0,0,2794,2795,5,72,0,0,2795,2796,1,
-        0,0,0,2796,2797,6,169,2,0,2797,340,1,0,0,0,2798,2799,5,78,0,0,2799,
-        2800,5,69,0,0,2800,2801,5,88,0,0,2801,2802,5,84,0,0,2802,2803,5,
-        81,0,0,2803,2804,5,85,0,0,2804,2805,5,65,0,0,2805,2806,5,82,0,0,
-        2806,2807,5,84,0,0,2807,2808,5,69,0,0,2808,2809,5,82,0,0,2809,2810,
-        1,0,0,0,2810,2811,6,170,2,0,2811,342,1,0,0,0,2812,2813,5,78,0,0,
-        2813,2814,5,69,0,0,2814,2815,5,88,0,0,2815,2816,5,84,0,0,2816,2817,
-        5,89,0,0,2817,2818,5,69,0,0,2818,2819,5,65,0,0,2819,2820,5,82,0,
-        0,2820,2821,1,0,0,0,2821,2822,6,171,2,0,2822,344,1,0,0,0,2823,2824,
-        5,78,0,0,2824,2825,5,79,0,0,2825,2826,5,78,0,0,2826,2827,5,86,0,
-        0,2827,2828,5,73,0,0,2828,2829,5,83,0,0,2829,2830,5,85,0,0,2830,
-        2831,5,65,0,0,2831,2832,5,76,0,0,2832,2833,1,0,0,0,2833,2834,6,172,
-        2,0,2834,346,1,0,0,0,2835,2836,5,78,0,0,2836,2837,5,79,0,0,2837,
-        2838,5,82,0,0,2838,2839,5,77,0,0,2839,2840,5,46,0,0,2840,2841,5,
-        68,0,0,2841,2842,5,73,0,0,2842,2843,5,83,0,0,2843,2844,5,84,0,0,
-        2844,2845,1,0,0,0,2845,2846,6,173,2,0,2846,348,1,0,0,0,2847,2848,
-        5,78,0,0,2848,2849,5,79,0,0,2849,2850,5,82,0,0,2850,2851,5,77,0,
-        0,2851,2852,5,46,0,0,2852,2853,5,73,0,0,2853,2854,5,78,0,0,2854,
-        2855,5,86,0,0,2855,2856,1,0,0,0,2856,2857,6,174,2,0,2857,350,1,0,
-        0,0,2858,2859,5,78,0,0,2859,2860,5,79,0,0,2860,2861,5,82,0,0,2861,
-        2862,5,77,0,0,2862,2863,5,46,0,0,2863,2864,5,83,0,0,2864,2865,5,
-        46,0,0,2865,2866,5,68,0,0,2866,2867,5,73,0,0,2867,2868,5,83,0,0,
-        2868,2869,5,84,0,0,2869,2870,1,0,0,0,2870,2871,6,175,2,0,2871,352,
-        1,0,0,0,2872,2873,5,78,0,0,2873,2874,5,79,0,0,2874,2875,5,82,0,0,
-        2875,2876,5,77,0,0,2876,2877,5,46,0,0,2877,2878,5,83,0,0,2878,2879,
-        5,46,0,0,2879,2880,5,73,0,0,2880,2881,5,78,0,0,2881,2882,5,86,0,
-        0,2882,2883,1,0,0,0,2883,2884,6,176,2,0,2884,354,1,0,0,0,2885,2886,
-        5,78,0,0,2886,2887,5,79,0,0,2887,2888,5,84,0,0,2888,2889,1,0,0,0,
-        2889,2890,6,177,2,0,2890,356,1,0,0,0,2891,2892,5,78,0,0,2892,2893,
-        5,79,0,0,2893,2894,5,87,0,0,2894,2895,1,0,0,0,2895,2896,6,178,2,
-        0,2896,358,1,0,0,0,2897,2898,5,79,0,0,2898,2899,5,68,0,0,2899,2900,
-        5,68,0,0,2900,2901,1,0,0,0,2901,2902,6,179,2,0,2902,360,1,0,0,0,
-        2903,2904,5,79,0,0,2904,2905,5,80,0,0,2905,2906,5,69,0,0,2906,2907,
-        5,78,0,0,2907,2908,5,73,0,0,2908,2909,5,78,0,0,2909,2910,5,71,0,
-        0,2910,2911,5,66,0,0,2911,2912,5,65,0,0,2912,2913,5,76,0,0,2913,
-        2914,5,65,0,0,2914,2915,5,78,0,0,2915,2916,5,67,0,0,2916,2917,5,
-        69,0,0,2917,2918,5,77,0,0,2918,2919,5,79,0,0,2919,2920,5,78,0,0,
-        2920,2921,5,84,0,0,2921,2922,5,72,0,0,2922,2923,1,0,0,0,2923,2924,
-        6,180,2,0,2924,362,1,0,0,0,2925,2926,5,79,0,0,2926,2927,5,80,0,0,
-        2927,2928,5,69,0,0,2928,2929,5,78,0,0,2929,2930,5,73,0,0,2930,2931,
-        5,78,0,0,2931,2932,5,71,0,0,2932,2933,5,66,0,0,2933,2934,5,65,0,
-        0,2934,2935,5,76,0,0,2935,2936,5,65,0,0,2936,2937,5,78,0,0,2937,
-        2938,5,67,0,0,2938,2939,5,69,0,0,2939,2940,5,81,0,0,2940,2941,5,
-        85,0,0,2941,2942,5,65,0,0,2942,2943,5,82,0,0,2943,2944,5,84,0,0,
-        2944,2945,5,69,0,0,2945,2946,5,82,0,0,2946,2947,1,0,0,0,2947,2948,
-        6,181,2,0,2948,364,1,0,0,0,2949,2950,5,79,0,0,2950,2951,5,80,0,0,
-        2951,2952,5,69,0,0,2952,2953,5,78,0,0,2953,2954,5,73,0,0,2954,2955,
-        5,78,0,0,2955,2956,5,71,0,0,2956,2957,5,66,0,0,2957,2958,5,65,0,
-        0,2958,2959,5,76,0,0,2959,2960,5,65,0,0,2960,2961,5,78,0,0,2961,
-        2962,5,67,0,0,2962,2963,5,69,0,0,2963,2964,5,89,0,0,2964,2965,5,
-        69,0,0,2965,2966,5,65,0,0,2966,2967,5,82,0,0,2967,2968,1,0,0,0,2968,
-        2969,6,182,2,0,2969,366,1,0,0,0,2970,2971,5,79,0,0,2971,2972,5,82,
-        0,0,2972,2973,1,0,0,0,2973,2974,6,183,2,0,2974,368,1,0,0,0,2975,
-        2976,5,80,0,0,2976,2977,5,65,0,0,2977,2978,5,82,0,0,2978,2979,5,
-        65,0,0,2979,2980,5,76,0,0,2980,2981,5,76,0,0,2981,2982,5,69,0,0,
-        2982,2983,5,76,0,0,2983,2984,5,80,0,0,2984,2985,5,69,0,0,2985,2986,
-        5,82,0,0,2986,2987,5,73,0,0,2987,2988,5,79,0,0,2988,2989,5,68,0,
-        0,2989,2990,1,0,0,0,2990,2991,6,184,2,0,2991,370,1,0,0,0,2992,2993,
-        5,80,0,0,2993,2994,5,65,0,0,2994,2995,5,84,0,0,2995,2996,5,72,0,
-        0,2996,2997,1,0,0,0,2997,2998,6,185,2,0,2998,372,1,0,0,0,2999,3000,
-        5,80,0,0,3000,3001,5,65,0,0,3001,3002,5,84,0,0,3002,3003,5,72,0,
-        0,3003,3004,5,67,0,0,3004,3005,5,79,0,0,3005,3006,5,78,0,0,3006,
-        3007,5,84,0,0,3007,3008,5,65,0,0,3008,3009,5,73,0,0,3009,3010,5,
-        78,0,0,3010,3011,5,83,0,0,3011,3012,1,0,0,0,3012,3013,6,186,2,0,
-        3013,374,1,0,0,0,3014,3015,5,80,0,0,3015,3016,5,65,0,0,3016,3017,
-        5,84,0,0,3017,3018,5,72,0,0,3018,3019,5,73,0,0,3019,3020,5,84,0,
-        0,3020,3021,5,69,0,0,3021,3022,5,77,0,0,3022,3023,1,0,0,0,3023,3024,
-        6,187,2,0,3024,376,1,0,0,0,3025,3026,5,80,0,0,3026,3027,5,65,0,0,
-        3027,3028,5,84,0,0,3028,3029,5,72,0,0,3029,3030,5,73,0,0,3030,3031,
-        5,84,0,0,3031,3032,5,69,0,0,3032,3033,5,77,0,0,3033,3034,5,82,0,
-        0,3034,3035,5,69,0,0,3035,3036,5,86,0,0,3036,3037,5,69,0,0,3037,
-        3038,5,82,0,0,3038,3039,5,83,0,0,3039,3040,5,69,0,0,3040,3041,1,
-        0,0,0,3041,3042,6,188,2,0,3042,378,1,0,0,0,3043,3044,5,80,0,0,3044,
-        3045,5,65,0,0,3045,3046,5,84,0,0,3046,3047,5,72,0,0,3047,3048,5,
-        76,0,0,3048,3049,5,69,0,0,3049,3050,5,78,0,0,3050,3051,5,71,0,0,
-        3051,3052,5,84,0,0,3052,3053,5,72,0,0,3053,3054,1,0,0,0,3054,3055,
-        6,189,2,0,3055,380,1,0,0,0,3056,3057,5,80,0,0,3057,3058,5,69,0,0,
-        3058,3059,5,82,0,0,3059,3060,5,67,0,0,3060,3061,5,69,0,0,3061,3062,
-        5,78,0,0,3062,3063,5,84,0,0,3063,3064,5,73,0,0,3064,3065,5,76,0,
-        0,3065,3066,5,69,0,0,3066,3067,5,46,0,0,3067,3068,5,69,0,0,3068,
-        3069,5,88,0,0,3069,3070,5,67,0,0,3070,3071,1,0,0,0,3071,3072,6,190,
-        2,0,3072,382,1,0,0,0,3073,3074,5,80,0,0,3074,3075,5,69,0,0,3075,
-        3076,5,82,0,0,3076,3077,5,67,0,0,3077,3078,5,69,0,0,3078,3079,5,
-        78,0,0,3079,3080,5,84,0,0,3080,3081,5,73,0,0,3081,3082,5,76,0,0,
-        3082,3083,5,69,0,0,3083,3084,5,46,0,0,3084,3085,5,73,0,0,3085,3086,
-        5,78,0,0,3086,3087,5,67,0,0,3087,3088,1,0,0,0,3088,3089,6,191,2,
-        0,3089,384,1,0,0,0,3090,3091,5,80,0,0,3091,3092,5,69,0,0,3092,3093,
-        5,82,0,0,3093,3094,5,67,0,0,3094,3095,5,69,0,0,3095,3096,5,78,0,
-        0,3096,3097,5,84,0,0,3097,3098,5,73,0,0,3098,3099,5,76,0,0,3099,
-        3100,5,69,0,0,3100,3101,5,88,0,0,3101,3102,5,46,0,0,3102,3103,5,
-        69,0,0,3103,3104,5,88,0,0,3104,3105,5,67,0,0,3105,3106,1,0,0,0,3106,
-        3107,6,192,2,0,3107,386,1,0,0,0,3108,3109,5,80,0,0,3109,3110,5,69,
-        0,0,3110,3111,5,82,0,0,3111,3112,5,67,0,0,3112,3113,5,69,0,0,3113,
-        3114,5,78,0,0,3114,3115,5,84,0,0,3115,3116,5,73,0,0,3116,3117,5,
-        76,0,0,3117,3118,5,69,0,0,3118,3119,5,88,0,0,3119,3120,5,46,0,0,
-        3120,3121,5,73,0,0,3121,3122,5,78,0,0,3122,3123,5,67,0,0,3123,3124,
-        1,0,0,0,3124,3125,6,193,2,0,3125,388,1,0,0,0,3126,3127,5,80,0,0,
-        3127,3128,5,69,0,0,3128,3129,5,82,0,0,3129,3130,5,77,0,0,3130,3131,
-        5,85,0,0,3131,3132,5,84,0,0,3132,3133,1,0,0,0,3133,3134,6,194,2,
-        0,3134,390,1,0,0,0,3135,3136,5,80,0,0,3136,3137,5,73,0,0,3137,3138,
-        1,0,0,0,3138,3139,6,195,2,0,3139,392,1,0,0,0,3140,3141,5,80,0,0,
-        3141,3142,5,79,0,0,3142,3143,5,73,0,0,3143,3144,5,83,0,0,3144,3145,
-        5,83,0,0,3145,3146,5,79,0,0,3146,3147,5,78,0,0,3147,3148,5,46,0,
-        0,3148,3149,5,68,0,0,3149,3150,5,73,0,0,3150,3151,5,83,0,0,3151,
-        3152,5,84,0,0,3152,3153,1,0,0,0,3153,3154,6,196,2,0,3154,394,1,0,
-        0,0,3155,3156,5,80,0,0,3156,3157,5,79,0,0,3157,3158,5,87,0,0,3158,
-        3159,5,69,0,0,3159,3160,5,82,0,0,3160,3161,1,0,0,0,3161,3162,6,197,
-        2,0,3162,396,1,0,0,0,3163,3164,5,80,0,0,3164,3165,5,82,0,0,3165,
-        3166,5,69,0,0,3166,3167,5,86,0,0,3167,3168,5,73,0,0,3168,3169,5,
-        79,0,0,3169,3170,5,85,0,0,3170,3171,5,83,0,0,3171,3172,5,68,0,0,
-        3172,3173,5,65,0,0,3173,3174,5,89,0,0,3174,3175,1,0,0,0,3175,3176,
-        6,198,2,0,3176,398,1,0,0,0,3177,3178,5,80,0,0,3178,3179,5,82,0,0,
-        3179,3180,5,69,0,0,3180,3181,5,86,0,0,3181,3182,5,73,0,0,3182,3183,
-        5,79,0,0,3183,3184,5,85,0,0,3184,3185,5,83,0,0,3185,3186,5,77,0,
-        0,3186,3187,5,79,0,0,3187,3188,5,78,0,0,3188,3189,5,84,0,0,3189,
-        3190,5,72,0,0,3190,3191,1,0,0,0,3191,3192,6,199,2,0,3192,400,1,0,
-        0,0,3193,3194,5,80,0,0,3194,3195,5,82,0,0,3195,3196,5,69,0,0,3196,
-        3197,5,86,0,0,3197,3198,5,73,0,0,3198,3199,5,79,0,0,3199,3200,5,
-        85,0,0,3200,3201,5,83,0,0,3201,3202,5,81,0,0,3202,3203,5,85,0,0,
-        3203,3204,5,65,0,0,3204,3205,5,82,0,0,3205,3206,5,84,0,0,3206,3207,
-        5,69,0,0,3207,3208,5,82,0,0,3208,3209,1,0,0,0,3209,3210,6,200,2,
-        0,3210,402,1,0,0,0,3211,3212,5,80,0,0,3212,3213,5,82,0,0,3213,3214,
-        5,69,0,0,3214,3215,5,86,0,0,3215,3216,5,73,0,0,3216,3217,5,79,0,
-        0,3217,3218,5,85,0,0,3218,3219,5,83,0,0,3219,3220,5,89,0,0,3220,
-        3221,5,69,0,0,3221,3222,5,65,0,0,3222,3223,5,82,0,0,3223,3224,1,
-        0,0,0,3224,3225,6,201,2,0,3225,404,1,0,0,0,3226,3227,5,80,0,0,3227,
-        3228,5,82,0,0,3228,3229,5,79,0,0,3229,3230,5,68,0,0,3230,3231,5,
-        85,0,0,3231,3232,5,67,0,0,3232,3233,5,84,0,0,3233,3234,1,0,0,0,3234,
-        3235,6,202,2,0,3235,406,1,0,0,0,3236,3237,5,80,0,0,3237,3238,5,82,
-        0,0,3238,3239,5,79,0,0,3239,3240,5,68,0,0,3240,3241,5,85,0,0,3241,
-        3242,5,67,0,0,3242,3243,5,84,0,0,3243,3244,5,88,0,0,3244,3245,1,
-        0,0,0,3245,3246,6,203,2,0,3246,408,1,0,0,0,3247,3248,5,81,0,0,3248,
-        3249,5,85,0,0,3249,3250,5,65,0,0,3250,3251,5,82,0,0,3251,3252,5,
-        84,0,0,3252,3253,5,69,0,0,3253,3254,5,82,0,0,3254,3255,1,0,0,0,3255,
-        3256,6,204,2,0,3256,410,1,0,0,0,3257,3258,5,81,0,0,3258,3259,5,85,
-        0,0,3259,3260,5,79,0,0,3260,3261,5,84,0,0,3261,3262,5,73,0,0,3262,
-        3263,5,69,0,0,3263,3264,5,78,0,0,3264,3265,5,84,0,0,3265,3266,1,
-        0,0,0,3266,3267,6,205,2,0,3267,412,1,0,0,0,3268,3269,5,82,0,0,3269,
-        3270,5,65,0,0,3270,3271,5,68,0,0,3271,3272,5,73,0,0,3272,3273,5,
-        65,0,0,3273,3274,5,78,0,0,3274,3275,5,83,0,0,3275,3276,1,0,0,0,3276,
-        3277,6,206,2,0,3277,414,1,0,0,0,3278,3279,5,82,0,0,3279,3280,5,65,
-        0,0,3280,3281,5,78,0,0,3281,3282,5,68,0,0,3282,3283,1,0,0,0,3283,
-        3284,6,207,2,0,3284,416,1,0,0,0,3285,3286,5,82,0,0,3286,3287,5,65,
-        0,0,3287,3288,5,78,0,0,3288,3289,5,68,0,0,3289,3290,5,66,0,0,3290,
-        3291,5,69,0,0,3291,3292,5,84,0,0,3292,3293,5,87,0,0,3293,3294,5,
-        69,0,0,3294,3295,5,69,0,0,3295,3296,5,78,0,0,3296,3297,1,0,0,0,3297,
-        3298,6,208,2,0,3298,418,1,0,0,0,3299,3300,5,82,0,0,3300,3301,5,65,
-        0,0,3301,3302,5,78,0,0,3302,3303,5,75,0,0,3303,3304,5,46,0,0,3304,
-        3305,5,69,0,0,3305,3306,5,81,0,0,3306,3307,1,0,0,0,3307,3308,6,209,
-        2,0,3308,420,1,0,0,0,3309,3310,5,82,0,0,3310,3311,5,65,0,0,3311,
-        3312,5,78,0,0,3312,3313,5,75,0,0,3313,3314,5,88,0,0,3314,3315,1,
-        0,0,0,3315,3316,6,210,2,0,3316,422,1,0,0,0,3317,3318,5,82,0,0,3318,
-        3319,5,69,0,0,3319,3320,5,76,0,0,3320,3321,5,65,0,0,3321,3322,5,
-        84,0,0,3322,3323,5,69,0,0,3323,3324,5,68,0,0,3324,3325,1,0,0,0,3325,
-        3326,6,211,2,0,3326,424,1,0,0,0,3327,3328,5,82,0,0,3328,3329,5,69,
-        0,0,3329,3330,5,76,0,0,3330,3331,5,65,0,0,3331,3332,5,84,0,0,3332,
-        3333,5,69,0,0,3333,3334,5,68,0,0,3334,3335,5,84,0,0,3335,3336,5,
-        65,0,0,3336,3337,5,66,0,0,3337,3338,5,76,0,0,3338,3339,5,69,0,0,
-        3339,3340,1,0,0,0,3340,3341,6,212,2,0,3341,426,1,0,0,0,3342,3343,
-        5,82,0,0,3343,3344,5,69,0,0,3344,3345,5,77,0,0,3345,3346,5,79,0,
-        0,3346,3347,5,86,0,0,3347,3348,5,69,0,0,3348,3349,5,70,0,0,3349,
-        3350,5,73,0,0,3350,3351,5,76,0,0,3351,3352,5,84,0,0,3352,3353,5,
-        69,0,0,3353,3354,5,82,0,0,3354,3355,5,83,0,0,3355,3356,1,0,0,0,3356,
-        3357,6,213,2,0,3357,428,1,0,0,0,3358,3359,5,82,0,0,3359,3360,5,69,
-        0,0,3360,3361,5,80,0,0,3361,3362,5,76,0,0,3362,3363,5,65,0,0,3363,
-        3364,5,67,0,0,3364,3365,5,69,0,0,3365,3366,1,0,0,0,3366,3367,6,214,
-        2,0,3367,430,1,0,0,0,3368,3369,5,82,0,0,3369,3370,5,69,0,0,3370,
-        3371,5,80,0,0,3371,3372,5,84,0,0,3372,3373,1,0,0,0,3373,3374,6,215,
-        2,0,3374,432,1,0,0,0,3375,3376,5,82,0,0,3376,3377,5,73,0,0,3377,
-        3378,5,71,0,0,3378,3379,5,72,0,0,3379,3380,5,84,0,0,3380,3381,1,
-        0,0,0,3381,3382,6,216,2,0,3382,434,1,0,0,0,3383,3384,5,82,0,0,3384,
-        3385,5,79,0,0,3385,3386,5,76,0,0,3386,3387,5,76,0,0,3387,3388,5,
-        85,0,0,3388,3389,5,80,0,0,3389,3390,1,0,0,0,3390,3391,6,217,2,0,
-        3391,436,1,0,0,0,3392,3393,5,82,0,0,3393,3394,5,79,0,0,3394,3395,
-        5,76,0,0,3395,3396,5,76,0,0,3396,3397,5,85,0,0,3397,3398,5,80,0,
-        0,3398,3399,5,65,0,0,3399,3400,5,68,0,0,3400,3401,5,68,0,0,3401,
-        3402,5,73,0,0,3402,3403,5,83,0,0,3403,3404,5,83,0,0,3404,3405,5,
-        85,0,0,3405,3406,5,66,0,0,3406,3407,5,84,0,0,3407,3408,5,79,0,0,
-        3408,3409,5,84,0,0,3409,3410,5,65,0,0,3410,3411,5,76,0,0,3411,3412,
-        1,0,0,0,3412,3413,6,218,2,0,3413,438,1,0,0,0,3414,3415,5,82,0,0,
-        3415,3416,5,79,0,0,3416,3417,5,76,0,0,3417,3418,5,76,0,0,3418,3419,
-        5,85,0,0,3419,3420,5,80,0,0,3420,3421,5,71,0,0,3421,3422,5,82,0,
-        0,3422,3423,5,79,0,0,3423,3424,5,85,0,0,3424,3425,5,80,0,0,3425,
-        3426,1,0,0,0,3426,3427,6,219,2,0,3427,440,1,0,0,0,3428,3429,5,82,
-        0,0,3429,3430,5,79,0,0,3430,3431,5,76,0,0,3431,3432,5,76,0,0,3432,
-        3433,5,85,0,0,3433,3434,5,80,0,0,3434,3435,5,73,0,0,3435,3436,5,
-        83,0,0,3436,3437,5,83,0,0,3437,3438,5,85,0,0,3438,3439,5,66,0,0,
-        3439,3440,5,84,0,0,3440,3441,5,79,0,0,3441,3442,5,84,0,0,3442,3443,
-        5,65,0,0,3443,3444,5,76,0,0,3444,3445,1,0,0,0,3445,3446,6,220,2,
-        0,3446,442,1,0,0,0,3447,3448,5,82,0,0,3448,3449,5,79,0,0,3449,3450,
-        5,85,0,0,3450,3451,5,78,0,0,3451,3452,5,68,0,0,3452,3453,1,0,0,0,
-        3453,3454,6,221,2,0,3454,444,1,0,0,0,3455,3456,5,82,0,0,3456,3457,
-        5,79,0,0,3457,3458,5,85,0,0,3458,3459,5,78,0,0,3459,3460,5,68,0,
-        0,3460,3461,5,68,0,0,3461,3462,5,79,0,0,3462,3463,5,87,0,0,3463,
-        3464,5,78,0,0,3464,3465,1,0,0,0,3465,3466,6,222,2,0,3466,446,1,0,
-        0,0,3467,3468,5,82,0,0,3468,3469,5,79,0,0,3469,3470,5,85,0,0,3470,
-        3471,5,78,0,0,3471,3472,5,68,0,0,3472,3473,5,85,0,0,3473,3474,5,
-        80,0,0,3474,3475,1,0,0,0,3475,3476,6,223,2,0,3476,448,1,0,0,0,3477,
-        3478,5,82,0,0,3478,3479,5,79,0,0,3479,3480,5,87,0,0,3480,3481,1,
-        0,0,0,3481,3482,6,224,2,0,3482,450,1,0,0,0,3483,3484,5,83,0,0,3484,
-        3485,5,65,0,0,3485,3486,5,77,0,0,3486,3487,5,69,0,0,3487,3488,5,
-        80,0,0,3488,3489,5,69,0,0,3489,3490,5,82,0,0,3490,3491,5,73,0,0,
-        3491,3492,5,79,0,0,3492,3493,5,68,0,0,3493,3494,5,76,0,0,3494,3495,
-        5,65,0,0,3495,3496,5,83,0,0,3496,3497,5,84,0,0,3497,3498,5,89,0,
-        0,3498,3499,5,69,0,0,3499,3500,5,65,0,0,3500,3501,5,82,0,0,3501,
-        3502,1,0,0,0,3502,3503,6,225,2,0,3503,452,1,0,0,0,3504,3505,5,83,
-        0,0,3505,3506,5,65,0,0,3506,3507,5,77,0,0,3507,3508,5,80,0,0,3508,
-        3509,5,76,0,0,3509,3510,5,69,0,0,3510,3511,1,0,0,0,3511,3512,6,226,
-        2,0,3512,454,1,0,0,0,3513,3514,5,83,0,0,3514,3515,5,69,0,0,3515,
-        3516,5,65,0,0,3516,3517,5,82,0,0,3517,3518,5,67,0,0,3518,3519,5,
-        72,0,0,3519,3520,1,0,0,0,3520,3521,6,227,2,0,3521,456,1,0,0,0,3522,
-        3523,5,83,0,0,3523,3524,5,69,0,0,3524,3525,5,67,0,0,3525,3526,5,
-        79,0,0,3526,3527,5,78,0,0,3527,3528,5,68,0,0,3528,3529,1,0,0,0,3529,
-        3530,6,228,2,0,3530,458,1,0,0,0,3531,3532,5,83,0,0,3532,3533,5,69,
-        0,0,3533,3534,5,76,0,0,3534,3535,5,69,0,0,3535,3536,5,67,0,0,3536,
-        3537,5,84,0,0,3537,3538,5,67,0,0,3538,3539,5,79,0,0,3539,3540,5,
-        76,0,0,3540,3541,5,85,0,0,3541,3542,5,77,0,0,3542,3543,5,78,0,0,
-        3543,3544,5,83,0,0,3544,3545,1,0,0,0,3545,3546,6,229,2,0,3546,460,
-        1,0,0,0,3547,3548,5,83,0,0,3548,3549,5,69,0,0,3549,3550,5,76,0,0,
-        3550,3551,5,69,0,0,3551,3552,5,67,0,0,3552,3553,5,84,0,0,3553,3554,
-        5,69,0,0,3554,3555,5,68,0,0,3555,3556,5,77,0,0,3556,3557,5,69,0,
-        0,3557,3558,5,65,0,0,3558,3559,5,83,0,0,3559,3560,5,85,0,0,3560,
-        3561,5,82,0,0,3561,3562,5,69,0,0,3562,3563,1,0,0,0,3563,3564,6,230,
-        2,0,3564,462,1,0,0,0,3565,3566,5,83,0,0,3566,3567,5,69,0,0,3567,
-        3568,5,76,0,0,3568,3569,5,69,0,0,3569,3570,5,67,0,0,3570,3571,5,
-        84,0,0,3571,3572,5,69,0,0,3572,3573,5,68,0,0,3573,3574,5,77,0,0,
-        3574,3575,5,69,0,0,3575,3576,5,65,0,0,3576,3577,5,83,0,0,3577,3578,
-        5,85,0,0,3578,3579,5,82,0,0,3579,3580,5,69,0,0,3580,3581,5,70,0,
-        0,3581,3582,5,79,0,0,3582,3583,5,82,0,0,3583,3584,5,77,0,0,3584,
-        3585,5,65,0,0,3585,3586,5,84,0,0,3586,3587,5,83,0,0,3587,3588,5,
-        84,0,0,3588,3589,5,82,0,0,3589,3590,5,73,0,0,3590,3591,5,78,0,0,
-        3591,3592,5,71,0,0,3592,3593,1,0,0,0,3593,3594,6,231,2,0,3594,464,
-        1,0,0,0,3595,3596,5,83,0,0,3596,3597,5,69,0,0,3597,3598,5,76,0,0,
-        3598,3599,5,69,0,0,3599,3600,5,67,0,0,3600,3601,5,84,0,0,3601,3602,
-        5,69,0,0,3602,3603,5,68,0,0,3603,3604,5,77,0,0,3604,3605,5,69,0,
-        0,3605,3606,5,65,0,0,3606,3607,5,83,0,0,3607,3608,5,85,0,0,3608,
-        3609,5,82,0,0,3609,3610,5,69,0,0,3610,3611,5,78,0,0,3611,3612,5,
-        65,0,0,3612,3613,5,77,0,0,3613,3614,5,69,0,0,3614,3615,1,0,0,0,3615,
-        3616,6,232,2,0,3616,466,1,0,0,0,3617,3618,5,83,0,0,3618,3619,5,69,
-        0,0,3619,3620,5,76,0,0,3620,3621,5,69,0,0,3621,3622,5,67,0,0,3622,
-        3623,5,84,0,0,3623,3624,5,69,0,0,3624,3625,5,68,0,0,3625,3626,5,
-        86,0,0,3626,3627,5,65,0,0,3627,3628,5,76,0,0,3628,3629,5,85,0,0,
-        3629,3630,5,69,0,0,3630,3631,1,0,0,0,3631,3632,6,233,2,0,3632,468,
-        1,0,0,0,3633,3634,5,83,0,0,3634,3635,5,73,0,0,3635,3636,5,71,0,0,
-        3636,3637,5,78,0,0,3637,3638,1,0,0,0,3638,3639,6,234,2,0,3639,470,
-        1,0,0,0,3640,3641,5,83,0,0,3641,3642,5,73,0,0,3642,3643,5,78,0,0,
-        3643,3644,1,0,0,0,3644,3645,6,235,2,0,3645,472,1,0,0,0,3646,3647,
-        5,83,0,0,3647,3648,5,73,0,0,3648,3649,5,78,0,0,3649,3650,5,72,0,
-        0,3650,3651,1,0,0,0,3651,3652,6,236,2,0,3652,474,1,0,0,0,3653,3654,
-        5,83,0,0,3654,3655,5,81,0,0,3655,3656,5,82,0,0,3656,3657,5,84,0,
-        0,3657,3658,1,0,0,0,3658,3659,6,237,2,0,3659,476,1,0,0,0,3660,3661,
-        5,83,0,0,3661,3662,5,81,0,0,3662,3663,5,82,0,0,3663,3664,5,84,0,
-        0,3664,3665,5,80,0,0,3665,3666,5,73,0,0,3666,3667,1,0,0,0,3667,3668,
-        6,238,2,0,3668,478,1,0,0,0,3669,3670,5,83,0,0,3670,3671,5,84,0,0,
-        3671,3672,5,65,0,0,3672,3673,5,82,0,0,3673,3674,5,84,0,0,3674,3675,
-        5,79,0,0,3675,3676,5,70,0,0,3676,3677,5,77,0,0,3677,3678,5,79,0,
-        0,3678,3679,5,78,0,0,3679,3680,5,84,0,0,3680,3681,5,72,0,0,3681,
-        3682,1,0,0,0,3682,3683,6,239,2,0,3683,480,1,0,0,0,3684,3685,5,83,
-        0,0,3685,3686,5,84,0,0,3686,3687,5,65,0,0,3687,3688,5,82,0,0,3688,
-        3689,5,84,0,0,3689,3690,5,79,0,0,3690,3691,5,70,0,0,3691,3692,5,
-        81,0,0,3692,3693,5,85,0,0,3693,3694,5,65,0,0,3694,3695,5,82,0,0,
-        3695,3696,5,84,0,0,3696,3697,5,69,0,0,3697,3698,5,82,0,0,3698,3699,
-        1,0,0,0,3699,3700,6,240,2,0,3700,482,1,0,0,0,3701,3702,5,83,0,0,
-        3702,3703,5,84,0,0,3703,3704,5,65,0,0,3704,3705,5,82,0,0,3705,3706,
-        5,84,0,0,3706,3707,5,79,0,0,3707,3708,5,70,0,0,3708,3709,5,89,0,
-        0,3709,3710,5,69,0,0,3710,3711,5,65,0,0,3711,3712,5,82,0,0,3712,
-        3713,1,0,0,0,3713,3714,6,241,2,0,3714,484,1,0,0,0,3715,3716,5,83,
-        0,0,3716,3717,5,84,0,0,3717,3718,5,68,0,0,3718,3719,5,69,0,0,3719,
-        3720,5,86,0,0,3720,3721,5,46,0,0,3721,3722,5,80,0,0,3722,3723,1,
-        0,0,0,3723,3724,6,242,2,0,3724,486,1,0,0,0,3725,3726,5,83,0,0,3726,
-        3727,5,84,0,0,3727,3728,5,68,0,0,3728,3729,5,69,0,0,3729,3730,5,
-        86,0,0,3730,3731,5,46,0,0,3731,3732,5,83,0,0,3732,3733,1,0,0,0,3733,
-        3734,6,243,2,0,3734,488,1,0,0,0,3735,3736,5,83,0,0,3736,3737,5,84,
-        0,0,3737,3738,5,68,0,0,3738,3739,5,69,0,0,3739,3740,5,86,0,0,3740,
-        3741,5,88,0,0,3741,3742,5,46,0,0,3742,3743,5,80,0,0,3743,3744,1,
-        0,0,0,3744,3745,6,244,2,0,3745,490,1,0,0,0,3746,3747,5,83,0,0,3747,
-        3748,5,84,0,0,3748,3749,5,68,0,0,3749,3750,5,69,0,0,3750,3751,5,
-        86,0,0,3751,3752,5,88,0,0,3752,3753,5,46,0,0,3753,3754,5,83,0,0,
-        3754,3755,1,0,0,0,3755,3756,6,245,2,0,3756,492,1,0,0,0,3757,3758,
-        5,83,0,0,3758,3759,5,85,0,0,3759,3760,5,66,0,0,3760,3761,5,83,0,
-        0,3761,3762,5,84,0,0,3762,3763,5,73,0,0,3763,3764,5,84,0,0,3764,
-        3765,5,85,0,0,3765,3766,5,84,0,0,3766,3767,5,69,0,0,3767,3768,1,
-        0,0,0,3768,3769,6,246,2,0,3769,494,1,0,0,0,3770,3771,5,83,0,0,3771,
-        3772,5,85,0,0,3772,3773,5,66,0,0,3773,3774,5,83,0,0,3774,3775,5,
-        84,0,0,3775,3776,5,73,0,0,3776,3777,5,84,0,0,3777,3778,5,85,0,0,
-        3778,3779,5,84,0,0,3779,3780,5,69,0,0,3780,3781,5,87,0,0,3781,3782,
-        5,73,0,0,3782,3783,5,84,0,0,3783,3784,5,72,0,0,3784,3785,5,73,0,
-        0,3785,3786,5,78,0,0,3786,3787,5,68,0,0,3787,3788,5,69,0,0,3788,
-        3789,5,88,0,0,3789,3790,1,0,0,0,3790,3791,6,247,2,0,3791,496,1,0,
-        0,0,3792,3793,5,83,0,0,3793,3794,5,85,0,0,3794,3795,5,77,0,0,3795,
-        3796,1,0,0,0,3796,3797,6,248,2,0,3797,498,1,0,0,0,3798,3799,5,83,
-        0,0,3799,3800,5,85,0,0,3800,3801,5,77,0,0,3801,3802,5,77,0,0,3802,
-        3803,5,65,0,0,3803,3804,5,82,0,0,3804,3805,5,73,0,0,3805,3806,5,
-        90,0,0,3806,3807,5,69,0,0,3807,3808,1,0,0,0,3808,3809,6,249,2,0,
-        3809,500,1,0,0,0,3810,3811,5,83,0,0,3811,3812,5,85,0,0,3812,3813,
-        5,77,0,0,3813,3814,5,77,0,0,3814,3815,5,65,0,0,3815,3816,5,82,0,
-        0,3816,3817,5,73,0,0,3817,3818,5,90,0,0,3818,3819,5,69,0,0,3819,
-        3820,5,67,0,0,3820,3821,5,79,0,0,3821,3822,5,76,0,0,3822,3823,5,
-        85,0,0,3823,3824,5,77,0,0,3824,3825,5,78,0,0,3825,3826,5,83,0,0,
-        3826,3827,1,0,0,0,3827,3828,6,250,2,0,3828,502,1,0,0,0,3829,3830,
-        5,83,0,0,3830,3831,5,85,0,0,3831,3832,5,77,0,0,3832,3833,5,88,0,
-        0,3833,3834,1,0,0,0,3834,3835,6,251,2,0,3835,504,1,0,0,0,3836,3837,
-        5,83,0,0,3837,3838,5,87,0,0,3838,3839,5,73,0,0,3839,3840,5,84,0,
-        0,3840,3841,5,67,0,0,3841,3842,5,72,0,0,3842,3843,1,0,0,0,3843,3844,
-        6,252,2,0,3844,506,1,0,0,0,3845,3846,5,84,0,0,3846,3847,5,46,0,0,
-        3847,3848,5,68,0,0,3848,3849,5,73,0,0,3849,3850,5,83,0,0,3850,3851,
-        5,84,0,0,3851,3852,1,0,0,0,3852,3853,6,253,2,0,3853,508,1,0,0,0,
-        3854,3855,5,84,0,0,3855,3856,5,46,0,0,3856,3857,5,68,0,0,3857,3858,
-        5,73,0,0,3858,3859,5,83,0,0,3859,3860,5,84,0,0,3860,3861,5,46,0,
-        0,3861,3862,5,50,0,0,3862,3863,5,84,0,0,3863,3864,1,0,0,0,3864,3865,
-        6,254,2,0,3865,510,1,0,0,0,3866,3867,5,84,0,0,3867,3868,5,46,0,0,
-        3868,3869,5,68,0,0,3869,3870,5,73,0,0,3870,3871,5,83,0,0,3871,3872,
-        5,84,0,0,3872,3873,5,46,0,0,3873,3874,5,82,0,0,3874,3875,5,84,0,
-        0,3875,3876,1,0,0,0,3876,3877,6,255,2,0,3877,512,1,0,0,0,3878,3879,
-        5,84,0,0,3879,3880,5,46,0,0,3880,3881,5,73,0,0,3881,3882,5,78,0,
-        0,3882,3883,5,86,0,0,3883,3884,1,0,0,0,3884,3885,6,256,2,0,3885,
-        514,1,0,0,0,3886,3887,5,84,0,0,3887,3888,5,46,0,0,3888,3889,5,73,
-        0,0,3889,3890,5,78,0,0,3890,3891,5,86,0,0,3891,3892,5,46,0,0,3892,
-        3893,5,50,0,0,3893,3894,5,84,0,0,3894,3895,1,0,0,0,3895,3896,6,257,
-        2,0,3896,516,1,0,0,0,3897,3898,5,84,0,0,3898,3899,5,65,0,0,3899,
-        3900,5,78,0,0,3900,3901,1,0,0,0,3901,3902,6,258,2,0,3902,518,1,0,
-        0,0,3903,3904,5,84,0,0,3904,3905,5,65,0,0,3905,3906,5,78,0,0,3906,
-        3907,5,72,0,0,3907,3908,1,0,0,0,3908,3909,6,259,2,0,3909,520,1,0,
-        0,0,3910,3911,5,84,0,0,3911,3912,5,73,0,0,3912,3913,5,77,0,0,3913,
-        3914,5,69,0,0,3914,3915,1,0,0,0,3915,3916,6,260,2,0,3916,522,1,0,
-        0,0,3917,3918,5,84,0,0,3918,3919,5,73,0,0,3919,3920,5,77,0,0,3920,
-        3921,5,69,0,0,3921,3922,5,86,0,0,3922,3923,5,65,0,0,3923,3924,5,
-        76,0,0,3924,3925,5,85,0,0,3925,3926,5,69,0,0,3926,3927,1,0,0,0,3927,
-        3928,6,261,2,0,3928,524,1,0,0,0,3929,3930,5,84,0,0,3930,3931,5,79,
-        0,0,3931,3932,5,68,0,0,3932,3933,5,65,0,0,3933,3934,5,89,0,0,3934,
-        3935,1,0,0,0,3935,3936,6,262,2,0,3936,526,1,0,0,0,3937,3938,5,84,
-        0,0,3938,3939,5,79,0,0,3939,3940,5,80,0,0,3940,3941,5,78,0,0,3941,
-        3942,1,0,0,0,3942,3943,6,263,2,0,3943,528,1,0,0,0,3944,3945,5,84,
-        0,0,3945,3946,5,79,0,0,3946,3947,5,80,0,0,3947,3948,5,78,0,0,3948,
-        3949,5,80,0,0,3949,3950,5,69,0,0,3950,3951,5,82,0,0,3951,3952,5,
-        76,0,0,3952,3953,5,69,0,0,3953,3954,5,86,0,0,3954,3955,5,69,0,0,
-        3955,3956,5,76,0,0,3956,3957,1,0,0,0,3957,3958,6,264,2,0,3958,530,
-        1,0,0,0,3959,3960,5,84,0,0,3960,3961,5,79,0,0,3961,3962,5,80,0,0,
-        3962,3963,5,78,0,0,3963,3964,5,83,0,0,3964,3965,5,75,0,0,3965,3966,
-        5,73,0,0,3966,3967,5,80,0,0,3967,3968,1,0,0,0,3968,3969,6,265,2,
-        0,3969,532,1,0,0,0,3970,3971,5,84,0,0,3971,3972,5,79,0,0,3972,3973,
-        5,84,0,0,3973,3974,5,65,0,0,3974,3975,5,76,0,0,3975,3976,5,77,0,
-        0,3976,3977,5,84,0,0,3977,3978,5,68,0,0,3978,3979,1,0,0,0,3979,3980,
-        6,266,2,0,3980,534,1,0,0,0,3981,3982,5,84,0,0,3982,3983,5,79,0,0,
-        3983,3984,5,84,0,0,3984,3985,5,65,0,0,3985,3986,5,76,0,0,3986,3987,
-        5,81,0,0,3987,3988,5,84,0,0,3988,3989,5,68,0,0,3989,3990,1,0,0,0,
-        3990,3991,6,267,2,0,3991,536,1,0,0,0,3992,3993,5,84,0,0,3993,3994,
-        5,79,0,0,3994,3995,5,84,0,0,3995,3996,5,65,0,0,3996,3997,5,76,0,
-        0,3997,3998,5,89,0,0,3998,3999,5,84,0,0,3999,4000,5,68,0,0,4000,
-        4001,1,0,0,0,4001,4002,6,268,2,0,4002,538,1,0,0,0,4003,4004,5,84,
-        0,0,4004,4005,5,82,0,0,4005,4006,5,69,0,0,4006,4007,5,65,0,0,4007,
-        4008,5,84,0,0,4008,4009,5,65,0,0,4009,4010,5,83,0,0,4010,4011,1,
-        0,0,0,4011,4012,6,269,2,0,4012,540,1,0,0,0,4013,4014,5,84,0,0,4014,
-        4015,5,82,0,0,4015,4016,5,73,0,0,4016,4017,5,77,0,0,4017,4018,1,
-        0,0,0,4018,4019,6,270,2,0,4019,542,1,0,0,0,4020,4021,5,84,0,0,4021,
-        4022,5,82,0,0,4022,4023,5,85,0,0,4023,4024,5,69,0,0,4024,4025,1,
-        0,0,0,4025,4026,6,271,2,0,4026,544,1,0,0,0,4027,4028,5,84,0,0,4028,
-        4029,5,82,0,0,4029,4030,5,85,0,0,4030,4031,5,78,0,0,4031,4032,5,
-        67,0,0,4032,4033,1,0,0,0,4033,4034,6,272,2,0,4034,546,1,0,0,0,4035,
-        4036,5,85,0,0,4036,4037,5,78,0,0,4037,4038,5,73,0,0,4038,4039,5,
-        67,0,0,4039,4040,5,72,0,0,4040,4041,5,65,0,0,4041,4042,5,82,0,0,
-        4042,4043,1,0,0,0,4043,4044,6,273,2,0,4044,548,1,0,0,0,4045,4046,
-        5,85,0,0,4046,4047,5,78,0,0,4047,4048,5,73,0,0,4048,4049,5,67,0,
-        0,4049,4050,5,79,0,0,4050,4051,5,68,0,0,4051,4052,5,69,0,0,4052,
-        4053,1,0,0,0,4053,4054,6,274,2,0,4054,550,1,0,0,0,4055,4056,5,85,
-        0,0,4056,4057,5,78,0,0,4057,4058,5,73,0,0,4058,4059,5,79,0,0,4059,
-        4060,5,78,0,0,4060,4061,1,0,0,0,4061,4062,6,275,2,0,4062,552,1,0,
-        0,0,4063,4064,5,85,0,0,4064,4065,5,80,0,0,4065,4066,5,80,0,0,4066,
-        4067,5,69,0,0,4067,4068,5,82,0,0,4068,4069,1,0,0,0,4069,4070,6,276,
-        2,0,4070,554,1,0,0,0,4071,4072,5,85,0,0,4072,4073,5,83,0,0,4073,
-        4074,5,69,0,0,4074,4075,5,82,0,0,4075,4076,5,69,0,0,4076,4077,5,
-        76,0,0,4077,4078,5,65,0,0,4078,4079,5,84,0,0,4079,4080,5,73,0,0,
-        4080,4081,5,79,0,0,4081,4082,5,78,0,0,4082,4083,5,83,0,0,4083,4084,
-        5,72,0,0,4084,4085,5,73,0,0,4085,4086,5,80,0,0,4086,4087,1,0,0,0,
-        4087,4088,6,277,2,0,4088,556,1,0,0,0,4089,4090,5,85,0,0,4090,4091,
-        5,83,0,0,4091,4092,5,69,0,0,4092,4093,5,82,0,0,4093,4094,5,78,0,
-        0,4094,4095,5,65,0,0,4095,4096,5,77,0,0,4096,4097,5,69,0,0,4097,
-        4098,1,0,0,0,4098,4099,6,278,2,0,4099,558,1,0,0,0,4100,4101,5,85,
-        0,0,4101,4102,5,83,0,0,4102,4103,5,69,0,0,4103,4104,5,82,0,0,4104,
-        4105,5,79,0,0,4105,4106,5,66,0,0,4106,4107,5,74,0,0,4107,4108,5,
-        69,0,0,4108,4109,5,67,0,0,4109,4110,5,84,0,0,4110,4111,5,73,0,0,
-        4111,4112,5,68,0,0,4112,4113,1,0,0,0,4113,4114,6,279,2,0,4114,560,
-        1,0,0,0,4115,4116,5,85,0,0,4116,4117,5,83,0,0,4117,4118,5,69,0,0,
-        4118,4119,5,82,0,0,4119,4120,5,80,0,0,4120,4121,5,82,0,0,4121,4122,
-        5,73,0,0,4122,4123,5,78,0,0,4123,4124,5,67,0,0,4124,4125,5,73,0,
-        0,4125,4126,5,80,0,0,4126,4127,5,65,0,0,4127,4128,5,76,0,0,4128,
-        4129,5,78,0,0,4129,4130,5,65,0,0,4130,4131,5,77,0,0,4131,4132,5,
-        69,0,0,4132,4133,1,0,0,0,4133,4134,6,280,2,0,4134,562,1,0,0,0,4135,
-        4136,5,85,0,0,4136,4137,5,84,0,0,4137,4138,5,67,0,0,4138,4139,5,
-        78,0,0,4139,4140,5,79,0,0,4140,4141,5,87,0,0,4141,4142,1,0,0,0,4142,
-        4143,6,281,2,0,4143,564,1,0,0,0,4144,4145,5,85,0,0,4145,4146,5,84,
-        0,0,4146,4147,5,67,0,0,4147,4148,5,84,0,0,4148,4149,5,79,0,0,4149,
-        4150,5,68,0,0,4150,4151,5,65,0,0,4151,4152,5,89,0,0,4152,4153,1,
-        0,0,0,4153,4154,6,282,2,0,4154,566,1,0,0,0,4155,4156,5,86,0,0,4156,
-        4157,5,65,0,0,4157,4158,5,76,0,0,4158,4159,5,85,0,0,4159,4160,5,
-        69,0,0,4160,4161,1,0,0,0,4161,4162,6,283,2,0,4162,568,1,0,0,0,4163,
-        4164,5,86,0,0,4164,4165,5,65,0,0,4165,4166,5,76,0,0,4166,4167,5,
-        85,0,0,4167,4168,5,69,0,0,4168,4169,5,83,0,0,4169,4170,1,0,0,0,4170,
-        4171,6,284,2,0,4171,570,1,0,0,0,4172,4173,5,86,0,0,4173,4174,5,65,
-        0,0,4174,4175,5,82,0,0,4175,4176,5,46,0,0,4176,4177,5,80,0,0,4177,
-        4178,1,0,0,0,4178,4179,6,285,2,0,4179,572,1,0,0,0,4180,4181,5,86,
-        0,0,4181,4182,5,65,0,0,4182,4183,5,82,0,0,4183,4184,5,46,0,0,4184,
-        4185,5,83,0,0,4185,4186,1,0,0,0,4186,4187,6,286,2,0,4187,574,1,0,
-        0,0,4188,4189,5,86,0,0,4189,4190,5,65,0,0,4190,4191,5,82,0,0,4191,
-        4192,5,88,0,0,4192,4193,5,46,0,0,4193,4194,5,80,0,0,4194,4195,1,
-        0,0,0,4195,4196,6,287,2,0,4196,576,1,0,0,0,4197,4198,5,86,0,0,4198,
-        4199,5,65,0,0,4199,4200,5,82,0,0,4200,4201,5,88,0,0,4201,4202,5,
-        46,0,0,4202,4203,5,83,0,0,4203,4204,1,0,0,0,4204,4205,6,288,2,0,
-        4205,578,1,0,0,0,4206,4207,5,87,0,0,4207,4208,5,69,0,0,4208,4209,
-        5,69,0,0,4209,4210,5,75,0,0,4210,4211,5,68,0,0,4211,4212,5,65,0,
-        0,4212,4213,5,89,0,0,4213,4214,1,0,0,0,4214,4215,6,289,2,0,4215,
-        580,1,0,0,0,4216,4217,5,89,0,0,4217,4218,5,69,0,0,4218,4219,5,65,
-        0,0,4219,4220,5,82,0,0,4220,4221,5,70,0,0,4221,4222,5,82,0,0,4222,
-        4223,5,65,0,0,4223,4224,5,67,0,0,4224,4225,1,0,0,0,4225,4226,6,290,
-        2,0,4226,582,1,0,0,0,4227,4228,5,87,0,0,4228,4229,5,69,0,0,4229,
-        4230,5,69,0,0,4230,4231,5,75,0,0,4231,4232,5,78,0,0,4232,4233,5,
-        85,0,0,4233,4234,5,77,0,0,4234,4235,1,0,0,0,4235,4236,6,291,2,0,
-        4236,584,1,0,0,0,4237,4238,5,88,0,0,4238,4239,5,73,0,0,4239,4240,
-        5,82,0,0,4240,4241,5,82,0,0,4241,4242,1,0,0,0,4242,4243,6,292,2,
-        0,4243,586,1,0,0,0,4244,4245,5,88,0,0,4245,4246,5,78,0,0,4246,4247,
-        5,80,0,0,4247,4248,5,86,0,0,4248,4249,1,0,0,0,4249,4250,6,293,2,
-        0,4250,588,1,0,0,0,4251,4252,5,89,0,0,4252,4253,5,69,0,0,4253,4254,
-        5,65,0,0,4254,4255,5,82,0,0,4255,4256,1,0,0,0,4256,4257,6,294,2,
-        0,4257,590,1,0,0,0,4258,4259,5,65,0,0,4259,4260,5,67,0,0,4260,4261,
-        5,67,0,0,4261,4262,5,82,0,0,4262,4263,5,73,0,0,4263,4264,5,78,0,
-        0,4264,4265,5,84,0,0,4265,4266,1,0,0,0,4266,4267,6,295,2,0,4267,
-        592,1,0,0,0,4268,4269,5,65,0,0,4269,4270,5,67,0,0,4270,4271,5,67,
-        0,0,4271,4272,5,82,0,0,4272,4273,5,73,0,0,4273,4274,5,78,0,0,4274,
-        4275,5,84,0,0,4275,4276,5,77,0,0,4276,4277,1,0,0,0,4277,4278,6,296,
-        2,0,4278,594,1,0,0,0,4279,4280,5,65,0,0,4280,4281,5,77,0,0,4281,
-        4282,5,79,0,0,4282,4283,5,82,0,0,4283,4284,5,68,0,0,4284,4285,5,
-        69,0,0,4285,4286,5,71,0,0,4286,4287,5,82,0,0,4287,4288,5,67,0,0,
-        4288,4289,1,0,0,0,4289,4290,6,297,2,0,4290,596,1,0,0,0,4291,4292,
-        5,65,0,0,4292,4293,5,77,0,0,4293,4294,5,79,0,0,4294,4295,5,82,0,
-        0,4295,4296,5,76,0,0,4296,4297,5,73,0,0,4297,4298,5,78,0,0,4298,
-        4299,5,67,0,0,4299,4300,1,0,0,0,4300,4301,6,298,2,0,4301,598,1,0,
-        0,0,4302,4303,5,67,0,0,4303,4304,5,79,0,0,4304,4305,5,85,0,0,4305,
-        4306,5,80,0,0,4306,4307,5,68,0,0,4307,4308,5,65,0,0,4308,4309,5,
-        89,0,0,4309,4310,5,66,0,0,4310,4311,5,83,0,0,4311,4312,1,0,0,0,4312,
-        4313,6,299,2,0,4313,600,1,0,0,0,4314,4315,5,67,0,0,4315,4316,5,79,
-        0,0,4316,4317,5,85,0,0,4317,4318,5,80,0,0,4318,4319,5,68,0,0,4319,
-        4320,5,65,0,0,4320,4321,5,89,0,0,4321,4322,5,83,0,0,4322,4323,1,
-        0,0,0,4323,4324,6,300,2,0,4324,602,1,0,0,0,4325,4326,5,67,0,0,4326,
-        4327,5,79,0,0,4327,4328,5,85,0,0,4328,4329,5,80,0,0,4329,4330,5,
-        68,0,0,4330,4331,5,65,0,0,4331,4332,5,89,0,0,4332,4333,5,83,0,0,
-        4333,4334,5,78,0,0,4334,4335,5,67,0,0,4335,4336,1,0,0,0,4336,4337,
-        6,301,2,0,4337,604,1,0,0,0,4338,4339,5,67,0,0,4339,4340,5,79,0,0,
-        4340,4341,5,85,0,0,4341,4342,5,80,0,0,4342,4343,5,78,0,0,4343,4344,
-        5,67,0,0,4344,4345,5,68,0,0,4345,4346,1,0,0,0,4346,4347,6,302,2,
-        0,4347,606,1,0,0,0,4348,4349,5,67,0,0,4349,4350,5,79,0,0,4350,4351,
-        5,85,0,0,4351,4352,5,80,0,0,4352,4353,5,78,0,0,4353,4354,5,85,0,
-        0,4354,4355,5,77,0,0,4355,4356,1,0,0,0,4356,4357,6,303,2,0,4357,
-        608,1,0,0,0,4358,4359,5,67,0,0,4359,4360,5,79,0,0,4360,4361,5,85,
-        0,0,4361,4362,5,80,0,0,4362,4363,5,80,0,0,4363,4364,5,67,0,0,4364,
-        4365,5,68,0,0,4365,4366,1,0,0,0,4366,4367,6,304,2,0,4367,610,1,0,
-        0,0,4368,4369,5,67,0,0,4369,4370,5,85,0,0,4370,4371,5,77,0,0,4371,
-        4372,5,73,0,0,4372,4373,5,80,0,0,4373,4374,5,77,0,0,4374,4375,5,
-        84,0,0,4375,4376,1,0,0,0,4376,4377,6,305,2,0,4377,612,1,0,0,0,4378,
-        4379,5,67,0,0,4379,4380,5,85,0,0,4380,4381,5,77,0,0,4381,4382,5,
-        80,0,0,4382,4383,5,82,0,0,4383,4384,5,73,0,0,4384,4385,5,78,0,0,
-        4385,4386,5,67,0,0,4386,4387,1,0,0,0,4387,4388,6,306,2,0,4388,614,
-        1,0,0,0,4389,4390,5,68,0,0,4390,4391,5,66,0,0,4391,4392,1,0,0,0,
-        4392,4393,6,307,2,0,4393,616,1,0,0,0,4394,4395,5,68,0,0,4395,4396,
-        5,68,0,0,4396,4397,5,66,0,0,4397,4398,1,0,0,0,4398,4399,6,308,2,
-        0,4399,618,1,0,0,0,4400,4401,5,68,0,0,4401,4402,5,73,0,0,4402,4403,
-        5,83,0,0,4403,4404,5,67,0,0,4404,4405,1,0,0,0,4405,4406,6,309,2,
-        0,4406,620,1,0,0,0,4407,4408,5,68,0,0,4408,4409,5,79,0,0,4409,4410,
-        5,76,0,0,4410,4411,5,76,0,0,4411,4412,5,65,0,0,4412,4413,5,82,0,
-        0,4413,4414,5,68,0,0,4414,4415,5,69,0,0,4415,4416,1,0,0,0,4416,4417,
-        6,310,2,0,4417,622,1,0,0,0,4418,4419,5,68,0,0,4419,4420,5,79,0,0,
-        4420,4421,5,76,0,0,4421,4422,5,76,0,0,4422,4423,5,65,0,0,4423,4424,
-        5,82,0,0,4424,4425,5,70,0,0,4425,4426,5,82,0,0,4426,4427,1,0,0,0,
-        4427,4428,6,311,2,0,4428,624,1,0,0,0,4429,4430,5,68,0,0,4430,4431,
-        5,85,0,0,4431,4432,5,82,0,0,4432,4433,5,65,0,0,4433,4434,5,84,0,
-        0,4434,4435,5,73,0,0,4435,4436,5,79,0,0,4436,4437,5,78,0,0,4437,
-        4438,1,0,0,0,4438,4439,6,312,2,0,4439,626,1,0,0,0,4440,4441,5,69,
-        0,0,4441,4442,5,70,0,0,4442,4443,5,70,0,0,4443,4444,5,69,0,0,4444,
-        4445,5,67,0,0,4445,4446,5,84,0,0,4446,4447,1,0,0,0,4447,4448,6,313,
-        2,0,4448,628,1,0,0,0,4449,4450,5,70,0,0,4450,4451,5,86,0,0,4451,
-        4452,1,0,0,0,4452,4453,6,314,2,0,4453,630,1,0,0,0,4454,4455,5,73,
-        0,0,4455,4456,5,78,0,0,4456,4457,5,84,0,0,4457,4458,5,82,0,0,4458,
-        4459,5,65,0,0,4459,4460,5,84,0,0,4460,4461,5,69,0,0,4461,4462,1,
-        0,0,0,4462,4463,6,315,2,0,4463,632,1,0,0,0,4464,4465,5,73,0,0,4465,
-        4466,5,80,0,0,4466,4467,5,77,0,0,4467,4468,5,84,0,0,4468,4469,1,
-        0,0,0,4469,4470,6,316,2,0,4470,634,1,0,0,0,4471,4472,5,73,0,0,4472,
-        4473,5,83,0,0,4473,4474,5,80,0,0,4474,4475,5,77,0,0,4475,4476,5,
-        84,0,0,4476,4477,1,0,0,0,4477,4478,6,317,2,0,4478,636,1,0,0,0,4479,
-        4480,5,77,0,0,4480,4481,5,68,0,0,4481,4482,5,85,0,0,4482,4483,5,
-        82,0,0,4483,4484,5,65,0,0,4484,4485,5,84,0,0,4485,4486,5,73,0,0,
-        4486,4487,5,79,0,0,4487,4488,5,78,0,0,4488,4489,1,0,0,0,4489,4490,
-        6,318,2,0,4490,638,1,0,0,0,4491,4492,5,78,0,0,4492,4493,5,79,0,0,
-        4493,4494,5,77,0,0,4494,4495,5,73,0,0,4495,4496,5,78,0,0,4496,4497,
-        5,65,0,0,4497,4498,5,76,0,0,4498,4499,1,0,0,0,4499,4500,6,319,2,
-        0,4500,640,1,0,0,0,4501,4502,5,78,0,0,4502,4503,5,80,0,0,4503,4504,
-        5,69,0,0,4504,4505,5,82,0,0,4505,4506,1,0,0,0,4506,4507,6,320,2,
-        0,4507,642,1,0,0,0,4508,4509,5,79,0,0,4509,4510,5,68,0,0,4510,4511,
-        5,68,0,0,4511,4512,5,70,0,0,4512,4513,5,80,0,0,4513,4514,5,82,0,
-        0,4514,4515,5,73,0,0,4515,4516,5,67,0,0,4516,4517,5,69,0,0,4517,
-        4518,1,0,0,0,4518,4519,6,321,2,0,4519,644,1,0,0,0,4520,4521,5,79,
-        0,0,4521,4522,5,68,0,0,4522,4523,5,68,0,0,4523,4524,5,70,0,0,4524,
-        4525,5,89,0,0,4525,4526,5,73,0,0,4526,4527,5,69,0,0,4527,4528,5,
-        76,0,0,4528,4529,5,68,0,0,4529,4530,1,0,0,0,4530,4531,6,322,2,0,
-        4531,646,1,0,0,0,4532,4533,5,79,0,0,4533,4534,5,68,0,0,4534,4535,
-        5,68,0,0,4535,4536,5,76,0,0,4536,4537,5,80,0,0,4537,4538,5,82,0,
-        0,4538,4539,5,73,0,0,4539,4540,5,67,0,0,4540,4541,5,69,0,0,4541,
-        4542,1,0,0,0,4542,4543,6,323,2,0,4543,648,1,0,0,0,4544,4545,5,79,
-        0,0,4545,4546,5,68,0,0,4546,4547,5,68,0,0,4547,4548,5,76,0,0,4548,
-        4549,5,89,0,0,4549,4550,5,73,0,0,4550,4551,5,69,0,0,4551,4552,5,
-        76,0,0,4552,4553,5,68,0,0,4553,4554,1,0,0,0,4554,4555,6,324,2,0,
-        4555,650,1,0,0,0,4556,4557,5,80,0,0,4557,4558,5,68,0,0,4558,4559,
-        5,85,0,0,4559,4560,5,82,0,0,4560,4561,5,65,0,0,4561,4562,5,84,0,
-        0,4562,4563,5,73,0,0,4563,4564,5,79,0,0,4564,4565,5,78,0,0,4565,
-        4566,1,0,0,0,4566,4567,6,325,2,0,4567,652,1,0,0,0,4568,4569,5,80,
-        0,0,4569,4570,5,77,0,0,4570,4571,5,84,0,0,4571,4572,1,0,0,0,4572,
-        4573,6,326,2,0,4573,654,1,0,0,0,4574,4575,5,80,0,0,4575,4576,5,80,
-        0,0,4576,4577,5,77,0,0,4577,4578,5,84,0,0,4578,4579,1,0,0,0,4579,
-        4580,6,327,2,0,4580,656,1,0,0,0,4581,4582,5,80,0,0,4582,4583,5,82,
-        0,0,4583,4584,5,73,0,0,4584,4585,5,67,0,0,4585,4586,5,69,0,0,4586,
-        4587,1,0,0,0,4587,4588,6,328,2,0,4588,658,1,0,0,0,4589,4590,5,80,
-        0,0,4590,4591,5,82,0,0,4591,4592,5,73,0,0,4592,4593,5,67,0,0,4593,
-        4594,5,69,0,0,4594,4595,5,68,0,0,4595,4596,5,73,0,0,4596,4597,5,
-        83,0,0,4597,4598,5,67,0,0,4598,4599,1,0,0,0,4599,4600,6,329,2,0,
-        4600,660,1,0,0,0,4601,4602,5,80,0,0,4602,4603,5,82,0,0,4603,4604,
-        5,73,0,0,4604,4605,5,67,0,0,4605,4606,5,69,0,0,4606,4607,5,77,0,
-        0,4607,4608,5,65,0,0,4608,4609,5,84,0,0,4609,4610,1,0,0,0,4610,4611,
-        6,330,2,0,4611,662,1,0,0,0,4612,4613,5,80,0,0,4613,4614,5,86,0,0,
-        4614,4615,1,0,0,0,4615,4616,6,331,2,0,4616,664,1,0,0,0,4617,4618,
-        5,82,0,0,4618,4619,5,65,0,0,4619,4620,5,84,0,0,4620,4621,5,69,0,
-        0,4621,4622,1,0,0,0,4622,4623,6,332,2,0,4623,666,1,0,0,0,4624,4625,
-        5,82,0,0,4625,4626,5,69,0,0,4626,4627,5,67,0,0,4627,4628,5,69,0,
-        0,4628,4629,5,73,0,0,4629,4630,5,86,0,0,4630,4631,5,69,0,0,4631,
-        4632,5,68,0,0,4632,4633,1,0,0,0,4633,4634,6,333,2,0,4634,668,1,0,
-        0,0,4635,4636,5,82,0,0,4636,4637,5,82,0,0,4637,4638,5,73,0,0,4638,
-        4639,1,0,0,0,4639,4640,6,334,2,0,4640,670,1,0,0,0,4641,4642,5,83,
-        0,0,4642,4643,5,76,0,0,4643,4644,5,78,0,0,4644,4645,1,0,0,0,4645,
-        4646,6,335,2,0,4646,672,1,0,0,0,4647,4648,5,83,0,0,4648,4649,5,89,
-        0,0,4649,4650,5,68,0,0,4650,4651,1,0,0,0,4651,4652,6,336,2,0,4652,
-        674,1,0,0,0,4653,4654,5,84,0,0,4654,4655,5,66,0,0,4655,4656,5,73,
-        0,0,4656,4657,5,76,0,0,4657,4658,5,76,0,0,4658,4659,5,69,0,0,4659,
-        4660,5,81,0,0,4660,4661,1,0,0,0,4661,4662,6,337,2,0,4662,676,1,0,
-        0,0,4663,4664,5,84,0,0,4664,4665,5,66,0,0,4665,4666,5,73,0,0,4666,
-        4667,5,76,0,0,4667,4668,5,76,0,0,4668,4669,5,80,0,0,4669,4670,5,
-        82,0,0,4670,4671,5,73,0,0,4671,4672,5,67,0,0,4672,4673,5,69,0,0,
-        4673,4674,1,0,0,0,4674,4675,6,338,2,0,4675,678,1,0,0,0,4676,4677,
-        5,84,0,0,4677,4678,5,66,0,0,4678,4679,5,73,0,0,4679,4680,5,76,0,
-        0,4680,4681,5,76,0,0,4681,4682,5,89,0,0,4682,4683,5,73,0,0,4683,
-        4684,5,69,0,0,4684,4685,5,76,0,0,4685,4686,5,68,0,0,4686,4687,1,
-        0,0,0,4687,4688,6,339,2,0,4688,680,1,0,0,0,4689,4690,5,86,0,0,4690,
-        4691,5,68,0,0,4691,4692,5,66,0,0,4692,4693,1,0,0,0,4693,4694,6,340,
-        2,0,4694,682,1,0,0,0,4695,4696,5,89,0,0,4696,4697,5,73,0,0,4697,
-        4698,5,69,0,0,4698,4699,5,76,0,0,4699,4700,5,68,0,0,4700,4701,1,
-        0,0,0,4701,4702,6,341,2,0,4702,684,1,0,0,0,4703,4704,5,89,0,0,4704,
-        4705,5,73,0,0,4705,4706,5,69,0,0,4706,4707,5,76,0,0,4707,4708,5,
-        68,0,0,4708,4709,5,68,0,0,4709,4710,5,73,0,0,4710,4711,5,83,0,0,
-        4711,4712,5,67,0,0,4712,4713,1,0,0,0,4713,4714,6,342,2,0,4714,686,
-        1,0,0,0,4715,4716,5,89,0,0,4716,4717,5,73,0,0,4717,4718,5,69,0,0,
-        4718,4719,5,76,0,0,4719,4720,5,68,0,0,4720,4721,5,77,0,0,4721,4722,
-        5,65,0,0,4722,4723,5,84,0,0,4723,4724,1,0,0,0,4724,4725,6,343,2,
-        0,4725,688,1,0,0,0,4726,4727,5,83,0,0,4727,4728,5,65,0,0,4728,4729,
-        5,77,0,0,4729,4730,5,80,0,0,4730,4731,5,76,0,0,4731,4732,5,69,0,
-        0,4732,4733,5,65,0,0,4733,4734,5,88,0,0,4734,4735,5,73,0,0,4735,
-        4736,5,83,0,0,4736,4737,5,87,0,0,4737,4738,5,73,0,0,4738,4739,5,
-        84,0,0,4739,4740,5,72,0,0,4740,4741,5,76,0,0,4741,4742,5,79,0,0,
-        4742,4743,5,67,0,0,4743,4744,5,65,0,0,4744,4745,5,76,0,0,4745,4746,
-        5,77,0,0,4746,4747,5,73,0,0,4747,4748,5,78,0,0,4748,4749,5,77,0,
-        0,4749,4750,5,65,0,0,4750,4751,5,88,0,0,4751,4752,1,0,0,0,4752,4753,
-        6,344,2,0,4753,690,1,0,0,0,4754,4755,5,69,0,0,4755,4756,5,86,0,0,
-        4756,4757,5,65,0,0,4757,4758,5,76,0,0,4758,4759,5,85,0,0,4759,4760,
-        5,65,0,0,4760,4761,5,84,0,0,4761,4762,5,69,0,0,4762,4763,5,65,0,
-        0,4763,4764,5,78,0,0,4764,4765,5,68,0,0,4765,4766,5,76,0,0,4766,
-        4767,5,79,0,0,4767,4768,5,71,0,0,4768,4769,1,0,0,0,4769,4770,6,345,
-        2,0,4770,692,1,0,0,0,4771,4772,5,79,0,0,4772,4773,5,70,0,0,4773,
-        4774,5,70,0,0,4774,4775,5,83,0,0,4775,4776,5,69,0,0,4776,4777,5,
-        84,0,0,4777,4778,1,0,0,0,4778,4779,6,346,2,0,4779,694,1,0,0,0,4780,
-        4781,5,73,0,0,4781,4782,5,78,0,0,4782,4783,5,68,0,0,4783,4784,5,
-        69,0,0,4784,4785,5,88,0,0,4785,4786,1,0,0,0,4786,4787,6,347,2,0,
-        4787,696,1,0,0,0,4788,4789,5,87,0,0,4789,4790,5,73,0,0,4790,4791,
-        5,78,0,0,4791,4792,5,68,0,0,4792,4793,5,79,0,0,4793,4794,5,87,0,
-        0,4794,4795,1,0,0,0,4795,4796,6,348,2,0,4796,698,1,0,0,0,4797,4798,
-        5,79,0,0,4798,4799,5,82,0,0,4799,4800,5,68,0,0,4800,4801,5,69,0,
-        0,4801,4802,5,82,0,0,4802,4803,5,66,0,0,4803,4804,5,89,0,0,4804,
-        4805,1,0,0,0,4805,4806,6,349,2,0,4806,700,1,0,0,0,4807,4808,5,82,
-        0,0,4808,4809,5,65,0,0,4809,4810,5,78,0,0,4810,4811,5,75,0,0,4811,
-        4812,1,0,0,0,4812,4813,6,350,2,0,4813,702,1,0,0,0,4814,4815,5,82,
-        0,0,4815,4816,5,79,0,0,4816,4817,5,87,0,0,4817,4818,5,78,0,0,4818,
-        4819,5,85,0,0,4819,4820,5,77,0,0,4820,4821,5,66,0,0,4821,4822,5,
-        69,0,0,4822,4823,5,82,0,0,4823,4824,1,0,0,0,4824,4825,6,351,2,0,
-        4825,704,1,0,0,0,4826,4827,5,80,0,0,4827,4828,5,65,0,0,4828,4829,
-        5,82,0,0,4829,4830,5,84,0,0,4830,4831,5,73,0,0,4831,4832,5,84,0,
-        0,4832,4833,5,73,0,0,4833,4834,5,79,0,0,4834,4835,5,78,0,0,4835,
-        4836,5,66,0,0,4836,4837,5,89,0,0,4837,4838,1,0,0,0,4838,4839,6,352,
-        2,0,4839,706,1,0,0,0,4840,4841,5,69,0,0,4841,4842,5,88,0,0,4842,
-        4843,5,84,0,0,4843,4844,5,69,0,0,4844,4845,5,82,0,0,4845,4846,5,
-        78,0,0,4846,4847,5,65,0,0,4847,4848,5,76,0,0,4848,4849,5,77,0,0,
-        4849,4850,5,69,0,0,4850,4851,5,65,0,0,4851,4852,5,83,0,0,4852,4853,
-        5,85,0,0,4853,4854,5,82,0,0,4854,4855,5,69,0,0,4855,4856,1,0,0,0,
-        4856,4857,6,353,2,0,4857,708,1,0,0,0,4858,4859,5,75,0,0,4859,4860,
-        5,77,0,0,4860,4861,5,69,0,0,4861,4862,5,65,0,0,4862,4863,5,78,0,
-        0,4863,4864,5,83,0,0,4864,4865,5,67,0,0,4865,4866,5,76,0,0,4866,
-        4867,5,85,0,0,4867,4868,5,83,0,0,4868,4869,5,84,0,0,4869,4870,5,
-        69,0,0,4870,4871,5,82,0,0,4871,4872,5,73,0,0,4872,4873,5,78,0,0,
-        4873,4874,5,71,0,0,4874,4875,1,0,0,0,4875,4876,6,354,2,0,4876,710,
-        1,0,0,0,4877,4878,5,68,0,0,4878,4879,5,69,0,0,4879,4880,5,70,0,0,
-        4880,4881,5,73,0,0,4881,4882,5,78,0,0,4882,4883,5,69,0,0,4883,4884,
-        1,0,0,0,4884,4885,6,355,2,0,4885,712,1,0,0,0,4886,4887,5,69,0,0,
-        4887,4888,5,86,0,0,4888,4889,5,65,0,0,4889,4890,5,76,0,0,4890,4891,
-        5,85,0,0,4891,4892,5,65,0,0,4892,4893,5,84,0,0,4893,4894,5,69,0,
-        0,4894,4895,1,0,0,0,4895,4896,6,356,2,0,4896,714,1,0,0,0,4897,4898,
-        5,79,0,0,4898,4899,5,82,0,0,4899,4900,5,68,0,0,4900,4901,5,69,0,
-        0,4901,4902,5,82,0,0,4902,4903,1,0,0,0,4903,4904,6,357,2,0,4904,
-        716,1,0,0,0,4905,4906,5,66,0,0,4906,4907,5,89,0,0,4907,4908,1,0,
-        0,0,4908,4909,6,358,2,0,4909,718,1,0,0,0,4910,4911,5,83,0,0,4911,
-        4912,5,84,0,0,4912,4913,5,65,0,0,4913,4914,5,82,0,0,4914,4915,5,
-        84,0,0,4915,4916,1,0,0,0,4916,4917,6,359,2,0,4917,720,1,0,0,0,4918,
-        4919,5,65,0,0,4919,4920,5,84,0,0,4920,4921,1,0,0,0,4921,4922,6,360,
-        2,0,4922,722,1,0,0,0,4923,4924,5,82,0,0,4924,4925,5,69,0,0,4925,
-        4926,5,84,0,0,4926,4927,5,85,0,0,4927,4928,5,82,0,0,4928,4929,5,
-        78,0,0,4929,4930,1,0,0,0,4930,4931,6,361,2,0,4931,724,1,0,0,0,4932,
-        4933,5,86,0,0,4933,4934,5,65,0,0,4934,4935,5,82,0,0,4935,4936,1,
-        0,0,0,4936,4937,6,362,2,0,4937,726,1,0,0,0,4938,4939,5,73,0,0,4939,
-        4940,5,78,0,0,4940,4941,1,0,0,0,4941,4942,6,363,2,0,4942,728,1,0,
-        0,0,4943,4944,5,65,0,0,4944,4945,5,83,0,0,4945,4946,5,67,0,0,4946,
-        4947,1,0,0,0,4947,4948,6,364,2,0,4948,730,1,0,0,0,4949,4950,5,68,
-        0,0,4950,4951,5,69,0,0,4951,4952,5,83,0,0,4952,4953,5,67,0,0,4953,
-        4954,1,0,0,0,4954,4955,6,365,2,0,4955,732,1,0,0,0,4956,4957,5,83,
-        0,0,4957,4958,5,75,0,0,4958,4959,5,73,0,0,4959,4960,5,80,0,0,4960,
-        4961,1,0,0,0,4961,4962,6,366,2,0,4962,734,1,0,0,0,4963,4964,5,68,
-        0,0,4964,4965,5,69,0,0,4965,4966,5,78,0,0,4966,4967,5,83,0,0,4967,
-        4968,5,69,0,0,4968,4969,1,0,0,0,4969,4970,6,367,2,0,4970,736,1,0,
-        0,0,4971,4972,5,66,0,0,4972,4973,5,76,0,0,4973,4974,5,65,0,0,4974,
-        4975,5,78,0,0,4975,4976,5,75,0,0,4976,4977,5,83,0,0,4977,4978,1,
-        0,0,0,4978,4979,6,368,2,0,4979,738,1,0,0,0,4980,4981,5,76,0,0,4981,
-        4982,5,65,0,0,4982,4983,5,83,0,0,4983,4984,5,84,0,0,4984,4985,1,
-        0,0,0,4985,4986,6,369,2,0,4986,740,1,0,0,0,4987,4988,5,70,0,0,4988,
-        4989,5,73,0,0,4989,4990,5,82,0,0,4990,4991,5,83,0,0,4991,4992,5,
-        84,0,0,4992,4993,1,0,0,0,4993,4994,6,370,2,0,4994,742,1,0,0,0,4995,
-        4996,5,87,0,0,4996,4997,5,69,0,0,4997,4998,5,69,0,0,4998,4999,5,
-        75,0,0,4999,5000,1,0,0,0,5000,5001,6,371,2,0,5001,744,1,0,0,0,5002,
-        5003,5,66,0,0,5003,5004,5,79,0,0,5004,5005,5,84,0,0,5005,5006,5,
-        72,0,0,5006,5007,1,0,0,0,5007,5008,6,372,2,0,5008,746,1,0,0,0,5009,
-        5010,5,78,0,0,5010,5011,5,79,0,0,5011,5012,5,78,0,0,5012,5013,5,
-        69,0,0,5013,5014,1,0,0,0,5014,5015,6,373,2,0,5015,748,1,0,0,0,5016,
-        5017,5,79,0,0,5017,5018,5,78,0,0,5018,5019,5,69,0,0,5019,5020,5,
-        87,0,0,5020,5021,5,65,0,0,5021,5022,5,89,0,0,5022,5023,1,0,0,0,5023,
-        5024,6,374,2,0,5024,750,1,0,0,0,5025,5026,5,79,0,0,5026,5027,5,78,
-        0,0,5027,5028,5,69,0,0,5028,5029,5,87,0,0,5029,5030,5,65,0,0,5030,
-        5031,5,89,0,0,5031,5032,5,95,0,0,5032,5033,5,82,0,0,5033,5034,5,
-        73,0,0,5034,5035,5,71,0,0,5035,5036,5,72,0,0,5036,5037,5,84,0,0,
-        5037,5038,5,70,0,0,5038,5039,5,73,0,0,5039,5040,5,76,0,0,5040,5041,
-        5,84,0,0,5041,5042,5,69,0,0,5042,5043,5,82,0,0,5043,5044,5,83,0,
-        0,5044,5045,5,76,0,0,5045,5046,5,69,0,0,5046,5047,5,70,0,0,5047,
-        5048,5,84,0,0,5048,5049,1,0,0,0,5049,5050,6,375,2,0,5050,752,1,0,
-        0,0,5051,5052,5,79,0,0,5052,5053,5,78,0,0,5053,5054,5,69,0,0,5054,
-        5055,5,87,0,0,5055,5056,5,65,0,0,5056,5057,5,89,0,0,5057,5058,5,
-        95,0,0,5058,5059,5,76,0,0,5059,5060,5,69,0,0,5060,5061,5,70,0,0,
-        5061,5062,5,84,0,0,5062,5063,5,70,0,0,5063,5064,5,73,0,0,5064,5065,
-        5,76,0,0,5065,5066,5,84,0,0,5066,5067,5,69,0,0,5067,5068,5,82,0,
-        0,5068,5069,5,83,0,0,5069,5070,5,82,0,0,5070,5071,5,73,0,0,5071,
-        5072,5,71,0,0,5072,5073,5,72,0,0,5073,5074,5,84,0,0,5074,5075,1,
-        0,0,0,5075,5076,6,376,2,0,5076,754,1,0,0,0,5077,5078,5,73,0,0,5078,
-        5079,5,78,0,0,5079,5080,5,84,0,0,5080,5081,5,69,0,0,5081,5082,5,
-        71,0,0,5082,5083,5,69,0,0,5083,5084,5,82,0,0,5084,5085,1,0,0,0,5085,
-        5086,6,377,2,0,5086,756,1,0,0,0,5087,5088,5,68,0,0,5088,5089,5,79,
-        0,0,5089,5090,5,85,0,0,5090,5091,5,66,0,0,5091,5092,5,76,0,0,5092,
-        5093,5,69,0,0,5093,5094,1,0,0,0,5094,5095,6,378,2,0,5095,758,1,0,
-        0,0,5096,5097,5,83,0,0,5097,5098,5,84,0,0,5098,5099,5,82,0,0,5099,
-        5100,5,73,0,0,5100,5101,5,78,0,0,5101,5102,5,71,0,0,5102,5103,1,
-        0,0,0,5103,5104,6,379,2,0,5104,760,1,0,0,0,5105,5106,5,66,0,0,5106,
-        5107,5,79,0,0,5107,5108,5,79,0,0,5108,5109,5,76,0,0,5109,5110,5,
-        69,0,0,5110,5111,5,65,0,0,5111,5112,5,78,0,0,5112,5113,1,0,0,0,5113,
-        5114,6,380,2,0,5114,762,1,0,0,0,5115,5116,5,68,0,0,5116,5117,5,65,
-        0,0,5117,5118,5,84,0,0,5118,5119,5,69,0,0,5119,5120,5,84,0,0,5120,
-        5121,5,73,0,0,5121,5122,5,77,0,0,5122,5123,5,69,0,0,5123,5124,1,
-        0,0,0,5124,5125,6,381,2,0,5125,764,1,0,0,0,5126,5127,5,86,0,0,5127,
-        5128,5,65,0,0,5128,5129,5,82,0,0,5129,5130,5,73,0,0,5130,5131,5,
-        65,0,0,5131,5132,5,78,0,0,5132,5133,5,84,0,0,5133,5134,1,0,0,0,5134,
-        5135,6,382,2,0,5135,766,1,0,0,0,5136,5137,5,84,0,0,5137,5138,5,69,
-        0,0,5138,5139,5,88,0,0,5139,5140,5,84,0,0,5140,5141,1,0,0,0,5141,
-        5142,6,383,2,0,5142,768,1,0,0,0,5143,5144,5,65,0,0,5144,5145,5,76,
-        0,0,5145,5146,5,80,0,0,5146,5147,5,72,0,0,5147,5148,5,65,0,0,5148,
-        5149,5,66,0,0,5149,5150,5,69,0,0,5150,5151,5,84,0,0,5151,5152,5,
-        73,0,0,5152,5153,5,67,0,0,5153,5154,5,65,0,0,5154,5155,5,76,0,0,
-        5155,5156,1,0,0,0,5156,5157,6,384,2,0,5157,770,1,0,0,0,5158,5159,
-        5,75,0,0,5159,5160,5,69,0,0,5160,5161,5,69,0,0,5161,5162,5,80,0,
-        0,5162,5163,1,0,0,0,5163,5164,6,385,2,0,5164,772,1,0,0,0,5165,5166,
-        5,82,0,0,5166,5167,5,69,0,0,5167,5168,5,76,0,0,5168,5169,1,0,0,0,
-        5169,5170,6,386,2,0,5170,774,1,0,0,0,5171,5172,5,69,0,0,5172,5173,
-        5,88,0,0,5173,5174,5,80,0,0,5174,5175,5,82,0,0,5175,5176,1,0,0,0,
-        5176,5177,6,387,2,0,5177,776,1,0,0,0,5178,5179,5,86,0,0,5179,5180,
-        5,65,0,0,5180,5181,5,76,0,0,5181,5182,1,0,0,0,5182,5183,6,388,2,
-        0,5183,778,1,0,0,0,5184,5185,5,65,0,0,5185,5186,5,78,0,0,5186,5187,
-        5,89,0,0,5187,5188,5,86,0,0,5188,5189,5,65,0,0,5189,5190,5,76,0,
-        0,5190,5191,1,0,0,0,5191,5192,6,389,2,0,5192,780,1,0,0,0,5193,5194,
-        5,65,0,0,5194,5195,5,78,0,0,5195,5196,5,89,0,0,5196,5197,5,82,0,
-        0,5197,5198,5,69,0,0,5198,5199,5,70,0,0,5199,5200,1,0,0,0,5200,5201,
-        6,390,2,0,5201,782,1,0,0,0,5202,5203,5,83,0,0,5203,5204,5,67,0,0,
-        5204,5205,5,65,0,0,5205,5206,5,76,0,0,5206,5207,5,65,0,0,5207,5208,
-        5,82,0,0,5208,5209,1,0,0,0,5209,5210,6,391,2,0,5210,784,1,0,0,0,
-        5211,5212,5,73,0,0,5212,5213,5,78,0,0,5213,5214,5,84,0,0,5214,5215,
-        5,54,0,0,5215,5216,5,52,0,0,5216,5217,1,0,0,0,5217,5218,6,392,2,
-        0,5218,786,1,0,0,0,5219,5220,5,68,0,0,5220,5221,5,69,0,0,5221,5222,
-        5,67,0,0,5222,5223,5,73,0,0,5223,5224,5,77,0,0,5224,5225,5,65,0,
-        0,5225,5226,5,76,0,0,5226,5227,1,0,0,0,5227,5228,6,393,2,0,5228,
-        788,1,0,0,0,5229,5230,5,78,0,0,5230,5231,5,85,0,0,5231,5232,5,77,
-        0,0,5232,5233,5,69,0,0,5233,5234,5,82,0,0,5234,5235,5,73,0,0,5235,
-        5236,5,67,0,0,5236,5237,1,0,0,0,5237,5238,6,394,2,0,5238,790,1,0,
-        0,0,5239,5240,5,68,0,0,5240,5241,5,84,0,0,5241,5242,5,34,0,0,5242,
-        5248,1,0,0,0,5243,5247,8,2,0,0,5244,5245,5,34,0,0,5245,5247,5,34,
-        0,0,5246,5243,1,0,0,0,5246,5244,1,0,0,0,5247,5250,1,0,0,0,5248,5246,
-        1,0,0,0,5248,5249,1,0,0,0,5249,5251,1,0,0,0,5250,5248,1,0,0,0,5251,
-        5252,5,34,0,0,5252,5253,6,395,3,0,5253,792,1,0,0,0,5254,5256,7,3,
-        0,0,5255,5254,1,0,0,0,5256,5257,1,0,0,0,5257,5255,1,0,0,0,5257,5258,
-        1,0,0,0,5258,794,1,0,0,0,5259,5261,7,3,0,0,5260,5259,1,0,0,0,5261,
-        5264,1,0,0,0,5262,5260,1,0,0,0,5262,5263,1,0,0,0,5263,5265,1,0,0,
-        0,5264,5262,1,0,0,0,5265,5267,5,46,0,0,5266,5268,7,3,0,0,5267,5266,
-        1,0,0,0,5268,5269,1,0,0,0,5269,5267,1,0,0,0,5269,5270,1,0,0,0,5270,
-        796,1,0,0,0,5271,5277,5,34,0,0,5272,5276,8,2,0,0,5273,5274,5,34,
-        0,0,5274,5276,5,34,0,0,5275,5272,1,0,0,0,5275,5273,1,0,0,0,5276,
-        5279,1,0,0,0,5277,5275,1,0,0,0,5277,5278,1,0,0,0,5278,5280,1,0,0,
-        0,5279,5277,1,0,0,0,5280,5281,5,34,0,0,5281,5282,6,398,4,0,5282,
-        798,1,0,0,0,5283,5289,5,39,0,0,5284,5288,8,4,0,0,5285,5286,5,39,
-        0,0,5286,5288,5,39,0,0,5287,5284,1,0,0,0,5287,5285,1,0,0,0,5288,
-        5291,1,0,0,0,5289,5287,1,0,0,0,5289,5290,1,0,0,0,5290,5292,1,0,0,
-        0,5291,5289,1,0,0,0,5292,5293,5,39,0,0,5293,5294,6,399,5,0,5294,
-        800,1,0,0,0,5295,5301,5,91,0,0,5296,5300,8,5,0,0,5297,5298,5,93,
-        0,0,5298,5300,5,93,0,0,5299,5296,1,0,0,0,5299,5297,1,0,0,0,5300,
-        5303,1,0,0,0,5301,5299,1,0,0,0,5301,5302,1,0,0,0,5302,5304,1,0,0,
-        0,5303,5301,1,0,0,0,5304,5305,5,93,0,0,5305,5306,6,400,6,0,5306,
-        802,1,0,0,0,5307,5308,3,855,427,0,5308,804,1,0,0,0,5309,5310,5,123,
-        0,0,5310,806,1,0,0,0,5311,5312,5,125,0,0,5312,808,1,0,0,0,5313,5314,
-        5,40,0,0,5314,810,1,0,0,0,5315,5316,5,41,0,0,5316,812,1,0,0,0,5317,
-        5318,5,44,0,0,5318,814,1,0,0,0,5319,5320,5,43,0,0,5320,816,1,0,0,
-        0,5321,5322,5,45,0,0,5322,818,1,0,0,0,5323,5324,5,42,0,0,5324,820,
-        1,0,0,0,5325,5326,5,47,0,0,5326,822,1,0,0,0,5327,5328,5,94,0,0,5328,
-        824,1,0,0,0,5329,5330,5,38,0,0,5330,826,1,0,0,0,5331,5332,5,61,0,
-        0,5332,828,1,0,0,0,5333,5334,5,60,0,0,5334,830,1,0,0,0,5335,5336,
-        5,62,0,0,5336,832,1,0,0,0,5337,5338,5,38,0,0,5338,5339,5,38,0,0,
-        5339,834,1,0,0,0,5340,5341,5,124,0,0,5341,5342,5,124,0,0,5342,836,
-        1,0,0,0,5343,5344,5,60,0,0,5344,5345,5,62,0,0,5345,838,1,0,0,0,5346,
-        5347,5,60,0,0,5347,5348,5,61,0,0,5348,840,1,0,0,0,5349,5350,5,62,
-        0,0,5350,5351,5,61,0,0,5351,842,1,0,0,0,5352,5353,5,61,0,0,5353,
-        5354,5,62,0,0,5354,844,1,0,0,0,5355,5356,5,58,0,0,5356,846,1,0,0,
-        0,5357,5358,8,6,0,0,5358,848,1,0,0,0,5359,5360,5,13,0,0,5360,5363,
-        5,10,0,0,5361,5363,7,6,0,0,5362,5359,1,0,0,0,5362,5361,1,0,0,0,5363,
-        850,1,0,0,0,5364,5367,3,853,426,0,5365,5367,7,7,0,0,5366,5364,1,
-        0,0,0,5366,5365,1,0,0,0,5367,852,1,0,0,0,5368,5369,7,8,0,0,5369,
-        854,1,0,0,0,5370,5374,3,857,428,0,5371,5373,3,859,429,0,5372,5371,
-        1,0,0,0,5373,5376,1,0,0,0,5374,5372,1,0,0,0,5374,5375,1,0,0,0,5375,
-        856,1,0,0,0,5376,5374,1,0,0,0,5377,5381,3,861,430,0,5378,5381,3,
-        863,431,0,5379,5381,5,95,0,0,5380,5377,1,0,0,0,5380,5378,1,0,0,0,
-        5380,5379,1,0,0,0,5381,858,1,0,0,0,5382,5385,3,857,428,0,5383,5385,
-        3,865,432,0,5384,5382,1,0,0,0,5384,5383,1,0,0,0,5385,860,1,0,0,0,
-        5386,5387,2,65,90,0,5387,862,1,0,0,0,5388,5389,2,97,122,0,5389,864,
-        1,0,0,0,5390,5391,2,48,57,0,5391,866,1,0,0,0,24,0,871,876,888,890,
-        896,902,904,5246,5248,5257,5262,5269,5275,5277,5287,5289,5299,5301,
-        5362,5366,5374,5380,5384,7,0,2,0,0,1,0,0,3,0,1,395,0,1,398,1,1,399,
-        2,1,400,3
+        129,1,0,0,0,1,155,1,0,0,0,3,165,1,0,0,0,5,186,1,0,0,0,7,192,1,0,
+        0,0,9,204,1,0,0,0,11,215,1,0,0,0,13,228,1,0,0,0,15,244,1,0,0,0,17,
+        256,1,0,0,0,19,271,1,0,0,0,21,289,1,0,0,0,23,304,1,0,0,0,25,317,
+        1,0,0,0,27,328,1,0,0,0,29,342,1,0,0,0,31,354,1,0,0,0,33,365,1,0,
+        0,0,35,379,1,0,0,0,37,392,1,0,0,0,39,409,1,0,0,0,41,426,1,0,0,0,
+        43,444,1,0,0,0,45,462,1,0,0,0,47,477,1,0,0,0,49,487,1,0,0,0,51,497,
+        1,0,0,0,53,507,1,0,0,0,55,518,1,0,0,0,57,529,1,0,0,0,59,538,1,0,
+        0,0,61,550,1,0,0,0,63,562,1,0,0,0,65,570,1,0,0,0,67,581,1,0,0,0,
+        69,589,1,0,0,0,71,597,1,0,0,0,73,606,1,0,0,0,75,615,1,0,0,0,77,631,
+        1,0,0,0,79,638,1,0,0,0,81,647,1,0,0,0,83,659,1,0,0,0,85,671,1,0,
+        0,0,87,683,1,0,0,0,89,686,1,0,0,0,91,688,1,0,0,0,93,690,1,0,0,0,
+        95,692,1,0,0,0,97,694,1,0,0,0,99,696,1,0,0,0,101,698,1,0,0,0,103,
+        700,1,0,0,0,105,702,1,0,0,0,107,704,1,0,0,0,109,706,1,0,0,0,111,
+        708,1,0,0,0,113,710,1,0,0,0,115,712,1,0,0,0,117,714,1,0,0,0,119,
+        717,1,0,0,0,121,720,1,0,0,0,123,723,1,0,0,0,125,726,1,0,0,0,127,
+        729,1,0,0,0,129,732,1,0,0,0,131,734,1,0,0,0,133,739,1,0,0,0,135,
+        743,1,0,0,0,137,745,1,0,0,0,139,747,1,0,0,0,141,757,1,0,0,0,143,
+        761,1,0,0,0,145,763,1,0,0,0,147,765,1,0,0,0,149,767,1,0,0,0,151,
+        152,5,47,0,0,152,156,5,47,0,0,153,154,5,45,0,0,154,156,5,45,0,0,
+        155,151,1,0,0,0,155,153,1,0,0,0,156,160,1,0,0,0,157,159,3,131,65,
+        0,158,157,1,0,0,0,159,162,1,0,0,0,160,158,1,0,0,0,160,161,1,0,0,
+        0,161,163,1,0,0,0,162,160,1,0,0,0,163,164,6,0,0,0,164,2,1,0,0,0,
+        165,166,5,47,0,0,166,167,5,42,0,0,167,174,1,0,0,0,168,173,3,3,1,
+        0,169,170,5,47,0,0,170,173,8,0,0,0,171,173,8,1,0,0,172,168,1,0,0,
+        0,172,169,1,0,0,0,172,171,1,0,0,0,173,176,1,0,0,0,174,175,1,0,0,
+        0,174,172,1,0,0,0,175,180,1,0,0,0,176,174,1,0,0,0,177,178,5,42,0,
+        0,178,181,5,47,0,0,179,181,5,0,0,1,180,177,1,0,0,0,180,179,1,0,0,
+        0,181,182,1,0,0,0,182,183,6,1,0,0,183,4,1,0,0,0,184,187,3,135,67,
+        0,185,187,3,133,66,0,186,184,1,0,0,0,186,185,1,0,0,0,187,188,1,0,
+        0,0,188,186,1,0,0,0,188,189,1,0,0,0,189,190,1,0,0,0,190,191,6,2,
+        1,0,191,6,1,0,0,0,192,193,7,2,0,0,193,194,7,3,0,0,194,195,7,4,0,
+        0,195,196,7,5,0,0,196,197,5,46,0,0,197,198,7,6,0,0,198,199,7,7,0,
+        0,199,200,7,8,0,0,200,201,7,4,0,0,201,202,1,0,0,0,202,203,6,3,2,
+        0,203,8,1,0,0,0,204,205,7,2,0,0,205,206,7,3,0,0,206,207,7,4,0,0,
+        207,208,7,5,0,0,208,209,5,46,0,0,209,210,7,7,0,0,210,211,7,9,0,0,
+        211,212,7,10,0,0,212,213,1,0,0,0,213,214,6,4,2,0,214,10,1,0,0,0,
+        215,216,7,11,0,0,216,217,7,12,0,0,217,218,7,7,0,0,218,219,7,8,0,
+        0,219,220,7,13,0,0,220,221,5,46,0,0,221,222,7,6,0,0,222,223,7,7,
+        0,0,223,224,7,8,0,0,224,225,7,4,0,0,225,226,1,0,0,0,226,227,6,5,
+        2,0,227,12,1,0,0,0,228,229,7,11,0,0,229,230,7,12,0,0,230,231,7,7,
+        0,0,231,232,7,8,0,0,232,233,7,13,0,0,233,234,5,46,0,0,234,235,7,
+        6,0,0,235,236,7,7,0,0,236,237,7,8,0,0,237,238,7,4,0,0,238,239,5,
+        46,0,0,239,240,7,14,0,0,240,241,7,4,0,0,241,242,1,0,0,0,242,243,
+        6,6,2,0,243,14,1,0,0,0,244,245,7,11,0,0,245,246,7,12,0,0,246,247,
+        7,7,0,0,247,248,7,8,0,0,248,249,7,13,0,0,249,250,5,46,0,0,250,251,
+        7,7,0,0,251,252,7,9,0,0,252,253,7,10,0,0,253,254,1,0,0,0,254,255,
+        6,7,2,0,255,16,1,0,0,0,256,257,7,11,0,0,257,258,7,12,0,0,258,259,
+        7,7,0,0,259,260,7,8,0,0,260,261,7,13,0,0,261,262,5,46,0,0,262,263,
+        7,7,0,0,263,264,7,9,0,0,264,265,7,10,0,0,265,266,5,46,0,0,266,267,
+        7,14,0,0,267,268,7,4,0,0,268,269,1,0,0,0,269,270,6,8,2,0,270,18,
+        1,0,0,0,271,272,7,11,0,0,272,273,7,15,0,0,273,274,7,9,0,0,274,275,
+        7,16,0,0,275,276,7,7,0,0,276,277,7,6,0,0,277,278,7,3,0,0,278,279,
+        7,9,0,0,279,280,7,11,0,0,280,281,7,3,0,0,281,282,5,46,0,0,282,283,
+        7,9,0,0,283,284,7,15,0,0,284,285,7,14,0,0,285,286,7,17,0,0,286,287,
+        1,0,0,0,287,288,6,9,2,0,288,20,1,0,0,0,289,290,7,11,0,0,290,291,
+        7,15,0,0,291,292,7,9,0,0,292,293,7,16,0,0,293,294,7,7,0,0,294,295,
+        7,6,0,0,295,296,7,3,0,0,296,297,7,9,0,0,297,298,7,11,0,0,298,299,
+        7,3,0,0,299,300,5,46,0,0,300,301,7,4,0,0,301,302,1,0,0,0,302,303,
+        6,10,2,0,303,22,1,0,0,0,304,305,7,3,0,0,305,306,7,18,0,0,306,307,
+        7,19,0,0,307,308,7,15,0,0,308,309,7,9,0,0,309,310,5,46,0,0,310,311,
+        7,6,0,0,311,312,7,7,0,0,312,313,7,8,0,0,313,314,7,4,0,0,314,315,
+        1,0,0,0,315,316,6,11,2,0,316,24,1,0,0,0,317,318,7,7,0,0,318,319,
+        7,16,0,0,319,320,5,46,0,0,320,321,7,3,0,0,321,322,7,5,0,0,322,323,
+        7,20,0,0,323,324,7,3,0,0,324,325,7,14,0,0,325,326,1,0,0,0,326,327,
+        6,12,2,0,327,26,1,0,0,0,328,329,7,7,0,0,329,330,7,8,0,0,330,331,
+        7,15,0,0,331,332,5,46,0,0,332,333,7,11,0,0,333,334,7,3,0,0,334,335,
+        7,7,0,0,335,336,7,21,0,0,336,337,7,7,0,0,337,338,7,9,0,0,338,339,
+        7,20,0,0,339,340,1,0,0,0,340,341,6,13,2,0,341,28,1,0,0,0,342,343,
+        7,9,0,0,343,344,7,15,0,0,344,345,7,14,0,0,345,346,7,17,0,0,346,347,
+        5,46,0,0,347,348,7,6,0,0,348,349,7,7,0,0,349,350,7,8,0,0,350,351,
+        7,4,0,0,351,352,1,0,0,0,352,353,6,14,2,0,353,30,1,0,0,0,354,355,
+        7,9,0,0,355,356,7,15,0,0,356,357,7,14,0,0,357,358,7,17,0,0,358,359,
+        5,46,0,0,359,360,7,7,0,0,360,361,7,9,0,0,361,362,7,10,0,0,362,363,
+        1,0,0,0,363,364,6,15,2,0,364,32,1,0,0,0,365,366,7,9,0,0,366,367,
+        7,15,0,0,367,368,7,14,0,0,368,369,7,17,0,0,369,370,5,46,0,0,370,
+        371,7,8,0,0,371,372,5,46,0,0,372,373,7,6,0,0,373,374,7,7,0,0,374,
+        375,7,8,0,0,375,376,7,4,0,0,376,377,1,0,0,0,377,378,6,16,2,0,378,
+        34,1,0,0,0,379,380,7,9,0,0,380,381,7,15,0,0,381,382,7,14,0,0,382,
+        383,7,17,0,0,383,384,5,46,0,0,384,385,7,8,0,0,385,386,5,46,0,0,386,
+        387,7,7,0,0,387,388,7,9,0,0,388,389,7,10,0,0,389,390,1,0,0,0,390,
+        391,6,17,2,0,391,36,1,0,0,0,392,393,7,19,0,0,393,394,7,3,0,0,394,
+        395,7,14,0,0,395,396,7,11,0,0,396,397,7,3,0,0,397,398,7,9,0,0,398,
+        399,7,4,0,0,399,400,7,7,0,0,400,401,7,21,0,0,401,402,7,3,0,0,402,
+        403,5,46,0,0,403,404,7,3,0,0,404,405,7,18,0,0,405,406,7,11,0,0,406,
+        407,1,0,0,0,407,408,6,18,2,0,408,38,1,0,0,0,409,410,7,19,0,0,410,
+        411,7,3,0,0,411,412,7,14,0,0,412,413,7,11,0,0,413,414,7,3,0,0,414,
+        415,7,9,0,0,415,416,7,4,0,0,416,417,7,7,0,0,417,418,7,21,0,0,418,
+        419,7,3,0,0,419,420,5,46,0,0,420,421,7,7,0,0,421,422,7,9,0,0,422,
+        423,7,11,0,0,423,424,1,0,0,0,424,425,6,19,2,0,425,40,1,0,0,0,426,
+        427,7,19,0,0,427,428,7,3,0,0,428,429,7,14,0,0,429,430,7,11,0,0,430,
+        431,7,3,0,0,431,432,7,9,0,0,432,433,7,4,0,0,433,434,7,7,0,0,434,
+        435,7,21,0,0,435,436,7,3,0,0,436,437,7,18,0,0,437,438,5,46,0,0,438,
+        439,7,3,0,0,439,440,7,18,0,0,440,441,7,11,0,0,441,442,1,0,0,0,442,
+        443,6,20,2,0,443,42,1,0,0,0,444,445,7,19,0,0,445,446,7,3,0,0,446,
+        447,7,14,0,0,447,448,7,11,0,0,448,449,7,3,0,0,449,450,7,9,0,0,450,
+        451,7,4,0,0,451,452,7,7,0,0,452,453,7,21,0,0,453,454,7,3,0,0,454,
+        455,7,18,0,0,455,456,5,46,0,0,456,457,7,7,0,0,457,458,7,9,0,0,458,
+        459,7,11,0,0,459,460,1,0,0,0,460,461,6,21,2,0,461,44,1,0,0,0,462,
+        463,7,19,0,0,463,464,7,15,0,0,464,465,7,7,0,0,465,466,7,8,0,0,466,
+        467,7,8,0,0,467,468,7,15,0,0,468,469,7,9,0,0,469,470,5,46,0,0,470,
+        471,7,6,0,0,471,472,7,7,0,0,472,473,7,8,0,0,473,474,7,4,0,0,474,
+        475,1,0,0,0,475,476,6,22,2,0,476,46,1,0,0,0,477,478,7,14,0,0,478,
+        479,7,5,0,0,479,480,7,9,0,0,480,481,7,22,0,0,481,482,5,46,0,0,482,
+        483,7,3,0,0,483,484,7,13,0,0,484,485,1,0,0,0,485,486,6,23,2,0,486,
+        48,1,0,0,0,487,488,7,8,0,0,488,489,7,4,0,0,489,490,7,6,0,0,490,491,
+        7,3,0,0,491,492,7,10,0,0,492,493,5,46,0,0,493,494,7,19,0,0,494,495,
+        1,0,0,0,495,496,6,24,2,0,496,50,1,0,0,0,497,498,7,8,0,0,498,499,
+        7,4,0,0,499,500,7,6,0,0,500,501,7,3,0,0,501,502,7,10,0,0,502,503,
+        5,46,0,0,503,504,7,8,0,0,504,505,1,0,0,0,505,506,6,25,2,0,506,52,
+        1,0,0,0,507,508,7,8,0,0,508,509,7,4,0,0,509,510,7,6,0,0,510,511,
+        7,3,0,0,511,512,7,10,0,0,512,513,7,18,0,0,513,514,5,46,0,0,514,515,
+        7,19,0,0,515,516,1,0,0,0,516,517,6,26,2,0,517,54,1,0,0,0,518,519,
+        7,8,0,0,519,520,7,4,0,0,520,521,7,6,0,0,521,522,7,3,0,0,522,523,
+        7,10,0,0,523,524,7,18,0,0,524,525,5,46,0,0,525,526,7,8,0,0,526,527,
+        1,0,0,0,527,528,6,27,2,0,528,56,1,0,0,0,529,530,7,4,0,0,530,531,
+        5,46,0,0,531,532,7,6,0,0,532,533,7,7,0,0,533,534,7,8,0,0,534,535,
+        7,4,0,0,535,536,1,0,0,0,536,537,6,28,2,0,537,58,1,0,0,0,538,539,
+        7,4,0,0,539,540,5,46,0,0,540,541,7,6,0,0,541,542,7,7,0,0,542,543,
+        7,8,0,0,543,544,7,4,0,0,544,545,5,46,0,0,545,546,5,50,0,0,546,547,
+        7,4,0,0,547,548,1,0,0,0,548,549,6,29,2,0,549,60,1,0,0,0,550,551,
+        7,4,0,0,551,552,5,46,0,0,552,553,7,6,0,0,553,554,7,7,0,0,554,555,
+        7,8,0,0,555,556,7,4,0,0,556,557,5,46,0,0,557,558,7,14,0,0,558,559,
+        7,4,0,0,559,560,1,0,0,0,560,561,6,30,2,0,561,62,1,0,0,0,562,563,
+        7,4,0,0,563,564,5,46,0,0,564,565,7,7,0,0,565,566,7,9,0,0,566,567,
+        7,10,0,0,567,568,1,0,0,0,568,569,6,31,2,0,569,64,1,0,0,0,570,571,
+        7,4,0,0,571,572,5,46,0,0,572,573,7,7,0,0,573,574,7,9,0,0,574,575,
+        7,10,0,0,575,576,5,46,0,0,576,577,5,50,0,0,577,578,7,4,0,0,578,579,
+        1,0,0,0,579,580,6,32,2,0,580,66,1,0,0,0,581,582,7,10,0,0,582,583,
+        7,5,0,0,583,584,7,14,0,0,584,585,5,46,0,0,585,586,7,19,0,0,586,587,
+        1,0,0,0,587,588,6,33,2,0,588,68,1,0,0,0,589,590,7,10,0,0,590,591,
+        7,5,0,0,591,592,7,14,0,0,592,593,5,46,0,0,593,594,7,8,0,0,594,595,
+        1,0,0,0,595,596,6,34,2,0,596,70,1,0,0,0,597,598,7,10,0,0,598,599,
+        7,5,0,0,599,600,7,14,0,0,600,601,7,18,0,0,601,602,5,46,0,0,602,603,
+        7,19,0,0,603,604,1,0,0,0,604,605,6,35,2,0,605,72,1,0,0,0,606,607,
+        7,10,0,0,607,608,7,5,0,0,608,609,7,14,0,0,609,610,7,18,0,0,610,611,
+        5,46,0,0,611,612,7,8,0,0,612,613,1,0,0,0,613,614,6,36,2,0,614,74,
+        1,0,0,0,615,616,5,68,0,0,616,617,5,84,0,0,617,618,5,34,0,0,618,624,
+        1,0,0,0,619,623,8,23,0,0,620,621,5,34,0,0,621,623,5,34,0,0,622,619,
+        1,0,0,0,622,620,1,0,0,0,623,626,1,0,0,0,624,622,1,0,0,0,624,625,
+        1,0,0,0,625,627,1,0,0,0,626,624,1,0,0,0,627,628,5,34,0,0,628,629,
+        6,37,3,0,629,76,1,0,0,0,630,632,7,24,0,0,631,630,1,0,0,0,632,633,
+        1,0,0,0,633,631,1,0,0,0,633,634,1,0,0,0,634,78,1,0,0,0,635,637,7,
+        24,0,0,636,635,1,0,0,0,637,640,1,0,0,0,638,636,1,0,0,0,638,639,1,
+        0,0,0,639,641,1,0,0,0,640,638,1,0,0,0,641,643,5,46,0,0,642,644,7,
+        24,0,0,643,642,1,0,0,0,644,645,1,0,0,0,645,643,1,0,0,0,645,646,1,
+        0,0,0,646,80,1,0,0,0,647,653,5,34,0,0,648,652,8,23,0,0,649,650,5,
+        34,0,0,650,652,5,34,0,0,651,648,1,0,0,0,651,649,1,0,0,0,652,655,
+        1,0,0,0,653,651,1,0,0,0,653,654,1,0,0,0,654,656,1,0,0,0,655,653,
+        1,0,0,0,656,657,5,34,0,0,657,658,6,40,4,0,658,82,1,0,0,0,659,665,
+        5,39,0,0,660,664,8,25,0,0,661,662,5,39,0,0,662,664,5,39,0,0,663,
+        660,1,0,0,0,663,661,1,0,0,0,664,667,1,0,0,0,665,663,1,0,0,0,665,
+        666,1,0,0,0,666,668,1,0,0,0,667,665,1,0,0,0,668,669,5,39,0,0,669,
+        670,6,41,5,0,670,84,1,0,0,0,671,677,5,91,0,0,672,676,8,26,0,0,673,
+        674,5,93,0,0,674,676,5,93,0,0,675,672,1,0,0,0,675,673,1,0,0,0,676,
+        679,1,0,0,0,677,675,1,0,0,0,677,678,1,0,0,0,678,680,1,0,0,0,679,
+        677,1,0,0,0,680,681,5,93,0,0,681,682,6,42,6,0,682,86,1,0,0,0,683,
+        684,3,139,69,0,684,685,6,43,7,0,685,88,1,0,0,0,686,687,5,123,0,0,
+        687,90,1,0,0,0,688,689,5,125,0,0,689,92,1,0,0,0,690,691,5,40,0,0,
+        691,94,1,0,0,0,692,693,5,41,0,0,693,96,1,0,0,0,694,695,5,44,0,0,
+        695,98,1,0,0,0,696,697,5,43,0,0,697,100,1,0,0,0,698,699,5,45,0,0,
+        699,102,1,0,0,0,700,701,5,42,0,0,701,104,1,0,0,0,702,703,5,47,0,
+        0,703,106,1,0,0,0,704,705,5,94,0,0,705,108,1,0,0,0,706,707,5,38,
+        0,0,707,110,1,0,0,0,708,709,5,61,0,0,709,112,1,0,0,0,710,711,5,60,
+        0,0,711,114,1,0,0,0,712,713,5,62,0,0,713,116,1,0,0,0,714,715,5,38,
+        0,0,715,716,5,38,0,0,716,118,1,0,0,0,717,718,5,124,0,0,718,719,5,
+        124,0,0,719,120,1,0,0,0,720,721,5,60,0,0,721,722,5,62,0,0,722,122,
+        1,0,0,0,723,724,5,60,0,0,724,725,5,61,0,0,725,124,1,0,0,0,726,727,
+        5,62,0,0,727,728,5,61,0,0,728,126,1,0,0,0,729,730,5,61,0,0,730,731,
+        5,62,0,0,731,128,1,0,0,0,732,733,5,58,0,0,733,130,1,0,0,0,734,735,
+        8,27,0,0,735,132,1,0,0,0,736,737,5,13,0,0,737,740,5,10,0,0,738,740,
+        7,27,0,0,739,736,1,0,0,0,739,738,1,0,0,0,740,134,1,0,0,0,741,744,
+        3,137,68,0,742,744,7,28,0,0,743,741,1,0,0,0,743,742,1,0,0,0,744,
+        136,1,0,0,0,745,746,7,29,0,0,746,138,1,0,0,0,747,751,3,141,70,0,
+        748,750,3,143,71,0,749,748,1,0,0,0,750,753,1,0,0,0,751,749,1,0,0,
+        0,751,752,1,0,0,0,752,140,1,0,0,0,753,751,1,0,0,0,754,758,3,145,
+        72,0,755,758,3,147,73,0,756,758,5,95,0,0,757,754,1,0,0,0,757,755,
+        1,0,0,0,757,756,1,0,0,0,758,142,1,0,0,0,759,762,3,141,70,0,760,762,
+        3,149,74,0,761,759,1,0,0,0,761,760,1,0,0,0,762,144,1,0,0,0,763,764,
+        2,65,90,0,764,146,1,0,0,0,765,766,2,97,122,0,766,148,1,0,0,0,767,
+        768,2,48,57,0,768,150,1,0,0,0,24,0,155,160,172,174,180,186,188,622,
+        624,633,638,645,651,653,663,665,675,677,739,743,751,757,761,8,0,
+        2,0,0,1,0,0,3,0,1,37,0,1,40,1,1,41,2,1,42,3,1,43,4
     ]
 
 class PyDAXLexer(Lexer):
@@ -2486,91 +726,9 @@ class PyDAXLexer(Lexer):
     modeNames = [ "DEFAULT_MODE" ]
 
     literalNames = [ "<INVALID>",
-            "'ABS'", "'ACOS'", "'ACOSH'", "'ACOT'", "'ACOTH'", "'ADDCOLUMNS'", 
-            "'ADDMISSINGITEMS'", "'ALL'", "'ALLCROSSFILTERED'", "'ALLEXCEPT'", 
-            "'ALLNOBLANKROW'", "'ALLSELECTED'", "'AND'", "'APPROXIMATEDISTINCTCOUNT'", 
-            "'ASIN'", "'ASINH'", "'ATAN'", "'ATANH'", "'AVERAGE'", "'AVERAGEA'", 
-            "'AVERAGEX'", "'BETA.DIST'", "'BETA.INV'", "'BLANK'", "'CALCULATE'", 
-            "'CALCULATETABLE'", "'CALENDAR'", "'CALENDARAUTO'", "'CEILING'", 
-            "'CHISQ.DIST'", "'CHISQ.DIST.RT'", "'CHISQ.INV'", "'CHISQ.INV.RT'", 
-            "'CLOSINGBALANCEMONTH'", "'CLOSINGBALANCEQUARTER'", "'CLOSINGBALANCEYEAR'", 
-            "'COALESCE'", "'COMBIN'", "'COMBINA'", "'COMBINEVALUES'", "'CONCATENATE'", 
-            "'CONCATENATEX'", "'CONFIDENCE.NORM'", "'CONFIDENCE.T'", "'CONTAINS'", 
-            "'CONTAINSROW'", "'CONTAINSSTRING'", "'CONTAINSSTRINGEXACT'", 
-            "'CONVERT'", "'COS'", "'COSH'", "'COT'", "'COTH'", "'COUNT'", 
-            "'COUNTA'", "'COUNTAX'", "'COUNTBLANK'", "'COUNTROWS'", "'COUNTX'", 
-            "'CROSSFILTER'", "'CROSSJOIN'", "'CURRENCY'", "'CURRENTGROUP'", 
-            "'CUSTOMDATA'", "'DATATABLE'", "'DATE'", "'DATEADD'", "'DATEDIFF'", 
-            "'DATESBETWEEN'", "'DATESINPERIOD'", "'DATESMTD'", "'DATESQTD'", 
-            "'DATESYTD'", "'DATEVALUE'", "'DAY'", "'DEGREES'", "'DETAILROWS'", 
-            "'DISTINCT'", "'DISTINCTCOUNT'", "'DISTINCTCOUNTNOBLANK'", "'DIVIDE'", 
-            "'EARLIER'", "'EARLIEST'", "'EDATE'", "'ENDOFMONTH'", "'ENDOFQUARTER'", 
-            "'ENDOFYEAR'", "'EOMONTH'", "'ERROR'", "'EVEN'", "'EXACT'", 
-            "'EXCEPT'", "'EXP'", "'EXPON.DIST'", "'FACT'", "'FALSE'", "'FILTER'", 
-            "'FILTERS'", "'FIND'", "'FIRSTDATE'", "'FIRSTNONBLANK'", "'FIRSTNONBLANKVALUE'", 
-            "'FIXED'", "'FLOOR'", "'FORMAT'", "'GCD'", "'GENERATE'", "'GENERATEALL'", 
-            "'GENERATESERIES'", "'GEOMEAN'", "'GEOMEANX'", "'GROUPBY'", 
-            "'HASONEFILTER'", "'HASONEVALUE'", "'HOUR'", "'IF'", "'IF.EAGER'", 
-            "'IFERROR'", "'IGNORE'", "'INT'", "'INTERSECT'", "'ISBLANK'", 
-            "'ISCROSSFILTERED'", "'ISEMPTY'", "'ISERROR'", "'ISEVEN'", "'ISFILTERED'", 
-            "'ISINSCOPE'", "'ISLOGICAL'", "'ISNONTEXT'", "'ISNUMBER'", "'ISO.CEILING'", 
-            "'ISODD'", "'ISONORAFTER'", "'ISSELECTEDMEASURE'", "'ISSUBTOTAL'", 
-            "'ISTEXT'", "'KEEPFILTERS'", "'KEYWORDMATCH'", "'LASTDATE'", 
-            "'LASTNONBLANK'", "'LASTNONBLANKVALUE'", "'LCM'", "'LEFT'", 
-            "'LEN'", "'LN'", "'LOG'", "'LOG10'", "'LOOKUPVALUE'", "'LOWER'", 
-            "'MAX'", "'MAXA'", "'MAXX'", "'MEDIAN'", "'MEDIANX'", "'MID'", 
-            "'MIN'", "'MINA'", "'MINUTE'", "'MINX'", "'MOD'", "'MONTH'", 
-            "'MROUND'", "'NATURALINNERJOIN'", "'NATURALLEFTOUTERJOIN'", 
-            "'NEXTDAY'", "'NEXTMONTH'", "'NEXTQUARTER'", "'NEXTYEAR'", "'NONVISUAL'", 
-            "'NORM.DIST'", "'NORM.INV'", "'NORM.S.DIST'", "'NORM.S.INV'", 
-            "'NOT'", "'NOW'", "'ODD'", "'OPENINGBALANCEMONTH'", "'OPENINGBALANCEQUARTER'", 
-            "'OPENINGBALANCEYEAR'", "'OR'", "'PARALLELPERIOD'", "'PATH'", 
-            "'PATHCONTAINS'", "'PATHITEM'", "'PATHITEMREVERSE'", "'PATHLENGTH'", 
-            "'PERCENTILE.EXC'", "'PERCENTILE.INC'", "'PERCENTILEX.EXC'", 
-            "'PERCENTILEX.INC'", "'PERMUT'", "'PI'", "'POISSON.DIST'", "'POWER'", 
-            "'PREVIOUSDAY'", "'PREVIOUSMONTH'", "'PREVIOUSQUARTER'", "'PREVIOUSYEAR'", 
-            "'PRODUCT'", "'PRODUCTX'", "'QUARTER'", "'QUOTIENT'", "'RADIANS'", 
-            "'RAND'", "'RANDBETWEEN'", "'RANK.EQ'", "'RANKX'", "'RELATED'", 
-            "'RELATEDTABLE'", "'REMOVEFILTERS'", "'REPLACE'", "'REPT'", 
-            "'RIGHT'", "'ROLLUP'", "'ROLLUPADDISSUBTOTAL'", "'ROLLUPGROUP'", 
-            "'ROLLUPISSUBTOTAL'", "'ROUND'", "'ROUNDDOWN'", "'ROUNDUP'", 
-            "'ROW'", "'SAMEPERIODLASTYEAR'", "'SAMPLE'", "'SEARCH'", "'SECOND'", 
-            "'SELECTCOLUMNS'", "'SELECTEDMEASURE'", "'SELECTEDMEASUREFORMATSTRING'", 
-            "'SELECTEDMEASURENAME'", "'SELECTEDVALUE'", "'SIGN'", "'SIN'", 
-            "'SINH'", "'SQRT'", "'SQRTPI'", "'STARTOFMONTH'", "'STARTOFQUARTER'", 
-            "'STARTOFYEAR'", "'STDEV.P'", "'STDEV.S'", "'STDEVX.P'", "'STDEVX.S'", 
-            "'SUBSTITUTE'", "'SUBSTITUTEWITHINDEX'", "'SUM'", "'SUMMARIZE'", 
-            "'SUMMARIZECOLUMNS'", "'SUMX'", "'SWITCH'", "'T.DIST'", "'T.DIST.2T'", 
-            "'T.DIST.RT'", "'T.INV'", "'T.INV.2T'", "'TAN'", "'TANH'", "'TIME'", 
-            "'TIMEVALUE'", "'TODAY'", "'TOPN'", "'TOPNPERLEVEL'", "'TOPNSKIP'", 
-            "'TOTALMTD'", "'TOTALQTD'", "'TOTALYTD'", "'TREATAS'", "'TRIM'", 
-            "'TRUE'", "'TRUNC'", "'UNICHAR'", "'UNICODE'", "'UNION'", "'UPPER'", 
-            "'USERELATIONSHIP'", "'USERNAME'", "'USEROBJECTID'", "'USERPRINCIPALNAME'", 
-            "'UTCNOW'", "'UTCTODAY'", "'VALUE'", "'VALUES'", "'VAR.P'", 
-            "'VAR.S'", "'VARX.P'", "'VARX.S'", "'WEEKDAY'", "'YEARFRAC'", 
-            "'WEEKNUM'", "'XIRR'", "'XNPV'", "'YEAR'", "'ACCRINT'", "'ACCRINTM'", 
-            "'AMORDEGRC'", "'AMORLINC'", "'COUPDAYBS'", "'COUPDAYS'", "'COUPDAYSNC'", 
-            "'COUPNCD'", "'COUPNUM'", "'COUPPCD'", "'CUMIPMT'", "'CUMPRINC'", 
-            "'DB'", "'DDB'", "'DISC'", "'DOLLARDE'", "'DOLLARFR'", "'DURATION'", 
-            "'EFFECT'", "'FV'", "'INTRATE'", "'IPMT'", "'ISPMT'", "'MDURATION'", 
-            "'NOMINAL'", "'NPER'", "'ODDFPRICE'", "'ODDFYIELD'", "'ODDLPRICE'", 
-            "'ODDLYIELD'", "'PDURATION'", "'PMT'", "'PPMT'", "'PRICE'", 
-            "'PRICEDISC'", "'PRICEMAT'", "'PV'", "'RATE'", "'RECEIVED'", 
-            "'RRI'", "'SLN'", "'SYD'", "'TBILLEQ'", "'TBILLPRICE'", "'TBILLYIELD'", 
-            "'VDB'", "'YIELD'", "'YIELDDISC'", "'YIELDMAT'", "'SAMPLEAXISWITHLOCALMINMAX'", 
-            "'EVALUATEANDLOG'", "'OFFSET'", "'INDEX'", "'WINDOW'", "'ORDERBY'", 
-            "'RANK'", "'ROWNUMBER'", "'PARTITIONBY'", "'EXTERNALMEASURE'", 
-            "'KMEANSCLUSTERING'", "'DEFINE'", "'EVALUATE'", "'ORDER'", "'BY'", 
-            "'START'", "'AT'", "'RETURN'", "'VAR'", "'IN'", "'ASC'", "'DESC'", 
-            "'SKIP'", "'DENSE'", "'BLANKS'", "'LAST'", "'FIRST'", "'WEEK'", 
-            "'BOTH'", "'NONE'", "'ONEWAY'", "'ONEWAY_RIGHTFILTERSLEFT'", 
-            "'ONEWAY_LEFTFILTERSRIGHT'", "'INTEGER'", "'DOUBLE'", "'STRING'", 
-            "'BOOLEAN'", "'DATETIME'", "'VARIANT'", "'TEXT'", "'ALPHABETICAL'", 
-            "'KEEP'", "'REL'", "'EXPR'", "'VAL'", "'ANYVAL'", "'ANYREF'", 
-            "'SCALAR'", "'INT64'", "'DECIMAL'", "'NUMERIC'", "'{'", "'}'", 
-            "'('", "')'", "','", "'+'", "'-'", "'*'", "'/'", "'^'", "'&'", 
-            "'='", "'<'", "'>'", "'&&'", "'||'", "'<>'", "'<='", "'>='", 
-            "'=>'", "':'" ]
+            "'{'", "'}'", "'('", "')'", "','", "'+'", "'-'", "'*'", "'/'", 
+            "'^'", "'&'", "'='", "'<'", "'>'", "'&&'", "'||'", "'<>'", "'<='", 
+            "'>='", "'=>'", "':'" ]
 
     symbolicNames = [ "<INVALID>",
             "SINGLE_LINE_COMMENT", "DELIMITED_COMMENT", "WHITESPACES", "ABS", 
@@ -2652,93 +810,22 @@ class PyDAXLexer(Lexer):
             "COLON" ]
 
     ruleNames = [ "SINGLE_LINE_COMMENT", "DELIMITED_COMMENT", "WHITESPACES", 
-                  "ABS", "ACOS", "ACOSH", "ACOT", "ACOTH", "ADDCOLUMNS", 
-                  "ADDMISSINGITEMS", "ALL", "ALLCROSSFILTERED", "ALLEXCEPT", 
-                  "ALLNOBLANKROW", "ALLSELECTED", "AND", "APPROXIMATEDISTINCTCOUNT", 
-                  "ASIN", "ASINH", "ATAN", "ATANH", "AVERAGE", "AVERAGEA", 
-                  "AVERAGEX", "BETADIST", "BETAINV", "BLANK", "CALCULATE", 
-                  "CALCULATETABLE", "CALENDAR", "CALENDARAUTO", "CEILING", 
-                  "CHISQDIST", "CHISQDISTRT", "CHISQINV", "CHISQINVRT", 
-                  "CLOSINGBALANCEMONTH", "CLOSINGBALANCEQUARTER", "CLOSINGBALANCEYEAR", 
-                  "COALESCE", "COMBIN", "COMBINA", "COMBINEVALUES", "CONCATENATE", 
-                  "CONCATENATEX", "CONFIDENCENORM", "CONFIDENCET", "CONTAINS", 
-                  "CONTAINSROW", "CONTAINSSTRING", "CONTAINSSTRINGEXACT", 
-                  "CONVERT", "COS", "COSH", "COT", "COTH", "COUNT", "COUNTA", 
-                  "COUNTAX", "COUNTBLANK", "COUNTROWS", "COUNTX", "CROSSFILTER", 
-                  "CROSSJOIN", "CURRENCY", "CURRENTGROUP", "CUSTOMDATA", 
-                  "DATATABLE", "DATE", "DATEADD", "DATEDIFF", "DATESBETWEEN", 
-                  "DATESINPERIOD", "DATESMTD", "DATESQTD", "DATESYTD", "DATEVALUE", 
-                  "DAY", "DEGREES", "DETAILROWS", "DISTINCT", "DISTINCTCOUNT", 
-                  "DISTINCTCOUNTNOBLANK", "DIVIDE", "EARLIER", "EARLIEST", 
-                  "EDATE", "ENDOFMONTH", "ENDOFQUARTER", "ENDOFYEAR", "EOMONTH", 
-                  "ERROR", "EVEN", "EXACT", "EXCEPT", "EXP", "EXPONDIST", 
-                  "FACT", "FALSE", "FILTER", "FILTERS", "FIND", "FIRSTDATE", 
-                  "FIRSTNONBLANK", "FIRSTNONBLANKVALUE", "FIXED", "FLOOR", 
-                  "FORMAT", "GCD", "GENERATE", "GENERATEALL", "GENERATESERIES", 
-                  "GEOMEAN", "GEOMEANX", "GROUPBY", "HASONEFILTER", "HASONEVALUE", 
-                  "HOUR", "IF", "IFEAGER", "IFERROR", "IGNORE", "INT", "INTERSECT", 
-                  "ISBLANK", "ISCROSSFILTERED", "ISEMPTY", "ISERROR", "ISEVEN", 
-                  "ISFILTERED", "ISINSCOPE", "ISLOGICAL", "ISNONTEXT", "ISNUMBER", 
-                  "ISOCEILING", "ISODD", "ISONORAFTER", "ISSELECTEDMEASURE", 
-                  "ISSUBTOTAL", "ISTEXT", "KEEPFILTERS", "KEYWORDMATCH", 
-                  "LASTDATE", "LASTNONBLANK", "LASTNONBLANKVALUE", "LCM", 
-                  "LEFT", "LEN", "LN", "LOG", "LOG10", "LOOKUPVALUE", "LOWER", 
-                  "MAX", "MAXA", "MAXX", "MEDIAN", "MEDIANX", "MID", "MIN", 
-                  "MINA", "MINUTE", "MINX", "MOD", "MONTH", "MROUND", "NATURALINNERJOIN", 
-                  "NATURALLEFTOUTERJOIN", "NEXTDAY", "NEXTMONTH", "NEXTQUARTER", 
-                  "NEXTYEAR", "NONVISUAL", "NORMDIST", "NORMINV", "NORMSDIST", 
-                  "NORMSINV", "NOT", "NOW", "ODD", "OPENINGBALANCEMONTH", 
-                  "OPENINGBALANCEQUARTER", "OPENINGBALANCEYEAR", "OR", "PARALLELPERIOD", 
-                  "PATH", "PATHCONTAINS", "PATHITEM", "PATHITEMREVERSE", 
-                  "PATHLENGTH", "PERCENTILEEXC", "PERCENTILEINC", "PERCENTILEXEXC", 
-                  "PERCENTILEXINC", "PERMUT", "PI", "POISSONDIST", "POWER", 
-                  "PREVIOUSDAY", "PREVIOUSMONTH", "PREVIOUSQUARTER", "PREVIOUSYEAR", 
-                  "PRODUCT", "PRODUCTX", "QUARTER", "QUOTIENT", "RADIANS", 
-                  "RAND", "RANDBETWEEN", "RANKEQ", "RANKX", "RELATED", "RELATEDTABLE", 
-                  "REMOVEFILTERS", "REPLACE", "REPT", "RIGHT", "ROLLUP", 
-                  "ROLLUPADDISSUBTOTAL", "ROLLUPGROUP", "ROLLUPISSUBTOTAL", 
-                  "ROUND", "ROUNDDOWN", "ROUNDUP", "ROW", "SAMEPERIODLASTYEAR", 
-                  "SAMPLE", "SEARCH", "SECOND", "SELECTCOLUMNS", "SELECTEDMEASURE", 
-                  "SELECTEDMEASUREFORMATSTRING", "SELECTEDMEASURENAME", 
-                  "SELECTEDVALUE", "SIGN", "SIN", "SINH", "SQRT", "SQRTPI", 
-                  "STARTOFMONTH", "STARTOFQUARTER", "STARTOFYEAR", "STDEVP", 
-                  "STDEVS", "STDEVXP", "STDEVXS", "SUBSTITUTE", "SUBSTITUTEWITHINDEX", 
-                  "SUM", "SUMMARIZE", "SUMMARIZECOLUMNS", "SUMX", "SWITCH", 
-                  "TDIST", "TDIST2T", "TDISTRT", "TINV", "TINV2T", "TAN", 
-                  "TANH", "TIME", "TIMEVALUE", "TODAY", "TOPN", "TOPNPERLEVEL", 
-                  "TOPNSKIP", "TOTALMTD", "TOTALQTD", "TOTALYTD", "TREATAS", 
-                  "TRIM", "TRUE", "TRUNC", "UNICHAR", "UNICODE", "UNION", 
-                  "UPPER", "USERELATIONSHIP", "USERNAME", "USEROBJECTID", 
-                  "USERPRINCIPALNAME", "UTCNOW", "UTCTODAY", "VALUE", "VALUES", 
-                  "VARP", "VARS", "VARXP", "VARXS", "WEEKDAY", "YEARFRAC", 
-                  "WEEKNUM", "XIRR", "XNPV", "YEAR", "ACCRINT", "ACCRINTM", 
-                  "AMORDEGRC", "AMORLINC", "COUPDAYBS", "COUPDAYS", "COUPDAYSNC", 
-                  "COUPNCD", "COUPNUM", "COUPPCD", "CUMIPMT", "CUMPRINC", 
-                  "DB", "DDB", "DISC", "DOLLARDE", "DOLLARFR", "DURATION", 
-                  "EFFECT", "FV", "INTRATE", "IPMT", "ISPMT", "MDURATION", 
-                  "NOMINAL", "NPER", "ODDFPRICE", "ODDFYIELD", "ODDLPRICE", 
-                  "ODDLYIELD", "PDURATION", "PMT", "PPMT", "PRICE", "PRICEDISC", 
-                  "PRICEMAT", "PV", "RATE", "RECEIVED", "RRI", "SLN", "SYD", 
-                  "TBILLEQ", "TBILLPRICE", "TBILLYIELD", "VDB", "YIELD", 
-                  "YIELDDISC", "YIELDMAT", "SAMPLEAXISWITHLOCALMINMAX", 
-                  "EVALUATEANDLOG", "OFFSET", "INDEX", "WINDOW", "ORDERBY", 
-                  "RANK", "ROWNUMBER", "PARTITIONBY", "EXTERNALMEASURE", 
-                  "KMEANSCLUSTERING", "DEFINE", "EVALUATE", "ORDER", "BY", 
-                  "START", "AT", "RETURN", "VAR", "IN", "ASC", "DESC", "SKIP_", 
-                  "DENSE", "BLANKS", "LAST", "FIRST", "WEEK", "BOTH", "NONE", 
-                  "ONEWAY", "ONEWAYRIGHTFILTERSLEFT", "ONEWAYLEFTFILTERSRIGHT", 
-                  "INTEGER", "DOUBLE", "STRING", "BOOLEAN", "DATETIME", 
-                  "VARIANT", "TEXT", "ALPHABETICAL", "KEEP", "REL", "EXPR", 
-                  "VAL", "ANYVAL", "ANYREF", "SCALAR", "INT64", "DECIMAL", 
-                  "NUMERIC", "DATE_LITERAL", "INTEGER_LITERAL", "REAL_LITERAL", 
-                  "STRING_LITERAL", "TABLE", "COLUMN_OR_MEASURE", "TABLE_OR_VARIABLE", 
-                  "OPEN_CURLY", "CLOSE_CURLY", "OPEN_PARENS", "CLOSE_PARENS", 
-                  "COMMA", "PLUS", "MINUS", "STAR", "DIV", "CARET", "AMP", 
-                  "ASSIGNMENT", "LT", "GT", "OP_AND", "OP_OR", "OP_NE", 
-                  "OP_LE", "OP_GE", "LAMBDA", "COLON", "InputCharacter", 
-                  "NewLine", "Whitespace", "UnicodeClassZS", "IdentifierOrKeyword", 
-                  "IdentifierStartCharacter", "IdentifierPartCharacter", 
-                  "UnicodeClassLU", "UnicodeClassLL", "UnicodeClassND" ]
+                  "BETADIST", "BETAINV", "CHISQDIST", "CHISQDISTRT", "CHISQINV", 
+                  "CHISQINVRT", "CONFIDENCENORM", "CONFIDENCET", "EXPONDIST", 
+                  "IFEAGER", "ISOCEILING", "NORMDIST", "NORMINV", "NORMSDIST", 
+                  "NORMSINV", "PERCENTILEEXC", "PERCENTILEINC", "PERCENTILEXEXC", 
+                  "PERCENTILEXINC", "POISSONDIST", "RANKEQ", "STDEVP", "STDEVS", 
+                  "STDEVXP", "STDEVXS", "TDIST", "TDIST2T", "TDISTRT", "TINV", 
+                  "TINV2T", "VARP", "VARS", "VARXP", "VARXS", "DATE_LITERAL", 
+                  "INTEGER_LITERAL", "REAL_LITERAL", "STRING_LITERAL", "TABLE", 
+                  "COLUMN_OR_MEASURE", "TABLE_OR_VARIABLE", "OPEN_CURLY", 
+                  "CLOSE_CURLY", "OPEN_PARENS", "CLOSE_PARENS", "COMMA", 
+                  "PLUS", "MINUS", "STAR", "DIV", "CARET", "AMP", "ASSIGNMENT", 
+                  "LT", "GT", "OP_AND", "OP_OR", "OP_NE", "OP_LE", "OP_GE", 
+                  "LAMBDA", "COLON", "InputCharacter", "NewLine", "Whitespace", 
+                  "UnicodeClassZS", "IdentifierOrKeyword", "IdentifierStartCharacter", 
+                  "IdentifierPartCharacter", "UnicodeClassLU", "UnicodeClassLL", 
+                  "UnicodeClassND" ]
 
     grammarFileName = "PyDAXLexer.g4"
 
@@ -2750,13 +837,27 @@ class PyDAXLexer(Lexer):
         self._predicates = None
 
 
+    # Upper case keyword spelling -> token type, built on first use (see DAXKeywords)
+    KEYWORD_TYPES = None
+
+    def keyword_or_identifier(self):
+        keyword_types_by_spelling = PyDAXLexer.KEYWORD_TYPES
+        if keyword_types_by_spelling is None:
+            keyword_types_by_spelling = PyDAXLexer.KEYWORD_TYPES = keyword_types(PyDAXLexer)
+        token_type = keyword_types_by_spelling.get(self.text.upper())
+        if token_type is not None:
+            self._type = token_type
+            self._channel = self.KEYWORD_CHANNEL
+
+
     def action(self, localctx:RuleContext, ruleIndex:int, actionIndex:int):
         if self._actions is None:
             actions = dict()
-            actions[395] = self.DATE_LITERAL_action 
-            actions[398] = self.STRING_LITERAL_action 
-            actions[399] = self.TABLE_action 
-            actions[400] = self.COLUMN_OR_MEASURE_action 
+            actions[37] = self.DATE_LITERAL_action 
+            actions[40] = self.STRING_LITERAL_action 
+            actions[41] = self.TABLE_action 
+            actions[42] = self.COLUMN_OR_MEASURE_action 
+            actions[43] = self.TABLE_OR_VARIABLE_action 
             self._actions = actions
         action = self._actions.get(ruleIndex, None)
         if action is not None:
@@ -2785,4 +886,9 @@ class PyDAXLexer(Lexer):
             self.text = self.text[1:-1].replace("]]","]");
      
 
+    def TABLE_OR_VARIABLE_action(self, localctx:RuleContext , actionIndex:int):
+        if actionIndex == 4:
+            self.keyword_or_identifier()
+     
+
 
@@ -1,3 +1,50 @@
+import os
+
 from .DAXExpression import DAXExpression
+from .DAXAnalysisResult import DAXAnalysisResult
+from .DAXAnalysisCache import DAXAnalysisCache, DAXCacheInfo
+from .DAXTimings import DAXTimings, DAXTimingsSummary
+from .DAXModel import DAXModel, DAXModelArtifact
+from .DAXScriptReader import DAXScriptReader, DAXDefinition
+from .DAXModelReader import DAXModelReader, DAXBimReader, DAXTmdlReader
 from .DAXReference import *
-from .best_practices_rules import *
\ No newline at end of file
+from .DAXReferenceIndex import DAXReferenceIndex
+from .DAXNameTable import DAXNameTable
+from .best_practices_rules import BestPracticeRule, RuleRegistry, RULE_REGISTRY, _RULE_MODULES
+
+#* Loaded on first access (PEP 562) so `import PyDAX` neither imports the rule modules nor the ANTLR runtime
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "DAXParser": ".DAXParser",
+    "DAXLineage": ".DAXLineage",
+    **dict.fromkeys(("DAXSyntaxTree", "DAXNodeKinds"), ".DAXSyntaxTree"),
+    **dict.fromkeys(_RULE_MODULES, ".best_practices_rules"),
+    **dict.fromkeys(("warmup", "save_dfa_cache", "load_dfa_cache", "load_cache_from_environment"), ".DAXLexerCache"),
+}
+
+__all__ = [
+    "DAXExpression", "DAXAnalysisResult", "DAXAnalysisCache", "DAXCacheInfo", "DAXTimings", "DAXTimingsSummary",
+    "DAXModel", "DAXModelArtifact", "DAXScriptReader", "DAXDefinition", "DAXModelReader", "DAXBimReader", "DAXTmdlReader",
+    "DAXToken", "DAXArtifactReference", "DAXReference", "DAXTableReference", "DAXVariableReference", "DAXFunctionReference",
+    "DAXUnknownReference", "DAXRelationshipReference", "DAXReferenceIndex", "DAXNameTable",
+    "BestPracticeRule", "RuleRegistry", "RULE_REGISTRY", *_LAZY_ATTRIBUTES,
+]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    from importlib import import_module
+
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if os.environ.get("PYDAX_DFA_CACHE"):
+    from .DAXLexerCache import load_cache_from_environment
+
+    load_cache_from_environment()
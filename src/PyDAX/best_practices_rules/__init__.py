@@ -1,9 +1,49 @@
+from importlib import import_module
+
 from .best_practice_rule import BestPracticeRule
-from .use_divide import UseDivide
-from .avoid_iferror import AvoidIfError
-from .use_treatas_instead_of_intersect import UseTreatasInsteadOfIntersect
-from .filter_column_values import FilterColumnValues
-from .filter_measure_values_by_columns import FilterMeasureValuesByColumns
-from .avoid_one_minus_division import AvoidOneMinusDivision
-from .evaluateandlog_should_not_be_used_in_production_models import EvaluateAndLogShouldNotBeUsedInProductionModels
-from .unused_variables import UnusedVariables
\ No newline at end of file
+from .rule_engine import RuleEngine
+from .registry import RuleRegistration, RuleRegistry
+
+#* Rule class -> module defining it. Rule modules are imported on first access (PEP 562)
+_RULE_MODULES: dict[str, str] = {
+    "UseDivide": "use_divide",
+    "AvoidIfError": "avoid_iferror",
+    "UseTreatasInsteadOfIntersect": "use_treatas_instead_of_intersect",
+    "FilterColumnValues": "filter_column_values",
+    "FilterMeasureValuesByColumns": "filter_measure_values_by_columns",
+    "AvoidOneMinusDivision": "avoid_one_minus_division",
+    "EvaluateAndLogShouldNotBeUsedInProductionModels": "evaluateandlog_should_not_be_used_in_production_models",
+    "UnusedVariables": "unused_variables",
+}
+
+#* Built-in rules: (rule ID, DAXExpression attribute, rule class), in verification order
+_BUILT_IN_RULES: tuple[tuple[str, str, str], ...] = (
+    ("USE_THE_DIVIDE_FUNCTION_FOR_DIVISION", "use_divide_function_for_division", "UseDivide"),
+    ("AVOID_USING_THE_IFERROR_FUNCTION", "avoid_using_iferror_function", "AvoidIfError"),
+    ("USE_THE_TREATAS_FUNCTION_INSTEAD_OF_INTERSECT", "use_the_treatas_function_instead_of_intersect", "UseTreatasInsteadOfIntersect"),
+    ("FILTER_COLUMN_VALUES", "filter_column_values", "FilterColumnValues"),
+    ("FILTER_MEASURE_VALUES_BY_COLUMNS", "filter_measure_values_by_columns", "FilterMeasureValuesByColumns"),
+    ("UNUSED_VARIABLES", "unused_variables", "UnusedVariables"),
+    ("AVOID_USING_'1-(X/Y)'_SYNTAX", "avoid_using_1_x_y_syntax", "AvoidOneMinusDivision"),
+    ("EVALUATEANDLOG_SHOULD_NOT_BE_USED_IN_PRODUCTION_MODELS", "evaluateandlog_should_not_be_used_in_production_models", "EvaluateAndLogShouldNotBeUsedInProductionModels"),
+)
+
+#* Every rule DAXExpression can verify: the built-in ones, then any registered by callers or entry points
+RULE_REGISTRY: RuleRegistry = RuleRegistry()
+for _id, _attribute, _class_name in _BUILT_IN_RULES:
+    RULE_REGISTRY.register(_id, f"{__name__}.{_RULE_MODULES[_class_name]}:{_class_name}", attribute=_attribute, category="DAX Expressions")
+del _id, _attribute, _class_name
+
+__all__ = ["BestPracticeRule", "RuleEngine", "RuleRegistration", "RuleRegistry", "RULE_REGISTRY", *_RULE_MODULES]
+
+
+def __getattr__(name: str):
+    if name not in _RULE_MODULES:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    rule_class = getattr(import_module(f".{_RULE_MODULES[name]}", __name__), name)
+    globals()[name] = rule_class
+    return rule_class
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
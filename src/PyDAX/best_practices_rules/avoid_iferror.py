@@ -1,8 +1,5 @@
 from .best_practice_rule import BestPracticeRule
-from ..utils import check_contains_function
-from ..PyDAXLexer import PyDAXLexer
-from antlr4 import Token
-from ..DAXToken import DAXToken
+from ..DAXTokenTypes import DAXTokenTypes
 
 
 rule_metadata = {
@@ -14,30 +11,12 @@ rule_metadata = {
       "short_name": "Avoid using the IFERROR function"
     }
 
-class AvoidIfError(BestPracticeRule):
-    def __init__(self) -> None:
-        # Initialize the base BestPracticeRule with metadata
-        super().__init__(
-            id=rule_metadata["ID"],
-            name=rule_metadata["Name"],
-            description=rule_metadata["Description"],
-            severity=rule_metadata["Severity"],
-            category=rule_metadata["Category"],
-            short_name=rule_metadata["short_name"],
-        )
+class AvoidIfError(BestPracticeRule, metadata=rule_metadata):
+    SUBSCRIBED_TYPES = frozenset({DAXTokenTypes.IFERROR})
+    REQUIRED_TYPES = (frozenset({DAXTokenTypes.IFERROR}),)
 
+    __slots__ = ()
 
-    def verify_violation(self, lexer: "PyDAXLexer") -> None:
-        # Check if the DAX expression contains the IFERROR function
-        self.clear_violations()
-        lexer.reset()  # Reset the lexer to start from the beginning
-        token: Token = lexer.nextToken()
-    
-        while token.type != Token.EOF:
-            if token.type == PyDAXLexer.IFERROR:
-                self.violators_tokens.append(DAXToken(token))
-                self.highlight_tokens.append(DAXToken(token))
-                
-            token = lexer.nextToken()
-        
-        self.verified = True
\ No newline at end of file
+    def on_token(self, index: int) -> None:
+        # Every IFERROR token is a violation
+        self.add_violation(index)
\ No newline at end of file
@@ -1,8 +1,8 @@
+from bisect import bisect_left
 
 from .best_practice_rule import BestPracticeRule
-from ..PyDAXLexer import PyDAXLexer
-from antlr4 import Token
-from ..DAXToken import DAXToken
+from ..DAXTokenTypes import DAXTokenTypes
+from ..DAXTokenBuffer import DAXTokenBuffer
 
 rule_metadata = {
     "ID": "AVOID_USING_'1-(X/Y)'_SYNTAX",
@@ -16,30 +16,25 @@ rule_metadata = {
 }
 
 
-class AvoidOneMinusDivision(BestPracticeRule):
-    def __init__(self) -> None:
-        super().__init__(
-            id=rule_metadata["ID"],
-            name=rule_metadata["Name"],
-            description=rule_metadata["Description"],
-            severity=str(rule_metadata["Severity"]),
-            category=rule_metadata["Category"],
-            short_name=rule_metadata["short_name"]
-        )
+class AvoidOneMinusDivision(BestPracticeRule, metadata=rule_metadata, severity=str(rule_metadata["Severity"])):
+    #* 1 +/- ... / ...
+    REQUIRED_TYPES = (
+        frozenset({DAXTokenTypes.INTEGER_LITERAL, DAXTokenTypes.REAL_LITERAL}),
+        frozenset({DAXTokenTypes.PLUS, DAXTokenTypes.MINUS}),
+        frozenset({DAXTokenTypes.DIV}),
+    )
 
-    def verify_violation(self, lexer: "PyDAXLexer") -> None:
-        self.clear_violations()
-        lexer.reset()
-        window: list[Token] = []
-        token: Token = lexer.nextToken()
-        while token.type != Token.EOF:
-            if token.channel == Token.DEFAULT_CHANNEL:
-                window.append(token)
-            token = lexer.nextToken()
+    __slots__ = ()
+
+    def verify_violation(self, tokens: "DAXTokenBuffer | PyDAXLexer") -> None:
+        buffer: DAXTokenBuffer = self.start_verification(tokens)
+        types = buffer.types
+        window: list[int] = buffer.on_channels(DAXTokenTypes.DEFAULT_CHANNEL)
+        divisions: list[int] | None = None  # Window positions of the '/' tokens, collected for the first candidate
         for i, t in enumerate(window):
             # Numeric literals are tokenized as INTEGER_LITERAL or REAL_LITERAL
-            if t.type in (PyDAXLexer.INTEGER_LITERAL, PyDAXLexer.REAL_LITERAL):
-                txt = t.text.strip()
+            if types[t] in (DAXTokenTypes.INTEGER_LITERAL, DAXTokenTypes.REAL_LITERAL):
+                txt = buffer.token_text(t).strip()
                 is_one = False
                 try:
                     is_one = float(txt) == 1.0
@@ -49,11 +44,12 @@ class AvoidOneMinusDivision(BestPracticeRule):
                     continue
                 if i + 2 < len(window):
                     op = window[i + 1]
+                    if types[op] not in (DAXTokenTypes.PLUS, DAXTokenTypes.MINUS):
+                        continue
+                    if divisions is None:
+                        divisions = [p for p, w in enumerate(window) if types[w] == DAXTokenTypes.DIV]
                     # search a '/' within next 10 tokens
-                    has_div = any(
-                        w.type == PyDAXLexer.DIV for w in window[i + 2 : min(len(window), i + 12)]
-                    )
-                    if op.type in (PyDAXLexer.PLUS, PyDAXLexer.MINUS) and has_div:
-                        self.violators_tokens.append(DAXToken(op))
-                        self.highlight_tokens.append(DAXToken(op))
+                    d = bisect_left(divisions, i + 2)
+                    if d < len(divisions) and divisions[d] < i + 12:
+                        self.add_violation(op)
         self.verified = True
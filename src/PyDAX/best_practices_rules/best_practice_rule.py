@@ -1,43 +1,141 @@
-from antlr4 import Token
-from ..PyDAXLexer import PyDAXLexer
-from typing import Literal
-from ..DAXToken import DAXToken
+from typing import Any
+from ..DAXToken import DAXToken, resolve_token, restore_slots, slot_state
+from ..DAXTokenBuffer import DAXTokenBuffer
+from .rule_engine import RuleEngine
 
 class BestPracticeRule:
-    def __init__(self, id: str, name: str, description: str, severity: str, category: str, short_name: str) -> None:
-        self.id: str = id
-        self.name: str = name
-        self.description: str = description
-        self.severity: str = severity
-        self.category: str = category
-        self.short_name: str = short_name
+    #* Token dispatch (see RuleEngine): a rule subscribing to token types or channels receives on_token(index) for
+    #* every matching token during a walk shared with the other rules, then finish_verification()
+    SUBSCRIBED_TYPES: frozenset[int] = frozenset()
+    SUBSCRIBED_CHANNELS: frozenset[int] = frozenset()
+    #* Prerequisites: the rule can only be violated by an expression containing at least one token type of every group.
+    #* RuleEngine skips the rule when they are missing and reports it verified without violations
+    REQUIRED_TYPES: tuple[frozenset[int], ...] = ()
+    
+    #* Metadata, shared by every instance: rules set it at class level
+    id: str = ""
+    name: str = ""
+    description: str = ""
+    severity: str = ""
+    category: str = ""
+    short_name: str = ""
+    METADATA_ATTRIBUTES: tuple[str, ...] = ("id", "name", "description", "severity", "category", "short_name")
+    #* Key of each metadata attribute in the rule_metadata dict of a rule module
+    METADATA_KEYS: dict[str, str] = {
+        "id": "ID", "name": "Name", "description": "Description", "severity": "Severity", "category": "Category",
+        "short_name": "short_name",
+    }
+
+    #* Rules declare __slots__ = () so instances only hold their verification state
+    __slots__ = ("verified", "tokens", "violators_indexes", "highlight_indexes")
+
+    def __init_subclass__(cls, metadata: dict[str, Any] | None = None, **kwargs: Any) -> None:
+        """Sets the class level metadata of a rule from its rule_metadata dict, then from keyword arguments named after
+        METADATA_ATTRIBUTES, e.g. `class MyRule(BestPracticeRule, metadata=rule_metadata, severity="2")`"""
+        if metadata is not None:
+            for attribute, key in cls.METADATA_KEYS.items():
+                if key in metadata:
+                    setattr(cls, attribute, metadata[key])
+        for attribute in cls.METADATA_ATTRIBUTES:
+            if attribute in kwargs:
+                setattr(cls, attribute, kwargs.pop(attribute))
+        super().__init_subclass__(**kwargs)
+
+    def __init__(
+        self, id: str | None = None, name: str | None = None, description: str | None = None,
+        severity: str | None = None, category: str | None = None, short_name: str | None = None,
+    ) -> None:
+        #* Metadata passed here overrides the class level one, for rules that do not declare __slots__
+        for attribute, value in zip(self.METADATA_ATTRIBUTES, (id, name, description, severity, category, short_name)):
+            if value is not None and value != getattr(type(self), attribute):
+                setattr(self, attribute, value)
 
         #Verification attr
         self.verified: bool = False
-        self.violators_tokens: list[DAXToken] = []
-        self.highlight_tokens: list[DAXToken] = []
-    
+        #Violations are kept as indexes into the verified DAXTokenBuffer
+        self.tokens: DAXTokenBuffer | None = None
+        self.violators_indexes: list[int] = []
+        self.highlight_indexes: list[int] = []
+
     def __str__(self) -> str:
-        return f"{self.name} - Verified: {self.verified}, Violations: {len(self.violators_tokens)}"
-    
+        return f"{self.name} - Verified: {self.verified}, Violations: {len(self.violators_indexes)}"
+
     def __getstate__(self):
-        state = self.__dict__.copy()
-        # Handle attributes that can't be pickled
-        return state
-    
+        return slot_state(self)
+
+    def __setstate__(self, state):
+        #* Pickles from previous versions stored materialized DAXToken lists, which resolve_token passes through
+        if "violators_tokens" in state:
+            state["violators_indexes"] = state.pop("violators_tokens")
+        if "highlight_tokens" in state:
+            state["highlight_indexes"] = state.pop("highlight_tokens")
+        if not hasattr(self, "__dict__"):
+            #* They also stored the metadata on the instance, now set by the class
+            for name in self.METADATA_ATTRIBUTES:
+                state.pop(name, None)
+        restore_slots(self, state)
+
+    @property
+    def violators_tokens(self) -> list[DAXToken]:
+        return [resolve_token(index, self.tokens) for index in self.violators_indexes]
+
+    @property
+    def highlight_tokens(self) -> list[DAXToken]:
+        return [resolve_token(index, self.tokens) for index in self.highlight_indexes]
+
     @property
     def violated(self) -> bool:
-        return len(self.violators_tokens) > 0
-    
+        return len(self.violators_indexes) > 0
+
     @property
     def number_of_violations(self) -> int:
-        return len(self.violators_tokens)
-    
-    
+        return len(self.violators_indexes)
+
+    @property
+    def dispatches_tokens(self) -> bool:
+        return bool(self.SUBSCRIBED_TYPES or self.SUBSCRIBED_CHANNELS)
+
+    def prerequisites_met(self, present_types: frozenset[int]) -> bool:
+        """Whether an expression containing `present_types` can violate the rule (see REQUIRED_TYPES)"""
+        for required in self.REQUIRED_TYPES:
+            if required.isdisjoint(present_types):
+                return False
+        return True
+
+
     def clear_violations(self) -> None:
-        self.violators_tokens.clear()
+        self.violators_indexes.clear()
         # Also clear highlight spans to avoid stale highlights across runs
-        self.highlight_tokens.clear()
+        self.highlight_indexes.clear()
+
+    def add_violation(self, index: int, highlight: bool = True) -> None:
+        """Registers the token at `index` of the verified buffer as a violator (and highlights it by default)"""
+        self.violators_indexes.append(index)
+        if highlight:
+            self.highlight_indexes.append(index)
+
+    def start_verification(self, tokens: "DAXTokenBuffer | PyDAXLexer") -> DAXTokenBuffer:
+        """Clears previous results and binds the rule to the token buffer it is about to verify"""
+        self.clear_violations()
+        self.tokens = self.token_buffer(tokens)
+        return self.tokens
+
+    @staticmethod
+    def token_buffer(tokens: "DAXTokenBuffer | PyDAXLexer") -> DAXTokenBuffer:
+        """Returns the token buffer to verify. A bare lexer is still accepted and lexed once."""
+        if isinstance(tokens, DAXTokenBuffer):
+            return tokens
+        return DAXTokenBuffer.from_lexer(tokens)
+
+    def on_token(self, index: int) -> None:
+        """Receives every token of the verified buffer matching SUBSCRIBED_TYPES or SUBSCRIBED_CHANNELS, in order"""
+        raise NotImplementedError("Rules subscribing to tokens must implement this method")
+
+    def finish_verification(self) -> None:
+        """Called once the walk over the verified buffer is over"""
+        self.verified = True
 
-    def verify_violation(self, dax_expression) -> None:
-        raise NotImplementedError("Subclasses must implement this method")
\ No newline at end of file
+    def verify_violation(self, tokens: "DAXTokenBuffer | PyDAXLexer") -> None:
+        if not self.dispatches_tokens:
+            raise NotImplementedError("Subclasses must implement this method or subscribe to tokens")
+        RuleEngine.verify_rule(self, self.token_buffer(tokens))
@@ -1,7 +1,10 @@
+from typing import TYPE_CHECKING
+
 from .best_practice_rule import BestPracticeRule
-from ..PyDAXLexer import PyDAXLexer
-from antlr4 import Token
-from ..DAXToken import DAXToken
+from ..DAXTokenTypes import DAXTokenTypes
+
+if TYPE_CHECKING:
+    from ..DAXTokenBuffer import DAXTokenBuffer
 
 rule_metadata = {
     "ID": "EVALUATEANDLOG_SHOULD_NOT_BE_USED_IN_PRODUCTION_MODELS",
@@ -15,24 +18,12 @@ rule_metadata = {
 }
 
 
-class EvaluateAndLogShouldNotBeUsedInProductionModels(BestPracticeRule):
-    def __init__(self) -> None:
-        super().__init__(
-            id=rule_metadata["ID"],
-            name=rule_metadata["Name"],
-            description=rule_metadata["Description"],
-            severity=str(rule_metadata["Severity"]),
-            category=rule_metadata["Category"],
-            short_name=rule_metadata["short_name"]
-        )
+class EvaluateAndLogShouldNotBeUsedInProductionModels(BestPracticeRule, metadata=rule_metadata, severity=str(rule_metadata["Severity"])):
+    SUBSCRIBED_TYPES = frozenset({DAXTokenTypes.EVALUATEANDLOG})
+    REQUIRED_TYPES = (frozenset({DAXTokenTypes.EVALUATEANDLOG}),)
+
+    __slots__ = ()
 
-    def verify_violation(self, lexer: "PyDAXLexer") -> None:
-        self.clear_violations()
-        lexer.reset()
-        token: Token = lexer.nextToken()
-        while token.type != Token.EOF:
-            if token.type == PyDAXLexer.EVALUATEANDLOG:
-                self.violators_tokens.append(DAXToken(token))
-                self.highlight_tokens.append(DAXToken(token))
-            token = lexer.nextToken()
-        self.verified = True
+    def on_token(self, index: int) -> None:
+        # Every EVALUATEANDLOG token is a violation
+        self.add_violation(index)
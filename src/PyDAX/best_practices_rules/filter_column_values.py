@@ -1,10 +1,7 @@
-import re
 from .best_practice_rule import BestPracticeRule
-from ..PyDAXLexer import PyDAXLexer
-from antlr4 import Token
-from ..DAXToken import DAXToken
-
-#! Limitation: Currently n ot checking for multiple violations on the same expression
+from ..DAXTokenTypes import DAXTokenTypes
+from ..DAXTokenBuffer import DAXTokenBuffer
+from .token_matcher import calls_in_arguments, match_sequence
 
 rule_metadata = {
     "ID": "FILTER_COLUMN_VALUES",
@@ -17,86 +14,40 @@ rule_metadata = {
     "short_name": "Prefer KEEPFILTERS('Table'[Column] = Value) or 'Table'[Column] = Value over FILTER('Table', 'Table'[Column] = Value)."
 }
 
+_TABLE = frozenset({DAXTokenTypes.TABLE, DAXTokenTypes.TABLE_OR_VARIABLE})
+#* FILTER( 'Table', 'Table'[Column]
+_PATTERN = (
+    frozenset({DAXTokenTypes.OPEN_PARENS}),
+    _TABLE,
+    frozenset({DAXTokenTypes.COMMA}),
+    _TABLE,
+    frozenset({DAXTokenTypes.COLUMN_OR_MEASURE}),
+)
 
-class FilterColumnValues(BestPracticeRule):
-    def __init__(self) -> None:
-        super().__init__(
-            id=rule_metadata["ID"],
-            name=rule_metadata["Name"],
-            description=rule_metadata["Description"],
-            severity=str(rule_metadata["Severity"]),
-            category=rule_metadata["Category"],
-            short_name=rule_metadata["short_name"]
-        )
-        self.patterns = [
-            re.compile(r"CALCULATE\s*\(\s*[^,]+,\s*FILTER\s*\(\s*'?[A-Za-z0-9 _]+'?\s*,\s*'?[A-Za-z0-9 _]+'?\[[A-Za-z0-9 _]+\]", re.IGNORECASE),
-            re.compile(r"CALCULATETABLE\s*\([^,]*,\s*FILTER\s*\(\s*'?[A-Za-z0-9 _]+'?,\s*'?[A-Za-z0-9 _]+'?\[[A-Za-z0-9 _]+\]", re.IGNORECASE),
-        ]
-
-    def verify_violation(self, lexer: "PyDAXLexer") -> None:
-        self.clear_violations()
-        lexer.reset()
 
-        full_text = lexer.inputStream.strdata
+class FilterColumnValues(BestPracticeRule, metadata=rule_metadata, severity=str(rule_metadata["Severity"])):
+    """Flags FILTER('Table', 'Table'[Column] ...) used as a filter argument of CALCULATE or CALCULATETABLE"""
 
-        # Token-based guard: require a real CALCULATE/CALCULATETABLE token on the keyword channel
-        # (ignores commented occurrences). Also prepare tokens for span expansion.
-        lexer.reset()
-        all_tokens: list[Token] = lexer.getAllTokens()
-        # Tokens on the keyword channel (functions like CALCULATE, FILTER)
-        keyword_tokens: list[Token] = [t for t in all_tokens if t.channel == PyDAXLexer.KEYWORD_CHANNEL]
-        # Tokens we can use to expand highlight spans (default + keyword channels)
-        search_tokens: list[Token] = [
-            t for t in all_tokens if t.channel in (Token.DEFAULT_CHANNEL, PyDAXLexer.KEYWORD_CHANNEL)
-        ]
-        
-        #* checks if there is a CALCULATE or CALCULATETABLE token that is not commented out (thats why we use KEYWORD_CHANNEL)
-        has_calculate = any(
-            token.type in (PyDAXLexer.CALCULATE, PyDAXLexer.CALCULATETABLE) for token in keyword_tokens
-        )
-        if not has_calculate:
-            self.verified = True
-            return
+    REQUIRED_TYPES = (frozenset({DAXTokenTypes.FILTER}), frozenset({DAXTokenTypes.CALCULATE, DAXTokenTypes.CALCULATETABLE}))
 
-        filter_tokens = [token for token in keyword_tokens if token.type == PyDAXLexer.FILTER]
+    __slots__ = ()
 
-        # Track added highlight spans to avoid duplicates
-        seen_highlights: set[tuple[int, int]] = set()
+    def verify_violation(self, tokens: "DAXTokenBuffer | PyDAXLexer") -> None:
+        buffer: DAXTokenBuffer = self.start_verification(tokens)
+        types = buffer.types
 
-        for pattern in self.patterns:
-            for match in pattern.finditer(full_text):
-                match_start, match_end = match.span()
-
-                for ft in filter_tokens:
-                    if ft.start >= match_start and ft.stop < match_end:
-                        # Count only the FILTER token as the violation
-                        if ft not in self.violators_tokens:
-                            self.violators_tokens.append(DAXToken(ft))
-                        # Always highlight FILTER itself
-                        key = (ft.start, ft.stop)
-                        if key not in seen_highlights:
-                            self.highlight_tokens.append(DAXToken(ft))
-                            seen_highlights.add(key)
+        # Commented out or quoted keywords are lexed as comments or strings, so only real calls are found here
+        if DAXTokenTypes.FILTER not in types or not (DAXTokenTypes.CALCULATE in types or DAXTokenTypes.CALCULATETABLE in types):
+            self.verified = True
+            return
 
-                        # Find the first COLUMN_OR_MEASURE token after FILTER within match span
-                        column_tok = None
-                        for t in search_tokens:
-                            if (
-                                t.type == PyDAXLexer.COLUMN_OR_MEASURE
-                                and t.start > ft.start
-                                and t.stop <= match_end
-                            ):
-                                column_tok = t
-                                break
+        for filter_index in calls_in_arguments(buffer, DAXTokenTypes.FILTER, (DAXTokenTypes.CALCULATE, DAXTokenTypes.CALCULATETABLE)):
+            matched = match_sequence(buffer, filter_index, _PATTERN)
+            if matched is None:
+                continue
+            # The FILTER token is the violation, FILTER .. 'Table'[Column] is highlighted
+            self.violators_indexes.append(filter_index)
+            self.highlight_indexes.append(filter_index)
+            self.highlight_indexes.extend(matched)
 
-                        # If present, add all tokens from FILTER .. column to highlight list only
-                        if column_tok is not None:
-                            end_idx = column_tok.stop
-                            for t in search_tokens:
-                                if t.start >= ft.start and t.stop <= end_idx:
-                                    key = (t.start, t.stop)
-                                    if key not in seen_highlights:
-                                        self.highlight_tokens.append(DAXToken(t))
-                                        seen_highlights.add(key)
-        
         self.verified = True
@@ -1,10 +1,7 @@
-import re
 from .best_practice_rule import BestPracticeRule
-from ..PyDAXLexer import PyDAXLexer
-from antlr4 import Token
-from ..DAXToken import DAXToken
-
-#! Limitation: Currently n ot checking for multiple violations on the same expression
+from ..DAXTokenTypes import DAXTokenTypes
+from ..DAXTokenBuffer import DAXTokenBuffer
+from .token_matcher import calls_in_arguments, match_sequence
 
 rule_metadata = {
     "ID": "FILTER_MEASURE_VALUES_BY_COLUMNS",
@@ -17,54 +14,33 @@ rule_metadata = {
     "short_name": "Prefer FILTER over VALUES/ALL('Table'[Column]) for measure filters rather than filtering entire tables"
 }
 
+#* FILTER( 'Table', [Measure]
+_PATTERN = (
+    frozenset({DAXTokenTypes.OPEN_PARENS}),
+    frozenset({DAXTokenTypes.TABLE, DAXTokenTypes.TABLE_OR_VARIABLE}),
+    frozenset({DAXTokenTypes.COMMA}),
+    frozenset({DAXTokenTypes.COLUMN_OR_MEASURE}),
+)
+
+
+class FilterMeasureValuesByColumns(BestPracticeRule, metadata=rule_metadata, severity=str(rule_metadata["Severity"])):
+    """Flags FILTER('Table', [Measure] ...) used as a filter argument of CALCULATE or CALCULATETABLE"""
 
-class FilterMeasureValuesByColumns(BestPracticeRule):
-    def __init__(self) -> None:
-        super().__init__(
-            id=rule_metadata["ID"],
-            name=rule_metadata["Name"],
-            description=rule_metadata["Description"],
-            severity=str(rule_metadata["Severity"]),
-            category=rule_metadata["Category"],
-            short_name=rule_metadata["short_name"],
-        )
-        self.patterns = [
-            re.compile(
-                r"CALCULATE\s*\(\s*[^,]+,\s*FILTER\s*\(\s*'?[A-Za-z0-9 _]+'?\s*,\s*\[[^\]]+\]",
-                re.IGNORECASE,
-            ),
-            re.compile(
-                r"CALCULATETABLE\s*\([^,]*,\s*FILTER\s*\(\s*'?[A-Za-z0-9 _]+'?\s*,\s*\[",
-                re.IGNORECASE,
-            ),
-        ]
+    REQUIRED_TYPES = (frozenset({DAXTokenTypes.FILTER}), frozenset({DAXTokenTypes.CALCULATE, DAXTokenTypes.CALCULATETABLE}))
 
-    def verify_violation(self, lexer: "PyDAXLexer") -> None:
-        self.clear_violations()
-        lexer.reset()
+    __slots__ = ()
 
-        full_text = lexer.inputStream.strdata
-        # Make sure that the expression contains a CALCULATE or CALCULATETABLE outside of comments/strings
-        lexer.reset()
-        all_tokens: list[Token] = lexer.getAllTokens()
-        keyword_tokens = [t for t in all_tokens if t.channel == PyDAXLexer.KEYWORD_CHANNEL]
-        has_calculate = any(
-            t.type in (PyDAXLexer.CALCULATE, PyDAXLexer.CALCULATETABLE) for t in keyword_tokens
-        )
-        if not has_calculate:
+    def verify_violation(self, tokens: "DAXTokenBuffer | PyDAXLexer") -> None:
+        buffer: DAXTokenBuffer = self.start_verification(tokens)
+        types = buffer.types
+
+        # Commented out or quoted keywords are lexed as comments or strings, so only real calls are found here
+        if DAXTokenTypes.FILTER not in types or not (DAXTokenTypes.CALCULATE in types or DAXTokenTypes.CALCULATETABLE in types):
             self.verified = True
             return
 
-        filter_tokens = [t for t in keyword_tokens if t.type == PyDAXLexer.FILTER]
-
-        # Find all violations via regex spans and map them to FILTER tokens by position
-        for pattern in self.patterns:
-            for match in pattern.finditer(full_text):
-                start, end = match.span()
-                for ft in filter_tokens:
-                    if ft.start >= start and ft.stop < end:
-                        if ft not in self.violators_tokens:
-                            self.violators_tokens.append(DAXToken(ft))
-                            self.highlight_tokens.append(DAXToken(ft))
+        for filter_index in calls_in_arguments(buffer, DAXTokenTypes.FILTER, (DAXTokenTypes.CALCULATE, DAXTokenTypes.CALCULATETABLE)):
+            if match_sequence(buffer, filter_index, _PATTERN) is not None:
+                self.add_violation(filter_index)
 
         self.verified = True
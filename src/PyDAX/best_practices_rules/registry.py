@@ -0,0 +1,137 @@
+import re
+from importlib import import_module
+from typing import Callable, Iterable, Iterator
+
+
+class RuleRegistration:
+    """A rule known to a RuleRegistry. The rule class is only imported once it is needed."""
+
+    def __init__(self, id: str, attribute: str, category: str | None, loader: Callable[[], type]) -> None:
+        self.id: str = id
+        self.attribute: str = attribute  # DAXExpression attribute holding the rule instance
+        self._category: str | None = category
+        self._loader: Callable[[], type] = loader
+        self._rule_class: type | None = None
+
+    @property
+    def rule_class(self) -> type:
+        if self._rule_class is None:
+            self._rule_class = self._loader()
+        return self._rule_class
+
+    @property
+    def category(self) -> str:
+        if self._category is None:
+            # Rules registered without a category (entry points) declare it in their metadata
+            self._category = self.rule_class().category
+        return self._category
+
+    def __repr__(self) -> str:
+        return f"RuleRegistration({self.id!r}, attribute={self.attribute!r})"
+
+
+class RuleRegistry:
+    """Best practice rules by ID, selectable by ID or category.
+
+    Built-in rules are registered when best_practices_rules is imported. Third-party packages can expose rules through
+    the `pydax.rules` entry point group (entry point name: rule ID, value: `module:RuleClass`). Entry points are
+    discovered by load_entry_points(), which select() calls the first time it selects every rule or is asked for an
+    ID or category it does not know, so reading package metadata is not paid for by `import PyDAX`.
+    """
+
+    ENTRY_POINT_GROUP: str = "pydax.rules"
+
+    def __init__(self) -> None:
+        self._by_id: dict[str, RuleRegistration] = {}
+        self._by_attribute: dict[str, RuleRegistration] = {}
+        self._selections: dict[tuple, tuple[str, ...]] = {}
+        self._entry_points_loaded: bool = False
+
+    def register(self, id: str, rule_class: "type | str", attribute: str | None = None, category: str | None = None) -> RuleRegistration:
+        """Registers a rule.
+
+        Args:
+            id (str): Rule ID, as used to enable or disable the rule
+            rule_class (type | str): The BestPracticeRule subclass, or "module:ClassName" to import it on first use
+            attribute (str | None): DAXExpression attribute holding the rule. Defaults to the lower case ID.
+            category (str | None): Rule category. When omitted, read from the rule once it is first needed.
+        """
+        attribute = attribute or re.sub(r"\W+", "_", id.lower()).strip("_")
+        if id.casefold() in self._by_id:
+            raise ValueError(f"A rule with ID '{id}' is already registered")
+        if attribute in self._by_attribute:
+            raise ValueError(f"A rule already uses the DAXExpression attribute '{attribute}'")
+
+        if isinstance(rule_class, str):
+            module_name, _, class_name = rule_class.partition(":")
+            loader = lambda: getattr(import_module(module_name), class_name)
+        else:
+            loader = lambda: rule_class
+        registration = RuleRegistration(id, attribute, category, loader)
+        self._by_id[id.casefold()] = registration
+        self._by_attribute[attribute] = registration
+        self._selections.clear()
+        return registration
+
+    def load_entry_points(self) -> None:
+        """Registers the rules exposed by installed packages through the `pydax.rules` entry point group"""
+        if self._entry_points_loaded:
+            return
+        self._entry_points_loaded = True
+        from importlib.metadata import entry_points
+
+        for entry_point in entry_points(group=self.ENTRY_POINT_GROUP):
+            if entry_point.name.casefold() not in self._by_id:
+                self.register(entry_point.name, entry_point.value)
+
+    def __iter__(self) -> Iterator[RuleRegistration]:
+        return iter(self._by_id.values())
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, id: str) -> bool:
+        return id.casefold() in self._by_id
+
+    def __getitem__(self, id: str) -> RuleRegistration:
+        return self._by_id[id.casefold()]
+
+    def by_attribute(self, attribute: str) -> RuleRegistration | None:
+        return self._by_attribute.get(attribute)
+
+    def select(self, enabled: Iterable[str] | None = None, disabled: Iterable[str] = ()) -> tuple[str, ...]:
+        """Attributes of the selected rules, in registration order.
+
+        Args:
+            enabled (Iterable[str] | None): Rule IDs or categories to enable. Defaults to every registered rule,
+                entry points included.
+            disabled (Iterable[str]): Rule IDs or categories to leave out, applied after `enabled`.
+
+        Raises:
+            ValueError: A name is neither a registered rule ID nor a category
+        """
+        if enabled is None:
+            self.load_entry_points()
+        key = (None if enabled is None else tuple(enabled), tuple(disabled))
+        selection = self._selections.get(key)
+        if selection is None:
+            enabled_names, disabled_names = key
+            included = list(self) if enabled_names is None else self._matching(enabled_names)
+            excluded = {registration.attribute for registration in self._matching(disabled_names)}
+            selection = self._selections[key] = tuple(
+                registration.attribute for registration in self if registration in included and registration.attribute not in excluded
+            )
+        return selection
+
+    def _matching(self, names: tuple[str, ...]) -> list[RuleRegistration]:
+        wanted = {name.casefold() for name in names}
+        if not self._entry_points_loaded and not wanted <= self._known_names():
+            self.load_entry_points()
+        known = self._known_names()
+        unknown = [name for name in names if name.casefold() not in known]
+        if unknown:
+            raise ValueError(f"Unknown rule IDs or categories {sorted(unknown)}, expected any of {sorted(known)}")
+        return [registration for registration in self if registration.id.casefold() in wanted or registration.category.casefold() in wanted]
+
+    def _known_names(self) -> set[str]:
+        return set(self._by_id) | {registration.category.casefold() for registration in self}
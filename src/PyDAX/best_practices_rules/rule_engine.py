@@ -0,0 +1,103 @@
+from typing import Iterable
+
+from ..DAXTokenBuffer import DAXTokenBuffer
+
+
+class _DispatchPlan:
+    """Subscriptions of a combination of rule classes. Subscriptions are class attributes, so the plan is shared by
+    every expression verified with the same rules."""
+
+    def __init__(self, rule_classes: tuple[type, ...]) -> None:
+        self.rule_classes: tuple[type, ...] = rule_classes
+        self.watched_types: frozenset[int] = frozenset().union(*(rule.SUBSCRIBED_TYPES for rule in rule_classes))
+        self.watched_channels: frozenset[int] = frozenset().union(*(rule.SUBSCRIBED_CHANNELS for rule in rule_classes))
+        #* channel << 16 | token type -> positions of the subscribed rules, filled as token kinds show up
+        self.subscribers: dict[int, tuple[int, ...]] = {}
+
+    def subscribers_of(self, token_type: int, channel: int) -> tuple[int, ...]:
+        key = channel << 16 | token_type
+        subscribers = self.subscribers.get(key)
+        if subscribers is None:
+            subscribers = self.subscribers[key] = tuple(
+                position
+                for position, rule in enumerate(self.rule_classes)
+                if token_type in rule.SUBSCRIBED_TYPES or channel in rule.SUBSCRIBED_CHANNELS
+            )
+        return subscribers
+
+    def watched_tokens(self, buffer: DAXTokenBuffer) -> list[int]:
+        """Indexes of the tokens at least one rule subscribed to, found in one pass over the buffer"""
+        types, watched_types = buffer.types, self.watched_types
+        if self.watched_channels:
+            watched_channels = self.watched_channels
+            return [index for index, (token_type, channel) in enumerate(zip(types, buffer.channels))
+                    if token_type in watched_types or channel in watched_channels]
+        # Type subscriptions only: most expressions contain none of the watched types, which set() finds at C speed
+        present = watched_types.intersection(types)
+        if not present:
+            return []
+        return [index for index, token_type in enumerate(types) if token_type in present]
+
+
+_PLANS: dict[tuple[type, ...], _DispatchPlan] = {}
+
+
+class RuleEngine:
+    """Verifies several best practice rules with a single walk over the token buffer.
+
+    Rules subscribing to token types or channels (BestPracticeRule.SUBSCRIBED_TYPES / SUBSCRIBED_CHANNELS) receive
+    on_token(index) for every matching token, in buffer order and at most once per token, then
+    finish_verification(). The cost of the walk grows with the number of tokens, not with rules x tokens.
+    Rules without subscriptions still verify the whole buffer through their own verify_violation.
+    Rules whose BestPracticeRule.REQUIRED_TYPES are missing from the buffer are not run at all.
+    """
+
+    def __init__(self, rules: Iterable["BestPracticeRule"]) -> None:
+        self.rules: list["BestPracticeRule"] = list(rules)
+
+    @staticmethod
+    def _plan_for(rule_classes: tuple[type, ...]) -> _DispatchPlan:
+        plan = _PLANS.get(rule_classes)
+        if plan is None:
+            plan = _PLANS[rule_classes] = _DispatchPlan(rule_classes)
+        return plan
+
+    @classmethod
+    def verify_rule(cls, rule: "BestPracticeRule", buffer: DAXTokenBuffer) -> None:
+        """Verifies a single token subscribing rule: every watched token is its own, no dispatch is needed"""
+        rule.start_verification(buffer)
+        on_token = rule.on_token
+        for index in cls._plan_for((type(rule),)).watched_tokens(buffer):
+            on_token(index)
+        rule.finish_verification()
+
+    def verify(self, buffer: DAXTokenBuffer) -> None:
+        present_types = buffer.present_types
+        token_rules: list["BestPracticeRule"] = []
+        buffer_rules: list["BestPracticeRule"] = []
+        for rule in self.rules:
+            if not rule.prerequisites_met(present_types):
+                # Cannot be violated: verified without violations, bound to the buffer like any verified rule
+                rule.start_verification(buffer)
+                rule.finish_verification()
+            elif rule.dispatches_tokens:
+                token_rules.append(rule)
+            else:
+                buffer_rules.append(rule)
+
+        for rule in token_rules:
+            rule.start_verification(buffer)
+
+        if token_rules:
+            types, channels = buffer.types, buffer.channels
+            handlers = [rule.on_token for rule in token_rules]
+            plan = self._plan_for(tuple(type(rule) for rule in token_rules))
+            for index in plan.watched_tokens(buffer):
+                for position in plan.subscribers_of(types[index], channels[index]):
+                    handlers[position](index)
+
+        for rule in token_rules:
+            rule.finish_verification()
+
+        for rule in buffer_rules:
+            rule.verify_violation(tokens=buffer)
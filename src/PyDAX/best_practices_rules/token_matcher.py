@@ -0,0 +1,54 @@
+from typing import Iterable
+
+from ..DAXTokenTypes import DAXTokenTypes
+from ..DAXTokenBuffer import DAXTokenBuffer
+
+#* Channels whose tokens never take part in the structure of an expression
+_SKIPPED_CHANNELS: frozenset[int] = frozenset({DAXTokenTypes.HIDDEN, DAXTokenTypes.COMMENTS_CHANNEL})
+
+
+def calls_in_arguments(buffer: DAXTokenBuffer, function: int, enclosing: Iterable[int], first_argument: int = 1) -> list[int]:
+    """Indexes of the `function` tokens written directly in an argument of a call to one of the `enclosing` functions,
+    from argument position `first_argument` (0 based) onwards.
+
+    A single pass over the buffer follows parenthesis nesting and argument positions, so strings, comments and calls
+    nested in another function's arguments are never mistaken for arguments of the enclosing call.
+    """
+    enclosing = frozenset(enclosing)
+    types, channels = buffer.types, buffer.channels
+    open_parens, close_parens, comma = DAXTokenTypes.OPEN_PARENS, DAXTokenTypes.CLOSE_PARENS, DAXTokenTypes.COMMA
+
+    #* One [function type, argument position] per open parenthesis, the type is 0 for a parenthesis that is no call
+    calls: list[list[int]] = []
+    previous = 0
+    matches: list[int] = []
+    for index in range(len(types)):
+        if channels[index] in _SKIPPED_CHANNELS:
+            continue
+        token_type = types[index]
+        if token_type == open_parens:
+            calls.append([previous, 0])
+        elif token_type == close_parens:
+            if calls:
+                calls.pop()
+        elif token_type == comma:
+            if calls:
+                calls[-1][1] += 1
+        elif token_type == function and calls and calls[-1][0] in enclosing and calls[-1][1] >= first_argument:
+            matches.append(index)
+        previous = token_type
+    return matches
+
+
+def match_sequence(buffer: DAXTokenBuffer, index: int, pattern: Iterable[frozenset[int]]) -> list[int] | None:
+    """Indexes of the significant tokens after `index` when their types match `pattern` one by one, None otherwise"""
+    types, channels = buffer.types, buffer.channels
+    matched: list[int] = []
+    for expected in pattern:
+        index += 1
+        while index < len(types) and channels[index] in _SKIPPED_CHANNELS:
+            index += 1
+        if index >= len(types) or types[index] not in expected:
+            return None
+        matched.append(index)
+    return matched
@@ -1,7 +1,6 @@
 from .best_practice_rule import BestPracticeRule
-from ..PyDAXLexer import PyDAXLexer
-from antlr4 import Token
-from ..DAXToken import DAXToken
+from ..DAXTokenTypes import DAXTokenTypes
+from ..DAXTokenBuffer import DAXTokenBuffer
 
 rule_metadata = {
     "ID": "UNUSED_VARIABLES",
@@ -13,41 +12,33 @@ rule_metadata = {
 }
 
 
-class UnusedVariables(BestPracticeRule):
-    def __init__(self) -> None:
-        super().__init__(
-            id=rule_metadata["ID"],
-            name=rule_metadata["Name"],
-            description=rule_metadata["Description"],
-            severity=str(rule_metadata["Severity"]),
-            category=rule_metadata["Category"],
-            short_name=rule_metadata["short_name"]
-        )
+class UnusedVariables(BestPracticeRule, metadata=rule_metadata, severity=str(rule_metadata["Severity"])):
+    REQUIRED_TYPES = (frozenset({DAXTokenTypes.VAR}),)
 
-    def verify_violation(self, lexer: "PyDAXLexer") -> None:
-        self.clear_violations()
-        lexer.reset()
+    __slots__ = ()
 
-        tokens: list[Token] = []
-        t: Token = lexer.nextToken()
-        while t.type != Token.EOF:
-            if t.channel == Token.DEFAULT_CHANNEL or t.type == PyDAXLexer.VAR:
-                tokens.append(t)
-            t = lexer.nextToken()
+    def verify_violation(self, tokens: "DAXTokenBuffer | PyDAXLexer") -> None:
+        buffer: DAXTokenBuffer = self.start_verification(tokens)
+        types = buffer.types
+        channels = buffer.channels
+
+        tokens: list[int] = [
+            t for t in range(len(buffer)) if channels[t] == DAXTokenTypes.DEFAULT_CHANNEL or types[t] == DAXTokenTypes.VAR
+        ]
 
         IDENT_LIKE = {
-            PyDAXLexer.TABLE_OR_VARIABLE,
+            DAXTokenTypes.TABLE_OR_VARIABLE,
         }
 
-        var_defs: dict[str, Token] = {}
+        var_defs: dict[str, int] = {}
         n = len(tokens)
         i = 0
         while i < n:
             tok = tokens[i]
-            if tok.type == PyDAXLexer.VAR:
+            if types[tok] == DAXTokenTypes.VAR:
                 j = i + 1
-                if j < n and tokens[j].type in IDENT_LIKE:
-                    name_l = tokens[j].text.lower()
+                if j < n and types[tokens[j]] in IDENT_LIKE:
+                    name_l = buffer.token_text(tokens[j]).lower()
                     var_defs[name_l] = tokens[j]
                     i = j
             i += 1
@@ -58,14 +49,13 @@ class UnusedVariables(BestPracticeRule):
 
         used: set[str] = set()
         for idx, tok in enumerate(tokens):
-            if tok.type in IDENT_LIKE:
-                name_l = tok.text.lower()
-                if name_l in var_defs and tok is not var_defs[name_l]:
+            if types[tok] in IDENT_LIKE:
+                name_l = buffer.token_text(tok).lower()
+                if name_l in var_defs and tok != var_defs[name_l]:
                     used.add(name_l)
 
         for name_l, def_tok in var_defs.items():
             if name_l not in used:
-                self.violators_tokens.append(DAXToken(def_tok))
-                self.highlight_tokens.append(DAXToken(def_tok))
+                self.add_violation(def_tok)
 
         self.verified = True
@@ -1,8 +1,5 @@
 from .best_practice_rule import BestPracticeRule
-from ..utils import check_contains_function
-from ..PyDAXLexer import PyDAXLexer
-from antlr4 import Token
-from ..DAXToken import DAXToken
+from ..DAXTokenTypes import DAXTokenTypes
 
 
 rule_metadata = {
@@ -16,37 +13,14 @@ rule_metadata = {
 
 
 
-class UseDivide(BestPracticeRule):
-    def __init__(self) -> None:
-        # Initialize the base BestPracticeRule with metadata
-        super().__init__(
-            id=rule_metadata["ID"],
-            name=rule_metadata["Name"],
-            description=rule_metadata["Description"],
-            severity=rule_metadata["Severity"],
-            category=rule_metadata["Category"],
-            short_name=rule_metadata["short_name"]
-        )
-
-
-    def verify_violation(self, lexer: "PyDAXLexer") -> None:
-        # Check if the DAX expression contains the division operator
-        self.clear_violations()
-        lexer.reset()  # Reset the lexer to start from the beginning
-        # Collect default-channel tokens in order to identify numerator/denominator
-        tokens: list[Token] = []
-        t: Token = lexer.nextToken()
-        while t.type != Token.EOF:
-            if t.channel == Token.DEFAULT_CHANNEL:
-                tokens.append(t)
-            t = lexer.nextToken()
-
-        for i, tok in enumerate(tokens):
-            if tok.type == PyDAXLexer.DIV:
-                # Count '/' itself as the violation
-                self.violators_tokens.append(DAXToken(tok))
-                self.highlight_tokens.append(DAXToken(tok))
-
-        
-        self.verified = True
+class UseDivide(BestPracticeRule, metadata=rule_metadata):
+    SUBSCRIBED_TYPES = frozenset({DAXTokenTypes.DIV})
+    REQUIRED_TYPES = (frozenset({DAXTokenTypes.DIV}),)
+
+    __slots__ = ()
+
+    def on_token(self, index: int) -> None:
+        # Count '/' itself as the violation
+        if self.tokens.channels[index] == DAXTokenTypes.DEFAULT_CHANNEL:
+            self.add_violation(index)
 
@@ -1,13 +1,15 @@
-from antlr4 import Token
-from typing import Any
-from .PyDAXLexer import PyDAXLexer
+from typing import Any, TYPE_CHECKING
+from .DAXTokenTypes import DAXTokenTypes
 
+if TYPE_CHECKING:
+    from .PyDAXLexer import PyDAXLexer
 
-def check_contains_function(lexer: PyDAXLexer, function: Any) -> bool:
+
+def check_contains_function(lexer: "PyDAXLexer", function: Any) -> bool:
         lexer.reset()  # Reset the lexer to start from the beginning
-        token: Token = lexer.nextToken()
+        token = lexer.nextToken()
          
-        while token.type != Token.EOF:
+        while token.type != DAXTokenTypes.EOF:
             if token.type == function:
                 return True
             token = lexer.nextToken()
@@ -0,0 +1,158 @@
+import pytest
+
+from src.PyDAX import DAXAnalysisCache, DAXExpression, DAXModel
+from src.PyDAX.DAXTokenBuffer import DAXTokenBuffer
+from src.PyDAX.DAXScanner import DAXScanner
+
+
+EXPRESSION = "VAR x = SUM(Sales[Amount]) -- total\nRETURN IFERROR(x / 2, 0)"
+
+
+def test_identical_expressions_are_lexed_once(monkeypatch):
+    cache = DAXAnalysisCache()
+    scans = []
+    scan = DAXScanner.scan
+    monkeypatch.setattr(DAXScanner, "scan", lambda text: scans.append(text) or scan(text))
+
+    first = DAXExpression(EXPRESSION, lexer_backend="scanner", cache=cache)
+    second = DAXExpression(EXPRESSION, lexer_backend="scanner", cache=cache)
+
+    assert len(scans) == 1
+    assert second.token_buffer is first.token_buffer
+    assert second.table_column_references == first.table_column_references
+    assert second.comments is first.comments
+    assert second.number_of_violations == first.number_of_violations == 2
+    assert cache.cache_info() == (1, 1, 1024, 1)
+
+
+def test_cached_results_match_uncached_analysis():
+    cache = DAXAnalysisCache()
+    DAXExpression(EXPRESSION, cache=cache)
+    cached = DAXExpression(EXPRESSION, cache=cache)
+    fresh = DAXExpression(EXPRESSION)
+
+    assert cached.dax_expression_no_comments == fresh.dax_expression_no_comments
+    assert [variable.name for variable in cached.variables] == [variable.name for variable in fresh.variables] == ["x"]
+    assert [(rule.id, rule.violators_indexes) for rule in cached.best_practice_rules] == [
+        (rule.id, rule.violators_indexes) for rule in fresh.best_practice_rules
+    ]
+    assert cached.generate_html_with_violations() == fresh.generate_html_with_violations()
+
+
+def test_keys_depend_on_rules_verification_and_version():
+    cache = DAXAnalysisCache(version="1")
+    key = cache.key(EXPRESSION, ("use_divide_function_for_division",), True)
+
+    assert key == cache.key(EXPRESSION, ("use_divide_function_for_division",), True)
+    assert key != cache.key(EXPRESSION + " ", ("use_divide_function_for_division",), True)
+    assert key != cache.key(EXPRESSION, ("unused_variables",), True)
+    assert key != cache.key(EXPRESSION, ("use_divide_function_for_division",), False)
+    assert key != DAXAnalysisCache(version="2").key(EXPRESSION, ("use_divide_function_for_division",), True)
+
+
+def test_different_rule_sets_are_cached_separately():
+    cache = DAXAnalysisCache()
+    DAXExpression(EXPRESSION, cache=cache, rules=["USE_THE_DIVIDE_FUNCTION_FOR_DIVISION"])
+    expression = DAXExpression(EXPRESSION, cache=cache)
+
+    assert cache.cache_info().hits == 0
+    assert len(expression.best_practice_rules) == len(DAXExpression.BEST_PRACTICE_RULES)
+    assert expression.number_of_violations == 2
+
+
+def test_analyses_missing_from_the_entry_are_computed_and_added():
+    cache = DAXAnalysisCache()
+    DAXExpression(EXPRESSION, analyses=("references",), cache=cache)
+    expression = DAXExpression(EXPRESSION, cache=cache)
+
+    assert expression.number_of_violations == 2
+    assert cache.cache_info().hits == 1
+    assert DAXExpression(EXPRESSION, analyses=("best_practices",), cache=cache).unused_variables is expression.unused_variables
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = DAXAnalysisCache(maxsize=2)
+    for text in ("1", "2", "1", "3"):
+        DAXExpression(text, cache=cache)
+
+    assert len(cache) == 2
+    assert cache.key("1", DAXExpression("", analyses=()).rule_attributes, True) in cache
+    assert cache.key("2", DAXExpression("", analyses=()).rule_attributes, True) not in cache
+
+    cache.clear()
+    assert cache.cache_info() == (0, 0, 2, 0)
+    with pytest.raises(ValueError):
+        DAXAnalysisCache(maxsize=0)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batches_analyze_each_distinct_expression_once(workers):
+    cache = DAXAnalysisCache()
+    DAXExpression("1 / 2", lexer_backend="scanner", cache=cache)
+    expressions = ["1 / 2", EXPRESSION, "IFERROR(", EXPRESSION, "IFERROR(", "1 / 2", EXPRESSION]
+
+    results = DAXExpression.analyze_many(expressions, workers=workers, cache=cache, lexer_backend="scanner", keep_expressions=True)
+
+    assert [result.index for result in results] == list(range(len(expressions)))
+    assert all(result.ok for result in results)
+    assert [result.expression.dax_expression for result in results] == expressions
+    assert [result.expression.number_of_violations for result in results] == [1, 2, 1, 2, 1, 1, 2]
+    assert cache.cache_info() == (5, 3, 1024, 3)
+    assert isinstance(results[3].expression.token_buffer, DAXTokenBuffer)
+    assert results[3].expression.token_buffer is results[6].expression.token_buffer
+
+    compact = DAXExpression.analyze_many(expressions, workers=workers, cache=cache, lexer_backend="scanner")
+    assert [result.number_of_violations for result in compact] == [1, 2, 1, 2, 1, 1, 2]
+    assert all(result.expression is None for result in compact)
+
+
+def test_model_shares_analyses_of_identical_expressions():
+    cache = DAXAnalysisCache()
+    model = DAXModel(lexer_backend="scanner", cache=cache)
+    for report in range(5):
+        model.add_measure("Titles", f"Title {report}", "\"Sales by \" & SELECTEDVALUE(Dates[Year])")
+
+    assert len(model.unused()) == 5
+    assert cache.cache_info().misses == 1 and cache.cache_info().hits == 4
+
+
+def test_models_sharing_a_cache_keep_their_own_references():
+    cache = DAXAnalysisCache()
+    first, second = DAXModel(lexer_backend="scanner", cache=cache), DAXModel(lexer_backend="scanner", cache=cache)
+    for model in (first, second):
+        model.add_measure("Sales", "Total", "SUM(Sales[Amount])")
+        model.add_measure("Sales", "Average", "[Total] / COUNTROWS(Sales)")
+    first.dependencies(first.measure("Average"))
+    second.add_measure("Sales", "Margin", "[Total] - SUM(Sales[Cost])")  # Other names, other ids in second.names
+    second.dependencies(second.measure("Average"))
+
+    assert cache.cache_info().hits == 2
+    for model in (first, second):
+        references = [reference for artifact in model.artifacts for reference in artifact.expression.table_column_references]
+        assert all(reference._names is model.names for reference in references)
+    first_total, = first.measure("Average").expression.table_column_references
+    second_total, = second.measure("Average").expression.table_column_references
+    assert first_total is not second_total and first_total.artifact_id == first.names.lookup("Total")
+    assert [str(artifact) for artifact in first.dependencies(first.measure("Average"))] == ["[Total]"]
+
+    cached = [reference for state in cache._entries.values() for reference in state["table_column_references"]]
+    assert cached and all(reference._names is None for reference in cached)
+
+
+@pytest.mark.parametrize("keep_expressions", [False, True])
+def test_batches_send_every_miss_to_the_pool_once(monkeypatch, keep_expressions):
+    cache = DAXAnalysisCache(maxsize=2)  # Smaller than the batch
+    DAXExpression("1 / 2", lexer_backend="scanner", cache=cache)
+    distinct = ["1 / 2", EXPRESSION, "IFERROR(", "[A] / [B]", "SUM(T[x])"]
+    expressions = distinct * 3
+    sent, scans = [], []
+    analyze_many, scan = DAXExpression._analyze_many.__func__, DAXScanner.scan
+    monkeypatch.setattr(DAXExpression, "_analyze_many", classmethod(lambda cls, batch, *args: sent.append(batch) or analyze_many(cls, batch, *args)))
+    monkeypatch.setattr(DAXScanner, "scan", lambda text: scans.append(text) or scan(text))
+
+    results = DAXExpression.analyze_many(expressions, workers=1, cache=cache, lexer_backend="scanner", keep_expressions=keep_expressions)
+
+    assert sent == [distinct[1:]] and sorted(filter(None, scans)) == sorted(distinct[1:])  # "" is the probe of the options
+    assert [result.index for result in results] == list(range(len(expressions)))
+    assert [result.number_of_violations for result in results] == [DAXExpression(text).number_of_violations for text in expressions]
+    assert cache.cache_info() == (11, 5, 2, 2)
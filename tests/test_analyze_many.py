@@ -0,0 +1,113 @@
+import pickle
+
+import pytest
+
+from src.PyDAX import DAXAnalysisResult, DAXExpression
+
+
+EXPRESSIONS = [
+    "VAR Unused = 1 RETURN SUM(Sales[Amount]) / 2",
+    "IFERROR(1 / 0, 0)",
+    "CALCULATE([Total Sales], FILTER('Sales', 'Sales'[Quantity] > 10))",
+    "",
+    "// comment only",
+    "DIVIDE(SUM(Sales[Amount]), [Total Customers])",
+]
+
+
+def summary(expression: DAXExpression) -> tuple:
+    return (
+        expression.comments,
+        expression.table_column_references,
+        expression.variables,
+        [(rule.name, rule.violators_indexes) for rule in expression.best_practice_rules],
+    )
+
+
+def compact_summary(expression: DAXExpression) -> tuple:
+    """What a compact DAXAnalysisResult of the expression holds"""
+    return (
+        expression.comments,
+        [(reference.table_name, reference.artifact_name, reference.artifact_token.start) for reference in expression.table_column_references],
+        [(variable.name, variable.token.start) for variable in expression.variables],
+        {rule.id: [token.start for token in rule.violators_tokens] for rule in expression.best_practice_rules},
+    )
+
+
+def result_summary(result: DAXAnalysisResult) -> tuple:
+    return result.comments, result.references["table_column_references"], result.references["variables"], result.violations
+
+
+@pytest.mark.parametrize("workers, chunksize", [(1, None), (2, None), (3, 1)])
+def test_results_match_single_expressions_in_input_order(workers, chunksize):
+    results = DAXExpression.analyze_many(EXPRESSIONS, workers=workers, chunksize=chunksize)
+
+    assert [result.index for result in results] == list(range(len(EXPRESSIONS)))
+    assert all(result.ok and result.expression is None for result in results)
+    for result, text in zip(results, EXPRESSIONS):
+        assert result_summary(result) == compact_summary(DAXExpression(text))
+        assert result.number_of_violations == DAXExpression(text).number_of_violations
+    assert results[0].references["table_column_references"] == [("Sales", "Amount", EXPRESSIONS[0].index("[Amount]"))]
+    assert results[0].violations["UNUSED_VARIABLES"] == [EXPRESSIONS[0].index("Unused")]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_expressions_are_sent_back_on_request(workers):
+    results = DAXExpression.analyze_many(EXPRESSIONS, workers=workers, keep_expressions=True)
+
+    for result, text in zip(results, EXPRESSIONS):
+        assert result.expression.dax_expression == text
+        assert summary(result.expression) == summary(DAXExpression(text))
+        assert result_summary(result) == compact_summary(DAXExpression(text))
+
+
+def test_options_are_forwarded():
+    results = DAXExpression.analyze_many(EXPRESSIONS, workers=2, analyses=("references",), lexer_backend="scanner")
+
+    assert all(result.comments is None and result.violations is None for result in results)
+    assert results[0].references["table_column_references"] == compact_summary(DAXExpression(EXPRESSIONS[0]))[1]
+
+    results = DAXExpression.analyze_many(EXPRESSIONS, workers=1, analyses=("references",), keep_expressions=True)
+    assert all("comments" not in result.expression.__dict__ for result in results)
+
+
+def test_invalid_options_fail_before_the_batch():
+    with pytest.raises(ValueError):
+        DAXExpression.analyze_many(EXPRESSIONS, workers=2, lexer_backend="unknown")
+
+
+def test_errors_are_reported_per_expression(monkeypatch):
+    original = DAXExpression.analyze_references
+
+    def failing_analyze_references(self):
+        if "FILTER" in self.dax_expression:
+            raise RuntimeError("boom")
+        original(self)
+
+    monkeypatch.setattr(DAXExpression, "analyze_references", failing_analyze_references)
+    results = DAXExpression.analyze_many(EXPRESSIONS, workers=1)
+
+    assert [result.ok for result in results] == [True, True, False, True, True, True]
+    assert results[2].references is None and results[2].violations is None
+    assert results[2].error == "RuntimeError: boom"
+    assert results[3].number_of_violations == 0
+
+
+def test_results_are_picklable():
+    result = DAXExpression.analyze_many(EXPRESSIONS[:1], workers=1)[0]
+    restored: DAXAnalysisResult = pickle.loads(pickle.dumps(result))
+
+    assert restored.index == 0
+    assert result_summary(restored) == result_summary(result)
+
+    result = DAXExpression.analyze_many(EXPRESSIONS[:1], workers=1, keep_expressions=True)[0]
+    restored = pickle.loads(pickle.dumps(result))
+    assert summary(restored.expression) == summary(result.expression)
+
+
+def test_compact_results_are_smaller_than_expressions():
+    compact, whole = (
+        DAXExpression.analyze_many(EXPRESSIONS, workers=1, keep_expressions=keep_expressions)
+        for keep_expressions in (False, True)
+    )
+    assert len(pickle.dumps(compact)) * 3 < len(pickle.dumps(whole))
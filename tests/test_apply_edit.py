@@ -0,0 +1,128 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from src.PyDAX import DAXAnalysisCache, DAXExpression
+from src.PyDAX.DAXScanner import DAXScanner
+from src.PyDAX.DAXTokenBuffer import DAXTokenBuffer
+
+
+RESOURCES = Path(__file__).resolve().parent.parent / "resources"
+SAMPLES = [path.read_text(encoding="utf-8") for path in sorted(RESOURCES.rglob("*.txt"))]
+#* Snippets opening or closing multi-character tokens, so edits also change how the surrounding text is lexed
+SNIPPETS = ["", " ", "\n", "/*", "*/", "//", '"', "'", "[", "]", 'DT"', "NORM.S", ".DIST", "/", "VAR x = 1", "(", ")", ".", "|"]
+
+DAX = """VAR total = SUM(Sales[Amount]) -- comment
+VAR unused = 1
+RETURN
+    IFERROR(total / [Target], 0)"""
+
+
+def assert_same_tokens(actual: DAXTokenBuffer, text: str) -> None:
+    expected = DAXScanner.scan(text)
+    assert actual.text == text
+    for name in ("types", "channels", "starts", "stops", "lines", "columns"):
+        assert getattr(actual, name) == getattr(expected, name), name
+
+
+@pytest.mark.parametrize("lexer_backend", DAXExpression.LEXER_BACKENDS)
+def test_random_edits_match_lexing_from_scratch(lexer_backend):
+    rng = random.Random(20)
+    for _ in range(60 if lexer_backend == "scanner" else 15):
+        expression = DAXExpression(rng.choice(SAMPLES), analyses=(), lexer_backend=lexer_backend)
+        for _ in range(3):
+            start = rng.randint(0, len(expression.dax_expression))
+            end = min(start + rng.choice([0, 1, 5, 40]), len(expression.dax_expression))
+            expression.apply_edit(start, end, "".join(rng.choice(SNIPPETS) for _ in range(rng.randint(0, 3))))
+            assert_same_tokens(expression.token_buffer, expression.dax_expression)
+
+
+@pytest.mark.parametrize(
+    ("text", "start", "end", "new_text"),
+    [
+        ("a + b /* c", 10, 10, " */ + d"),  # Closes a comment
+        ("x /* c */ + 1\n+ 2", 2, 4, ""),  # Removes the comment start: its end becomes operators
+        ("1 + /* comment / \n + 2", 0, 0, "x"),  # '/' '*' read up to the end of the text
+        ("NORM.S + 1", 6, 6, ".DIST"),  # Completes a dotted keyword
+        ('DT"2020-01-01 & x', 13, 13, '"'),  # Closes a date literal
+        ("a\nb\nc + d", 1, 2, ""),  # Joins lines: offsets, lines and columns after the edit move
+        ("|\n//Tooltip */", 0, 2, "VAR x = 1*/"),  # Skipped characters before the first token
+    ],
+)
+def test_edits_changing_tokens_beyond_the_edit(text, start, end, new_text):
+    buffer, first, old_stop, new_stop = DAXScanner.scan(text).apply_edit(start, end, new_text, DAXScanner.scan)
+    edited = text[:start] + new_text + text[end:]
+    assert_same_tokens(buffer, edited)
+    assert len(buffer) - new_stop == len(DAXScanner.scan(text)) - old_stop
+
+
+def test_only_tokens_around_the_edit_are_lexed_again():
+    text = "\n".join(f"VAR v{index} = SUM(Sales[Amount]) * {index}" for index in range(500)) + "\nRETURN v0"
+    buffer = DAXScanner.scan(text)
+    middle = text.index("VAR v250")
+    lexed: list[int] = []
+
+    def lex(*arguments):
+        fragment = DAXScanner.scan(*arguments)
+        lexed.append(len(fragment))
+        return fragment
+
+    edited, first, old_stop, new_stop = buffer.apply_edit(middle, middle + 3, "var", lex)
+    assert sum(lexed) < 30
+    assert old_stop - first == new_stop - first < 30
+    assert_same_tokens(edited, text[:middle] + "var" + text[middle + 3:])
+    assert buffer.text == text  # The edited buffer is a new one
+
+
+@pytest.mark.parametrize("lexer_backend", DAXExpression.LEXER_BACKENDS)
+def test_analyses_are_computed_again(lexer_backend):
+    expression = DAXExpression(DAX, lexer_backend=lexer_backend)
+    assert expression.number_of_violations == 3  # IFERROR, division, unused variable
+
+    start = DAX.index("IFERROR(total / [Target], 0)")
+    expression.apply_edit(start, start + len("IFERROR(total / [Target], 0)"), "DIVIDE(total + unused, Sales[Target])")
+    fresh = DAXExpression(expression.dax_expression, lexer_backend=lexer_backend)
+
+    assert expression.number_of_violations == fresh.number_of_violations == 0
+    assert [str(reference) for reference in expression.table_column_references] == ["'Sales'[Amount]", "'Sales'[Target]"]
+    assert expression.comments == fresh.comments == ["-- comment"]
+    assert expression.reference_index.count("Sales") == 2
+
+
+def test_lazy_analyses_stay_lazy():
+    expression = DAXExpression(DAX, analyses=())
+    expression.token_buffer
+    expression.apply_edit(0, 0, "// header\n")
+
+    assert "comments" not in vars(expression) and "variables" not in vars(expression)
+    assert expression.comments == ["// header", "-- comment"]
+    assert expression.use_divide_function_for_division.violated is True
+    division = expression.dax_expression.index("/ [Target]")
+    expression.apply_edit(division, division + 1, "*")
+    assert "use_divide_function_for_division" not in vars(expression)
+    assert expression.use_divide_function_for_division.violated is False
+
+
+def test_edit_before_lexing_and_invalid_ranges():
+    expression = DAXExpression("1 + 2", analyses=())
+    expression.apply_edit(4, 5, "[x]")
+    assert expression.dax_expression == "1 + [x]"
+    assert_same_tokens(expression.token_buffer, "1 + [x]")
+
+    with pytest.raises(ValueError):
+        expression.apply_edit(3, 2, "")
+    with pytest.raises(ValueError):
+        expression.apply_edit(0, 100, "")
+
+
+def test_cached_buffers_are_not_modified():
+    cache = DAXAnalysisCache()
+    first = DAXExpression(DAX, lexer_backend="scanner", cache=cache)
+    second = DAXExpression(DAX, lexer_backend="scanner", cache=cache)
+    second.apply_edit(0, 3, "var")
+
+    assert first.token_buffer.text == DAX
+    assert_same_tokens(first.token_buffer, DAX)
+    assert [str(variable.name) for variable in first.variables] == ["total", "unused"]
+    assert DAXExpression(DAX, lexer_backend="scanner", cache=cache).number_of_violations == 3
@@ -66,3 +66,14 @@ def test_avoid_one_plus_division_rule(make_artifact_ref):
         make_artifact_ref(table_name="Sales", artifact_name="Amount"),
         make_artifact_ref(table_name="Sales", artifact_name="Total"),
     ]
+
+
+@pytest.mark.parametrize("dax, violated", [
+    ("1 - (a + b + c / d)", True),
+    ("1 - a + b + c + d + e / f", True),  # '/' is the 10th token after the operator
+    ("1 - a + b + c + d + e + f / g", False),
+    ("1 - a", False),
+])
+def test_division_must_follow_within_ten_tokens(dax, violated):
+    expr = DAXExpression(dax)
+    assert expr.avoid_using_1_x_y_syntax.violated is violated
@@ -0,0 +1,21 @@
+import pytest
+
+from benchmarks.bench_phases import load_corpus, phases, slowdowns
+from src.PyDAX import DAXExpression
+
+
+def test_every_phase_runs_over_the_corpus():
+    corpus = load_corpus()[:10]
+    runs = phases(corpus, "scanner")
+
+    assert [name for name in runs if name.startswith("rule:")] == [f"rule:{name}" for name in DAXExpression.BEST_PRACTICE_RULES]
+    for run in runs.values():
+        run()
+
+
+def test_slowdowns_are_relative_to_the_calibration_unit():
+    baseline = {"lexing": 1.0, "generate_html": 2.0}
+    timings = {"lexing": 3.0, "generate_html": 5.0, "new_phase": 1.0}
+
+    # Everything ran twice as slow as the baseline machine: only generate_html really regressed
+    assert slowdowns(timings, 2.0, baseline, 1.0) == pytest.approx({"lexing": 0.5, "generate_html": 0.25})
@@ -0,0 +1,48 @@
+import re
+
+import pytest
+
+from src.PyDAX import DAXExpression
+from src.PyDAX.DAXKeywords import DOTTED_KEYWORDS, keyword_types
+from src.PyDAX.PyDAXLexer import PyDAXLexer
+
+
+@pytest.mark.parametrize("lexer_backend", DAXExpression.LEXER_BACKENDS)
+@pytest.mark.parametrize(
+    "text, expected_type",
+    [
+        ("CALCULATE", PyDAXLexer.CALCULATE),
+        ("calculate", PyDAXLexer.CALCULATE),
+        ("Var", PyDAXLexer.VAR),
+        ("skip", PyDAXLexer.SKIP_),
+        ("OneWay_RightFiltersLeft", PyDAXLexer.ONEWAYRIGHTFILTERSLEFT),
+        ("var.p", PyDAXLexer.VARP),
+        ("t.Dist.2t", PyDAXLexer.TDIST2T),
+        ("calculated", PyDAXLexer.TABLE_OR_VARIABLE),
+        ("BETADIST", PyDAXLexer.TABLE_OR_VARIABLE),
+    ],
+)
+def test_keywords_are_case_insensitive(text, expected_type, lexer_backend):
+    buffer = DAXExpression(text, analyses=(), lexer_backend=lexer_backend).token_buffer
+
+    assert list(buffer.types) == [expected_type]
+    expected_channel = 0 if expected_type == PyDAXLexer.TABLE_OR_VARIABLE else PyDAXLexer.KEYWORD_CHANNEL
+    assert list(buffer.channels) == [expected_channel]
+    assert buffer.token_text(0) == text
+
+
+def test_lowercase_variables_are_detected():
+    expr = DAXExpression("var x = 1\nvar y = x * 2\nreturn y")
+
+    assert [v.name for v in expr.variables] == ["x", "y"]
+    assert expr.variables[0].last_expression_token.text == "1"
+    assert expr.table_references == []
+    assert expr.unused_variables.violated is False
+
+
+def test_keyword_table_covers_every_keyword_token():
+    keywords = keyword_types(PyDAXLexer)
+
+    assert len(keywords) + len(DOTTED_KEYWORDS) == PyDAXLexer.NUMERIC - PyDAXLexer.ABS + 1
+    assert all(re.fullmatch(r"[A-Z_][A-Z0-9_]*", spelling) for spelling in keywords)
+    assert all(PyDAXLexer.ABS <= getattr(PyDAXLexer, name) <= PyDAXLexer.NUMERIC for name in DOTTED_KEYWORDS)
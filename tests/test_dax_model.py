@@ -0,0 +1,100 @@
+from pathlib import Path
+
+import pytest
+
+from src.PyDAX import DAXModel
+
+
+SAMPLES = Path(__file__).resolve().parent.parent / "resources" / "sample_dax_expressions"
+
+
+def sample(name: str) -> str:
+    return (SAMPLES / f"{name}.txt").read_text(encoding="utf-8")
+
+
+@pytest.fixture
+def model() -> DAXModel:
+    model = DAXModel()
+    model.add_calculated_column("factWeather", "parent_column_used_by_unused", sample("calc_column_factWeather_parent_column_used_by_unused"))
+    for name in ("parent_used_by_unused", "child_used_by_unused", "child_used_by_unused_2", "grand_child_unused",
+                 "grand_child_unused_2", "another_unused", "FahrenheitConstant", "Actual temp F"):
+        model.add_measure("_Measures", name, sample(f"measure__Measures_{name}"))
+    for name in ("Celcius_to_Fahrenheit", "Celcius_to_Fahrenheit_with_Constant", "kanton_zug_udf", "_ref_to_udf_kanton_zug", "create_decades_table"):
+        model.add_function(name, sample(f"udf_{name}"))
+    model.add_calculated_table("dimCalendar", sample("table_dimCalendar"))
+    model.add_calculated_table("UDF generated table", sample("table_UDF generated table"))
+    return model
+
+
+def names(artifacts) -> list[str]:
+    return [str(artifact) for artifact in artifacts]
+
+
+def test_dependencies(model):
+    assert names(model.dependencies(model.measure("grand_child_unused_2"))) == ["[child_used_by_unused]", "[child_used_by_unused_2]"]
+    assert names(model.dependencies(model.measure("grand_child_unused"), transitive=True)) == [
+        "[child_used_by_unused]",
+        "'factWeather'[parent_column_used_by_unused]",
+        "[parent_used_by_unused]",
+    ]
+    assert names(model.dependencies(model.calculated_table("UDF generated table"))) == ["'dimCalendar'", "create_decades_table()"]
+    assert names(model.dependencies(model.function("_ref_to_udf_kanton_zug"))) == ["kanton_zug_udf()"]
+
+
+def test_dependents(model):
+    column = model.calculated_column("FACTWEATHER", "Parent_Column_Used_By_Unused")
+
+    assert names(model.dependents(column)) == [
+        "[child_used_by_unused]",
+        "[child_used_by_unused_2]",
+        "[another_unused]",
+    ]
+    assert set(names(model.dependents(column, transitive=True))) == {
+        "[child_used_by_unused]",
+        "[child_used_by_unused_2]",
+        "[another_unused]",
+        "[grand_child_unused]",
+        "[grand_child_unused_2]",
+    }
+
+
+def test_unused_and_unreachable(model):
+    assert "[grand_child_unused]" in names(model.unused())
+    assert "[child_used_by_unused]" not in names(model.unused())
+
+    unreachable = names(model.unreachable([model.measure("Actual temp F"), model.calculated_table("UDF generated table")]))
+    assert "[grand_child_unused]" in unreachable
+    assert "[child_used_by_unused]" in unreachable
+    assert "[parent_used_by_unused]" in unreachable
+    assert "'factWeather'[parent_column_used_by_unused]" in unreachable
+    assert "create_decades_table()" not in unreachable
+    assert "'dimCalendar'" not in unreachable
+
+
+def test_unqualified_reference_in_calculated_column_prefers_its_own_table():
+    model = DAXModel(lexer_backend="scanner")
+    column = model.add_calculated_column("Sales", "Margin", "[Amount] - [Cost]")
+    cost = model.add_calculated_column("Sales", "Cost", "[Amount] * 0.6")
+    amount_measure = model.add_measure("Sales", "Amount", "SUM(Sales[Net])")
+    model.add_measure("Sales", "Cost", "SUM(Sales[Cost])")
+
+    assert model.dependencies(column) == [amount_measure, cost]
+
+
+def test_model_is_rebuilt_after_adding_artifacts():
+    model = DAXModel()
+    total = model.add_measure("Sales", "Total", "[Base] * 2")
+    assert model.dependencies(total) == []
+
+    base = model.add_measure("Sales", "Base", "1")
+    assert model.dependencies(total) == [base]
+
+
+def test_duplicates_and_foreign_artifacts_are_rejected():
+    model = DAXModel()
+    model.add_measure("Sales", "Total", "1")
+
+    with pytest.raises(ValueError):
+        model.add_measure("Other", "TOTAL", "2")
+    with pytest.raises(KeyError):
+        model.dependents(DAXModel().add_measure("Sales", "Total", "1"))
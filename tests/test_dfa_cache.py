@@ -0,0 +1,99 @@
+import marshal
+from importlib import resources
+
+import pytest
+from antlr4 import InputStream
+
+from src.PyDAX import DAXExpression, load_dfa_cache, warmup
+from src.PyDAX.DAXLexerCache import WARMUP_CORPUS, dfa_size
+from src.PyDAX.DAXTokenBuffer import DAXTokenBuffer
+from src.PyDAX.PyDAXLexer import PyDAXLexer
+
+
+DAX = (
+    "/* header */\n"
+    "VAR Total = CALCULATE(SUM('Sales'[Amount]), DT\"2020-01-01\" <= 'Date'[Date])\n"
+    "RETURN DIVIDE(Total, 2.5) & \"text\" // done"
+)
+
+
+@pytest.fixture
+def empty_dfa():
+    """Starts the test from an empty lexer DFA and restores the shared one afterwards"""
+    saved = [(dfa._states, dfa.s0) for dfa in PyDAXLexer.decisionsToDFA]
+    for dfa in PyDAXLexer.decisionsToDFA:
+        dfa._states = {}
+        dfa.s0 = None
+    yield
+    for dfa, (states, s0) in zip(PyDAXLexer.decisionsToDFA, saved):
+        dfa._states = states
+        dfa.s0 = s0
+
+
+def lex(text: str) -> DAXTokenBuffer:
+    lexer = PyDAXLexer(InputStream(text))
+    lexer.removeErrorListeners()
+    return DAXTokenBuffer.from_lexer(lexer)
+
+
+def test_saved_dfa_is_loaded_back(empty_dfa, tmp_path):
+    path = tmp_path / "lexer.dfa"
+    states = warmup([DAX], cache_path=path)
+    expected = lex(DAX)
+
+    for dfa in PyDAXLexer.decisionsToDFA:
+        dfa._states = {}
+        dfa.s0 = None
+
+    assert load_dfa_cache(path) is True
+    assert dfa_size() == states
+    tokens = lex(DAX)
+    assert dfa_size() == states  # Lexing the same input reuses the loaded states
+    assert list(tokens.types) == list(expected.types)
+    assert list(tokens.stops) == list(expected.stops)
+    assert DAXExpression(DAX).generate_html() == DAXExpression(DAX, lexer_backend="scanner").generate_html()
+
+
+def test_warmup_loads_an_existing_cache_instead_of_lexing(empty_dfa, tmp_path):
+    path = tmp_path / "lexer.dfa"
+    states = warmup([DAX], cache_path=path)
+    for dfa in PyDAXLexer.decisionsToDFA:
+        dfa._states = {}
+        dfa.s0 = None
+
+    assert warmup(["1 + 1"], cache_path=path) == states
+
+
+def test_invalid_cache_is_ignored(empty_dfa, tmp_path):
+    lex(DAX)
+    states = dfa_size()
+    path = tmp_path / "lexer.dfa"
+    path.write_bytes(b"not a cache")
+
+    assert load_dfa_cache(path) is False
+    assert load_dfa_cache(tmp_path / "missing.dfa") is False
+    assert dfa_size() == states
+
+
+@pytest.mark.parametrize("corrupt", [
+    lambda data: data.pop("dfas"),
+    lambda data: data.update(contexts=[("S", 1_000_000, 0)]),
+    lambda data: data.update(dfas=[([(0, False, 0, 99_999, [], [])], 0)] * len(data["dfas"])),
+    lambda data: data.update(dfas=[None] * len(data["dfas"])),
+])
+def test_corrupt_cache_with_a_valid_header_is_ignored(empty_dfa, tmp_path, corrupt):
+    path = tmp_path / "lexer.dfa"
+    warmup([DAX], cache_path=path)
+    data = marshal.loads(path.read_bytes())
+    corrupt(data)
+    path.write_bytes(marshal.dumps(data))
+    states = dfa_size()
+
+    assert load_dfa_cache(path) is False
+    assert dfa_size() == states
+
+
+def test_default_warmup_uses_the_bundled_corpus(empty_dfa):
+    corpus = resources.files("src.PyDAX").joinpath(WARMUP_CORPUS)
+    assert corpus.is_file()
+    assert warmup() > 0
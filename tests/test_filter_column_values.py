@@ -31,15 +31,14 @@ def test_no_violation_with_complex_filter():
     assert len(expr.filter_column_values.violators_tokens) == 0, "There should be no violating tokens."
 
 
-#! Limitation: Currently n ot checking for multiple violations on the same expression
-# def test_multiple_violations():
-#     """Tests that the rule correctly identifies multiple violations in the same expression."""
-#     expr = DAXExpression(dax_violates_multiple)
+def test_multiple_violations():
+    """Tests that the rule correctly identifies multiple violations in the same expression."""
+    expr = DAXExpression(dax_violates_multiple)
 
-#     assert expr.filter_column_values.violated, "The rule should be marked as violated."
-#     assert len(expr.filter_column_values.violators_tokens) == 2, "There should be two violating tokens."
-#     for token in expr.filter_column_values.violators_tokens:
-#         assert token.text.upper() == "FILTER", "Each violating token should be 'FILTER'."
+    assert expr.filter_column_values.violated, "The rule should be marked as violated."
+    assert len(expr.filter_column_values.violators_tokens) == 2, "There should be two violating tokens."
+    for token in expr.filter_column_values.violators_tokens:
+        assert token.text.upper() == "FILTER", "Each violating token should be 'FILTER'."
 
 def test_no_violation_with_keepfilters():
     """Tests that using KEEPFILTERS instead of FILTER does not trigger a violation."""
@@ -55,4 +54,38 @@ def test_no_violation_standalone_filter():
 
     assert not expr.filter_column_values.violated, "A standalone FILTER should not trigger a violation."
     assert len(expr.filter_column_values.violators_tokens) == 0, "There should be no violating tokens for a standalone FILTER."
-    
\ No newline at end of file
+
+
+def test_highlights_filter_up_to_the_column():
+    """Tests that FILTER up to the filtered column is highlighted, without whitespace."""
+    expr = DAXExpression(dax_violates)
+
+    assert [token.text for token in expr.filter_column_values.highlight_tokens] == ["FILTER", "(", "Sales", ",", "Sales", "Quantity"]
+
+
+@pytest.mark.parametrize("dax", [
+    "CALCULATE([Total Sales], 'Date'[Year] = 2024, FILTER('Sales', 'Sales'[Quantity] > 10))",  # Third argument
+    "CALCULATETABLE('Sales', FILTER('Sales', 'Sales'[Quantity] > 10))",
+    "CALCULATE(CALCULATE([Total Sales], FILTER(Sales, Sales[Quantity] > 10)), 'Date'[Year] = 2024)",  # Nested CALCULATE
+    "CALCULATE(DIVIDE([A], [B]), FILTER('Sales', 'Sales'[Quantity] > 10))",  # Comma in the first argument
+])
+def test_violation_in_any_filter_argument(dax):
+    """Tests that FILTER is found in every filter argument of CALCULATE/CALCULATETABLE, whatever comes before it."""
+    expr = DAXExpression(dax, lexer_backend="scanner")
+
+    assert [token.text for token in expr.filter_column_values.violators_tokens] == ["FILTER"]
+
+
+@pytest.mark.parametrize("dax", [
+    "CALCULATE(SUMX(FILTER('Sales', 'Sales'[Quantity] > 10), [Amount]))",  # FILTER in the expression argument
+    "CALCULATE([Total Sales], KEEPFILTERS(FILTER('Sales', 'Sales'[Quantity] > 10)))",  # Argument of another function
+    "CALCULATE([Total Sales], FILTER('Sales', [Total Sales] > 10))",  # Measure, see FilterMeasureValuesByColumns
+    "CALCULATE([Total Sales], \"FILTER('Sales', 'Sales'[Quantity] > 10)\")",  # String
+    "CALCULATE([Total Sales] /* , FILTER('Sales', 'Sales'[Quantity] > 10) */)",  # Comment
+])
+def test_no_violation_outside_filter_arguments(dax):
+    """Tests that FILTER calls that are not filter arguments of CALCULATE/CALCULATETABLE are ignored."""
+    expr = DAXExpression(dax, lexer_backend="scanner")
+
+    assert not expr.filter_column_values.violated
+
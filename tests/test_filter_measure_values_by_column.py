@@ -44,15 +44,14 @@ def test_no_violation_with_all_column():
     assert expr.filter_measure_values_by_columns.violated is False
     assert len(expr.filter_measure_values_by_columns.violators_tokens) == 0
 
-#! Limitation: Currently n ot checking for multiple violations on the same expression
-# def test_multiple_violations():
-#     expr = DAXExpression(dax_violates_multiple)
+def test_multiple_violations():
+    expr = DAXExpression(dax_violates_multiple)
 
-#     assert expr.filter_measure_values_by_columns is not None
-#     assert expr.filter_measure_values_by_columns.violated is True
-#     assert len(expr.filter_measure_values_by_columns.violators_tokens) == 2
-#     for token in expr.filter_measure_values_by_columns.violators_tokens:
-#         assert token.text.upper() == "FILTER"
+    assert expr.filter_measure_values_by_columns is not None
+    assert expr.filter_measure_values_by_columns.violated is True
+    assert len(expr.filter_measure_values_by_columns.violators_tokens) == 2
+    for token in expr.filter_measure_values_by_columns.violators_tokens:
+        assert token.text.upper() == "FILTER"
 
 
 def test_no_violation_standalone_filter():
@@ -60,4 +59,21 @@ def test_no_violation_standalone_filter():
 
     assert expr.filter_measure_values_by_columns is not None
     assert expr.filter_measure_values_by_columns.violated is False
-    assert len(expr.filter_measure_values_by_columns.violators_tokens) == 0
\ No newline at end of file
+    assert len(expr.filter_measure_values_by_columns.violators_tokens) == 0
+
+
+def test_violations_in_nested_calculate_chain():
+    dax = "[Total Sales]"
+    for index in range(50):
+        dax = f"CALCULATE({dax}, FILTER(Sales, [Total Sales] > {index}))"
+    expr = DAXExpression(dax, lexer_backend="scanner")
+
+    assert expr.filter_measure_values_by_columns.number_of_violations == 50
+    assert not expr.filter_column_values.violated
+
+
+def test_no_violation_in_comments_or_strings():
+    expr = DAXExpression("CALCULATE([Total Sales], \"FILTER('Sales', [Total Sales] > 10)\") // , FILTER('Sales', [Total Sales] > 10)")
+
+    assert expr.filter_measure_values_by_columns.violated is False
+
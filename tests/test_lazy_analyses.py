@@ -0,0 +1,66 @@
+import pickle
+
+import pytest
+
+from src.PyDAX import DAXExpression
+
+
+DAX = (
+    "// Unused variable and a division\n"
+    "VAR Unused = 1\n"
+    "RETURN SUM(Sales[Amount]) / [Total Customers]"
+)
+
+
+def test_only_requested_analyses_run_up_front(make_artifact_ref):
+    expr = DAXExpression(DAX, analyses=("references",))
+
+    assert "table_column_references" in expr.__dict__
+    assert "comments" not in expr.__dict__
+    assert not any(name in expr.__dict__ for name in DAXExpression.BEST_PRACTICE_RULES)
+
+    assert expr.table_column_references == [
+        make_artifact_ref(table_name="Sales", artifact_name="Amount"),
+        make_artifact_ref(table_name="", artifact_name="Total Customers"),
+    ]
+
+
+def test_lazy_attributes_are_computed_once_on_first_access():
+    expr = DAXExpression(DAX, analyses=())
+
+    assert expr.comments == ["// Unused variable and a division"]
+    assert expr.clean_dax_expression.startswith("VARUnused=1")
+    assert expr.comments is expr.comments
+    assert [v.name for v in expr.variables] == ["Unused"]
+
+
+def test_lazy_rules_are_verified_on_first_access():
+    expr = DAXExpression(DAX, analyses=())
+
+    assert expr.unused_variables.verified is True
+    assert expr.unused_variables.number_of_violations == 1
+    assert "use_divide_function_for_division" not in expr.__dict__
+    assert expr.number_of_violations == 2
+
+
+def test_lazy_rules_are_not_verified_when_disabled():
+    expr = DAXExpression(DAX, verify_best_practices=False, analyses=())
+
+    assert expr.unused_variables.verified is False
+    expr.verify_best_practices()
+    assert expr.unused_variables.verified is True
+    assert expr.number_of_violations == 2
+
+
+def test_unknown_analysis_is_rejected():
+    with pytest.raises(ValueError):
+        DAXExpression(DAX, analyses=("lineage",))
+
+
+def test_pickled_lazy_expression_computes_missing_analyses():
+    expr = DAXExpression(DAX, analyses=("references",))
+    restored = pickle.loads(pickle.dumps(expr))
+
+    assert restored.comments == expr.comments
+    assert restored.number_of_violations == 2
+    assert restored.table_column_references == expr.table_column_references
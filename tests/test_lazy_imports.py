@@ -0,0 +1,73 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from src.PyDAX import DAXExpression
+from src.PyDAX.DAXTokenTypes import DAXTokenTypes
+from src.PyDAX.PyDAXLexer import PyDAXLexer
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def loaded_modules(code: str) -> list[str]:
+    """Modules of interest in sys.modules after running `code` in a fresh interpreter"""
+    script = (
+        f"import sys, json; {code}; "
+        "print(json.dumps([m for m in sys.modules if m.startswith('antlr4') or m.startswith('src.PyDAX')]))"
+    )
+    output = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+
+def test_token_types_match_the_generated_lexer():
+    assert DAXTokenTypes.symbolicNames == PyDAXLexer.symbolicNames
+    for token_type, name in enumerate(PyDAXLexer.symbolicNames[1:], 1):
+        assert getattr(DAXTokenTypes, name) == getattr(PyDAXLexer, name) == token_type
+    assert DAXTokenTypes.COMMENTS_CHANNEL == PyDAXLexer.COMMENTS_CHANNEL
+    assert DAXTokenTypes.KEYWORD_CHANNEL == PyDAXLexer.KEYWORD_CHANNEL
+
+
+def test_import_loads_neither_antlr_nor_rule_modules():
+    modules = loaded_modules("import src.PyDAX")
+
+    assert not any(module.startswith("antlr4") for module in modules)
+    assert "src.PyDAX.PyDAXLexer" not in modules
+    assert {module for module in modules if module.startswith("src.PyDAX.best_practices_rules.")} == {
+        "src.PyDAX.best_practices_rules.best_practice_rule",
+        "src.PyDAX.best_practices_rules.registry",
+        "src.PyDAX.best_practices_rules.rule_engine",
+    }
+
+
+def test_scanner_backend_never_loads_antlr():
+    modules = loaded_modules("from src.PyDAX import DAXExpression; DAXExpression('VAR x = 1 / 2 RETURN x', lexer_backend='scanner')")
+
+    assert not any(module.startswith("antlr4") for module in modules)
+    assert "src.PyDAX.best_practices_rules.use_divide" in modules
+
+
+def test_rules_are_imported_only_when_used():
+    modules = loaded_modules("from src.PyDAX import DAXExpression; DAXExpression('1 / 2', analyses=()).use_divide_function_for_division")
+
+    assert "src.PyDAX.best_practices_rules.use_divide" in modules
+    assert "src.PyDAX.best_practices_rules.unused_variables" not in modules
+
+
+def test_rule_classes_are_still_exported():
+    import src.PyDAX as PyDAX
+    from src.PyDAX.best_practices_rules import UnusedVariables
+
+    assert PyDAX.UnusedVariables is UnusedVariables
+    assert DAXExpression.rule_class("unused_variables") is UnusedVariables
+    assert callable(PyDAX.warmup)
+
+
+def test_star_import_exports_rule_classes_and_lazy_names():
+    namespace: dict = {}
+    exec("from src.PyDAX import *", namespace)
+
+    assert {"DAXExpression", "DAXModel", "DAXArtifactReference", "BestPracticeRule", "RULE_REGISTRY"} <= set(namespace)
+    assert {"UnusedVariables", "UseDivide", "DAXParser", "DAXSyntaxTree", "warmup"} <= set(namespace)
+    assert "os" not in namespace and "_LAZY_ATTRIBUTES" not in namespace
@@ -0,0 +1,109 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from src.PyDAX import DAXLineage, DAXModel
+
+
+SAMPLES = Path(__file__).resolve().parent.parent / "resources" / "sample_dax_expressions"
+
+
+def sample(name: str) -> str:
+    return (SAMPLES / f"{name}.txt").read_text(encoding="utf-8")
+
+
+def names(artifacts) -> list[str]:
+    return [str(artifact) for artifact in artifacts]
+
+
+@pytest.fixture
+def model() -> DAXModel:
+    model = DAXModel(lexer_backend="scanner")
+    model.add_calculated_column("factWeather", "parent_column_used_by_unused", sample("calc_column_factWeather_parent_column_used_by_unused"))
+    for name in ("parent_used_by_unused", "child_used_by_unused", "child_used_by_unused_2", "grand_child_unused",
+                 "grand_child_unused_2", "FahrenheitConstant", "Actual temp F", "Actual Temperature (℃)"):
+        model.add_measure("_Measures", name, sample(f"measure__Measures_{name}"))
+    for name in ("Celcius_to_Fahrenheit_with_Constant", "kanton_zug_udf", "_ref_to_udf_kanton_zug"):
+        model.add_function(name, sample(f"udf_{name}"))
+    return model
+
+
+def test_physical_columns_through_measures_and_functions(model):
+    lineage = model.lineage
+    assert isinstance(lineage, DAXLineage) and model.lineage is lineage
+
+    #* Through the measure passed to Celcius_to_Fahrenheit_with_Constant
+    assert lineage.physical_columns(model.measure("Actual temp F")) == [("factWeather", "temp_c"), ("factWeather", "Forecast")]
+    assert lineage.column_dependents("FACTWEATHER", "Temp_C") == [model.measure("Actual temp F"), model.measure("Actual Temperature (℃)")]
+    assert lineage.depends_on(model.measure("Actual temp F"), ("factweather", "forecast"))
+    assert lineage.depends_on(model.function("Celcius_to_Fahrenheit_with_Constant"), model.measure("FahrenheitConstant"))
+    #* parent_column_used_by_unused is calculated, from rand()
+    assert lineage.physical_columns(model.measure("grand_child_unused")) == []
+    assert lineage.physical_columns(model.function("_ref_to_udf_kanton_zug")) == []
+
+
+def test_transitive_queries_match_the_dependency_graph(model):
+    lineage = model.lineage
+    for artifact in model.artifacts:
+        assert lineage.dependencies(artifact) == sorted(model.dependencies(artifact, transitive=True), key=model.artifacts.index)
+        assert lineage.dependents(artifact) == sorted(model.dependents(artifact, transitive=True), key=model.artifacts.index)
+    assert lineage.depends_on(model.measure("grand_child_unused"), model.measure("parent_used_by_unused"))
+    assert not lineage.depends_on(model.measure("parent_used_by_unused"), model.measure("grand_child_unused"))
+
+
+def test_physical_columns():
+    model = DAXModel(lexer_backend="scanner")
+    margin = model.add_calculated_column("Sales", "Margin", "[Amount] - Sales[Cost]")
+    total = model.add_measure("Sales", "Total", "SUMX(Sales, Sales[Margin] * 'Rate'[Value]) + [Missing]")
+    model.add_calculated_table("Top", "TOPN(10, Sales, [Total])")
+    ranked = model.add_measure("Sales", "Ranked", "COUNTROWS(Top) + SUM(Top[Total])")
+
+    lineage = model.lineage
+    assert lineage.columns == [("Sales", "Amount"), ("Sales", "Cost"), ("Rate", "Value")]
+    assert lineage.physical_columns(margin) == [("Sales", "Amount"), ("Sales", "Cost")]
+    assert lineage.physical_columns(ranked) == lineage.columns
+    assert lineage.column_dependents("sales", "COST") == [margin, total, model.calculated_table("Top"), ranked]
+    assert lineage.column_dependents("Sales", "Unknown") == []
+    assert not lineage.depends_on(margin, ("Rate", "Value"))
+
+    model.add_measure("Sales", "Missing", "MAX(Other[Column])")
+    assert model.lineage is not lineage
+    assert ("Other", "Column") in model.lineage.physical_columns(ranked)
+
+
+def test_cycles():
+    model = DAXModel(lexer_backend="scanner")
+    a = model.add_measure("T", "a", "[b] + T[x]")
+    b = model.add_measure("T", "b", "[a] + [c]")
+    c = model.add_measure("T", "c", "T[y]")
+    loop = model.add_measure("T", "loop", "[loop]")  # The model ignores references to the artifact itself
+
+    lineage = model.lineage
+    assert lineage.dependencies(a) == [b, c] and lineage.dependencies(b) == [a, c]
+    assert lineage.physical_columns(b) == [("T", "x"), ("T", "y")]
+    assert lineage.depends_on(a, a) and not lineage.depends_on(loop, loop) and not lineage.depends_on(c, c)
+    assert lineage.dependencies(loop) == [] and lineage.dependents(c) == [a, b]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_models_match_breadth_first_walks(seed):
+    generator = random.Random(seed)
+    model = DAXModel(lexer_backend="scanner")
+    size = 60
+    for index in range(size):
+        referenced = [f"[m{generator.randrange(size)}]" for _ in range(generator.randrange(4))]
+        referenced += [f"T[c{generator.randrange(10)}]" for _ in range(generator.randrange(2))]
+        model.add_measure("T", f"m{index}", " + ".join(referenced) or "0")
+
+    lineage = model.lineage
+    for artifact in generator.sample(model.artifacts, 20):
+        reached = model.dependencies(artifact, transitive=True)
+        assert lineage.dependencies(artifact) == sorted(reached, key=model.artifacts.index)
+        assert lineage.dependents(artifact) == sorted(model.dependents(artifact, transitive=True), key=model.artifacts.index)
+        columns = {
+            (reference.table_name, reference.artifact_name)
+            for source in [artifact, *reached]
+            for reference in source.expression.table_column_references if reference.table_name
+        }
+        assert set(lineage.physical_columns(artifact)) == columns
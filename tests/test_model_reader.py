@@ -0,0 +1,166 @@
+import io
+import json
+
+import pytest
+
+from src.PyDAX import DAXBimReader, DAXModel, DAXModelArtifact, DAXModelReader, DAXTmdlReader
+
+
+BIM = {
+    "name": "SemanticModel",
+    "compatibilityLevel": 1702,
+    "model": {
+        "culture": "en-US",
+        "dataSources": [{"name": "db", "connectionString": "Data Source={server}; [not] \"json\""}],
+        "tables": [
+            {
+                "name": "Sales",
+                "columns": [
+                    {"name": "Amount", "dataType": "decimal", "sourceColumn": "Amount"},
+                    {"name": "Big", "type": "calculated", "dataType": "boolean", "expression": "Sales[Amount] > 100"},
+                ],
+                "partitions": [{"name": "Sales", "source": {"type": "m", "expression": ["let", "    Source = Sql.Database(\"s\", \"d\")", "in", "    Source"]}}],
+                "measures": [
+                    {"name": "Total", "expression": "SUM ( Sales[Amount] )", "formatString": "0.00"},
+                    {
+                        "name": "Margin ]'\"",
+                        "expression": ["", "VAR cost = SUM ( Sales[Cost] )", "RETURN DIVIDE ( [Total] - cost, [Total] )"],
+                        "annotations": [{"name": "x", "value": "{[\"}"}],
+                    },
+                ],
+            },
+            {
+                "columns": [{"name": "Date", "type": "calculatedTableColumn", "sourceColumn": "[Date]"}],
+                "partitions": [{"name": "Calendar", "source": {"type": "calculated", "expression": "CALENDARAUTO()"}}],
+                "name": "Calendar",
+            },
+        ],
+        "relationships": [{"name": "r", "fromTable": "Sales", "fromColumn": "Date", "toTable": "Calendar", "toColumn": "Date"}],
+        "functions": [{"name": "Double", "expression": "( x ) => x * 2"}],
+        "annotations": [{"name": "PBI_ProTooling", "value": "[\"DevMode\"]"}],
+    },
+}
+
+TMDL_TABLE = """table Sales
+\tlineageTag: 0c7b
+
+\t/// Sum of the sales
+\tmeasure Total = SUM ( Sales[Amount] )
+\t\tformatString: 0.00
+
+\tmeasure 'Margin ]''"' =
+\t\t\tVAR cost = SUM ( Sales[Cost] )
+\t\t\tRETURN DIVIDE ( [Total] - cost, [Total] )
+\t\tlineageTag: 5e1a
+
+\tcolumn Amount
+\t\tdataType: decimal
+\t\tsourceColumn: Amount
+
+\tcolumn Big = Sales[Amount] > 100
+\t\tdataType: boolean
+
+\tpartition Sales = m
+\t\tmode: import
+\t\tsource =
+\t\t\t\tlet
+\t\t\t\t    Source = Sql.Database("s", "d")
+\t\t\t\tin
+\t\t\t\t    Source
+
+\tannotation PBI_ResultType = Table
+"""
+
+TMDL_CALENDAR = """table Calendar
+\tcolumn Date
+\t\tdataType: dateTime
+
+\tpartition Calendar = calculated
+\t\tmode: import
+\t\tsource = CALENDARAUTO()
+"""
+
+TMDL_FUNCTIONS = """function Double = ```
+\t\t( x ) =>
+\t\t\tx * 2
+\t\t```
+"""
+
+EXPECTED = [
+    ("calculated_column", "Sales", "Big", "Sales[Amount] > 100"),
+    ("measure", "Sales", "Total", "SUM ( Sales[Amount] )"),
+    ("measure", "Sales", "Margin ]'\"", "VAR cost = SUM ( Sales[Cost] )\nRETURN DIVIDE ( [Total] - cost, [Total] )"),
+    ("calculated_table", None, "Calendar", "CALENDARAUTO()"),
+    ("function", None, "Double", "( x ) =>\n\tx * 2"),
+]
+
+
+def records(artifacts) -> list[tuple]:
+    return [(artifact.kind, artifact.table_name, artifact.name, artifact.dax_expression.strip()) for artifact in artifacts]
+
+
+@pytest.fixture
+def tmdl_folder(tmp_path):
+    (tmp_path / "tables").mkdir()
+    (tmp_path / "tables" / "Sales.tmdl").write_text(TMDL_TABLE, encoding="utf-8")
+    (tmp_path / "tables" / "Calendar.tmdl").write_text(TMDL_CALENDAR, encoding="utf-8")
+    (tmp_path / "functions.tmdl").write_text(TMDL_FUNCTIONS, encoding="utf-8-sig")
+    (tmp_path / "model.tmdl").write_text("model Model\n\tculture: en-US\n\nref table Sales\nref table Calendar\n", encoding="utf-8")
+    return tmp_path
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_bim_reader(chunk_size):
+    bim = BIM | {"model": BIM["model"] | {"functions": [{"name": "Double", "expression": ["( x ) =>", "\tx * 2"]}]}}
+    text = json.dumps(bim, indent=2)
+    assert records(DAXBimReader(io.StringIO(text), chunk_size=chunk_size)) == EXPECTED
+
+
+def test_bim_reader_reads_paths_with_byte_order_mark(tmp_path):
+    path = tmp_path / "model.bim"
+    path.write_text(json.dumps(BIM), encoding="utf-8-sig")
+    assert [artifact.name for artifact in DAXBimReader(path)] == ["Big", "Total", "Margin ]'\"", "Calendar", "Double"]
+
+
+def test_bim_reader_rejects_invalid_json():
+    with pytest.raises(ValueError, match="Invalid model.bim"):
+        list(DAXBimReader(io.StringIO('{"model": {"tables": [{"name": "T", "measures": [{"name": ')))
+    with pytest.raises(ValueError, match="Invalid model.bim"):
+        list(DAXBimReader(io.StringIO('{"model": [1, 2')))
+
+
+def test_tmdl_reader_reads_folders_in_path_order(tmdl_folder):
+    functions, calendar, sales = EXPECTED[4:], EXPECTED[3:4], EXPECTED[1:3] + EXPECTED[:1]  # In file order
+    assert records(DAXTmdlReader(tmdl_folder)) == functions + calendar + sales
+    assert records(DAXTmdlReader(tmdl_folder / "tables" / "Sales.tmdl")) == sales
+    assert records(DAXTmdlReader(io.StringIO(TMDL_TABLE.replace("\t", "    ")))) == sales
+
+
+def test_analyze_in_batches(tmdl_folder):
+    artifacts = list(DAXTmdlReader(tmdl_folder).analyze(batch_size=2, lexer_backend="scanner"))
+    assert all(artifact.error is None for artifact in artifacts)
+    assert [reference.artifact_name for reference in artifacts[-1].expression.table_column_references] == ["Amount"]
+    with pytest.raises(ValueError):
+        next(DAXTmdlReader(tmdl_folder).analyze(batch_size=0))
+
+
+def test_readers_implement_iteration():
+    with pytest.raises(TypeError):
+        DAXModelReader()
+
+    class ListReader(DAXModelReader):
+        def __iter__(self):
+            yield DAXModelArtifact(DAXModelArtifact.MEASURE, "Total", "SUM(Sales[Amount])", table_name="Sales")
+
+    [artifact] = ListReader().analyze(lexer_backend="scanner")
+    assert artifact.expression.table_column_references[0].artifact_name == "Amount"
+
+
+def test_model_from_reader(tmdl_folder):
+    model = DAXModel(lexer_backend="scanner")
+    model.add_artifacts(DAXBimReader(io.StringIO(json.dumps(BIM))).analyze(analyses=("references",), verify_best_practices=False))
+
+    assert [str(artifact) for artifact in model.dependencies(model.measure("Margin ]'\""))] == ["[Total]"]
+    assert [str(artifact) for artifact in model.dependents(model.calculated_column("sales", "big"))] == []
+    with pytest.raises(ValueError, match="already contains"):
+        model.add_artifacts(DAXTmdlReader(tmdl_folder))
@@ -0,0 +1,74 @@
+import copy
+import pickle
+
+from src.PyDAX import DAXExpression, DAXModel, DAXNameTable
+
+
+def test_names_are_interned_case_insensitively():
+    names = DAXNameTable()
+    sales = names.intern("Sales")
+    assert names.intern("SALES") == names.intern("sales") == sales
+    assert names.intern("Product") == sales + 1 and len(names) == 2
+    assert names.name(sales) == "Sales" and names.keys[sales] == "sales"
+    assert names.lookup("sAlEs") == sales and names.lookup("Customer") is None
+    assert "SALES" in names and "Customer" not in names and len(names) == 2
+
+    #* Each spelling is stored once
+    spelling, name_id = names.entry("".join(["SA", "LES"]))
+    assert spelling is names.entry("SALES")[0] and name_id == sales
+    assert names.intern("Straße") == names.intern("STRASSE")
+
+
+def test_reference_equality_is_case_insensitive():
+    first = DAXExpression("SUM(Sales[Amount]) + [Total] + COUNTROWS(Store) + Double(1)", analyses=())
+    second = DAXExpression("SUM(SALES[amount]) + [TOTAL] + COUNTROWS(STORE) + DOUBLE(1)", analyses=())
+    assert first.table_column_references == second.table_column_references
+    assert first.table_references == second.table_references and first.function_references == second.function_references
+    assert len({*first.table_column_references, *second.table_column_references}) == 2
+
+    names = DAXNameTable()
+    first.intern_names(names)
+    second.intern_names(names)
+    assert [reference.artifact_id for reference in first.table_column_references] == [
+        reference.artifact_id for reference in second.table_column_references
+    ]
+    assert first.table_column_references == second.table_column_references
+    assert first.table_column_references[0].table_name is names.entry("Sales")[0]
+    assert second.table_references[0].name_id == first.table_references[0].name_id
+    assert first.table_column_references[0] != second.table_column_references[1]
+
+
+def test_variable_equality_is_case_insensitive():
+    variable, = DAXExpression("VAR total = 1 RETURN total", analyses=()).variables
+    renamed = copy.copy(variable)
+    renamed.name = "TOTAL"
+    assert renamed == variable and hash(renamed) == hash(variable)
+
+    names = DAXNameTable()
+    variable.intern(names)
+    renamed.intern(names)
+    assert renamed.name_id == variable.name_id == 0 and renamed == variable
+
+
+def test_pickles_do_not_carry_name_ids():
+    expression = DAXExpression("SUM(Sales[Amount]) + COUNTROWS(Store)", analyses=())
+    expression.intern_names(DAXNameTable())
+
+    restored = pickle.loads(pickle.dumps(expression))
+    reference = restored.table_column_references[0]
+    assert reference.table_id is None and reference._names is None
+    assert restored.table_references[0].name_id is None
+    assert reference == expression.table_column_references[0]
+
+
+def test_model_interns_the_names_of_its_artifacts():
+    model = DAXModel(lexer_backend="scanner")
+    model.add_measure("Sales", "Total", "SUM(Sales[Amount])")
+    average = model.add_measure("Sales", "Average", "[TOTAL] / COUNTROWS(SALES) + SUM(sales[amount])")
+    model.dependencies(average)
+
+    total, = (reference for reference in average.expression.table_column_references if reference.artifact_name == "TOTAL")
+    assert total.artifact_id == model.names.lookup("total") and model.names.name(total.artifact_id) == "Total"
+    first, second = (artifact.expression.table_column_references[0] for artifact in model.artifacts)
+    assert first.table_id == second.table_id and first.artifact_id == second.artifact_id
+    assert model.measure("TOTAL") is model.artifacts[0]
@@ -0,0 +1,118 @@
+import pickle
+
+import pytest
+
+from src.PyDAX import DAXExpression
+from src.PyDAX.DAXParser import DAXParser
+from src.PyDAX.DAXSyntaxTree import DAXNodeKinds
+
+
+def parse(dax: str, lexer_backend: str = "antlr"):
+    return DAXExpression(dax, analyses=(), lexer_backend=lexer_backend).syntax_tree
+
+
+def outline(tree, node=None) -> str:
+    """Compact form of a subtree: kind(children) with the token text of leaves"""
+    node = tree.root if node is None else node
+    kind = DAXNodeKinds.names[tree.kinds[node]]
+    children = tree.children(node)
+    token = tree.tokens[node]
+    label = tree.buffer.source_text(token) if token >= 0 else ""
+    if not children:
+        return label or kind
+    return f"{label or kind}({', '.join(outline(tree, child) for child in children)})"
+
+
+@pytest.mark.parametrize("lexer_backend", DAXExpression.LEXER_BACKENDS)
+@pytest.mark.parametrize(
+    ("dax", "expected"),
+    [
+        ("1 + 2 * 3 ^ -4", "ROOT(+(1, *(2, ^(3, -(4)))))"),
+        ("1 - 2 - 3", "ROOT(-(-(1, 2), 3))"),
+        ("NOT a && b || c IN {1, 2}", "ROOT(||(&&(NOT(a), b), IN(c, {(1, 2))))"),
+        ("a & b = c <> d", "ROOT(<>(=(&(a, b), c), d))"),
+        ("a == b", "ROOT(=(a, b))"),
+        ("-(1 + 2)", "ROOT(-(((+(1, 2))))"),
+        ("CALCULATE([Total], FILTER(ALL(T), T[a] = 1), )", "ROOT(CALCULATE([Total], FILTER(ALL(T), =([a], 1)), EMPTY))"),
+        ("IF(TRUE(), FALSE)", "ROOT(IF(TRUE, FALSE))"),
+        ("'My Table'[c] & 'My Table'", "ROOT(&([c], 'My Table'))"),
+        ("Order[Id] + Start[x]", "ROOT(+([Id], [x]))"),
+        ("() => 6", "ROOT(=>((, 6))"),
+        ("(x : NUMERIC) => x + 1", "ROOT(=>(((:(x, NUMERIC)), +(x, 1)))"),
+        ("= 1 - [a] / [b]", "ROOT(-(1, /([a], [b])))"),
+    ],
+)
+def test_expressions(dax, expected, lexer_backend):
+    tree = parse(dax, lexer_backend)
+    assert outline(tree) == expected
+    assert tree.errors == []
+
+
+def test_variables_and_scopes():
+    tree = parse("VAR a = 1 VAR b = a + 1 RETURN a * b")
+    assert outline(tree) == "ROOT(VAR(a(1), b(+(a, 1)), RETURN(*(a, b))))"
+    a, b = tree.of_kind(DAXNodeKinds.VARIABLE)
+    first, last = tree.variable_scope(a)
+    assert tree.buffer.text[tree.buffer.starts[first]:tree.buffer.stops[last] + 1] == "VAR b = a + 1 RETURN a * b"
+    assert tree.text(tree.parents[b]) == "VAR a = 1 VAR b = a + 1 RETURN a * b"
+
+
+def test_nested_var_blocks():
+    tree = parse("VAR x = CALCULATE(VAR a = 1 RETURN a) RETURN x")
+    assert outline(tree) == "ROOT(VAR(x(CALCULATE(VAR(a(1), RETURN(a)))), RETURN(x)))"
+    assert tree.errors == []
+
+
+def test_query():
+    tree = parse("DEFINE VAR x = 1 MEASURE T[m] = SUM(T[a]) EVALUATE T ORDER BY T[a] DESC, T[b] START AT 1")
+    assert outline(tree) == "ROOT(DEFINE(x(1), MEASURE([m], SUM([a]))), EVALUATE(T, ORDER(DESC([a]), [b]), START(1)))"
+    assert tree.errors == []
+    variable = tree.of_kind(DAXNodeKinds.VARIABLE)[0]
+    assert tree.buffer.source_text(tree.variable_scope(variable)[0]) == "MEASURE"
+
+
+@pytest.mark.parametrize(
+    ("dax", "expected", "errors"),
+    [
+        ("SUM(T[a] +", "ROOT(SUM(+([a], EMPTY)))", [(-1, "expected an expression"), (0, "missing ')'")]),
+        ("VAR a = ", "ROOT(VAR(a(EMPTY)))", [(-1, "expected an expression"), (0, "missing RETURN")]),
+        ("CALCULATE(SUM(", "ROOT(CALCULATE(SUM))", [(2, "missing ')'"), (0, "missing ')'")]),
+        (") 1 2", "ROOT(1, 2)", [(0, "unmatched ')'"), (4, "expected an operator")]),
+        ("{1, , 2}", "ROOT({(1, EMPTY, 2))", [(4, "expected an expression")]),
+        ("ORDER BY x", "ROOT(x)", [(0, "ORDER BY outside EVALUATE")]),
+    ],
+)
+def test_partial_expressions(dax, expected, errors):
+    tree = parse(dax)
+    assert outline(tree) == expected
+    assert tree.errors == errors
+
+
+def test_deep_nesting_does_not_recurse():
+    tree = parse("(" * 800 + "1" + ")" * 800)
+    assert len(tree) == 802 and tree.errors == []
+    assert len(list(tree.ancestors(tree.of_kind(DAXNodeKinds.LITERAL)[0]))) == 801
+    assert len(parse("SUM(" * 800 + "1").errors) == 800
+
+
+def test_nodes_point_back_to_tokens():
+    tree = parse("CALCULATE([Total Sales], Sales[Qty] > 1)")
+    buffer = tree.buffer
+    quantity = [index for index in range(len(buffer)) if buffer.source_text(index) == "[Qty]"][0]
+    node = tree.node_of_token(quantity)
+    assert tree.kinds[node] == DAXNodeKinds.COLUMN_REFERENCE
+    assert tree.node_of_token(quantity - 1) == node  # The table
+    assert tree.text(node) == "Sales[Qty]"
+    comparison = tree.parents[node]
+    assert tree.argument_index(comparison) == 1
+    assert buffer.source_text(tree.tokens[tree.parents[comparison]]) == "CALCULATE"
+    assert tree.node_of_token(1) == -1  # '('
+
+
+def test_syntax_tree_is_parsed_once_and_not_pickled():
+    expression = DAXExpression("SUM(T[a])", analyses=())
+    buffer = expression.token_buffer
+    assert expression.syntax_tree is buffer.syntax_tree
+    restored = pickle.loads(pickle.dumps(buffer))
+    assert "_syntax_tree" not in vars(restored)
+    assert outline(restored.syntax_tree) == outline(DAXParser.parse(buffer)) == "ROOT(SUM([a]))"
@@ -0,0 +1,71 @@
+import pickle
+
+from src.PyDAX import DAXExpression, DAXReferenceIndex
+
+
+DAX = """
+VAR total = SUM(Sales[Amount])
+VAR Quantity = SUM('Sales'[Qty]) + SUM(sales[qty])
+RETURN
+    DIVIDE(total, [Target]) + CALCULATE([Target], FILTER(Sales, Sales[Qty] > 1), Store[City] = "Zug")
+"""
+
+
+def test_references_by_table_and_artifact():
+    index = DAXExpression(DAX, analyses=("references",)).reference_index
+
+    assert index.count("Sales") == 4
+    assert index.count("SALES", "qty") == 3
+    assert [str(reference) for reference in index.references("sales", "Qty")] == ["'Sales'[Qty]", "'sales'[qty]", "'Sales'[Qty]"]
+    assert index.count("", "Target") == 2  # Measures written without their table
+    assert index.references("Customer") == [] and index.count("Customer", "Name") == 0
+    assert len(index.tables["sales"]) == 1  # FILTER(Sales, ...)
+
+
+def test_positions_follow_the_document():
+    expression = DAXExpression(DAX, analyses=("references",))
+    index = expression.reference_index
+    positions = index.positions("Sales", "Qty")
+
+    assert positions == sorted(positions)
+    assert [expression.token_buffer.source_text(position) for position in positions] == ["[Qty]", "[qty]", "[Qty]"]
+    # Standalone measures are extracted after the qualified references but indexed in document order
+    assert index.positions("", "Target") == sorted(index.positions("", "Target"))
+
+
+def test_unique_references_and_counts():
+    index = DAXExpression(DAX, analyses=("references",)).reference_index
+
+    assert [str(reference) for reference in index.unique()] == [
+        "'Sales'[Amount]", "'Sales'[Qty]", "''[Target]", "'Store'[City]"
+    ]
+    assert index.counts() == {("sales", "amount"): 1, ("sales", "qty"): 3, ("", "target"): 2, ("store", "city"): 1}
+
+
+def test_variables_by_name():
+    expression = DAXExpression(DAX, analyses=("references",))
+    index = expression.reference_index
+
+    assert index.variable("TOTAL") is expression.variables[0]
+    assert index.variable("quantity").name == "Quantity"
+    assert index.variable("Sales") is None
+    assert [str(reference) for reference in expression.variable_references] == ["total"]
+
+
+def test_index_is_built_once_and_not_pickled():
+    expression = DAXExpression(DAX, analyses=())
+    index = expression.reference_index
+    assert isinstance(index, DAXReferenceIndex) and expression.reference_index is index
+
+    restored = pickle.loads(pickle.dumps(expression))
+    assert "_reference_index" not in vars(restored)
+    assert restored.reference_index.counts() == index.counts()
+
+
+def test_many_variables_are_classified():
+    names = [f"v{index}" for index in range(300)]
+    dax = "".join(f"VAR {name} = {index} " for index, name in enumerate(names)) + "RETURN " + " + ".join(reversed(names)) + " + Sales"
+    expression = DAXExpression(dax, analyses=("references",))
+
+    assert [str(reference) for reference in expression.variable_references] == names[::-1]
+    assert [str(reference) for reference in expression.table_references] == ["Sales"]
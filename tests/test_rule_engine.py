@@ -0,0 +1,103 @@
+from pathlib import Path
+
+import pytest
+
+from src.PyDAX import DAXExpression
+from src.PyDAX.DAXTokenTypes import DAXTokenTypes
+from src.PyDAX.best_practices_rules import BestPracticeRule, RuleEngine
+
+
+RESOURCES = Path(__file__).resolve().parent.parent / "resources"
+
+
+class RecordingRule(BestPracticeRule):
+    SUBSCRIBED_TYPES = frozenset({DAXTokenTypes.SUM, DAXTokenTypes.DIV})
+    SUBSCRIBED_CHANNELS = frozenset({DAXTokenTypes.KEYWORD_CHANNEL})
+
+    def __init__(self) -> None:
+        super().__init__(id="RECORDING", name="Recording", description="", severity="1", category="Test", short_name="Recording")
+        self.received: list[int] = []
+        self.finished = 0
+
+    def on_token(self, index: int) -> None:
+        self.received.append(index)
+
+    def finish_verification(self) -> None:
+        super().finish_verification()
+        self.finished += 1
+
+
+def test_tokens_are_dispatched_once_in_order_to_subscribers():
+    buffer = DAXExpression("SUM(Sales[Amount]) / CALCULATE(1) // SUM", analyses=()).token_buffer
+    rule = RecordingRule()
+
+    RuleEngine([rule]).verify(buffer)
+
+    expected = [index for index in range(len(buffer))
+                if buffer.types[index] in (DAXTokenTypes.SUM, DAXTokenTypes.DIV) or buffer.channels[index] == DAXTokenTypes.KEYWORD_CHANNEL]
+    assert rule.received == expected
+    assert [buffer.token_text(index) for index in rule.received] == ["SUM", "/", "CALCULATE"]
+    assert rule.finished == 1 and rule.verified
+
+
+def test_rule_without_subscriptions_must_implement_verify_violation():
+    class NoOpRule(BestPracticeRule):
+        pass
+
+    rule = NoOpRule(id="NOOP", name="NoOp", description="", severity="1", category="Test", short_name="NoOp")
+    with pytest.raises(NotImplementedError):
+        rule.verify_violation(DAXExpression("1", analyses=()).token_buffer)
+
+
+class GuardedRule(BestPracticeRule):
+    REQUIRED_TYPES = (frozenset({DAXTokenTypes.FILTER}), frozenset({DAXTokenTypes.CALCULATE, DAXTokenTypes.CALCULATETABLE}))
+
+    def __init__(self) -> None:
+        super().__init__(id="GUARDED", name="Guarded", description="", severity="1", category="Test", short_name="Guarded")
+        self.runs = 0
+
+    def verify_violation(self, tokens) -> None:
+        self.start_verification(tokens)
+        self.runs += 1
+        self.add_violation(0)
+        self.verified = True
+
+
+@pytest.mark.parametrize("dax, runs", [
+    ("SUM(Sales[Amount])", 0),
+    ("FILTER(Sales, Sales[Amount] > 1)", 0),  # CALCULATE or CALCULATETABLE missing
+    ("CALCULATE([M]) // FILTER(", 0),  # Commented out tokens are not present
+    ("CALCULATETABLE(FILTER(Sales, Sales[Amount] > 1))", 1),
+])
+def test_rules_missing_their_prerequisites_are_skipped(dax, runs):
+    buffer = DAXExpression(dax, analyses=()).token_buffer
+    rule = GuardedRule()
+    rule.add_violation(0)  # Left over from a previous verification
+
+    RuleEngine([rule, RecordingRule()]).verify(buffer)
+
+    assert rule.runs == runs
+    assert rule.verified and rule.tokens is buffer
+    assert rule.number_of_violations == runs
+
+
+def test_present_types_are_collected_once():
+    buffer = DAXExpression("SUM(1) /* IFERROR */", analyses=()).token_buffer
+
+    assert buffer.present_types == frozenset(buffer.types)
+    assert DAXTokenTypes.IFERROR not in buffer.present_types
+    assert buffer.present_types is buffer.present_types
+
+
+@pytest.mark.parametrize("path", sorted(RESOURCES.rglob("*.txt")), ids=lambda path: path.name)
+def test_engine_matches_rules_verified_one_by_one(path):
+    text = path.read_text(encoding="utf-8")
+    expression = DAXExpression(text, analyses=())
+    expression.verify_best_practices()
+
+    for name in DAXExpression.BEST_PRACTICE_RULES:
+        alone = DAXExpression.rule_class(name)()
+        alone.verify_violation(tokens=DAXExpression(text, analyses=()).token_buffer)
+        rule = getattr(expression, name)
+        assert rule.verified
+        assert (rule.violators_indexes, rule.highlight_indexes) == (alone.violators_indexes, alone.highlight_indexes)
@@ -0,0 +1,127 @@
+import importlib.metadata
+import pickle
+import sys
+
+import pytest
+
+from src.PyDAX import DAXExpression
+from src.PyDAX.DAXTokenTypes import DAXTokenTypes
+from src.PyDAX.best_practices_rules import RULE_REGISTRY, BestPracticeRule, RuleRegistry, UseDivide
+
+
+class CountingRule(BestPracticeRule):
+    SUBSCRIBED_TYPES = frozenset({DAXTokenTypes.SUM})
+
+    def __init__(self) -> None:
+        super().__init__(id="COUNT_SUM", name="Count SUM", description="", severity="1", category="Custom", short_name="Count SUM")
+
+    def on_token(self, index: int) -> None:
+        self.add_violation(index)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """A registry holding the built-in rules, used by DAXExpression for the duration of the test"""
+    registry = RuleRegistry()
+    for registration in RULE_REGISTRY:
+        registry.register(registration.id, registration.rule_class, registration.attribute, registration.category)
+    monkeypatch.setattr(sys.modules["src.PyDAX.DAXExpression"], "RULE_REGISTRY", registry)
+    return registry
+
+
+def test_built_in_rules_are_registered_under_their_ids():
+    assert len(RULE_REGISTRY) == len(DAXExpression.BEST_PRACTICE_RULES)
+    for registration in RULE_REGISTRY:
+        rule = registration.rule_class()
+        assert rule.id == registration.id
+        assert rule.category == registration.category
+        assert DAXExpression.BEST_PRACTICE_RULES[registration.attribute] == type(rule).__name__
+
+
+def test_only_enabled_rules_are_instantiated_and_verified():
+    expression = DAXExpression("IFERROR(1 / 2, 0)", rules=["use_the_divide_function_for_division", "AVOID_USING_THE_IFERROR_FUNCTION"])
+
+    assert expression.rule_attributes == ("use_divide_function_for_division", "avoid_using_iferror_function")
+    assert [rule.id for rule in expression.best_practice_rules] == ["USE_THE_DIVIDE_FUNCTION_FOR_DIVISION", "AVOID_USING_THE_IFERROR_FUNCTION"]
+    assert expression.number_of_violations == 2
+    assert "unused_variables" not in expression.__dict__
+    with pytest.raises(AttributeError):
+        expression.unused_variables
+
+
+def test_rules_can_be_disabled_by_id_or_category():
+    expression = DAXExpression("1 / 2", disabled_rules=["USE_THE_DIVIDE_FUNCTION_FOR_DIVISION"])
+    assert "use_divide_function_for_division" not in expression.rule_attributes
+    assert len(expression.best_practice_rules) == len(RULE_REGISTRY) - 1
+    assert expression.number_of_violations == 0
+
+    assert DAXExpression("1 / 2", disabled_rules=["DAX Expressions"]).best_practice_rules == []
+    assert len(DAXExpression("1 / 2", rules=["dax expressions"]).best_practice_rules) == len(RULE_REGISTRY)
+
+
+def test_unknown_rules_are_rejected(monkeypatch):
+    monkeypatch.setattr(importlib.metadata, "entry_points", lambda group: [])
+    with pytest.raises(ValueError, match="NOT_A_RULE"):
+        RuleRegistry().select(["NOT_A_RULE"])
+    with pytest.raises(ValueError, match="NOT_A_RULE"):
+        DAXExpression("1", rules=["NOT_A_RULE"])
+
+
+def test_selections_are_shared_between_expressions():
+    first = DAXExpression("1", analyses=(), rules=["UNUSED_VARIABLES"])
+    second = DAXExpression("2", analyses=(), rules=["UNUSED_VARIABLES"])
+    assert first.rule_attributes is second.rule_attributes
+
+
+def test_registered_rules_are_verified_by_default(registry):
+    registry.register("COUNT_SUM", CountingRule)
+
+    expression = DAXExpression("SUM(Sales[Amount]) + SUM(Sales[Cost])")
+
+    assert expression.count_sum.number_of_violations == 2
+    assert expression.best_practice_rules[-1] is expression.count_sum
+    assert DAXExpression("SUM(Sales[Amount])", rules=["Custom"]).rule_attributes == ("count_sum",)
+
+
+def test_entry_points_are_loaded_when_a_selection_names_an_unknown_rule(registry, monkeypatch):
+    entry_point = importlib.metadata.EntryPoint("COUNT_SUM", f"{__name__}:CountingRule", RuleRegistry.ENTRY_POINT_GROUP)
+    monkeypatch.setattr(importlib.metadata, "entry_points", lambda group: [entry_point] if group == RuleRegistry.ENTRY_POINT_GROUP else [])
+
+    assert "COUNT_SUM" not in registry
+    expression = DAXExpression("SUM(Sales[Amount])", rules=["COUNT_SUM"])
+
+    assert registry["count_sum"].rule_class is CountingRule
+    assert registry["count_sum"].category == "Custom"
+    assert [rule.id for rule in expression.best_practice_rules] == ["COUNT_SUM"]
+    assert expression.number_of_violations == 1
+
+
+def test_entry_points_are_verified_by_default(registry, monkeypatch):
+    entry_point = importlib.metadata.EntryPoint("COUNT_SUM", f"{__name__}:CountingRule", RuleRegistry.ENTRY_POINT_GROUP)
+    monkeypatch.setattr(importlib.metadata, "entry_points", lambda group: [entry_point] if group == RuleRegistry.ENTRY_POINT_GROUP else [])
+
+    expression = DAXExpression("SUM(Sales[Amount])")
+
+    assert expression.rule_attributes[-1] == "count_sum"
+    assert expression.count_sum.number_of_violations == 1
+
+
+def test_rule_selection_is_fixed_when_the_expression_is_created(registry):
+    expression = DAXExpression("SUM(Sales[Amount])", analyses=())
+    rule_attributes = expression.rule_attributes
+
+    registry.register("COUNT_SUM", CountingRule)
+
+    assert expression.rule_attributes is rule_attributes and "count_sum" not in rule_attributes
+    assert "COUNT_SUM" not in [rule.id for rule in expression.best_practice_rules]
+    assert DAXExpression("SUM(Sales[Amount])", analyses=()).rule_attributes[-1] == "count_sum"
+
+
+def test_rule_selection_survives_pickling():
+    expression = DAXExpression("1 / 2", rules=["USE_THE_DIVIDE_FUNCTION_FOR_DIVISION"])
+
+    restored = pickle.loads(pickle.dumps(expression))
+
+    assert restored.rule_attributes == ("use_divide_function_for_division",)
+    assert isinstance(restored.use_divide_function_for_division, UseDivide)
+    assert restored.number_of_violations == 1
@@ -0,0 +1,80 @@
+import random
+from pathlib import Path
+
+import pytest
+from antlr4 import InputStream
+
+from src.PyDAX import DAXExpression
+from src.PyDAX.DAXScanner import DAXScanner
+from src.PyDAX.DAXTokenBuffer import DAXTokenBuffer
+from src.PyDAX.PyDAXLexer import PyDAXLexer
+
+
+RESOURCES = Path(__file__).resolve().parent.parent / "resources"
+SAMPLES = sorted(RESOURCES.rglob("*.txt"))
+
+#* Inputs exercising longest match, fallbacks and PyDAXLexer's error recovery
+EDGE_CASES = [
+    "",
+    "VAR.P(x) + VAR.Pa + VAR.X + T.DIST.2T(1) + T.DIST.2",
+    "12.5.3 + 12. + .5 + 1.)",
+    "/* a /* nested */ still comment */ after",
+    "/* unterminated /",
+    "/*/ x",
+    "/**/ // line\r\n-- dashes next",
+    "'a . b' + 'it''s'[col]] ]",
+    '"abc"" def" & DT"2020-01-01" & DT"2020',
+    '"unterminated',
+    "'unterminated\n[open\n",
+    "a || b | c && d <> e <= f >= g => h : i",
+    "été # ! ? @   　\t\x0b\x0c ",
+]
+
+
+def antlr_buffer(text: str) -> DAXTokenBuffer:
+    lexer = PyDAXLexer(InputStream(text))
+    lexer.removeErrorListeners()
+    return DAXTokenBuffer.from_lexer(lexer)
+
+
+def assert_same_tokens(text: str) -> None:
+    expected = antlr_buffer(text)
+    actual = DAXScanner.scan(text)
+    for column in ("types", "channels", "starts", "stops", "lines", "columns"):
+        assert list(getattr(actual, column)) == list(getattr(expected, column)), f"{column} differ for {text!r}"
+
+
+@pytest.mark.parametrize("path", SAMPLES, ids=lambda path: path.name)
+def test_scanner_matches_lexer_on_samples(path):
+    assert_same_tokens(path.read_text(encoding="utf-8"))
+
+
+@pytest.mark.parametrize("text", EDGE_CASES)
+def test_scanner_matches_lexer_on_edge_cases(text):
+    assert_same_tokens(text)
+
+
+def test_scanner_matches_lexer_on_random_input():
+    pieces = ["/*", "*/", "/", "*", "//", "--", "\n", "\r\n", " ", "'", "''", "[", "]", "]]", '"', '""', 'DT"',
+              ".", "1", "2.5", "VAR", "VAR.P", "T.DIST", ".2T", "x", "|", "||", "&", "<", ">", "=", "é", "#"]
+    rnd = random.Random(0)
+    for _ in range(2000):
+        assert_same_tokens("".join(rnd.choice(pieces) for _ in range(rnd.randint(1, 12))))
+
+
+def test_expression_results_do_not_depend_on_backend():
+    text = SAMPLES[0].read_text(encoding="utf-8")
+    antlr = DAXExpression(text)
+    scanner = DAXExpression(text, lexer_backend="scanner")
+
+    assert scanner.comments == antlr.comments
+    assert scanner.clean_dax_expression == antlr.clean_dax_expression
+    assert scanner.table_column_references == antlr.table_column_references
+    assert [v.name for v in scanner.variables] == [v.name for v in antlr.variables]
+    assert [rule.violators_tokens for rule in scanner.best_practice_rules] == [rule.violators_tokens for rule in antlr.best_practice_rules]
+    assert scanner.generate_html_with_violations() == antlr.generate_html_with_violations()
+
+
+def test_unknown_lexer_backend_is_rejected():
+    with pytest.raises(ValueError):
+        DAXExpression("1", lexer_backend="regex")
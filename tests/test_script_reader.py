@@ -0,0 +1,112 @@
+import io
+
+import pytest
+
+from src.PyDAX import DAXDefinition, DAXExpression, DAXScriptReader
+
+
+SCRIPT = """// Exported script
+DEFINE
+    VAR __Year = 2024
+    MEASURE Sales[Total] = SUM ( Sales[Amount] )
+    MEASURE 'Sales'[Margin] =
+        VAR cost = SUM ( Sales[Cost] )
+        VAR revenue = [Total]
+        RETURN DIVIDE ( revenue - cost, revenue )
+    VAR __Filter = TREATAS ( { __Year }, 'Date'[Year] ) /* trailing comment */
+    COLUMN Sales[Big] = Sales[Amount] > 100
+    TABLE Top10 = TOPN ( 10, Sales, [Total] )
+    FUNCTION Double = ( x ) => x * 2
+EVALUATE
+    SUMMARIZECOLUMNS ( 'Date'[Year], __Filter, "Total", [Total] )
+ORDER BY 'Date'[Year] DESC
+EVALUATE { [Margin] }
+"""
+
+
+def read(text: str, **options) -> list[DAXDefinition]:
+    return list(DAXScriptReader(io.StringIO(text), **options))
+
+
+def test_definitions_and_queries():
+    definitions = read(SCRIPT)
+
+    assert [(definition.kind, definition.name, definition.line) for definition in definitions] == [
+        ("variable", "__Year", 3),
+        ("measure", "Sales[Total]", 4),
+        ("measure", "'Sales'[Margin]", 5),
+        ("variable", "__Filter", 9),
+        ("column", "Sales[Big]", 10),
+        ("table", "Top10", 11),
+        ("function", "Double", 12),
+        ("evaluate", "", 13),
+        ("evaluate", "", 16),
+    ]
+    assert definitions[2].dax_expression.startswith("VAR cost") and definitions[2].dax_expression.endswith("revenue )")
+    assert definitions[3].dax_expression == "TREATAS ( { __Year }, 'Date'[Year] )"
+    assert definitions[7].dax_expression.endswith("ORDER BY 'Date'[Year] DESC")
+    for definition in definitions:
+        assert SCRIPT[definition.offset:].startswith(("VAR", "MEASURE", "COLUMN", "TABLE", "FUNCTION", "EVALUATE"))
+        assert SCRIPT[definition.expression_offset:].startswith(definition.dax_expression)
+
+
+#* A chunk ending after a '/' of a long comment leaves the comment unterminated in the window, lexed as '/' '*'
+COMMENTED_SCRIPT = """DEFINE
+MEASURE T[a] = 1 /* the ratio is computed upstream in the warehouse as a/b */
+MEASURE T[b] = 2
+EVALUATE {[a]}
+"""
+
+
+@pytest.mark.parametrize("script, chunk_size", [
+    *((SCRIPT, chunk_size) for chunk_size in (1, 7, 64, 1 << 16)),
+    (COMMENTED_SCRIPT, COMMENTED_SCRIPT.index("a/b") + 2),
+    *((COMMENTED_SCRIPT, chunk_size) for chunk_size in range(1, 100, 3)),
+])
+def test_chunk_size_does_not_change_the_definitions(script, chunk_size):
+    expected = [(d.kind, d.name, d.dax_expression, d.offset, d.line, d.expression_offset) for d in read(script)]
+    actual = [(d.kind, d.name, d.dax_expression, d.offset, d.line, d.expression_offset) for d in read(script, chunk_size=chunk_size)]
+    assert actual == expected
+    if script is COMMENTED_SCRIPT:
+        assert [(name, dax_expression) for _, name, dax_expression, *_ in actual] == [("T[a]", "1"), ("T[b]", "2"), ("", "{[a]}")]
+
+
+def test_expressions_are_created_lazily():
+    definition = read(SCRIPT, lexer_backend="scanner", rules=["AVOID_USING_THE_IFERROR_FUNCTION"])[2]
+    assert definition._expression is None
+
+    expression = definition.expression
+    assert isinstance(expression, DAXExpression) and definition.expression is expression
+    assert "variables" not in vars(expression)
+    assert [variable.name for variable in expression.variables] == ["cost", "revenue"]
+    assert expression._lexer_backend == "scanner"
+
+
+def test_files_without_define():
+    definitions = read("MEASURE T[a] = 1\nMEASURE T[b] = VAR x = 1 RETURN x\nMEASURE T[c] = COUNTROWS(Table) + Table[x]")
+    assert [(definition.name, definition.dax_expression) for definition in definitions] == [
+        ("T[a]", "1"), ("T[b]", "VAR x = 1 RETURN x"), ("T[c]", "COUNTROWS(Table) + Table[x]")
+    ]
+    [expression] = read("VAR x = 1\nVAR y = x\nRETURN x + y")
+    assert expression.kind == DAXDefinition.EXPRESSION and expression.dax_expression == "VAR x = 1\nVAR y = x\nRETURN x + y"
+    assert read("") == [] and read("// only a comment") == []
+
+
+def test_unbalanced_parentheses_end_at_the_next_query():
+    definitions = read("DEFINE MEASURE T[a] = SUM(T[x] MEASURE T[b] = 1 EVALUATE T")
+    assert [(definition.kind, definition.dax_expression) for definition in definitions] == [
+        ("measure", "SUM(T[x] MEASURE T[b] = 1"), ("evaluate", "T")
+    ]
+
+
+def test_definitions_are_streamed(tmp_path):
+    path = tmp_path / "script.dax"
+    path.write_text("DEFINE\n" + "\n".join(f"MEASURE T[m{index}] = {index} /* {'x' * 50} */" for index in range(5000)), encoding="utf-8")
+
+    with open(path, encoding="utf-8") as file:
+        definitions = iter(DAXScriptReader(file, chunk_size=1024))
+        assert next(definitions).name == "T[m0]"
+        assert file.tell() < 10_000  # Only the first chunks were read
+        assert sum(1 for _ in definitions) == 4999
+
+    assert [definition.name for definition in DAXScriptReader(path)][-1] == "T[m4999]"
@@ -0,0 +1,99 @@
+import copy
+import pickle
+
+import pytest
+
+from src.PyDAX import DAXArtifactReference, DAXExpression, DAXToken
+from src.PyDAX.DAXVariable import DAXVariable
+from src.PyDAX.best_practices_rules import BestPracticeRule, UnusedVariables, UseDivide
+
+DAX = """
+VAR Unused = 1
+VAR Total = SUM(Sales[Amount]) / 2
+RETURN Total + COUNTROWS(Store) + [Margin]
+"""
+
+
+def test_analysis_objects_have_no_instance_dict():
+    expr = DAXExpression(DAX)
+    objects = [
+        expr.table_column_references[0].artifact_token,
+        *expr.table_column_references,
+        *expr.table_references,
+        *expr.function_references,
+        *expr.variables,
+        *expr.best_practice_rules,
+    ]
+    for instance in objects:
+        assert not hasattr(instance, "__dict__"), type(instance).__name__
+
+
+def test_rule_metadata_is_set_at_class_level():
+    rule = UseDivide()
+    assert rule.id == UseDivide.id == "USE_THE_DIVIDE_FUNCTION_FOR_DIVISION"
+    assert rule.name == UseDivide.name and rule.category == UseDivide.category
+    assert UseDivide.severity == 2 and UnusedVariables.severity == "2"
+    with pytest.raises(AttributeError):
+        rule.name = "Renamed"
+
+
+class LegacyRule(BestPracticeRule):
+    """A rule written before metadata moved to class level"""
+
+    def __init__(self) -> None:
+        super().__init__(id="legacy", name="Legacy", description="", severity="1", category="Test", short_name="L")
+
+
+def test_rules_without_slots_can_still_pass_metadata():
+    rule = LegacyRule()
+    assert (rule.id, rule.name, rule.short_name) == ("legacy", "Legacy", "L")
+    assert BestPracticeRule.name == ""
+    restored = pickle.loads(pickle.dumps(rule))
+    assert (restored.id, restored.name, restored.verified) == ("legacy", "Legacy", False)
+
+
+def test_pickle_round_trip_keeps_slots():
+    expr = DAXExpression(DAX)
+    restored = pickle.loads(pickle.dumps(expr))
+
+    assert restored.variables == expr.variables
+    assert restored.unused_variables.violators_tokens == expr.unused_variables.violators_tokens
+    assert restored.unused_variables.verified and restored.unused_variables.name == UnusedVariables.name
+    token = expr.table_column_references[0].artifact_token
+    assert pickle.loads(pickle.dumps(token)) == token == copy.copy(token)
+
+
+def test_unpickles_dict_states_from_previous_versions(make_token):
+    old_token = DAXToken(make_token(text="Total", start=4, line=2))
+
+    token = DAXToken.__new__(DAXToken)
+    token.__setstate__({"start": 4, "stop": 9, "line": 2, "column": 0, "text": "Total", "type": 0})
+    assert token == old_token
+
+    variable = DAXVariable.__new__(DAXVariable)
+    variable.__setstate__({"name": "Total", "token": old_token, "var_keyword_token": old_token, "last_expression_token": None})
+    assert variable.token == old_token and variable.last_expression_token is None
+    assert variable._names is None and variable.name_id is None
+
+    reference = DAXArtifactReference.__new__(DAXArtifactReference)
+    reference.__setstate__({"table_name": "Sales", "artifact_name": "Amount", "table_token": None, "artifact_token": old_token})
+    assert reference.table_id is None and reference.artifact_token == old_token
+
+    rule = UseDivide.__new__(UseDivide)
+    rule.__setstate__({
+        "id": UseDivide.id, "name": "Old name", "description": "", "severity": 2, "category": "",
+        "short_name": "", "verified": True, "violators_tokens": [old_token], "highlight_tokens": [old_token],
+    })
+    assert rule.verified and rule.violators_tokens == [old_token] and rule.tokens is None
+    assert rule.name == UseDivide.name  # Metadata comes from the class
+
+
+def test_metadata_can_be_passed_as_class_keywords():
+    metadata = {"ID": "KEYWORD_RULE", "Name": "Keyword rule", "Severity": 3, "short_name": "K"}
+
+    class KeywordRule(BestPracticeRule, metadata=metadata, severity="3", category="Test"):
+        __slots__ = ()
+
+    assert (KeywordRule.id, KeywordRule.name, KeywordRule.short_name) == ("KEYWORD_RULE", "Keyword rule", "K")
+    assert (KeywordRule.severity, KeywordRule.category, KeywordRule.description) == ("3", "Test", "")
+    assert BestPracticeRule.id == "" and not hasattr(KeywordRule(), "__dict__")
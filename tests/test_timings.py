@@ -0,0 +1,81 @@
+import pickle
+
+import pytest
+
+from src.PyDAX import DAXExpression, DAXTimings
+from src.PyDAX.best_practices_rules import RULE_REGISTRY
+
+
+EXPRESSION = "VAR x = SUM(Sales[Amount]) -- total\nRETURN IFERROR(x / 2, 0)"
+
+
+def test_timings_are_not_collected_by_default():
+    expression = DAXExpression(EXPRESSION)
+    expression.generate_html()
+
+    assert expression.timings is None
+    assert "timings" not in expression.__dict__
+
+
+@pytest.mark.parametrize("lexer_backend", DAXExpression.LEXER_BACKENDS)
+def test_every_phase_is_timed(lexer_backend):
+    expression = DAXExpression(EXPRESSION, collect_timings=True, lexer_backend=lexer_backend)
+    expression.generate_html()
+    expression.generate_html_with_violations()
+
+    timings = expression.timings
+    rule_phases = [f"rule:{registration.id}" for registration in RULE_REGISTRY]
+    assert list(timings) == ["lexing", "comments", "references", *rule_phases, "html", "html_with_violations"]
+    assert all(timings[phase] >= 0 for phase in timings)
+    assert set(timings.tokens.values()) == {len(expression.token_buffer)}
+    assert timings.calls["lexing"] == 1
+    assert timings.total == pytest.approx(sum(timings.seconds.values()))
+
+
+def test_timed_verification_finds_the_same_violations():
+    timed = DAXExpression(EXPRESSION, collect_timings=True)
+    untimed = DAXExpression(EXPRESSION)
+
+    assert timed.number_of_violations == untimed.number_of_violations == 2
+    assert [rule.violators_indexes for rule in timed.best_practice_rules] == [rule.violators_indexes for rule in untimed.best_practice_rules]
+
+
+def test_lazily_verified_rules_are_timed():
+    expression = DAXExpression(EXPRESSION, analyses=(), collect_timings=True, rules=["AVOID_USING_THE_IFERROR_FUNCTION"])
+    expression.avoid_using_iferror_function
+
+    assert list(expression.timings) == ["lexing", "rule:AVOID_USING_THE_IFERROR_FUNCTION"]
+
+
+def test_timings_survive_pickling():
+    expression = DAXExpression(EXPRESSION, collect_timings=True)
+
+    restored = pickle.loads(pickle.dumps(expression))
+
+    assert restored.timings.seconds == expression.timings.seconds
+
+
+def test_batch_timings_are_summarized_by_phase():
+    expressions = ["1 / 2", EXPRESSION, "SUM(Sales[Amount])", "VAR a = 1 RETURN " + " + ".join(["a"] * 500)]
+    results = DAXExpression.analyze_many(expressions, workers=1, collect_timings=True, analyses=("references",))
+
+    summary = DAXTimings.summarize(result.timings for result in results)
+
+    assert list(summary) == ["lexing", "references"]
+    references = summary["references"]
+    assert references.count == len(expressions)
+    assert references.p50 <= references.p90 <= references.p99 <= references.max
+    assert references.total == pytest.approx(sum(result.timings["references"] for result in results))
+    assert results[references.slowest].timings["references"] == references.max
+    assert references.slowest_tokens == len(DAXExpression(expressions[references.slowest]).token_buffer)
+
+
+def test_summaries_skip_expressions_without_timings():
+    timings = DAXTimings()
+    timings.record("lexing", 0.5, 10)
+
+    summary = DAXTimings.summarize([None, timings, None])
+
+    assert summary["lexing"].count == 1
+    assert summary["lexing"].slowest == 1
+    assert DAXTimings.summarize([]) == {}
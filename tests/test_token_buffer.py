@@ -0,0 +1,99 @@
+import pickle
+
+from antlr4 import InputStream, Token
+
+from src.PyDAX import DAXArtifactReference, DAXExpression, UseDivide
+from src.PyDAX.DAXToken import DAXToken
+from src.PyDAX.DAXTokenBuffer import DAXTokenBuffer
+from src.PyDAX.PyDAXLexer import PyDAXLexer
+
+
+DAX = (
+    "// Sales per customer\n"
+    "VAR Unused = 1\n"
+    "RETURN CALCULATE(SUM(Sales[Amount]) / COUNTROWS(Customers), FILTER('Sales', 'Sales'[Quantity] > 10))"
+)
+
+
+def test_expression_is_lexed_once(monkeypatch):
+    passes = []
+    original_next_token = PyDAXLexer.nextToken
+
+    def counting_next_token(lexer):
+        token = original_next_token(lexer)
+        if token.type == Token.EOF:
+            passes.append(token)
+        return token
+
+    monkeypatch.setattr(PyDAXLexer, "nextToken", counting_next_token)
+
+    expr = DAXExpression(DAX)
+    expr.generate_html()
+    expr.generate_html_with_violations()
+
+    assert len(passes) == 1
+
+
+def test_buffer_channels_and_types():
+    expr = DAXExpression(DAX)
+    buffer = expr.token_buffer
+
+    assert isinstance(buffer, DAXTokenBuffer)
+    assert buffer.text == DAX
+    assert [buffer.token_text(i) for i in buffer.on_channels(PyDAXLexer.COMMENTS_CHANNEL)] == ["// Sales per customer"]
+    assert buffer.contains_type(PyDAXLexer.DIV)
+    assert len(buffer.of_type(PyDAXLexer.COLUMN_OR_MEASURE)) == 2
+
+
+def test_rule_still_accepts_a_lexer():
+    lexer = PyDAXLexer(InputStream("1 / 2"))
+    lexer.removeErrorListeners()
+
+    rule = UseDivide()
+    rule.verify_violation(lexer)
+
+    assert rule.verified is True
+    assert rule.number_of_violations == 1
+
+
+def test_references_and_rules_hold_buffer_indexes():
+    expr = DAXExpression(DAX)
+    buffer = expr.token_buffer
+
+    reference = expr.table_column_references[0]
+    assert isinstance(reference._artifact_token, int)
+    assert reference.artifact_token == buffer.token(reference._artifact_token)
+    assert reference.artifact_token.text == "Amount"
+
+    rule = expr.use_divide_function_for_division
+    assert rule.violators_indexes == buffer.of_type(PyDAXLexer.DIV)
+    assert rule.violators_tokens[0].text == "/"
+
+
+def test_token_text_matches_lexer_actions():
+    expr = DAXExpression("'Dim ''Date'''[Col]]umn] & \"text\" & DT\"2020-01-01\"")
+    buffer = expr.token_buffer
+    texts = {buffer.types[i]: buffer.token_text(i) for i in range(len(buffer))}
+
+    assert texts[PyDAXLexer.TABLE] == "Dim 'Date'"
+    assert texts[PyDAXLexer.COLUMN_OR_MEASURE] == "Col]umn"
+    assert texts[PyDAXLexer.STRING_LITERAL] == "text"
+    assert texts[PyDAXLexer.DATE_LITERAL] == "2020-01-01"
+
+
+def test_pickle_round_trip_keeps_tokens():
+    expr = DAXExpression(DAX)
+    restored = pickle.loads(pickle.dumps(expr))
+
+    assert restored.table_column_references == expr.table_column_references
+    assert [r.artifact_token for r in restored.table_column_references] == [r.artifact_token for r in expr.table_column_references]
+    assert restored.unused_variables.violators_tokens == expr.unused_variables.violators_tokens
+
+
+def test_unpickles_materialized_tokens_from_previous_versions(make_token):
+    reference = DAXArtifactReference.__new__(DAXArtifactReference)
+    old_token = DAXToken(make_token(text="Amount", start=6))
+    reference.__setstate__({"table_name": "", "artifact_name": "Amount", "table_token": None, "artifact_token": old_token})
+
+    assert reference.artifact_token == old_token
+    assert reference.table_token is None
@@ -0,0 +1,93 @@
+import pickle
+
+import pytest
+
+from src.PyDAX import DAXExpression
+from src.PyDAX.DAXTokenTypes import DAXTokenTypes
+
+
+DAX = "CALCULATE( SUM(Sales[Amount]) /* (not a paren) */, FILTER(Sales, Sales[Qty] > (1 + 2)), )"
+
+
+def token_index(buffer, text: str, occurrence: int = 0) -> int:
+    """Buffer index of the `occurrence`-th token whose source text is `text`"""
+    return [index for index in range(len(buffer)) if buffer.source_text(index) == text][occurrence]
+
+
+@pytest.fixture(params=DAXExpression.LEXER_BACKENDS)
+def buffer(request):
+    return DAXExpression(DAX, analyses=(), lexer_backend=request.param).token_buffer
+
+
+def test_navigation_is_built_once_and_not_pickled(buffer):
+    assert buffer.navigation is buffer.navigation
+    restored = pickle.loads(pickle.dumps(buffer))
+    assert "_navigation" not in vars(restored)
+    assert list(restored.navigation.matching_paren) == list(buffer.navigation.matching_paren)
+
+
+def test_significant_tokens_skip_whitespace_and_comments(buffer):
+    navigation = buffer.navigation
+    assert navigation.significant == buffer.on_channels(DAXTokenTypes.DEFAULT_CHANNEL, DAXTokenTypes.KEYWORD_CHANNEL)
+
+    close_sum = token_index(buffer, ")")
+    comma = token_index(buffer, ",")
+    assert navigation.next_significant[close_sum] == comma
+    assert navigation.previous_significant[comma] == close_sum
+    assert navigation.position(comma) == navigation.significant.index(comma)
+    assert navigation.position(close_sum + 1) == -1  # Whitespace
+    assert navigation.next_significant[close_sum + 1] == comma
+    assert navigation.previous_significant[0] == -1
+    assert navigation.next_significant[len(buffer) - 1] == -1
+
+
+def test_matching_parens(buffer):
+    navigation = buffer.navigation
+    calculate_open = token_index(buffer, "(")
+    calculate_close = len(buffer) - 1
+    assert navigation.matching_paren[calculate_open] == calculate_close
+    assert navigation.matching_paren[calculate_close] == calculate_open
+    inner_open = token_index(buffer, "(", 3)
+    assert buffer.source_text(navigation.previous_significant[inner_open]) == ">"
+    assert navigation.matching_paren[navigation.matching_paren[inner_open]] == inner_open
+    assert navigation.matching_paren[0] == -1
+
+
+def test_enclosing_call_and_argument_positions(buffer):
+    navigation = buffer.navigation
+    calculate_open = token_index(buffer, "(")
+    filter_token = token_index(buffer, "FILTER")
+    quantity = token_index(buffer, "[Qty]")
+    filter_open = navigation.next_significant[filter_token]
+
+    assert navigation.enclosing_paren[filter_token] == calculate_open
+    assert navigation.argument_positions[filter_token] == 1
+    assert navigation.enclosing_paren[quantity] == filter_open
+    assert navigation.argument_positions[quantity] == 1
+    assert navigation.function_of(filter_open) == filter_token
+    # A pair's parentheses belong to the enclosing pair
+    assert navigation.enclosing_paren[filter_open] == navigation.enclosing_paren[navigation.matching_paren[filter_open]] == calculate_open
+    assert navigation.enclosing_paren[0] == -1
+
+
+def test_argument_boundaries(buffer):
+    navigation = buffer.navigation
+    calculate_open = token_index(buffer, "(")
+    arguments = navigation.arguments(calculate_open)
+
+    assert len(arguments) == 3
+    assert [buffer.source_text(navigation.next_significant[before]) for before, _ in arguments[:2]] == ["SUM", "FILTER"]
+    before, after = arguments[2]
+    assert navigation.next_significant[before] == after  # Empty trailing argument
+    assert after == navigation.matching_paren[calculate_open]
+
+
+def test_unbalanced_parentheses():
+    buffer = DAXExpression("SUM(T[a]) + MAX(T[b], (1", analyses=()).token_buffer
+    navigation = buffer.navigation
+    max_open = token_index(buffer, "(", 1)
+
+    assert navigation.matching_paren[max_open] == -1
+    assert navigation.arguments(max_open)[-1] == (token_index(buffer, ","), len(buffer))
+    assert navigation.matching_paren[token_index(buffer, ")")] == token_index(buffer, "(")
+    assert DAXExpression(")) + (", analyses=()).token_buffer.navigation.matching_paren.tolist() == [-1] * 6
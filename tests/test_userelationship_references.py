@@ -78,3 +78,11 @@ def test_userelationship_inside_complex_expression():
     assert rel.column1 == "Date"
     assert rel.table2 == "Fact Sales"
     assert rel.column2 == "OrderDate"
+
+
+def test_unclosed_userelationship_does_not_swallow_later_references():
+    dax = "CALCULATE([Total Sales], USERELATIONSHIP(Dates[Date], Sales[OrderDate] + SUM(Sales[Amount])"
+    expr = DAXExpression(dax)
+
+    assert expr.relationship_references == []
+    assert ("Sales", "Amount") in [(ref.table_name, ref.artifact_name) for ref in expr.table_column_references]